@@ -68,6 +68,19 @@ def graph():
     default=False,
     help='Enable features marked as unstable.'
 )
+@click.option(
+    '--persistent-workers',
+    is_flag=True,
+    show_default=True,
+    default=False,
+    help='Keep one pool of worker processes up for the whole graph run instead of starting workers for each stage.'
+)
+@click.option(
+    '--worker-start-method',
+    default='spawn',
+    type=click.Choice(['spawn', 'forkserver']),
+    help='Start method for persistent workers. Forkserver preloads Hedra before workers are forked.'
+)
 def run(
     path: str, 
     cpus: int, 
@@ -80,6 +93,8 @@ def run(
     bypass_connection_validation: bool,
     connection_validation_retries: int,
     enable_latest: bool,
+    persistent_workers: bool,
+    worker_start_method: str
 ):
     run_graph(
         path, 
@@ -92,7 +107,9 @@ def run(
         log_directory,
         bypass_connection_validation,
         connection_validation_retries,
-        enable_latest
+        enable_latest,
+        persistent_workers,
+        worker_start_method
     )
 
 
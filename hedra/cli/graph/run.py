@@ -37,6 +37,8 @@ def run_graph(
     bypass_connection_validation: bool,
     connection_validation_retries: int,
     enable_latest: bool,
+    persistent_workers: bool=False,
+    worker_start_method: str='spawn'
 ):
 
     if enable_latest:
@@ -86,6 +88,10 @@ def run_graph(
 
     hedra_core_config['bypass_connection_validation'] = bypass_connection_validation
 
+    if persistent_workers:
+        hedra_core_config['persistent_workers'] = persistent_workers
+        hedra_core_config['worker_start_method'] = worker_start_method
+
     if connection_validation_retries:
         hedra_core_config['connection_validation_retries'] = connection_validation_retries
     
@@ -35,7 +35,9 @@ class GraphQLClient(BaseClient[MercuryGraphQLClient, GraphQLAction, GraphQLResul
                 total_timeout=config.request_timeout
             ),
             reset_connections=config.reset_connections,
-            tracing_session=tracing_session
+            tracing_session=tracing_session,
+            idle_timeout=config.idle_timeout,
+            max_connection_age=config.max_connection_age
         )
         self.request_type = RequestTypes.GRAPHQL
         self.client_type = self.request_type.capitalize()
@@ -35,7 +35,10 @@ class GraphQLHTTP2Client(BaseClient[MercuryGraphQLHTTP2Client, GraphQLHTTP2Actio
                 total_timeout=config.request_timeout
             ),
             reset_connections=config.reset_connections,
-            tracing_session=tracing_session
+            tracing_session=tracing_session,
+            idle_timeout=config.idle_timeout,
+            max_connection_age=config.max_connection_age,
+            streams_per_connection=config.streams_per_connection
         )
         self.request_type = RequestTypes.GRAPHQL_HTTP2
         self.client_type = self.request_type.capitalize()
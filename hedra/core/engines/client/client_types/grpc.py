@@ -1,10 +1,11 @@
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Optional, Union
 from hedra.core.engines.client.config import Config
 from hedra.core.engines.types.common.types import RequestTypes
 from hedra.core.engines.types.grpc import (
     MercuryGRPCClient,
     GRPCAction,
-    GRPCResult
+    GRPCResult,
+    GRPCStreamTypes
 )
 from hedra.core.engines.types.common import Timeouts
 from hedra.core.engines.client.store import ActionsStore
@@ -35,7 +36,10 @@ class GRPCClient(BaseClient[MercuryGRPCClient, GRPCAction, GRPCResult]):
                 total_timeout=config.request_timeout
             ),
             reset_connections=config.reset_connections,
-            tracing_session=tracing_session
+            tracing_session=tracing_session,
+            idle_timeout=config.idle_timeout,
+            max_connection_age=config.max_connection_age,
+            streams_per_connection=config.streams_per_connection
         )
         self.request_type = RequestTypes.GRPC
         self.client_type = self.request_type.capitalize()
@@ -57,6 +61,92 @@ class GRPCClient(BaseClient[MercuryGRPCClient, GRPCAction, GRPCResult]):
         protobuf: Any = None, 
         user: str = None, 
         tags: List[Dict[str, str]] = [],
+        compression: Optional[str]=None,
+        trace: Trace=None
+    ):
+        return await self._execute_stream(
+            url,
+            GRPCStreamTypes.UNARY,
+            headers=headers,
+            data=protobuf,
+            user=user,
+            tags=tags,
+            compression=compression,
+            trace=trace
+        )
+
+    async def client_stream(
+        self,
+        url: str,
+        headers: Dict[str, str] = {},
+        protobufs: List[Any] = [],
+        user: str = None,
+        tags: List[Dict[str, str]] = [],
+        compression: Optional[str]=None,
+        trace: Trace=None
+    ):
+        return await self._execute_stream(
+            url,
+            GRPCStreamTypes.CLIENT,
+            headers=headers,
+            data=protobufs,
+            user=user,
+            tags=tags,
+            compression=compression,
+            trace=trace
+        )
+
+    async def server_stream(
+        self,
+        url: str,
+        headers: Dict[str, str] = {},
+        protobuf: Any = None,
+        user: str = None,
+        tags: List[Dict[str, str]] = [],
+        compression: Optional[str]=None,
+        trace: Trace=None
+    ):
+        return await self._execute_stream(
+            url,
+            GRPCStreamTypes.SERVER,
+            headers=headers,
+            data=protobuf,
+            user=user,
+            tags=tags,
+            compression=compression,
+            trace=trace
+        )
+
+    async def bidi_stream(
+        self,
+        url: str,
+        headers: Dict[str, str] = {},
+        protobufs: List[Any] = [],
+        user: str = None,
+        tags: List[Dict[str, str]] = [],
+        compression: Optional[str]=None,
+        trace: Trace=None
+    ):
+        return await self._execute_stream(
+            url,
+            GRPCStreamTypes.BIDI,
+            headers=headers,
+            data=protobufs,
+            user=user,
+            tags=tags,
+            compression=compression,
+            trace=trace
+        )
+
+    async def _execute_stream(
+        self,
+        url: str,
+        stream_type: str,
+        headers: Dict[str, str] = {},
+        data: Any = None,
+        user: str = None,
+        tags: List[Dict[str, str]] = [],
+        compression: Optional[str]=None,
         trace: Trace=None
     ):
         if trace and self.session.tracing_session is None:
@@ -69,9 +159,11 @@ class GRPCClient(BaseClient[MercuryGRPCClient, GRPCAction, GRPCResult]):
             url,
             method='POST',
             headers=headers,
-            data=protobuf,
+            data=data,
             user=user,
-            tags=tags
+            tags=tags,
+            stream_type=stream_type,
+            compression=compression
         )
 
         return await self._execute_action(request)
\ No newline at end of file
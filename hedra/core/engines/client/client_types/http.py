@@ -1,4 +1,4 @@
-from typing import Dict, Iterator, List, Union
+from typing import Dict, Iterator, List, Optional, Union
 from hedra.core.engines.client.config import Config
 from hedra.core.engines.types.http import (
     MercuryHTTPClient,
@@ -6,6 +6,7 @@ from hedra.core.engines.types.http import (
     HTTPResult
 )
 from hedra.core.engines.types.common.types import RequestTypes
+from hedra.core.engines.types.common.body_policy import BodyPolicies
 from hedra.core.engines.types.common import Timeouts
 from hedra.core.engines.client.store import ActionsStore
 from hedra.core.engines.types.tracing.trace_session import (
@@ -35,7 +36,10 @@ class HTTPClient(BaseClient[MercuryHTTPClient, HTTPAction, HTTPResult]):
                 total_timeout=config.request_timeout
             ),
             reset_connections=config.reset_connections,
-            tracing_session=tracing_session
+            tracing_session=tracing_session,
+            pipeline_depth=config.pipeline_depth,
+            idle_timeout=config.idle_timeout,
+            max_connection_age=config.max_connection_age
         )
         self.request_type = RequestTypes.HTTP
         self.client_type = self.request_type.capitalize()
@@ -61,6 +65,8 @@ class HTTPClient(BaseClient[MercuryHTTPClient, HTTPAction, HTTPResult]):
         user: str = None,
         tags: List[Dict[str, str]] = [],
         redirects: int=3,
+        body_policy: str=BodyPolicies.FULL,
+        body_limit: Optional[int]=None,
         trace: Trace=None
     ):
         if trace and self.session.tracing_session is None:
@@ -76,7 +82,9 @@ class HTTPClient(BaseClient[MercuryHTTPClient, HTTPAction, HTTPResult]):
             data=None,
             user=user,
             tags=tags,
-            redirects=redirects             
+            redirects=redirects,
+            body_policy=body_policy,
+            body_limit=body_limit
         )
 
         return await self._execute_action(request)
@@ -89,6 +97,8 @@ class HTTPClient(BaseClient[MercuryHTTPClient, HTTPAction, HTTPResult]):
         user: str = None,
         tags: List[Dict[str, str]] = [],
         redirects: int=3,
+        body_policy: str=BodyPolicies.FULL,
+        body_limit: Optional[int]=None,
         trace: Trace=None
     ):
         if trace and self.session.tracing_session is None:
@@ -104,7 +114,9 @@ class HTTPClient(BaseClient[MercuryHTTPClient, HTTPAction, HTTPResult]):
             data=data,
             user=user,
             tags=tags,
-            redirects=redirects           
+            redirects=redirects,
+            body_policy=body_policy,
+            body_limit=body_limit
         )
 
         return await self._execute_action(request)
@@ -117,6 +129,8 @@ class HTTPClient(BaseClient[MercuryHTTPClient, HTTPAction, HTTPResult]):
         user: str = None,
         tags: List[Dict[str, str]] = [],
         redirects: int=3,
+        body_policy: str=BodyPolicies.FULL,
+        body_limit: Optional[int]=None,
         trace: Trace=None
     ):
         if trace and self.session.tracing_session is None:
@@ -132,7 +146,9 @@ class HTTPClient(BaseClient[MercuryHTTPClient, HTTPAction, HTTPResult]):
             data=data,
             user=user,
             tags=tags,
-            redirects=redirects
+            redirects=redirects,
+            body_policy=body_policy,
+            body_limit=body_limit
         )
 
         return await self._execute_action(request)
@@ -145,6 +161,8 @@ class HTTPClient(BaseClient[MercuryHTTPClient, HTTPAction, HTTPResult]):
         user: str = None,
         tags: List[Dict[str, str]] = [],
         redirects: int=3,
+        body_policy: str=BodyPolicies.FULL,
+        body_limit: Optional[int]=None,
         trace: Trace=None
     ):
         if trace and self.session.tracing_session is None:
@@ -160,7 +178,9 @@ class HTTPClient(BaseClient[MercuryHTTPClient, HTTPAction, HTTPResult]):
             data=data,
             user=user,
             tags=tags,
-            redirects=redirects
+            redirects=redirects,
+            body_policy=body_policy,
+            body_limit=body_limit
         )
 
         return await self._execute_action(request)
@@ -172,6 +192,8 @@ class HTTPClient(BaseClient[MercuryHTTPClient, HTTPAction, HTTPResult]):
         user: str = None,
         tags: List[Dict[str, str]] = [],
         redirects: int=3,
+        body_policy: str=BodyPolicies.FULL,
+        body_limit: Optional[int]=None,
         trace: Trace=None
     ):
         if trace and self.session.tracing_session is None:
@@ -187,7 +209,9 @@ class HTTPClient(BaseClient[MercuryHTTPClient, HTTPAction, HTTPResult]):
             data=None,
             user=user,
             tags=tags,
-            redirects=redirects
+            redirects=redirects,
+            body_policy=body_policy,
+            body_limit=body_limit
         )
 
         return await self._execute_action(request)
@@ -1,4 +1,4 @@
-from typing import Dict, List, Union, Iterator
+from typing import Dict, List, Optional, Union, Iterator
 from hedra.core.engines.client.config import Config
 from hedra.core.engines.types.http2 import(
     MercuryHTTP2Client,
@@ -6,6 +6,7 @@ from hedra.core.engines.types.http2 import(
     HTTP2Result
 )
 from hedra.core.engines.types.common.types import RequestTypes
+from hedra.core.engines.types.common.body_policy import BodyPolicies
 from hedra.core.engines.types.common import Timeouts
 from hedra.core.engines.client.store import ActionsStore
 from hedra.core.engines.types.tracing.trace_session import (
@@ -36,7 +37,10 @@ class HTTP2Client(BaseClient[MercuryHTTP2Client, HTTP2Action, HTTP2Result]):
                 total_timeout=config.request_timeout
             ),
             reset_connections=config.reset_connections,
-            tracing_session=tracing_session
+            tracing_session=tracing_session,
+            idle_timeout=config.idle_timeout,
+            max_connection_age=config.max_connection_age,
+            streams_per_connection=config.streams_per_connection
         )
         self.request_type = RequestTypes.HTTP2
         self.client_type = self.request_type.capitalize()
@@ -57,6 +61,8 @@ class HTTP2Client(BaseClient[MercuryHTTP2Client, HTTP2Action, HTTP2Result]):
         headers: Dict[str, str] = {}, 
         user: str = None,
         tags: List[Dict[str, str]] = [],
+        body_policy: str=BodyPolicies.FULL,
+        body_limit: Optional[int]=None,
         trace: Trace=None
     ):
         if trace and self.session.tracing_session is None:
@@ -71,7 +77,9 @@ class HTTP2Client(BaseClient[MercuryHTTP2Client, HTTP2Action, HTTP2Result]):
             headers=headers,
             data=None,
             user=user,
-            tags=tags
+            tags=tags,
+            body_policy=body_policy,
+            body_limit=body_limit
         )
         
         return await self._execute_action(request)
@@ -83,6 +91,8 @@ class HTTP2Client(BaseClient[MercuryHTTP2Client, HTTP2Action, HTTP2Result]):
         data: Union[dict, str, bytes, Iterator] = None,
         user: str = None,
         tags: List[Dict[str, str]] = [],
+        body_policy: str=BodyPolicies.FULL,
+        body_limit: Optional[int]=None,
         trace: Trace=None
     ):
         if trace and self.session.tracing_session is None:
@@ -97,7 +107,9 @@ class HTTP2Client(BaseClient[MercuryHTTP2Client, HTTP2Action, HTTP2Result]):
             headers=headers,
             data=data,
             user=user,
-            tags=tags
+            tags=tags,
+            body_policy=body_policy,
+            body_limit=body_limit
         )
     
         return await self._execute_action(request)
@@ -110,6 +122,8 @@ class HTTP2Client(BaseClient[MercuryHTTP2Client, HTTP2Action, HTTP2Result]):
         data: Union[dict, str, bytes, Iterator] = None,
         user: str = None,
         tags: List[Dict[str, str]] = [],
+        body_policy: str=BodyPolicies.FULL,
+        body_limit: Optional[int]=None,
         trace: Trace=None
     ):
         if trace and self.session.tracing_session is None:
@@ -124,7 +138,9 @@ class HTTP2Client(BaseClient[MercuryHTTP2Client, HTTP2Action, HTTP2Result]):
             headers=headers,
             data=data,
             user=user,
-            tags=tags
+            tags=tags,
+            body_policy=body_policy,
+            body_limit=body_limit
         )
 
         return await self._execute_action(request)
@@ -137,6 +153,8 @@ class HTTP2Client(BaseClient[MercuryHTTP2Client, HTTP2Action, HTTP2Result]):
         data: Union[dict, str, bytes, Iterator] = None,
         user: str = None,
         tags: List[Dict[str, str]] = [],
+        body_policy: str=BodyPolicies.FULL,
+        body_limit: Optional[int]=None,
         trace: Trace=None
     ):
         if trace and self.session.tracing_session is None:
@@ -151,7 +169,9 @@ class HTTP2Client(BaseClient[MercuryHTTP2Client, HTTP2Action, HTTP2Result]):
             headers=headers,
             data=data,
             user=user,
-            tags=tags
+            tags=tags,
+            body_policy=body_policy,
+            body_limit=body_limit
         )
 
         return await self._execute_action(request)
@@ -163,6 +183,8 @@ class HTTP2Client(BaseClient[MercuryHTTP2Client, HTTP2Action, HTTP2Result]):
         headers: Dict[str, str] = {}, 
         user: str = None,
         tags: List[Dict[str, str]] = [],
+        body_policy: str=BodyPolicies.FULL,
+        body_limit: Optional[int]=None,
         trace: Trace=None
     ):
         if trace and self.session.tracing_session is None:
@@ -177,7 +199,9 @@ class HTTP2Client(BaseClient[MercuryHTTP2Client, HTTP2Action, HTTP2Result]):
             headers=headers,
             data=None,
             user=user,
-            tags=tags
+            tags=tags,
+            body_policy=body_policy,
+            body_limit=body_limit
         )
 
         return await self._execute_action(request)
@@ -36,7 +36,8 @@ class HTTP3Client(BaseClient[MercuryHTTP3Client, HTTP3Action, HTTP3Result]):
                 total_timeout=config.request_timeout
             ),
             reset_connections=config.reset_connections,
-            tracing_session=tracing_session
+            tracing_session=tracing_session,
+            streams_per_connection=config.streams_per_connection
         )
         self.request_type = RequestTypes.HTTP2
         self.client_type = self.request_type.capitalize()
@@ -32,7 +32,9 @@ class PlaywrightClient(BaseClient[MercuryPlaywrightClient, PlaywrightCommand, Pl
             group_size=config.group_size,
             timeouts=Timeouts(
                 total_timeout=config.request_timeout
-            )
+            ),
+            commands_per_context=config.commands_per_context,
+            max_browser_memory=config.max_browser_memory
         )
 
         self.request_type = RequestTypes.PLAYWRIGHT
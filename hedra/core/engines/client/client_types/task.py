@@ -2,6 +2,7 @@ from typing import (
     Coroutine, 
     Dict, 
     List, 
+    Optional,
     Tuple, 
     Union
 )
@@ -32,7 +33,8 @@ class TaskClient(BaseClient[MercuryTaskRunner, Task, TaskResult]):
             timeouts=Timeouts(
                 total_timeout=config.request_timeout
             ),
-            tracing_session=tracing_session
+            tracing_session=tracing_session,
+            task_workers=config.task_workers
         )
         self.request_type = RequestTypes.TASK
         self.client_type = self.request_type.capitalize()
@@ -46,14 +48,16 @@ class TaskClient(BaseClient[MercuryTaskRunner, Task, TaskResult]):
         task: Coroutine, 
         env: str = None,
         user: str = None,
-        tags: List[Dict[str, str]] = []
+        tags: List[Dict[str, str]] = [],
+        executor: Optional[str] = None
     ) -> Tuple[Task, MercuryTaskRunner]:
         task_action = Task(
             self.next_name,
             task,
             source=env,
             user=user,
-            tags=tags
+            tags=tags,
+            executor=executor
         )
 
         return task_action, self.session
\ No newline at end of file
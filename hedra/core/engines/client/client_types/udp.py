@@ -1,5 +1,5 @@
 import asyncio
-from typing import Dict, Iterator, List, Union
+from typing import Dict, Iterator, List, Optional, Union
 from hedra.core.engines.client.config import Config
 from hedra.core.engines.types.udp import UDPAction, UDPResult, MercuryUDPClient
 from hedra.core.engines.types.common.types import RequestTypes
@@ -19,7 +19,8 @@ class UDPClient(BaseClient[MercuryUDPClient, UDPAction, UDPResult]):
             timeouts=Timeouts(
                 total_timeout=config.request_timeout
             ),
-            reset_connections=config.reset_connections
+            reset_connections=config.reset_connections,
+            batch_datagrams=config.batch_datagrams
         )
         self.request_type = RequestTypes.UDP
         self.client_type = self.request_type.capitalize()
@@ -61,7 +62,9 @@ class UDPClient(BaseClient[MercuryUDPClient, UDPAction, UDPResult]):
         wait_for_resonse: bool = False,
         data: Union[dict, str, bytes, Iterator] = None,
         user: str = None,
-        tags: List[Dict[str, str]] = []
+        tags: List[Dict[str, str]] = [],
+        correlation_offset: Optional[int] = None,
+        correlation_length: int = 2
     ):
 
         request = UDPAction(
@@ -70,7 +73,9 @@ class UDPClient(BaseClient[MercuryUDPClient, UDPAction, UDPResult]):
             wait_for_response=wait_for_resonse,
             data=data,
             user=user,
-            tags=tags           
+            tags=tags,
+            correlation_offset=correlation_offset,
+            correlation_length=correlation_length
         )
 
         return await self._execute_action(request)
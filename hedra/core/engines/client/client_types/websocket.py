@@ -24,7 +24,9 @@ class WebsocketClient(BaseClient[MercuryWebsocketClient, WebsocketAction, Websoc
             timeouts=Timeouts(
                 total_timeout=config.request_timeout
             ),
-            reset_connections=config.reset_connections
+            reset_connections=config.reset_connections,
+            idle_timeout=config.idle_timeout,
+            max_connection_age=config.max_connection_age
         )
         self.request_type = RequestTypes.WEBSOCKET
         self.client_type = self.request_type.capitalize()
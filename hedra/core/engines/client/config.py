@@ -31,6 +31,19 @@ class Config:
         self.request_timeout = kwargs.get('request_timeout', 60)
         self.reset_connections = kwargs.get('reset_connections')
         self.graceful_stop = kwargs.get('graceful_stop', 1)
+        self.streaming_dispatch = kwargs.get('streaming_dispatch', False)
+        self.max_in_flight: Union[int, None] = kwargs.get('max_in_flight')
+        self.columnar_results = kwargs.get('columnar_results', False)
+        self.shared_memory_results = kwargs.get('shared_memory_results', False)
+        self.pipeline_depth = kwargs.get('pipeline_depth', 1)
+        self.warm_connections = kwargs.get('warm_connections', 0)
+        self.idle_timeout: Union[float, None] = kwargs.get('idle_timeout')
+        self.max_connection_age: Union[float, None] = kwargs.get('max_connection_age')
+        self.streams_per_connection = kwargs.get('streams_per_connection', 1)
+        self.batch_datagrams = kwargs.get('batch_datagrams', False)
+        self.worker_aggregation = kwargs.get('worker_aggregation', False)
+        self.monitor_mode = kwargs.get('monitor_mode', 'system')
+        self.task_workers: Union[int, None] = kwargs.get('task_workers')
         self.optimized = False
 
         if self.request_timeout > self.total_time:
@@ -43,6 +56,8 @@ class Config:
         self.permissions: List[str] = kwargs.get('permissions', [])
         self.color_scheme = kwargs.get('color_scheme')
         self.group_size = kwargs.get('group_size')
+        self.commands_per_context: Union[int, None] = kwargs.get('commands_per_context')
+        self.max_browser_memory: Union[int, None] = kwargs.get('max_browser_memory')
         self.playwright_options = kwargs.get('playwright_options', {})
         self.experiment: Dict[str, Union[str, int, List[float]]] = kwargs.get('experiment', {})
         self.tracing: Union[TracingConfig, None] = kwargs.get('tracing')
@@ -71,6 +86,19 @@ class Config:
             'request_timeout': self.request_timeout,
             'reset_connections': self.reset_connections,
             'graceful_stop': self.graceful_stop,
+            'streaming_dispatch': self.streaming_dispatch,
+            'max_in_flight': self.max_in_flight,
+            'columnar_results': self.columnar_results,
+            'shared_memory_results': self.shared_memory_results,
+            'pipeline_depth': self.pipeline_depth,
+            'warm_connections': self.warm_connections,
+            'idle_timeout': self.idle_timeout,
+            'max_connection_age': self.max_connection_age,
+            'streams_per_connection': self.streams_per_connection,
+            'batch_datagrams': self.batch_datagrams,
+            'worker_aggregation': self.worker_aggregation,
+            'monitor_mode': self.monitor_mode,
+            'task_workers': self.task_workers,
             'optimized': self.optimized,
             'browser_type': self.browser_type,
             'device_type': self.device_type,
@@ -79,6 +107,8 @@ class Config:
             'permissions': self.permissions,
             'color_scheme': self.color_scheme,
             'group_size': self.group_size,
+            'commands_per_context': self.commands_per_context,
+            'max_browser_memory': self.max_browser_memory,
             'playwright_options': self.playwright_options,
             'experiment': self.experiment,
             'trace': trace,
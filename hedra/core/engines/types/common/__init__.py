@@ -1,3 +1,4 @@
 from .metadata import Metadata
+from .resolver import ResolverCache, resolver_cache
 from .url import URL
 from .timeouts import Timeouts
\ No newline at end of file
@@ -32,6 +32,9 @@ class BaseEngine(Generic[A, R]):
             self.waiter = asyncio.get_event_loop().create_future()
             await self.waiter
 
+    async def warm(self, action: A, connections: int) -> int:
+        return 0
+
     async def execute_before(self, action: A) -> Coroutine[Any, Any, A]:
         action.action_args = {
             'action': action
@@ -0,0 +1,50 @@
+from typing import Optional
+
+
+class BodyPolicies:
+    DISCARD='DISCARD'
+    KEEP_FIRST='KEEP_FIRST'
+    FULL='FULL'
+
+
+class BodyPolicy:
+
+    __slots__ = (
+        'policy',
+        'limit',
+        'max_size'
+    )
+
+    def __init__(
+        self, 
+        policy: str=BodyPolicies.FULL, 
+        limit: Optional[int]=None
+    ) -> None:
+        self.policy = policy.upper()
+        self.limit = limit
+        self.max_size: Optional[int] = None
+
+        if self.policy == BodyPolicies.DISCARD:
+            self.max_size = 0
+
+        elif self.policy == BodyPolicies.KEEP_FIRST:
+
+            if limit is None or limit < 0:
+                raise Exception('Err. - the KEEP_FIRST body policy requires a non-negative body limit.')
+
+            self.max_size = limit
+
+        elif self.policy != BodyPolicies.FULL:
+            raise Exception(f'Err. - unknown body policy - {policy}.')
+
+    def keep(self, body: bytearray, data: bytes) -> int:
+        if self.max_size is None:
+            body.extend(data)
+
+        else:
+            remaining = self.max_size - len(body)
+            if remaining > 0:
+                with memoryview(data) as data_view:
+                    body.extend(data_view[:remaining])
+
+        return len(data)
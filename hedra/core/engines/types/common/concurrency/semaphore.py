@@ -60,7 +60,7 @@ class Semaphore(_ContextManagerMixin, mixins._LoopBoundMixin):
 
     def locked(self):
         """Returns True if semaphore can not be acquired immediately."""
-        return self._value == 0
+        return self._value <= 0
 
     async def acquire(self):
         """Acquire a semaphore.
@@ -92,4 +92,16 @@ class Semaphore(_ContextManagerMixin, mixins._LoopBoundMixin):
         become larger than zero again, wake up that coroutine.
         """
         self._value += 1
-        self._wake_up_next()
\ No newline at end of file
+        if self._value > 0:
+            self._wake_up_next()
+
+    def resize(self, delta: int):
+        """Grow or shrink the number of available slots in place.
+        Shrinking below the number of held slots is allowed - the
+        counter goes negative and acquire() blocks until enough
+        holders have released.
+        """
+        self._value += delta
+
+        for _ in range(min(delta, self._value)):
+            self._wake_up_next()
\ No newline at end of file
@@ -0,0 +1,134 @@
+import time
+from collections import deque
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    Generic,
+    Hashable,
+    Iterator,
+    Optional,
+    TypeVar
+)
+
+
+C = TypeVar('C')
+
+
+class HostConnectionPool(Generic[C]):
+
+    __slots__ = (
+        'size',
+        'idle_timeout',
+        'max_connection_age',
+        'hosts',
+        'idle_count',
+        'last_reaped'
+    )
+
+    def __init__(
+        self,
+        size: int,
+        idle_timeout: Optional[float]=None,
+        max_connection_age: Optional[float]=None
+    ) -> None:
+        self.size = size
+        self.idle_timeout = idle_timeout
+        self.max_connection_age = max_connection_age
+        self.hosts: Dict[Hashable, Deque[C]] = {}
+        self.idle_count = 0
+        self.last_reaped = time.monotonic()
+
+    def __iter__(self) -> Iterator[C]:
+        for idle in self.hosts.values():
+            for connection in idle:
+                yield connection
+
+    def healthy(self, connection: Any, now: float) -> bool:
+
+        if connection.reusable is False:
+            return False
+
+        if self.idle_timeout and now - connection.last_used >= self.idle_timeout:
+            return False
+
+        if self.max_connection_age and now - connection.created >= self.max_connection_age:
+            return False
+
+        return True
+
+    def acquire(self, host_key: Hashable) -> Optional[C]:
+        idle = self.hosts.get(host_key)
+        if not idle:
+            return None
+
+        now = time.monotonic()
+
+        # Idle connections are used LIFO so the warmest socket is reused
+        # first and the coldest are left for reaping.
+        while idle:
+            connection = idle.pop()
+            self.idle_count -= 1
+
+            if self.healthy(connection, now):
+                return connection
+
+            connection.abort()
+
+        return None
+
+    def release(self, host_key: Hashable, connection: C) -> None:
+        now = time.monotonic()
+
+        if self.idle_count >= self.size or self.healthy(connection, now) is False:
+            connection.abort()
+
+        else:
+            connection.last_used = now
+
+            idle = self.hosts.get(host_key)
+            if idle is None:
+                idle = deque()
+                self.hosts[host_key] = idle
+
+            idle.append(connection)
+            self.idle_count += 1
+
+        if self.idle_timeout and now - self.last_reaped >= self.idle_timeout:
+            self.reap(now)
+
+    def reap(self, now: Optional[float]=None) -> int:
+
+        if now is None:
+            now = time.monotonic()
+
+        reaped = 0
+        for host_key, idle in list(self.hosts.items()):
+
+            # The left of each deque holds the longest idle connections.
+            while idle and self.healthy(idle[0], now) is False:
+                idle.popleft().abort()
+                reaped += 1
+
+            if len(idle) == 0:
+                del self.hosts[host_key]
+
+        self.idle_count -= reaped
+        self.last_reaped = now
+
+        return reaped
+
+    def resize(self, size: int) -> None:
+        self.size = size
+
+        while self.idle_count > self.size:
+            idle = max(self.hosts.values(), key=len)
+            idle.popleft().abort()
+            self.idle_count -= 1
+
+    def clear(self) -> None:
+        for connection in self:
+            connection.abort()
+
+        self.hosts.clear()
+        self.idle_count = 0
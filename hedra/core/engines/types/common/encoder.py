@@ -6,6 +6,7 @@ hpack/hpack
 Implements the HPACK header compression algorithm as detailed by the IETF.
 """
 
+from typing import Dict, Tuple
 from .hpack.table import HeaderTable, table_entry_size
 from .hpack.exceptions import (
     HPACKDecodingError, OversizedHeaderListError, InvalidTableSizeError
@@ -137,10 +138,16 @@ class Encoder:
     HTTP/2 header blocks.
     """
 
+    # Bounds the number of distinct header sets a connection keeps
+    # pre-encoded blocks for.
+    MAX_CACHED_BLOCKS = 1024
+
     __slots__ = (
         'header_table',
         'huffman_coder',
-        'table_size_changes'
+        'table_size_changes',
+        'table_version',
+        'cached_blocks'
     )
 
     def __init__(self):
@@ -150,6 +157,11 @@ class Encoder:
         )
         self.table_size_changes = []
 
+        # Bumped whenever the dynamic table may have changed, so cached
+        # blocks referencing it can be invalidated.
+        self.table_version = 0
+        self.cached_blocks: Dict[Tuple, Tuple[int, bytes]] = {}
+
     @property
     def header_table_size(self):
         """
@@ -162,6 +174,33 @@ class Encoder:
         self.header_table.maxsize = value
         if self.header_table.resized:
             self.table_size_changes.append(value)
+            self.table_version += 1
+
+    def encode_cached(self, headers: Tuple, huffman=True) -> bytes:
+        """
+        Encodes a header set, reusing the block from a previous call if the
+        dynamic table has not changed since.
+
+        Blocks are only cached when encoding them left the dynamic table
+        untouched - i.e. every header was already indexed - as only those
+        blocks can be replayed without the peer's table drifting from ours.
+        ``headers`` must be hashable (a tuple of header tuples).
+        """
+        cached = self.cached_blocks.get(headers)
+        if cached is not None and cached[0] == self.table_version:
+            return cached[1]
+
+        table_version = self.table_version
+        header_block = self.encode(headers, huffman=huffman)
+
+        if self.table_version == table_version:
+
+            if len(self.cached_blocks) >= self.MAX_CACHED_BLOCKS:
+                self.cached_blocks.clear()
+
+            self.cached_blocks[headers] = (table_version, header_block)
+
+        return header_block
 
     def encode(self, headers, huffman=True):
         """
@@ -226,6 +265,7 @@ class Encoder:
         if self.header_table.resized:
             header_block.append(self._encode_table_size_change())
             self.header_table.resized = False
+            self.table_version += 1
 
         # Add each header to the header block
         for header in headers:
@@ -264,6 +304,7 @@ class Encoder:
             encoded = self._encode_literal(name, value, indexbit, huffman)
             if not sensitive:
                 self.header_table.add(name, value)
+                self.table_version += 1
             return encoded
 
         # The header is in the table, break out the values. If we matched
@@ -285,6 +326,7 @@ class Encoder:
             )
             if not sensitive:
                 self.header_table.add(name, value)
+                self.table_version += 1
 
         return encoded
 
@@ -87,34 +87,23 @@ def decode_huffman(huffman_string):
     state = 0
     flags = 0
     decoded_bytes = bytearray()
+    byte_rows = HUFFMAN_BYTE_ROWS
 
-    # Perversely, bytearrays are a lot more convenient across Python 2 and
-    # Python 3 because they behave *the same way* on both platforms. Given that
-    # we really do want numerical bytes when we iterate here, let's use a
-    # bytearray.
-    huffman_string = bytearray(huffman_string)
-
-    # This loop is unrolled somewhat. Because we use a nibble, not a byte, we
-    # need to handle each nibble twice. We unroll that: it makes the loop body
-    # a bit longer, but that's ok.
+    # Both nibbles of each input byte are resolved with a single lookup in
+    # a row derived from the nibble table below. Rows are built the first
+    # time a state is reached at a byte boundary.
     for input_byte in huffman_string:
-        index = (state * 16) + (input_byte >> 4)
-        state, flags, output_byte = HUFFMAN_TABLE[index]
-
-        if flags & HUFFMAN_FAIL:
-            raise HPACKDecodingError("Invalid Huffman String")
-
-        if flags & HUFFMAN_EMIT_SYMBOL:
-            decoded_bytes.append(output_byte)
+        row = byte_rows[state]
+        if row is None:
+            row = _build_byte_row(state)
 
-        index = (state * 16) + (input_byte & 0x0F)
-        state, flags, output_byte = HUFFMAN_TABLE[index]
+        state, flags, output_bytes = row[input_byte]
 
         if flags & HUFFMAN_FAIL:
             raise HPACKDecodingError("Invalid Huffman String")
 
-        if flags & HUFFMAN_EMIT_SYMBOL:
-            decoded_bytes.append(output_byte)
+        if output_bytes:
+            decoded_bytes.extend(output_bytes)
 
     if not (flags & HUFFMAN_COMPLETE):
         raise HPACKDecodingError("Incomplete Huffman string")
@@ -122,6 +111,40 @@ def decode_huffman(huffman_string):
     return bytes(decoded_bytes)
 
 
+def _build_byte_row(state):
+    """
+    Folds the two nibble transitions for every possible input byte from
+    ``state`` into one ``(state, flags, output_bytes)`` entry.
+    """
+    row = []
+
+    for input_byte in range(256):
+        high_state, high_flags, high_output = HUFFMAN_TABLE[
+            (state * 16) + (input_byte >> 4)
+        ]
+
+        low_state, low_flags, low_output = HUFFMAN_TABLE[
+            (high_state * 16) + (input_byte & 0x0F)
+        ]
+
+        output_bytes = bytearray()
+        if high_flags & HUFFMAN_EMIT_SYMBOL:
+            output_bytes.append(high_output)
+
+        if low_flags & HUFFMAN_EMIT_SYMBOL:
+            output_bytes.append(low_output)
+
+        # Completion only matters after the final nibble, failure after
+        # either of them.
+        flags = low_flags | (high_flags & HUFFMAN_FAIL)
+
+        row.append((low_state, flags, bytes(output_bytes)))
+
+    HUFFMAN_BYTE_ROWS[state] = row
+
+    return row
+
+
 # Some decoder flags to control state transitions.
 HUFFMAN_COMPLETE = 1
 HUFFMAN_EMIT_SYMBOL = (1 << 1)
@@ -4737,3 +4760,7 @@ HUFFMAN_TABLE = [
     (0, HUFFMAN_FAIL, 0),
     (0, HUFFMAN_FAIL, 0),
 ]
+
+
+# One lazily built row of 256 byte transitions per state of the table above.
+HUFFMAN_BYTE_ROWS = [None] * (len(HUFFMAN_TABLE) // 16)
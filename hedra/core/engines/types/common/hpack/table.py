@@ -128,7 +128,6 @@ class HeaderTable:
         self.resized = False
         self.dynamic_entries = deque()
 
-    @lru_cache(maxsize=4096)
     def get_by_index(self, index):
         """
         Returns the entry specified by index
@@ -8,6 +8,7 @@ from asyncio import (
 )
 from asyncio.exceptions import LimitOverrunError
 from .constants import _DEFAULT_LIMIT
+from .response_head import ResponseHead
 
 
 class Reader:
@@ -143,6 +144,58 @@ class Reader:
         self._maybe_resume_transport()
         return data
     
+    async def readexactly(self, n):
+
+        if self._exception is not None:
+            raise self._exception
+
+        while len(self._buffer) < n:
+
+            if self._eof:
+                raise Exception('Connection closed.')
+
+            await self._wait_for_data('readexactly')
+
+        data = bytes(self._buffer[:n])
+        del self._buffer[:n]
+
+        self._maybe_resume_transport()
+        return data
+    
+    async def readinto(self, n, body: bytearray=None, max_size: int=None):
+
+        if self._exception is not None:
+            raise self._exception
+
+        remaining = n
+        while remaining > 0:
+
+            if not self._buffer:
+
+                if self._eof:
+                    raise Exception('Connection closed.')
+
+                await self._wait_for_data('readinto')
+                continue
+
+            read_size = min(remaining, len(self._buffer))
+
+            if body is not None:
+
+                keep_size = read_size
+                if max_size is not None:
+                    keep_size = min(read_size, max_size - len(body))
+
+                if keep_size > 0:
+                    with memoryview(self._buffer) as buffer_view:
+                        body.extend(buffer_view[:keep_size])
+
+            del self._buffer[:read_size]
+            remaining -= read_size
+
+        self._maybe_resume_transport()
+        return n
+    
     async def readline_fast(self, sep=b'\n'):
         seplen = len(sep)
         if self._exception is not None:
@@ -172,6 +225,52 @@ class Reader:
         self._maybe_resume_transport()
         return bytes(chunk)
 
+    async def read_response_head(self) -> ResponseHead:
+        """Read a complete HTTP/1.x response head (status line and headers).
+
+        The buffer is scanned once for the blank line ending the head,
+        resuming from where the previous scan stopped as data arrives.
+        Interim 1xx responses (other than 101) are consumed and skipped.
+        """
+        offset = 0
+
+        while True:
+
+            if self._exception is not None:
+                raise self._exception
+
+            head_end = self._buffer.find(b'\r\n\r\n', offset)
+            separator_length = 4
+
+            if head_end < 0:
+                head_end = self._buffer.find(b'\n\n', offset)
+                separator_length = 2
+
+            if head_end < 0:
+                offset = max(len(self._buffer) - 3, 0)
+
+                if offset > self._limit:
+                    raise LimitOverrunError(
+                        'Response head exceeds the limit',
+                        offset
+                    )
+
+                if self._eof:
+                    raise Exception('Connection closed.')
+
+                await self._wait_for_data('read_response_head')
+                continue
+
+            head = ResponseHead(bytes(self._buffer[:head_end]))
+            del self._buffer[:head_end + separator_length]
+
+            if 100 <= head.status < 200 and head.status != 101:
+                offset = 0
+                continue
+
+            self._maybe_resume_transport()
+            return head
+
     async def readuntil(self, separator=b'\n'):
         """Read data from the stream until ``separator`` is found.
         On success, the data and separator will be removed from the
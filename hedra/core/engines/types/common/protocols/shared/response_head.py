@@ -0,0 +1,98 @@
+from typing import Dict, Optional
+
+
+class ResponseHead:
+
+    __slots__ = (
+        'status_line',
+        'status',
+        'content_length',
+        'chunked',
+        'keep_alive',
+        'raw',
+        '_lowered',
+        '_headers'
+    )
+
+    '''
+    Status line and framing fields of an HTTP/1.x response, parsed in a
+    single pass over the raw head. The full header dict is only built if
+    something asks for it.
+    '''
+
+    def __init__(self, raw: bytes) -> None:
+        self.raw = raw
+        self._lowered = raw.lower()
+        self._headers: Optional[Dict[bytes, bytes]] = None
+
+        status_end = raw.find(b'\n')
+        if status_end < 0:
+            status_end = len(raw)
+
+        self.status_line = raw[:status_end + 1]
+
+        try:
+            self.status = int(self.status_line.split(None, 2)[1])
+
+        except (IndexError, ValueError):
+            raise Exception(f'Invalid HTTP status line - {self.status_line}')
+
+        content_length = self.get(b'content-length')
+        self.content_length = int(content_length) if content_length else None
+
+        transfer_encoding = self._find(b'\ntransfer-encoding:')
+        self.chunked = transfer_encoding is not None and b'chunked' in transfer_encoding
+
+        connection = self._find(b'\nconnection:') or b''
+
+        if self._lowered.startswith(b'http/1.0'):
+            self.keep_alive = b'keep-alive' in connection
+
+        else:
+            self.keep_alive = b'close' not in connection
+
+    @property
+    def headers(self) -> Dict[bytes, bytes]:
+
+        if self._headers is None:
+            headers: Dict[bytes, bytes] = {}
+
+            for line in self.raw.split(b'\n')[1:]:
+                key, sep, value = line.partition(b':')
+
+                if sep:
+                    headers[key.strip().lower()] = value.strip()
+
+            self._headers = headers
+
+        return self._headers
+
+    def get(self, key: bytes, default: Optional[bytes]=None) -> Optional[bytes]:
+
+        if self._headers is not None:
+            return self._headers.get(key, default)
+
+        start = self._lowered.find(b'\n' + key + b':')
+        if start < 0:
+            return default
+
+        start += len(key) + 2
+        end = self.raw.find(b'\n', start)
+        if end < 0:
+            end = len(self.raw)
+
+        return self.raw[start:end].strip()
+
+    def _find(self, prefix: bytes) -> Optional[bytes]:
+        # Returns the lowered value of the header, for case-insensitive
+        # token checks.
+        start = self._lowered.find(prefix)
+        if start < 0:
+            return None
+
+        start += len(prefix)
+        end = self._lowered.find(b'\n', start)
+        if end < 0:
+            end = len(self._lowered)
+
+        return self._lowered[start:end]
@@ -1,21 +1,25 @@
 import asyncio
 import socket
+import ssl
 from typing import Optional, Callable
 from hedra.core.engines.types.common.types import RequestTypes
 from hedra.core.engines.types.common.protocols.shared.reader import Reader
 from hedra.core.engines.types.common.protocols.shared.writer import Writer
 from .protocol import UDPProtocol
+from .quic_endpoint import QuicEndpoint
 from .quic_protocol import QuicProtocol
 
 try:
     from aioquic.h3.connection import H3_ALPN
     from aioquic.quic.connection import QuicConnection
     from aioquic.quic.configuration import QuicConfiguration
+    from aioquic.tls import SessionTicket
 
 except ImportError:
     H3_ALPN = []
     QuicConnection = object
     QuicConfiguration = object
+    SessionTicket = object
 
 from hedra.core.engines.types.common.protocols.shared.constants import _DEFAULT_LIMIT
 
@@ -67,58 +71,65 @@ class UDPConnection:
         configuration: Optional[QuicConfiguration] = None,
         stream_handler: Optional[QuicStreamHandler] = None,
         local_port: int = 0,
+        endpoint: Optional[QuicEndpoint] = None,
+        session_ticket: Optional[SessionTicket] = None,
+        session_ticket_handler: Optional[Callable[[SessionTicket], None]] = None,
+        early_data: bool = False
     ):
         
         _, _, _, _, address = socket_config
         if len(address) == 2:
             address = ("::ffff:" + address[0], address[1], 0, 0)
 
-        local_host = "::"
-
-        # keep compatibility for Python 3.7 on Windows
-        if not hasattr(socket, "IPPROTO_IPV6"):
-            socket.IPPROTO_IPV6 = 41
-
-        configuration = QuicConfiguration(
-            is_client=True, alpn_protocols=H3_ALPN
-        )
+        if configuration is None:
+            configuration = QuicConfiguration(
+                is_client=True, 
+                alpn_protocols=H3_ALPN,
+                verify_mode=ssl.CERT_NONE
+            )
 
         # prepare QUIC connection
         if configuration.server_name is None:
             configuration.server_name = server_name
+
+        configuration.session_ticket = session_ticket
             
         connection = QuicConnection(
             configuration=configuration, 
-            session_ticket_handler=lambda handler: None
+            session_ticket_handler=session_ticket_handler or (lambda ticket: None)
         )
 
-        # explicitly enable IPv4/IPv6 dual stack
-        self.socket = socket.socket(socket.AF_INET6, socket.SOCK_DGRAM)
-        completed = False
-        try:
-            self.socket.setsockopt(socket.IPPROTO_IPV6, socket.IPV6_V6ONLY, 0)
-            self.socket.setblocking(False)
-            self.socket.bind((local_host, local_port, 0, 0))
-            completed = True
-        finally:
-            if not completed:
-                self.socket.close()
+        if endpoint is None:
+            endpoint = QuicEndpoint(configuration.connection_id_length)
+            
+        if endpoint.connected is False:
+            await endpoint.open(local_port=local_port)
+
         # connect
         self.loop = asyncio.get_event_loop()
-        _, protocol = await self.loop.create_datagram_endpoint(
-            lambda: QuicProtocol(
-                connection, 
-                stream_handler=stream_handler,
-                loop=self.loop
-            ),
-            sock=self.socket,
+        protocol = QuicProtocol(
+            connection, 
+            stream_handler=stream_handler,
+            loop=self.loop
         )
 
+        endpoint.attach(protocol)
 
         protocol.init_connection()
 
         protocol.connect(address)
-        await protocol.wait_connected()
+
+        # With a resumable ticket the client has 0-RTT keys as soon as
+        # connect() returns, so requests may be written before the
+        # handshake completes.
+        if early_data is False or protocol.early_data_ready is False:
+            try:
+                await protocol.wait_connected()
+
+            except BaseException as connection_error:
+                protocol.close()
+                endpoint.detach(protocol)
+                raise connection_error
 
         return protocol
     
@@ -91,7 +91,7 @@ class UDPProtocol(FlowControlMixin, Protocol):
     def error_received(self, exc):
         raise exc
 
-    def datagram_received(self, data):
+    def datagram_received(self, data, addr=None):
         reader = self._stream_reader
         if reader is not None:
             reader.feed_data(data)
@@ -0,0 +1,137 @@
+from __future__ import annotations
+import asyncio
+import socket
+from typing import Dict, Optional, Text, Union
+from .quic_protocol import QuicProtocol
+
+try:
+    from aioquic.quic.connection import NetworkAddress
+
+except ImportError:
+    NetworkAddress = tuple
+
+
+class QuicEndpoint(asyncio.DatagramProtocol):
+
+    __slots__ = (
+        'loop',
+        'socket',
+        'transport',
+        'connection_id_length',
+        'connection_ids',
+        'unmatched',
+        'closed'
+    )
+
+    '''
+    One dual-stack UDP socket shared by every QUIC connection in a pool.
+    Inbound datagrams are routed to their connection by destination
+    connection ID, which the endpoint tracks as connections issue and
+    retire them.
+    '''
+
+    def __init__(self, connection_id_length: int=8) -> None:
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.socket: Optional[socket.socket] = None
+        self.transport: Optional[asyncio.DatagramTransport] = None
+        self.connection_id_length = connection_id_length
+        self.connection_ids: Dict[bytes, QuicProtocol] = {}
+        self.unmatched = 0
+        self.closed = False
+
+    @property
+    def connected(self) -> bool:
+        return self.transport is not None and self.closed is False
+
+    async def open(self, local_host: str='::', local_port: int=0) -> None:
+
+        if self.connected:
+            return
+
+        # keep compatibility for Python 3.7 on Windows
+        if not hasattr(socket, "IPPROTO_IPV6"):
+            socket.IPPROTO_IPV6 = 41
+
+        # explicitly enable IPv4/IPv6 dual stack
+        self.socket = socket.socket(socket.AF_INET6, socket.SOCK_DGRAM)
+        completed = False
+        try:
+            self.socket.setsockopt(socket.IPPROTO_IPV6, socket.IPV6_V6ONLY, 0)
+            self.socket.setblocking(False)
+            self.socket.bind((local_host, local_port, 0, 0))
+            completed = True
+        finally:
+            if not completed:
+                self.socket.close()
+
+        self.loop = asyncio.get_event_loop()
+        await self.loop.create_datagram_endpoint(
+            lambda: self,
+            sock=self.socket
+        )
+
+        self.closed = False
+
+    def attach(self, protocol: QuicProtocol) -> None:
+        protocol.connection_made(self.transport)
+
+        protocol._connection_id_issued_handler = lambda connection_id: self.register(
+            connection_id,
+            protocol
+        )
+        protocol._connection_id_retired_handler = self.retire
+        protocol._connection_terminated_handler = lambda: self.detach(protocol)
+
+        self.register(protocol._quic.host_cid, protocol)
+
+    def register(self, connection_id: bytes, protocol: QuicProtocol) -> None:
+        self.connection_ids[connection_id] = protocol
+
+    def retire(self, connection_id: bytes) -> None:
+        self.connection_ids.pop(connection_id, None)
+
+    def detach(self, protocol: QuicProtocol) -> None:
+        retired = [
+            connection_id for connection_id, registered in self.connection_ids.items() if registered is protocol
+        ]
+
+        for connection_id in retired:
+            del self.connection_ids[connection_id]
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self.transport = transport
+
+    def datagram_received(self, data: Union[bytes, Text], addr: NetworkAddress) -> None:
+
+        if len(data) < 1 + self.connection_id_length:
+            return
+
+        if data[0] & 0x80:
+            # Long header - the destination connection ID is length
+            # prefixed after the version.
+            connection_id = data[6:6 + data[5]]
+
+        else:
+            connection_id = data[1:1 + self.connection_id_length]
+
+        protocol = self.connection_ids.get(connection_id)
+        if protocol is None:
+            self.unmatched += 1
+            return
+
+        protocol.datagram_received(data, addr)
+
+    def error_received(self, exc: Exception) -> None:
+        pass
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        self.closed = True
+        self.transport = None
+
+    def close(self) -> None:
+
+        if self.transport:
+            self.transport.close()
+
+        self.connection_ids.clear()
+        self.closed = True
@@ -61,6 +61,7 @@ try:
     )
 
     from aioquic.quic.connection import stream_is_unidirectional
+    from aioquic.tls import Epoch
 
 except ImportError:
     pylsqpack = object
@@ -87,6 +88,7 @@ except ImportError:
     QuicEvent = object
     StreamDataReceived = object
     stream_is_unidirectional = dummy_stream_is_unidirectional
+    Epoch = object
 
 
 QuicConnectionIdHandler = Callable[[bytes], None]
@@ -387,6 +389,7 @@ class QuicProtocol(asyncio.DatagramProtocol):
         '_received_settings',
         '_sent_settings',
         'responses',
+        'last_received',
         '_is_closed'
     )
 
@@ -451,6 +454,7 @@ class QuicProtocol(asyncio.DatagramProtocol):
         self._received_settings: Optional[Dict[int, int]] = None
         self._sent_settings: Optional[Dict[int, int]] = None
         self.responses: Dict[int, ResponseFrameCollection] = {} 
+        self.last_received: float = 0
         self._is_closed = False
         
 
@@ -529,6 +533,87 @@ class QuicProtocol(asyncio.DatagramProtocol):
         if stream_id not in self._stream:
             self._stream[stream_id] = H3Stream(stream_id)
         return self._stream[stream_id]
+
+    @property
+    def connected(self) -> bool:
+        return self._connected
+
+    @property
+    def closed(self) -> bool:
+        return self._is_closed or self._closed.is_set()
+
+    @property
+    def early_data_ready(self) -> bool:
+        """
+        Whether 0-RTT keys from a resumed session are available.
+        """
+        return self._connected is False and self._quic._cryptos[Epoch.ZERO_RTT].send.is_valid()
+
+    @property
+    def session_resumed(self) -> bool:
+        return self._quic.tls is not None and self._quic.tls.session_resumed
+
+    @property
+    def early_data_accepted(self) -> bool:
+        return self._quic.tls is not None and self._quic.tls.early_data_accepted
+
+    def send_request(
+        self,
+        headers: Headers,
+        data: Optional[bytes]=None
+    ) -> Tuple[int, asyncio.Future[ResponseFrameCollection]]:
+        """
+        Open a request stream, write HEADERS (and DATA) to it and return
+        the stream ID with a future for the response.
+        """
+        stream_id = self._quic.get_next_available_stream_id()
+
+        stream = self._get_or_create_stream(stream_id)
+        if stream.headers_send_state == HeadersState.AFTER_TRAILERS:
+            raise Exception("HEADERS frame is not allowed in this state")
+
+        encoder, frame_data = self._encoder.encode(stream_id, headers)
+
+        self._encoder_bytes_sent += len(encoder)
+        self._quic.send_stream_data(self._local_encoder_stream_id, encoder)
+
+        # update state and send headers
+        if stream.headers_send_state == HeadersState.INITIAL:
+            stream.headers_send_state = HeadersState.AFTER_HEADERS
+        else:
+            stream.headers_send_state = HeadersState.AFTER_TRAILERS
+
+        self._quic.send_stream_data(
+            stream_id,
+            encode_frame(FrameType.HEADERS, frame_data),
+            not data
+        )
+
+        if data:
+            self._quic.send_stream_data(
+                stream_id,
+                encode_frame(FrameType.DATA, data),
+                True
+            )
+
+        waiter = self._loop.create_future()
+        self._request_events[stream_id] = deque()
+        self._request_waiter[stream_id] = waiter
+
+        # Requests written in the same loop iteration share packets.
+        self._transmit_soon()
+
+        return stream_id, waiter
+
+    def release_stream(self, stream_id: int) -> None:
+        """
+        Drop the per-stream state for a finished request so long lived
+        connections do not accumulate it.
+        """
+        self._stream.pop(stream_id, None)
+        self._request_waiter.pop(stream_id, None)
+        self._request_events.pop(stream_id, None)
+        self.responses.pop(stream_id, None)
     
 
     async def create_stream(
@@ -603,7 +688,8 @@ class QuicProtocol(asyncio.DatagramProtocol):
         self._transport = cast(asyncio.DatagramTransport, transport)
 
     def datagram_received(self, data: Union[bytes, Text], addr: NetworkAddress) -> None:
-        self._quic.receive_datagram(cast(bytes, data), addr, now=self._loop.time())
+        self.last_received = self._loop.time()
+        self._quic.receive_datagram(cast(bytes, data), addr, now=self.last_received)
         self._process_events()
         self.transmit()
 
@@ -846,6 +932,10 @@ class QuicProtocol(asyncio.DatagramProtocol):
 
                 self.responses[http_event.stream_id].headers_frame = http_event
 
+                request_waiter = self._request_waiter.get(http_event.stream_id)
+                if http_event.stream_ended and request_waiter and request_waiter.done() is False:
+                    request_waiter.set_result(self.responses.pop(http_event.stream_id))
+
                 if http_event.push_id in self.pushes:
                     # push
                     self.pushes[http_event.push_id].append(http_event)
@@ -860,7 +950,9 @@ class QuicProtocol(asyncio.DatagramProtocol):
                 request_waiter = self._request_waiter.get(http_event.stream_id)
 
                 if http_event.stream_ended and request_waiter is None:
-                    raise Exception('Err. - Stream failed')
+                    # The request was released (e.g. it timed out) before
+                    # its response finished.
+                    self.responses.pop(http_event.stream_id, None)
                 
                 elif http_event.stream_ended and request_waiter.done() is False:
                     request_waiter.set_result(self.responses.pop(http_event.stream_id))
@@ -1038,11 +1130,19 @@ class QuicProtocol(asyncio.DatagramProtocol):
                     waiter.set_exception(ConnectionError)
                 self._ping_waiters.clear()
 
+                # abort in flight requests
+                for waiter in self._request_waiter.values():
+                    if waiter.done() is False:
+                        waiter.set_exception(
+                            Exception(f'Connection terminated - {event.reason_phrase}')
+                        )
+
                 self._closed.set()
             elif isinstance(event, HandshakeCompleted):
+                self._connected = True
+
                 if self._connected_waiter is not None:
                     waiter = self._connected_waiter
-                    self._connected = True
                     self._connected_waiter = None
                     waiter.set_result(None)
             elif isinstance(event, PingAcknowledged):
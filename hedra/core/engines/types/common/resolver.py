@@ -0,0 +1,321 @@
+from __future__ import annotations
+import aiodns
+import asyncio
+import socket
+import time
+from collections import defaultdict
+from ipaddress import ip_address, IPv4Address
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple
+)
+
+
+SocketConfig = Tuple[int, int, int, str, Tuple[Any, ...]]
+HostKey = Tuple[str, int, int, int]
+
+
+class ResolvedHost:
+
+    __slots__ = (
+        'addresses',
+        'expires',
+        'error',
+        'ip_addr',
+        'socket_config'
+    )
+
+    def __init__(
+        self,
+        addresses: Dict[str, List[SocketConfig]]={},
+        expires: float=0,
+        error: Optional[str]=None,
+        ip_addr: Optional[str]=None,
+        socket_config: Optional[SocketConfig]=None
+    ) -> None:
+        self.addresses = dict(addresses)
+        self.expires = expires
+        self.error = error
+        self.ip_addr = ip_addr
+        self.socket_config = socket_config
+
+    @property
+    def expired(self):
+        return time.time() >= self.expires
+
+    def rotate(self, offset: int) -> None:
+        ip_addrs = list(self.addresses.keys())
+
+        if len(ip_addrs) < 2 or self.ip_addr not in self.addresses:
+            return
+
+        next_ip_addr = ip_addrs[
+            (ip_addrs.index(self.ip_addr) + offset) % len(ip_addrs)
+        ]
+
+        for socket_config in self.addresses[next_ip_addr]:
+            if self.socket_config is None or socket_config[1] == self.socket_config[1]:
+                self.ip_addr = next_ip_addr
+                self.socket_config = socket_config
+                break
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'addresses': self.addresses,
+            'expires': self.expires,
+            'error': self.error,
+            'ip_addr': self.ip_addr,
+            'socket_config': self.socket_config
+        }
+
+
+class ResolverCache:
+
+    __slots__ = (
+        'hosts',
+        'pending',
+        'default_ttl',
+        'negative_ttl',
+        'lookups',
+        '_resolver',
+        '_loop'
+    )
+
+    def __init__(
+        self,
+        default_ttl: float=300,
+        negative_ttl: float=5
+    ) -> None:
+        self.hosts: Dict[HostKey, ResolvedHost] = {}
+        self.pending: Dict[HostKey, asyncio.Future] = {}
+        self.default_ttl = default_ttl
+        self.negative_ttl = negative_ttl
+        self.lookups = 0
+        self._resolver: Optional[aiodns.DNSResolver] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @staticmethod
+    def key(hostname: str, port: int, family: int, protocol: int) -> HostKey:
+        return (
+            hostname,
+            port,
+            family,
+            protocol
+        )
+
+    def get(
+        self,
+        hostname: str,
+        port: int,
+        family: int,
+        protocol: int
+    ) -> Optional[ResolvedHost]:
+        host = self.hosts.get(
+            self.key(hostname, port, family, protocol)
+        )
+
+        if host is None or host.expired or host.error or host.socket_config is None:
+            return None
+
+        return host
+
+    def select(
+        self,
+        hostname: str,
+        port: int,
+        family: int,
+        protocol: int,
+        ip_addr: str,
+        socket_config: SocketConfig
+    ) -> None:
+        host = self.hosts.get(
+            self.key(hostname, port, family, protocol)
+        )
+
+        if host is not None:
+            host.ip_addr = ip_addr
+            host.socket_config = socket_config
+
+    def store(
+        self,
+        hostname: str,
+        port: int,
+        family: int,
+        protocol: int,
+        addresses: Dict[str, List[SocketConfig]],
+        ttl: Optional[float]=None
+    ) -> None:
+        if ttl is None:
+            ttl = self.default_ttl
+
+        self.hosts[self.key(hostname, port, family, protocol)] = ResolvedHost(
+            addresses=addresses,
+            expires=time.time() + ttl
+        )
+
+    async def lookup(
+        self,
+        hostname: str,
+        port: int,
+        family: int,
+        protocol: int
+    ) -> Dict[str, List[SocketConfig]]:
+
+        host_key = self.key(hostname, port, family, protocol)
+        host = self.hosts.get(host_key)
+
+        if host and host.expired is False:
+
+            if host.error:
+                raise Exception(host.error)
+
+            return self._ordered(host)
+
+        pending = self.pending.get(host_key)
+        if pending:
+            return self._ordered(
+                await asyncio.shield(pending)
+            )
+
+        pending = asyncio.get_running_loop().create_future()
+        self.pending[host_key] = pending
+
+        try:
+            addresses, ttl = await self._resolve(hostname, port, family)
+
+            host = ResolvedHost(
+                addresses=addresses,
+                expires=time.time() + ttl
+            )
+
+            self.hosts[host_key] = host
+            pending.set_result(host)
+
+            return self._ordered(host)
+
+        except Exception as resolve_error:
+            self.hosts[host_key] = ResolvedHost(
+                expires=time.time() + self.negative_ttl,
+                error=str(resolve_error)
+            )
+
+            pending.set_exception(resolve_error)
+            pending.exception()
+
+            raise resolve_error
+
+        finally:
+            del self.pending[host_key]
+
+    def _ordered(self, host: ResolvedHost) -> Dict[str, List[SocketConfig]]:
+        ip_addrs = list(host.addresses.keys())
+
+        if len(ip_addrs) < 2:
+            return host.addresses
+
+        self.lookups += 1
+        offset = self.lookups % len(ip_addrs)
+
+        return {
+            ip_addr: host.addresses[ip_addr] for ip_addr in ip_addrs[offset:] + ip_addrs[:offset]
+        }
+
+    async def _resolve(
+        self,
+        hostname: str,
+        port: int,
+        family: int
+    ) -> Tuple[Dict[str, List[SocketConfig]], float]:
+
+        loop = asyncio.get_running_loop()
+
+        if self._resolver is None or self._loop is not loop:
+            self._resolver = aiodns.DNSResolver(loop=loop)
+            self._loop = loop
+
+        ttl = self.default_ttl
+
+        if family == socket.AF_INET6:
+            query_types = ['AAAA']
+
+        elif family == socket.AF_INET:
+            query_types = ['A']
+
+        else:
+            # Unspecified lookups want both, as getaddrinfo() returns, so
+            # IPv6-only hosts still resolve.
+            query_types = ['A', 'AAAA']
+
+        query_results = await asyncio.gather(*[
+            self._resolver.query(hostname, query_type) for query_type in query_types
+        ], return_exceptions=True)
+
+        records = []
+        for query_result in query_results:
+
+            if isinstance(query_result, aiodns.error.DNSError):
+                continue
+
+            elif isinstance(query_result, BaseException):
+                raise query_result
+
+            records.extend(query_result)
+
+        resolved = [record.host for record in records]
+
+        if len(records) > 0:
+            ttl = min([record.ttl for record in records])
+
+        else:
+            # Names such as localhost or /etc/hosts entries are only
+            # visible to the system resolver.
+            host = await self._resolver.gethostbyname(hostname, family)
+            resolved = host.addresses
+
+        infos: Dict[str, List[SocketConfig]] = defaultdict(list)
+        for address in resolved:
+
+            if isinstance(ip_address(address), IPv4Address):
+                address_family = socket.AF_INET
+
+            else:
+                address_family = socket.AF_INET6
+
+            if family != socket.AF_UNSPEC and address_family != family:
+                continue
+
+            info = await loop.getaddrinfo(
+                address,
+                port,
+                family=family,
+                proto=0,
+                flags=0
+            )
+
+            infos[address].extend(info)
+
+        if len(infos) == 0:
+            raise Exception(f'Err. - could not resolve host - {hostname}')
+
+        return dict(infos), max(ttl, 1)
+
+    def to_dict(self) -> Dict[HostKey, Dict[str, Any]]:
+        return {
+            host_key: host.to_dict() for host_key, host in self.hosts.items() if host.error is None and host.expired is False
+        }
+
+    def load(self, hosts: Dict[HostKey, Dict[str, Any]], offset: int=0) -> None:
+        for host_key, host_config in hosts.items():
+
+            host = ResolvedHost(**host_config)
+            if host.expired:
+                continue
+
+            host.rotate(offset)
+            self.hosts[host_key] = host
+
+
+resolver_cache = ResolverCache()
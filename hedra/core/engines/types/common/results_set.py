@@ -1,6 +1,6 @@
 import psutil
 from collections import defaultdict
-from typing import Dict, List, Union, Any
+from typing import Dict, List, Union, Any, Optional
 from hedra.core.engines.types.common.types import RequestTypes
 from hedra.core.engines.types.common.base_result import BaseResult
 from hedra.core.engines.types.graphql import GraphQLResult
@@ -18,6 +18,8 @@ from hedra.monitoring import (
     CPUMonitor,
     MemoryMonitor
 )
+from hedra.reporting.processed_result.processed_results_group import ProcessedResultsGroup
+from hedra.reporting.processed_result.shared_results_segment import SharedResultsSegment
 
 
 ResultsBatch = Dict[str, Union[List[BaseResult], float]]
@@ -46,6 +48,7 @@ class ResultsSet:
         self.stage_streamed_analytics: Union[List[StreamAnalytics], None] = execution_results.get('streamed_analytics')
 
         self.total_elapsed: float = execution_results.get('total_elapsed', 0)
+        self.stage_start_epoch: Optional[float] = execution_results.get('stage_start_epoch')
         self.total_results: int = execution_results.get('total_results', 0)
 
         self.stage_batch_size = execution_results.get('stage_batch_size', 0)
@@ -57,6 +60,8 @@ class ResultsSet:
         )
 
         self.results: List[BaseResult] = execution_results.get('stage_results', [])
+        self.events: Dict[str, ProcessedResultsGroup] = execution_results.get('stage_events', {})
+        self.columnar_results: List[Union[bytes, SharedResultsSegment]] = execution_results.get('stage_columnar_results', [])
 
         self.serialized_results: List[Dict[str, Any]] = execution_results.get('serialized_results', [])
         self.experiment = execution_results.get('experiment')
@@ -109,7 +114,10 @@ class ResultsSet:
             'stage_workers': self.stage_workers,
             'stage_optimized': self.stage_optimized,
             'total_elapsed': self.total_elapsed,
+            'stage_start_epoch': self.stage_start_epoch,
             'total_results': self.total_results,
             'stage_results': list(self.results),
+            'stage_events': dict(self.events),
+            'stage_columnar_results': list(self.columnar_results),
             'serialized_results': list(self.serialized_results)
         })
\ No newline at end of file
@@ -1,12 +1,17 @@
 import ssl
+from functools import lru_cache
 
 
+# Loading the default certificates takes tens of milliseconds and every
+# client (one per action a worker loads) would otherwise repeat it, so
+# each process builds its contexts once and its clients share them.
+
+@lru_cache(maxsize=None)
 def get_http2_ssl_context():
     """
     This function creates an SSLContext object that is suitably configured for
     HTTP/2. If you're working with Python TLS directly, you'll want to do the
-    exact same setup as this function does.
-    """
+    exact same setup as this function does.    """
     # Get the basic context from the standard library.
     ctx = ssl.create_default_context(ssl.Purpose.SERVER_AUTH)
 
@@ -42,6 +47,7 @@ def get_http2_ssl_context():
 
     return ctx
 
+@lru_cache(maxsize=None)
 def get_graphql_ssl_context():
     # Get the basic context from the standard library.
     ctx = ssl.create_default_context(ssl.Purpose.SERVER_AUTH)
@@ -81,6 +87,7 @@ def get_graphql_ssl_context():
 
 
 
+@lru_cache(maxsize=None)
 def get_default_ssl_context():
     ctx = ssl.create_default_context(ssl.Purpose.SERVER_AUTH)
     ctx.check_hostname = False
@@ -1,11 +1,9 @@
-import aiodns
 import re
 import socket
-from collections import defaultdict
 from ipaddress import ip_address, IPv4Address
 from urllib.parse import urlparse
-from asyncio.events import get_event_loop
 from typing import Dict, List
+from .resolver import resolver_cache
 from .types import SocketProtocols, SocketTypes
 
 ip_address_pattern = re.compile(
@@ -16,7 +14,6 @@ ip_address_pattern = re.compile(
 class URL:
 
     __slots__ = (
-        'resolver',
         'ip_addr',
         'parsed',
         'is_ssl',
@@ -26,12 +23,10 @@ class URL:
         'socket_config',
         'family',
         'protocol',
-        'loop',
         'host_ip'
     )
 
     def __init__(self, url: str, port: int=80, family: SocketTypes=SocketTypes.DEFAULT, protocol: SocketProtocols=SocketProtocols.DEFAULT) -> None:
-        self.resolver = aiodns.DNSResolver()
         self.ip_addr = None
         self.parsed = urlparse(url)
         self.is_ssl = 'https' in url or 'wss' in url   
@@ -45,7 +40,6 @@ class URL:
         self.socket_config = None
         self.family = family
         self.protocol = protocol
-        self.loop = None
 
         self.host_ip: str | None = url.split(':')[0] if re.match(
             ip_address_pattern,
@@ -58,11 +52,6 @@ class URL:
 
     async def lookup(self):
 
-        if self.loop is None:
-            self.loop = get_event_loop()
-
-        infos: Dict[str, List] = defaultdict(list)
-
         if self.parsed.hostname is None:
             
             try:
@@ -81,48 +70,67 @@ class URL:
                 else:
                     socket_type = socket.AF_INET6
                 
-                infos[self.full] = [(
-                    socket_type,
+                infos: Dict[str, List] = {
+                    self.full: [(
+                        socket_type,
+                        self.protocol,
+                        None,
+                        None,
+                        (
+                            host,
+                            self.port
+                        )
+                    )]
+                }
+
+                resolver_cache.store(
+                    self.hostname,
+                    self.port,
+                    self.family,
                     self.protocol,
-                    None,
-                    None,
-                    (
-                        host,
-                        self.port
-                    )
-                )]
+                    infos
+                )
             
             except Exception as parse_error:
                 raise parse_error
 
         else:
-
-            resolved = await self.resolver.gethostbyname(self.parsed.hostname, self.family)
-    
-            for address in resolved.addresses:
-
-                if isinstance(ip_address(address), IPv4Address):
-                    socket_type = socket.AF_INET
-
-                else:
-                    socket_type = socket.AF_INET6
-
-                info = await self.loop.getaddrinfo(
-                    address, 
-                    self.port, 
-                    family=self.family, 
-                    proto=0, 
-                    flags=0
-                )
-
-                if infos.get(address) is None:
-                    infos[address] = [*info]
-
-                else:
-                    infos[address].extend(info)
+            infos = await resolver_cache.lookup(
+                self.parsed.hostname,
+                self.port,
+                self.family,
+                self.protocol
+            )
 
         return infos
 
+    def load_resolved(self) -> bool:
+        host = resolver_cache.get(
+            self.hostname,
+            self.port,
+            self.family,
+            self.protocol
+        )
+
+        if host is None:
+            return False
+
+        self.ip_addr = host.ip_addr
+        self.socket_config = host.socket_config
+        self.has_ip_addr = True
+
+        return True
+
+    def store_resolved(self) -> None:
+        resolver_cache.select(
+            self.hostname,
+            self.port,
+            self.family,
+            self.protocol,
+            self.ip_addr,
+            self.socket_config
+        )
+
     @property
     def params(self):
         return self.parsed.params
@@ -25,7 +25,9 @@ class MercuryGraphQLClient(MercuryHTTPClient[GraphQLAction, GraphQLResult]):
         concurrency: int = 10 ** 3, 
         timeouts: Timeouts = Timeouts(), 
         reset_connections: bool = False,
-        tracing_session: Optional[TraceSession]=None
+        tracing_session: Optional[TraceSession]=None,
+        idle_timeout: Optional[float]=None,
+        max_connection_age: Optional[float]=None
     ) -> None:
 
         super(
@@ -35,7 +37,9 @@ class MercuryGraphQLClient(MercuryHTTPClient[GraphQLAction, GraphQLResult]):
             concurrency=concurrency, 
             timeouts=timeouts, 
             reset_connections=reset_connections,
-            tracing_session=tracing_session
+            tracing_session=tracing_session,
+            idle_timeout=idle_timeout,
+            max_connection_age=max_connection_age
         )
 
         self.session_id = str(uuid.uuid4())
@@ -66,10 +70,14 @@ class MercuryGraphQLClient(MercuryHTTPClient[GraphQLAction, GraphQLResult]):
                     action,
                     response
                 )
+
+            connection: Union[HTTPConnection, None] = None
             
             try:
                 
-                connection = self.pool.connections.pop()
+                connection = self.pool.acquire(
+                    self.pool.host_key(action.url)
+                )
 
                 if action.hooks.listen:
                     event = asyncio.Event()
@@ -136,15 +144,13 @@ class MercuryGraphQLClient(MercuryHTTPClient[GraphQLAction, GraphQLResult]):
                             response
                         )
 
-                response.response_code = await asyncio.wait_for(
-                    connection.reader.readline_fast(),
+                head = await asyncio.wait_for(
+                    connection.reader.read_response_head(),
                     timeout=self.timeouts.socket_read_timeout
                 )
 
-                headers = await asyncio.wait_for(
-                    connection.read_headers(),
-                    timeout=self.timeouts.socket_read_timeout
-                )
+                response.update_head(head)
+                connection.update_keep_alive(head)
 
                 if trace and trace.on_response_headers_received:
                     await trace.on_response_headers_received(
@@ -173,7 +179,7 @@ class MercuryGraphQLClient(MercuryHTTPClient[GraphQLAction, GraphQLResult]):
                             response.status = 408
                             raise Exception('Request timed out while redirecting.')
                         
-                        redirect_url = str(headers.get(b'location'))
+                        redirect_url = head.get(b'location', b'').decode()
                         if redirect_url.startswith('http') is False:
                             action.url.path = redirect_url
                             action.encoded_headers = None
@@ -207,15 +213,13 @@ class MercuryGraphQLClient(MercuryHTTPClient[GraphQLAction, GraphQLResult]):
 
                         response.write_end = time.monotonic()
 
-                        response.response_code = await asyncio.wait_for(
-                            connection.reader.readline_fast(),
+                        head = await asyncio.wait_for(
+                            connection.reader.read_response_head(),
                             timeout=self.timeouts.socket_read_timeout
                         )
 
-                        headers = await asyncio.wait_for(
-                            connection.read_headers(),
-                            timeout=self.timeouts.socket_read_timeout
-                        )
+                        response.update_head(head)
+                        connection.update_keep_alive(head)
 
                         status = response.status
 
@@ -224,55 +228,13 @@ class MercuryGraphQLClient(MercuryHTTPClient[GraphQLAction, GraphQLResult]):
 
                         elapsed_time = time.time() - redirect_time_start
 
-                content_length = headers.get(b'content-length')
-                transfer_encoding = headers.get(b'transfer-encoding')
-
-                # We require Content-Length or Transfer-Encoding headers to read a
-                # request body, otherwise it's anyone's guess as to how big the body
-                # is, and we ain't playing that game.
-                body = bytearray()
-                if content_length:
-                    body = await asyncio.wait_for(
-                        connection.readexactly(int(content_length)),
-                        timeout=self.timeouts.socket_read_timeout
-                    )
-
-                elif transfer_encoding:
-                    
-                    all_chunks_read = False
-
-                    while True and not all_chunks_read:
-
-                        chunk_size = int((await connection.readuntil()).rstrip(), 16)
-    
-                        if not chunk_size:
-                            # read last CRLF
-                            body.extend(
-                                await asyncio.wait_for(
-                                    connection.readuntil(),
-                                    timeout=self.timeouts.socket_read_timeout
-                                )
-                            )
-                            
-                            break
-                        
-                        chunk = await asyncio.wait_for(
-                            connection.readexactly(chunk_size + 2),
-                            timeout=self.timeouts.socket_read_timeout
-                        )
-
-                        body.extend(
-                            chunk[:-2]
-                        )
-
-                        if trace and trace.on_response_chunk_received:
-                            await trace.on_response_chunk_received(
-                                trace.span,
-                                action,
-                                response
-                            )
-
-                    all_chunks_read = True
+                body = await self.read_body(
+                    connection,
+                    head,
+                    action,
+                    response,
+                    trace
+                )
          
                 response.complete = time.monotonic()
 
@@ -283,9 +245,11 @@ class MercuryGraphQLClient(MercuryHTTPClient[GraphQLAction, GraphQLResult]):
                         response
                     )
 
-                response.headers = headers
                 response.body = body
-                self.pool.connections.append(connection)
+                self.pool.release(
+                    self.pool.host_key(action.url),
+                    connection
+                )
 
                 if action.hooks.after:
                     response = await self.execute_after(action, response)
@@ -312,7 +276,8 @@ class MercuryGraphQLClient(MercuryHTTPClient[GraphQLAction, GraphQLResult]):
                 response.complete = time.monotonic()
                 response.error = str(e)
 
-                self.pool.connections.append(HTTPConnection(reset_connection=self.pool.reset_connections))
+                if connection:
+                    connection.abort()
 
                 if trace and trace.on_request_exception:
                     await trace.on_request_exception(response)
@@ -24,7 +24,10 @@ class MercuryGraphQLHTTP2Client(MercuryHTTP2Client[GraphQLHTTP2Action, GraphQLHT
         concurrency: int = 10 ** 3, 
         timeouts: Timeouts = Timeouts(), 
         reset_connections: bool = False,
-        tracing_session: Optional[TraceSession]=None
+        tracing_session: Optional[TraceSession]=None,
+        idle_timeout: Optional[float]=None,
+        max_connection_age: Optional[float]=None,
+        streams_per_connection: int=1
     ) -> None:
 
         super(
@@ -34,7 +37,10 @@ class MercuryGraphQLHTTP2Client(MercuryHTTP2Client[GraphQLHTTP2Action, GraphQLHT
             concurrency=concurrency, 
             timeouts=timeouts, 
             reset_connections=reset_connections,
-            tracing_session=tracing_session
+            tracing_session=tracing_session,
+            idle_timeout=idle_timeout,
+            max_connection_age=max_connection_age,
+            streams_per_connection=streams_per_connection
         )
 
         self.session_id = str(uuid.uuid4())
@@ -66,8 +72,9 @@ class MercuryGraphQLHTTP2Client(MercuryHTTP2Client[GraphQLHTTP2Action, GraphQLHT
                     response
                 )
 
-            pipe = self.pool.pipes.pop()
-            connection = self.pool.connections.pop()
+            pipe, connection = self.pool.acquire(
+                self.pool.host_key(action.url)
+            )
         
             try:
 
@@ -160,15 +167,18 @@ class MercuryGraphQLHTTP2Client(MercuryHTTP2Client[GraphQLHTTP2Action, GraphQLHT
                             if not event.is_set():
                                 event.set()      
 
-                self.pool.pipes.append(pipe)
-                self.pool.connections.append(connection)
+                self.pool.release(
+                    self.pool.host_key(action.url),
+                    connection,
+                    pipe=pipe
+                )
                 
             except Exception as e:
                 response.complete = time.monotonic()
                 response._status = 400
                 response.error = str(e)
 
-                self.pool.reset()
+                self.pool.reset(connection, pipe=pipe)
 
                 if trace and trace.on_request_exception:
                     await trace.on_request_exception(response)
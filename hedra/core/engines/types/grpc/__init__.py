@@ -1,3 +1,5 @@
 from .client import MercuryGRPCClient
 from .action import GRPCAction
-from .result import GRPCResult
\ No newline at end of file
+from .result import GRPCResult
+from .codec import GRPCCodec
+from .stream_types import GRPCStreamTypes
@@ -1,46 +1,67 @@
-import binascii
-from typing import Dict, Iterator, List, Union
+from typing import Any, Dict, Iterator, List, Optional, Union
 from hedra.core.engines.types.common.hooks import Hooks
 from hedra.core.engines.types.common.types import RequestTypes
 from hedra.core.engines.types.http2.action import HTTP2Action
+from .codec import GRPCCodec
+from .stream_types import GRPCStreamTypes
 
 
 class GRPCAction(HTTP2Action):
 
     def __init__(
         self,
-        name: str, 
-        url: str, 
-        method: str = 'GET', 
-        headers: Dict[str, str] = {}, 
-        data: Union[str, dict, Iterator, bytes, None] = None, 
-        user: str=None, 
-        tags: List[Dict[str, str]] = []
+        name: str,
+        url: str,
+        method: str = 'GET',
+        headers: Dict[str, str] = {},
+        data: Union[str, dict, Iterator, bytes, None] = None,
+        user: str=None,
+        tags: List[Dict[str, str]] = [],
+        stream_type: str=GRPCStreamTypes.UNARY,
+        compression: Optional[str]=None
     ) -> None:
-    
+
         super(
-            GRPCAction, 
+            GRPCAction,
             self
         ).__init__(
-            name, 
-            url, 
-            method, 
-            headers, 
-            data, user, 
+            name,
+            url,
+            method,
+            headers,
+            data, user,
             tags
         )
 
         self.timeout = 60
         self.type = RequestTypes.GRPC
         self.hooks: Hooks[GRPCAction] = Hooks()
+        self.stream_type = stream_type.upper()
+        self.codec = GRPCCodec(compression=compression)
+        self.encoded_messages: List[bytes] = []
+
+    @property
+    def streaming_request(self) -> bool:
+        return self.stream_type in (
+            GRPCStreamTypes.CLIENT,
+            GRPCStreamTypes.BIDI
+        )
 
     def _setup_headers(self):
         grpc_headers = {
             'Content-Type': 'application/grpc',
             'Grpc-Timeout': f'{self.timeout}S',
-            'TE': 'trailers'
+            'TE': 'trailers',
+            'Grpc-Accept-Encoding': 'gzip,deflate,identity'
+        }
+
+        if self.codec.compression:
+            grpc_headers['Grpc-Encoding'] = self.codec.compression
+
+        self.headers = {
+            **self._headers,
+            **grpc_headers
         }
-        self._headers.update(grpc_headers)
 
         super(
             GRPCAction,
@@ -48,8 +69,23 @@ class GRPCAction(HTTP2Action):
         )._setup_headers()
 
     def _setup_data(self) -> None:
-        encoded_protobuf = str(binascii.b2a_hex(self.data.SerializeToString()), encoding='raw_unicode_escape')
-        encoded_message_length = hex(int(len(encoded_protobuf)/2)).lstrip("0x").zfill(8)
-        encoded_protobuf = f'00{encoded_message_length}{encoded_protobuf}'
 
-        self.encoded_data = binascii.a2b_hex(encoded_protobuf)
\ No newline at end of file
+        messages: List[Any] = [self.data]
+        if self.streaming_request:
+            messages = list(self.data or [])
+
+        self.encoded_messages = self.codec.encode_many([
+            self._serialize_message(message) for message in messages
+        ])
+
+        self.encoded_data = b''.join(self.encoded_messages)
+
+    def _serialize_message(self, message: Any) -> bytes:
+
+        if message is None:
+            return b''
+
+        elif isinstance(message, (bytes, bytearray)):
+            return bytes(message)
+
+        return message.SerializeToString()
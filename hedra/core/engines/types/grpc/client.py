@@ -3,6 +3,10 @@ import uuid
 import asyncio
 from typing import Any, Coroutine, Optional, Union
 from hedra.core.engines.types.http2 import MercuryHTTP2Client
+from hedra.core.engines.types.http2.multiplexed_pipe import MultiplexedPipe
+from hedra.core.engines.types.http2.multiplexed_stream import MultiplexedStream
+from hedra.core.engines.types.http2.pipe import HTTP2Pipe
+from hedra.core.engines.types.http2.stream import Stream
 from hedra.core.engines.types.common import Timeouts
 from hedra.core.engines.types.tracing.trace_session import (
     TraceSession, 
@@ -11,6 +15,7 @@ from hedra.core.engines.types.tracing.trace_session import (
 
 from .action import GRPCAction
 from .result import GRPCResult
+from .stream_types import GRPCStreamTypes
 
 
 class MercuryGRPCClient(MercuryHTTP2Client[GRPCAction, GRPCResult]):
@@ -20,7 +25,10 @@ class MercuryGRPCClient(MercuryHTTP2Client[GRPCAction, GRPCResult]):
         concurrency: int = 10 ** 3, 
         timeouts: Timeouts = None, 
         reset_connections: bool=False,
-        tracing_session: Optional[TraceSession]=None
+        tracing_session: Optional[TraceSession]=None,
+        idle_timeout: Optional[float]=None,
+        max_connection_age: Optional[float]=None,
+        streams_per_connection: int=1
     ) -> None:
         super(
             MercuryGRPCClient,
@@ -29,7 +37,10 @@ class MercuryGRPCClient(MercuryHTTP2Client[GRPCAction, GRPCResult]):
             concurrency=concurrency, 
             timeouts=timeouts, 
             reset_connections=reset_connections,
-            tracing_session=tracing_session
+            tracing_session=tracing_session,
+            idle_timeout=idle_timeout,
+            max_connection_age=max_connection_age,
+            streams_per_connection=streams_per_connection
         )
 
         self.session_id = str(uuid.uuid4())
@@ -61,8 +72,11 @@ class MercuryGRPCClient(MercuryHTTP2Client[GRPCAction, GRPCResult]):
                     response
                 )
 
-            pipe = self.pool.pipes.pop()
-            connection = self.pool.connections.pop()
+            pipe, connection = self.pool.acquire(
+                self.pool.host_key(action.url)
+            )
+
+            sender: Optional[asyncio.Task] = None
         
             try:
 
@@ -113,10 +127,30 @@ class MercuryGRPCClient(MercuryHTTP2Client[GRPCAction, GRPCResult]):
                         response
                     )
   
-                if action.encoded_data is not None:
-                    await pipe.submit_request_body(action, stream)
+                if action.stream_type == GRPCStreamTypes.BIDI:
+                    sender = asyncio.create_task(
+                        self._send_messages(
+                            pipe,
+                            action,
+                            stream,
+                            response
+                        )
+                    )
+
+                elif action.stream_type == GRPCStreamTypes.CLIENT:
+                    await self._send_messages(
+                        pipe,
+                        action,
+                        stream,
+                        response
+                    )
 
-                response.write_end = time.monotonic()
+                else:
+
+                    if action.encoded_data is not None:
+                        await pipe.submit_request_body(action, stream)
+
+                    response.write_end = time.monotonic()
 
                 if action.encoded_data and trace and trace.on_request_data_sent:
                         await trace.on_request_data_sent(
@@ -135,6 +169,9 @@ class MercuryGRPCClient(MercuryHTTP2Client[GRPCAction, GRPCResult]):
                     timeout=self.timeouts.total_timeout
                 )
 
+                if sender:
+                    await sender
+
                 response.complete = time.monotonic()
 
                 if action.hooks.after:
@@ -155,15 +192,21 @@ class MercuryGRPCClient(MercuryHTTP2Client[GRPCAction, GRPCResult]):
                             if not event.is_set():
                                 event.set()      
 
-                self.pool.pipes.append(pipe)
-                self.pool.connections.append(connection)
+                self.pool.release(
+                    self.pool.host_key(action.url),
+                    connection,
+                    pipe=pipe
+                )
                 
             except Exception as e:
+                if sender and not sender.done():
+                    sender.cancel()
+
                 response.complete = time.monotonic()
                 response._status = 400
                 response.error = str(e)
 
-                self.pool.reset()
+                self.pool.reset(connection, pipe=pipe)
 
                 if trace and trace.on_request_exception:
                     await trace.on_request_exception(response)
@@ -182,3 +225,39 @@ class MercuryGRPCClient(MercuryHTTP2Client[GRPCAction, GRPCResult]):
                 await trace.on_request_end(response)
 
             return response
+
+    async def _send_messages(
+        self,
+        pipe: Union[HTTP2Pipe, MultiplexedPipe],
+        action: GRPCAction,
+        stream: Union[Stream, MultiplexedStream],
+        response: GRPCResult
+    ) -> None:
+
+        encoded_messages = action.encoded_messages
+        last_idx = len(encoded_messages) - 1
+
+        if last_idx < 0:
+            await pipe.submit_request_body(
+                action,
+                stream,
+                data=b'',
+                end_stream=True
+            )
+
+        # Each message is written as its own DATA frame and timestamped,
+        # so response messages can be matched to the request that
+        # preceded them.
+        for idx, encoded_message in enumerate(encoded_messages):
+            response.sent.append(time.monotonic())
+
+            await pipe.submit_request_body(
+                action,
+                stream,
+                data=encoded_message,
+                end_stream=idx == last_idx
+            )
+
+            await asyncio.sleep(0)
+
+        response.write_end = time.monotonic()
@@ -0,0 +1,100 @@
+import struct
+import zlib
+from gzip import (
+    compress as gzip_compress,
+    decompress as gzip_decompress
+)
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+
+# Every gRPC message is prefixed with a one byte compressed flag and a
+# four byte big-endian message length.
+GRPC_MESSAGE_HEADER = struct.Struct('!BI')
+
+
+compressors: Dict[str, Callable[[bytes], bytes]] = {
+    'gzip': gzip_compress,
+    'deflate': zlib.compress
+}
+
+decompressors: Dict[str, Callable[[bytes], bytes]] = {
+    'gzip': gzip_decompress,
+    'deflate': zlib.decompress
+}
+
+
+class GRPCCodec:
+
+    __slots__ = (
+        'compression',
+        '_compress'
+    )
+
+    def __init__(self, compression: Optional[str]=None) -> None:
+
+        if compression == 'identity':
+            compression = None
+
+        if compression is not None and compression not in compressors:
+            raise Exception(f'Err. - unsupported gRPC compression - {compression}.')
+
+        self.compression = compression
+        self._compress = compressors.get(compression)
+
+    def encode(self, message: bytes) -> bytes:
+
+        compressed = 0
+        if self._compress:
+            message = self._compress(message)
+            compressed = 1
+
+        return GRPC_MESSAGE_HEADER.pack(compressed, len(message)) + message
+
+    def encode_many(self, messages: List[bytes]) -> List[bytes]:
+        return [
+            self.encode(message) for message in messages
+        ]
+
+    @staticmethod
+    def decode_from(
+        data: Union[bytes, bytearray, memoryview],
+        offset: int=0
+    ) -> Tuple[List[Tuple[bool, bytes]], int]:
+        '''
+        Decodes every complete message in data starting at offset, returning
+        the (compressed, payload) pairs and the offset of the first unread byte.
+        '''
+
+        messages: List[Tuple[bool, bytes]] = []
+        data_size = len(data)
+        header_size = GRPC_MESSAGE_HEADER.size
+
+        while data_size - offset >= header_size:
+            compressed, message_length = GRPC_MESSAGE_HEADER.unpack_from(data, offset)
+
+            start = offset + header_size
+            end = start + message_length
+
+            if end > data_size:
+                break
+
+            messages.append((
+                compressed == 1,
+                bytes(data[start:end])
+            ))
+
+            offset = end
+
+        return messages, offset
+
+    @staticmethod
+    def decompress(message: bytes, compressed: bool, encoding: Optional[str]) -> bytes:
+
+        if compressed is False:
+            return message
+
+        decompress = decompressors.get(encoding)
+        if decompress is None:
+            raise Exception(f'Err. - unsupported gRPC message encoding - {encoding}.')
+
+        return decompress(message)
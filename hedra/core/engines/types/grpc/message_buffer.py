@@ -0,0 +1,34 @@
+import time
+from typing import List, Tuple
+from .codec import GRPCCodec
+
+
+class GRPCMessageBuffer(bytearray):
+
+    __slots__ = (
+        'offset',
+        'messages',
+        'received'
+    )
+
+    '''
+    Response body that decodes length-prefixed gRPC messages as DATA
+    frames are appended, so each message is timestamped when it
+    completes rather than when the stream ends.
+    '''
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.offset = 0
+        self.messages: List[Tuple[bool, bytes]] = []
+        self.received: List[float] = []
+
+    def extend(self, data: bytes) -> None:
+        super().extend(data)
+
+        messages, self.offset = GRPCCodec.decode_from(self, self.offset)
+
+        if messages:
+            received = time.monotonic()
+            self.messages.extend(messages)
+            self.received.extend([received] * len(messages))
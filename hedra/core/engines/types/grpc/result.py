@@ -1,25 +1,83 @@
 from __future__ import annotations
-import binascii
-from typing import Dict, Union
+from typing import Any, List, Optional
 from hedra.core.engines.types.common.types import RequestTypes
 from hedra.core.engines.types.http2.result import HTTP2Result
 from .action import GRPCAction
+from .codec import GRPCCodec
+from .message_buffer import GRPCMessageBuffer
 
 
 class GRPCResult(HTTP2Result):
 
-    def __init__(self, action: GRPCAction, error: Exception = None) -> None: 
+    def __init__(self, action: GRPCAction, error: Exception = None) -> None:
         super(GRPCResult, self).__init__(action, error)
         self.type = RequestTypes.GRPC
+        self.body = GRPCMessageBuffer()
+        self.stream_type = action.stream_type
+        self.sent: List[float] = []
+
+    @property
+    def messages(self) -> List[bytes]:
+
+        if isinstance(self.body, GRPCMessageBuffer):
+            decoded_messages = self.body.messages
+
+        else:
+            decoded_messages, _ = GRPCCodec.decode_from(self.body or b'')
+
+        encoding: Optional[bytes] = self.headers.get(b'grpc-encoding')
+        if encoding:
+            encoding = encoding.decode()
+
+        return [
+            GRPCCodec.decompress(
+                message,
+                compressed,
+                encoding
+            ) for compressed, message in decoded_messages
+        ]
+
+    @property
+    def received(self) -> List[float]:
+
+        if isinstance(self.body, GRPCMessageBuffer):
+            return self.body.received
+
+        return []
+
+    @property
+    def message_timings(self) -> List[float]:
+        '''
+        Latency of each response message, measured from the later of the
+        previous response message and the matching request message.
+        '''
+
+        timings: List[float] = []
+
+        sent = self.sent
+        if len(sent) == 0 and self.write_end:
+            sent = [self.write_end]
+
+        previous = None
+        for idx, received in enumerate(self.received):
+            start = sent[min(idx, len(sent) - 1)] if sent else self.start
+
+            if previous is not None and previous > start:
+                start = previous
+
+            timings.append(received - start)
+            previous = received
+
+        return timings
 
     @property
     def data(self):
-        wire_msg = binascii.b2a_hex(self.body)
+        messages = self.messages
 
-        message_length = wire_msg[4:10]
-        msg = wire_msg[10:10+int(message_length, 16)*2]
+        if len(messages) > 0:
+            return messages[0]
 
-        return binascii.a2b_hex(msg)
+        return b''
 
     @data.setter
     def data(self, value):
@@ -28,3 +86,13 @@ class GRPCResult(HTTP2Result):
     def to_protobuf(self, protobuf):
         protobuf.ParseFromString(self.data)
         return protobuf
+
+    def to_protobufs(self, protobuf_type: Any) -> List[Any]:
+
+        protobufs = []
+        for message in self.messages:
+            protobuf = protobuf_type()
+            protobuf.ParseFromString(message)
+            protobufs.append(protobuf)
+
+        return protobufs
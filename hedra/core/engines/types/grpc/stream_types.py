@@ -0,0 +1,5 @@
+class GRPCStreamTypes:
+    UNARY='UNARY'
+    CLIENT='CLIENT'
+    SERVER='SERVER'
+    BIDI='BIDI'
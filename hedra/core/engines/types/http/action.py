@@ -5,11 +5,16 @@ from typing import (
     Union, 
     List, 
     Any, 
-    Tuple
+    Tuple,
+    Optional
 )
 from urllib.parse import urlencode
 from hedra.core.engines.types.common.hooks import Hooks
 from hedra.core.engines.types.common.base_action import BaseAction
+from hedra.core.engines.types.common.body_policy import (
+    BodyPolicy,
+    BodyPolicies
+)
 from hedra.core.engines.types.common.constants import NEW_LINE
 from hedra.core.engines.types.common.protocols.shared.writer import Writer
 from hedra.core.engines.types.common import URL
@@ -34,6 +39,7 @@ class HTTPAction(BaseAction):
         'redirects',
         'action_args',
         'mutations',
+        'body_policy',
         '_header_items'
     )
     
@@ -46,7 +52,9 @@ class HTTPAction(BaseAction):
         data: Union[str, dict, Iterator, bytes, None] = None, 
         user: str=None, 
         tags: List[Dict[str, str]] = [],
-        redirects: int=3
+        redirects: int=3,
+        body_policy: str=BodyPolicies.FULL,
+        body_limit: Optional[int]=None
     ) -> None:
         super(HTTPAction, self).__init__(
             name,
@@ -69,6 +77,10 @@ class HTTPAction(BaseAction):
         self.is_stream = False
         self.ssl_context = None
         self.redirects = redirects
+        self.body_policy = BodyPolicy(
+            policy=body_policy,
+            limit=body_limit
+        )
         self.hooks: Hooks[HTTPAction] = Hooks()
         self.action_args: Dict[str, Any] = {}
 
@@ -8,12 +8,14 @@ from typing import (
     Union, 
     Coroutine, 
     TypeVar, 
-    Optional
+    Optional,
+    List
 )
 from hedra.core.engines.types.common.base_engine import BaseEngine
 from hedra.core.engines.types.common.ssl import get_default_ssl_context
 from hedra.core.engines.types.common.timeouts import Timeouts
 from hedra.core.engines.types.common.concurrency import Semaphore
+from hedra.core.engines.types.common.protocols.shared.response_head import ResponseHead
 from hedra.core.engines.types.tracing.trace_session import (
     TraceSession, 
     Trace
@@ -36,7 +38,6 @@ class MercuryHTTPClient(BaseEngine[Union[A, HTTPAction], Union[R, HTTPResult]]):
         'session_id',
         'timeouts',
         'registered',
-        '_hosts',
         'closed',
         'sem',
         'pool',
@@ -52,7 +53,10 @@ class MercuryHTTPClient(BaseEngine[Union[A, HTTPAction], Union[R, HTTPResult]]):
         concurrency: int=10**3, 
         timeouts: Timeouts = Timeouts(), 
         reset_connections: bool=False,
-        tracing_session: Optional[TraceSession]=None
+        tracing_session: Optional[TraceSession]=None,
+        pipeline_depth: int=1,
+        idle_timeout: Optional[float]=None,
+        max_connection_age: Optional[float]=None
     ) -> None:
         super(
             MercuryHTTPClient,
@@ -63,15 +67,19 @@ class MercuryHTTPClient(BaseEngine[Union[A, HTTPAction], Union[R, HTTPResult]]):
         self.timeouts = timeouts
 
         self.registered: Dict[str, HTTPAction] = {}
-        self._hosts = {}
         self.closed = False
 
-        self.sem = asyncio.Semaphore(value=concurrency)
-        self.pool = Pool(concurrency, reset_connections=reset_connections)
+        self.sem = Semaphore(value=concurrency)
+        self.pool = Pool(
+            concurrency, 
+            reset_connections=reset_connections,
+            pipeline_depth=pipeline_depth,
+            idle_timeout=idle_timeout,
+            max_connection_age=max_connection_age
+        )
         self.tracing_session: Union[TraceSession, None] = tracing_session
         self.logger = HedraLogger()
         self.logger.initialize()
-        self.pool.create_pool()
 
         self.active = 0
         self.waiter = None
@@ -86,34 +94,75 @@ class MercuryHTTPClient(BaseEngine[Union[A, HTTPAction], Union[R, HTTPResult]]):
                 'socket_read_timeout': self.timeouts.socket_read_timeout,
                 'total_timeout': self.timeouts.total_timeout
             },
-            'reset_connections': self.pool.reset_connections
+            'reset_connections': self.pool.reset_connections,
+            'pipeline_depth': self.pool.pipeline_depth,
+            'idle_timeout': self.pool.idle_timeout,
+            'max_connection_age': self.pool.max_connection_age
         }
 
+    def resize_pool(self, concurrency: int):
+        if isinstance(self.sem, Semaphore):
+            self.sem.resize(concurrency - self.pool.size)
+
+        else:
+            self.sem = Semaphore(value=concurrency)
+
+        self.pool.resize(concurrency)
+
     async def set_pool(self, concurrency: int):
-        self.sem = asyncio.Semaphore(value=concurrency)
-        self.pool = Pool(concurrency, reset_connections=self.pool.reset_connections)
-        self.pool.create_pool()
+        self.resize_pool(concurrency)
 
     def extend_pool(self, increased_capacity: int):
-        self.pool.size += increased_capacity
-        for _ in range(increased_capacity):
-            self.pool.connections.append(
-                HTTPConnection(self.pool.reset_connections)
-            )
-        
-        self.sem = Semaphore(self.pool.size)
+        self.resize_pool(self.pool.size + increased_capacity)
 
     def shrink_pool(self, decrease_capacity: int):
-        self.pool.size -= decrease_capacity
-        self.pool.connections = self.pool.connections[:self.pool.size]
-        self.sem = Semaphore(self.pool.size)
+        self.resize_pool(self.pool.size - decrease_capacity)
+
+    async def warm(self, action: HTTPAction, connections: int):
+        host_key = self.pool.host_key(action.url)
+        
+        if self.pool.pipelined:
+            connections = min(connections, self.pool.pipelines_per_host)
+
+        else:
+            connections = min(connections, self.pool.size)
+
+        warmed: List[HTTPConnection] = [
+            HTTPConnection(self.pool.reset_connections) for _ in range(connections)
+        ]
+
+        results = await asyncio.gather(*[
+            connection.make_connection(
+                action.url.hostname,
+                action.url.ip_addr,
+                action.url.port,
+                action.url.socket_config,
+                timeout=self.timeouts.connect_timeout,
+                ssl=action.ssl_context
+            ) for connection in warmed
+        ], return_exceptions=True)
+
+        warmed_count = 0
+        for connection, result in zip(warmed, results):
+            if isinstance(result, Exception):
+                continue
+
+            if self.pool.pipelined:
+                self.pool.add_pipelined(host_key, connection)
+
+            else:
+                self.pool.release(host_key, connection)
+
+            warmed_count += 1
+
+        return warmed_count
     
     async def prepare(self, action: HTTPAction) -> Coroutine[Any, Any, None]:
         try:
             if action.url.is_ssl:
                 action.ssl_context = self.ssl_context
                 
-            if self._hosts.get(action.url.hostname) is None:
+            if action.url.load_resolved() is False:
                 socket_configs = await asyncio.wait_for(action.url.lookup(), timeout=self.timeouts.connect_timeout)
             
                 for ip_addr, configs in socket_configs.items():
@@ -145,15 +194,7 @@ class MercuryHTTPClient(BaseEngine[Union[A, HTTPAction], Union[R, HTTPResult]]):
                 if action.url.socket_config is None:
                     raise Exception('Connection Failed')
 
-                self._hosts[action.url.hostname] = {
-                    'ip_addr': action.url.ip_addr,
-                    'socket_config': action.url.socket_config
-                }
-
-            else:
-                host_config = self._hosts[action.url.hostname]
-                action.url.ip_addr = host_config.get('ip_addr')
-                action.url.socket_config = host_config.get('socket_config')
+                action.url.store_resolved()
 
             if action.is_setup is False:
                 action.setup()
@@ -164,6 +205,10 @@ class MercuryHTTPClient(BaseEngine[Union[A, HTTPAction], Union[R, HTTPResult]]):
             raise e
 
     async def execute_prepared_request(self, action: HTTPAction) -> Coroutine[Any, Any, HTTPResult]:
+
+        if self.pool.pipelined:
+            return await self.execute_pipelined_request(action)
+
         trace: Union[Trace, None] = None
         if self.tracing_session:
             trace = self.tracing_session.create_trace()
@@ -189,9 +234,13 @@ class MercuryHTTPClient(BaseEngine[Union[A, HTTPAction], Union[R, HTTPResult]]):
                     response
                 )
             
+            connection: Union[HTTPConnection, None] = None
+
             try:
                 
-                connection = self.pool.connections.pop()
+                connection = self.pool.acquire(
+                    self.pool.host_key(action.url)
+                )
 
                 if action.hooks.listen:
                     event = asyncio.Event()
@@ -258,15 +307,13 @@ class MercuryHTTPClient(BaseEngine[Union[A, HTTPAction], Union[R, HTTPResult]]):
                             response
                         )
 
-                response.response_code = await asyncio.wait_for(
-                    connection.reader.readline_fast(),
+                head = await asyncio.wait_for(
+                    connection.reader.read_response_head(),
                     timeout=self.timeouts.socket_read_timeout
                 )
 
-                headers = await asyncio.wait_for(
-                    connection.read_headers(),
-                    timeout=self.timeouts.socket_read_timeout
-                )
+                response.update_head(head)
+                connection.update_keep_alive(head)
 
                 if trace and trace.on_response_headers_received:
                     await trace.on_response_headers_received(
@@ -295,7 +342,7 @@ class MercuryHTTPClient(BaseEngine[Union[A, HTTPAction], Union[R, HTTPResult]]):
                             response.status = 408
                             raise Exception('Request timed out while redirecting.')
                         
-                        redirect_url = str(headers.get(b'location'))
+                        redirect_url = head.get(b'location', b'').decode()
                         if redirect_url.startswith('http') is False:
                             action.url.path = redirect_url
                             action.encoded_headers = None
@@ -307,14 +354,14 @@ class MercuryHTTPClient(BaseEngine[Union[A, HTTPAction], Union[R, HTTPResult]]):
                             action.is_setup = False
                             await self.prepare(action)
 
-                            await connection.make_connection(
-                                action.url.hostname,
-                                action.url.ip_addr,
-                                action.url.port,
-                                action.url.socket_config,
-                                timeout=self.timeouts.connect_timeout,
-                                ssl=action.ssl_context
-                            )
+                        await connection.make_connection(
+                            action.url.hostname,
+                            action.url.ip_addr,
+                            action.url.port,
+                            action.url.socket_config,
+                            timeout=self.timeouts.connect_timeout,
+                            ssl=action.ssl_context
+                        )
 
                         response.connect_end = time.monotonic()
                             
@@ -329,15 +376,13 @@ class MercuryHTTPClient(BaseEngine[Union[A, HTTPAction], Union[R, HTTPResult]]):
 
                         response.write_end = time.monotonic()
 
-                        response.response_code = await asyncio.wait_for(
-                            connection.reader.readline_fast(),
+                        head = await asyncio.wait_for(
+                            connection.reader.read_response_head(),
                             timeout=self.timeouts.socket_read_timeout
                         )
 
-                        headers = await asyncio.wait_for(
-                            connection.read_headers(),
-                            timeout=self.timeouts.socket_read_timeout
-                        )
+                        response.update_head(head)
+                        connection.update_keep_alive(head)
 
                         status = response.status
 
@@ -346,55 +391,213 @@ class MercuryHTTPClient(BaseEngine[Union[A, HTTPAction], Union[R, HTTPResult]]):
 
                         elapsed_time = time.time() - redirect_time_start
 
-                content_length = headers.get(b'content-length')
-                transfer_encoding = headers.get(b'transfer-encoding')
+                body = await self.read_body(
+                    connection,
+                    head,
+                    action,
+                    response,
+                    trace
+                )
+         
+                response.complete = time.monotonic()
 
-                # We require Content-Length or Transfer-Encoding headers to read a
-                # request body, otherwise it's anyone's guess as to how big the body
-                # is, and we ain't playing that game.
-                body = bytearray()
-                if content_length:
-                    body = await asyncio.wait_for(
-                        connection.readexactly(int(content_length)),
-                        timeout=self.timeouts.socket_read_timeout
+                if trace and trace.on_response_data_received:
+                    await trace.on_response_data_received(
+                        trace.span,
+                        action,
+                        response
                     )
 
-                elif transfer_encoding:
+                response.body = body
+                self.pool.release(
+                    self.pool.host_key(action.url),
+                    connection
+                )
+
+                if action.hooks.after:
+                    response = await self.execute_after(action, response)
+                    action.setup()
+
+                if action.hooks.checks:
+                    response = await self.execute_checks(action, response)
+
+                if action.hooks.notify:
+                    await asyncio.gather(*[
+                        asyncio.create_task(
+                            channel.call(response, action.hooks.listeners)
+                        ) for channel in action.hooks.channels
+                    ])
+
+                    for listener in action.hooks.listeners: 
+                        if len(listener.hooks.channel_events) > 0:
+                            listener.setup()
+                            event = listener.hooks.channel_events.pop()
+                            if not event.is_set():
+                                event.set()       
+
+            except Exception as e:
+                response.complete = time.monotonic()
+                response.error = str(e)
+
+                if connection:
+                    connection.abort()
+
+                if trace and trace.on_request_exception:
+                    await trace.on_request_exception(response)
+
+            self.active -= 1
+            if self.waiter and self.active <= self.pool.size:
+
+                try:
+                    self.waiter.set_result(None)
+                    self.waiter = None
+
+                except asyncio.InvalidStateError:
+                    self.waiter = None
+
+            if trace and trace.on_request_end:
+                await trace.on_request_end(response)
+
+            return response
+
+    async def execute_pipelined_request(self, action: HTTPAction) -> Coroutine[Any, Any, HTTPResult]:
+        trace: Union[Trace, None] = None
+        if self.tracing_session:
+            trace = self.tracing_session.create_trace()
+            await trace.on_request_start(action)
+  
+        response = HTTPResult(action)
+        response.wait_start = time.monotonic()
+        self.active += 1
+
+        if trace and trace.on_connection_queued_start:
+            await trace.on_connection_queued_start(
+                trace.span,
+                action,
+                response
+            )
+ 
+        async with self.sem:
+
+            if trace and trace.on_connection_queued_end:
+                await trace.on_connection_queued_end(
+                    trace.span,
+                    action,
+                    response
+                )
+
+            connection: Union[HTTPConnection, None] = None
+            
+            try:
+
+                if action.hooks.listen:
+                    event = asyncio.Event()
+                    action.hooks.channel_events.append(event)
+                    await event.wait()
                     
-                    all_chunks_read = False
+                if action.hooks.before:
+                    action = await self.execute_before(action)
+                    action.setup()
 
-                    while True and not all_chunks_read:
+                connection = self.pool.select_pipelined(
+                    self.pool.host_key(action.url)
+                )
+                connection.pending += 1
 
-                        chunk_size = int((await connection.readuntil()).rstrip(), 16)
-    
-                        if not chunk_size:
-                            # read last CRLF
-                            body.extend(
-                                await asyncio.wait_for(
-                                    connection.readuntil(),
-                                    timeout=self.timeouts.socket_read_timeout
-                                )
-                            )
-                            
-                            break
-                        
-                        chunk = await asyncio.wait_for(
-                            connection.readexactly(chunk_size + 2),
-                            timeout=self.timeouts.socket_read_timeout
+                response.start = time.monotonic()
+
+                # Only the first request in a pipeline may (re)connect - any
+                # request already written to the connection is still waiting
+                # on a response from the current socket.
+                if connection.pending == 1:
+                    connection.connecting = asyncio.get_running_loop().create_future()
+
+                    try:
+                        await connection.make_connection(
+                            action.url.hostname,
+                            action.url.ip_addr,
+                            action.url.port,
+                            action.url.socket_config,
+                            timeout=self.timeouts.connect_timeout,
+                            ssl=action.ssl_context
+                        )
+
+                    finally:
+                        connection.connecting.set_result(None)
+
+                elif connection.connecting and not connection.connecting.done():
+                    await connection.connecting
+
+                if connection.reusable is False:
+                    raise Exception('Connection closed before request was sent.')
+
+                response.connect_end = time.monotonic()
+
+                # Requests are written back-to-back and responses arrive in the
+                # order they were written, so we must queue on the connection
+                # lock immediately after writing and without yielding.
+                reader = connection.reader
+                connection.write(action.encoded_headers)
+                
+                if action.encoded_data:
+                    if action.is_stream:
+                        action.write_chunks(connection)
+
+                    else:
+                        connection.write(action.encoded_data)
+
+                response.write_end = time.monotonic()
+
+                async with connection.lock:
+
+                    if trace and trace.on_connection_create_end:
+                        await trace.on_connection_create_end(
+                            trace.span,
+                            action,
+                            response
                         )
 
-                        body.extend(
-                            chunk[:-2]
+                    if trace and trace.on_request_headers_sent:
+                        await trace.on_request_headers_sent(
+                            trace.span,
+                            action,
+                            response
                         )
 
-                        if trace and trace.on_response_chunk_received:
-                            await trace.on_response_chunk_received(
+                    if connection.connected is False or connection.reader is not reader:
+                        raise Exception('Connection closed before response was received.')
+                    
+                    try:
+                        head = await asyncio.wait_for(
+                            reader.read_response_head(),
+                            timeout=self.timeouts.socket_read_timeout
+                        )
+
+                        response.update_head(head)
+                        connection.update_keep_alive(head)
+
+                        if trace and trace.on_response_headers_received:
+                            await trace.on_response_headers_received(
                                 trace.span,
                                 action,
                                 response
                             )
 
-                    all_chunks_read = True
+                        # Redirects are returned as-is, since following them would
+                        # interleave a new request into the pipeline.
+                        body = await self.read_body(
+                            connection,
+                            head,
+                            action,
+                            response,
+                            trace
+                        )
+
+                    except Exception as e:
+                        connection.abort()
+                        raise e
+
+                    connection.last_used = time.monotonic()
          
                 response.complete = time.monotonic()
 
@@ -405,9 +608,7 @@ class MercuryHTTPClient(BaseEngine[Union[A, HTTPAction], Union[R, HTTPResult]]):
                         response
                     )
 
-                response.headers = headers
                 response.body = body
-                self.pool.connections.append(connection)
 
                 if action.hooks.after:
                     response = await self.execute_after(action, response)
@@ -434,11 +635,12 @@ class MercuryHTTPClient(BaseEngine[Union[A, HTTPAction], Union[R, HTTPResult]]):
                 response.complete = time.monotonic()
                 response.error = str(e)
 
-                self.pool.connections.append(HTTPConnection(reset_connection=self.pool.reset_connections))
-
                 if trace and trace.on_request_exception:
                     await trace.on_request_exception(response)
 
+            if connection:
+                connection.pending -= 1
+
             self.active -= 1
             if self.waiter and self.active <= self.pool.size:
 
@@ -454,6 +656,70 @@ class MercuryHTTPClient(BaseEngine[Union[A, HTTPAction], Union[R, HTTPResult]]):
 
             return response
 
+    async def read_body(
+        self,
+        connection: HTTPConnection,
+        head: ResponseHead,
+        action: HTTPAction,
+        response: HTTPResult,
+        trace: Union[Trace, None]=None
+    ) -> bytearray:
+
+        content_length = head.content_length
+        max_size = action.body_policy.max_size
+
+        # We require Content-Length or Transfer-Encoding headers to read a
+        # request body, otherwise it's anyone's guess as to how big the body
+        # is, and we ain't playing that game.
+        body = bytearray()
+        if content_length:
+            response.body_size = await asyncio.wait_for(
+                connection.reader.readinto(
+                    content_length,
+                    body=body,
+                    max_size=max_size
+                ),
+                timeout=self.timeouts.socket_read_timeout
+            )
+
+        elif head.chunked:
+
+            while True:
+
+                chunk_size = int((await connection.readuntil()).rstrip(), 16)
+
+                if not chunk_size:
+                    # read last CRLF
+                    await asyncio.wait_for(
+                        connection.readuntil(),
+                        timeout=self.timeouts.socket_read_timeout
+                    )
+                    
+                    break
+
+                response.body_size += await asyncio.wait_for(
+                    connection.reader.readinto(
+                        chunk_size,
+                        body=body,
+                        max_size=max_size
+                    ),
+                    timeout=self.timeouts.socket_read_timeout
+                )
+
+                await asyncio.wait_for(
+                    connection.reader.readinto(2),
+                    timeout=self.timeouts.socket_read_timeout
+                )
+
+                if trace and trace.on_response_chunk_received:
+                    await trace.on_response_chunk_received(
+                        trace.span,
+                        action,
+                        response
+                    )
+
+        return body
+
     async def close(self):
         if self.closed is False:
             await self.pool.close()
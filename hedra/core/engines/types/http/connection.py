@@ -1,9 +1,11 @@
 from __future__ import annotations
 import asyncio
+import time
 from ssl import SSLContext
 from typing import Optional, Tuple
 from hedra.core.engines.types.common.protocols import TCPConnection
 from hedra.core.engines.types.common.protocols.shared.reader import Reader
+from hedra.core.engines.types.common.protocols.shared.response_head import ResponseHead
 from hedra.core.engines.types.common.protocols.shared.writer import Writer
 from hedra.core.engines.types.common.protocols.shared.constants import _DEFAULT_LIMIT
 
@@ -21,6 +23,10 @@ class HTTPConnection:
         'connected',
         'reset_connection',
         'pending',
+        'keep_alive',
+        'connecting',
+        'created',
+        'last_used',
         '_connection_factory'
     )
 
@@ -37,6 +43,10 @@ class HTTPConnection:
         self.connected = False
         self.reset_connection = reset_connection
         self.pending = 0
+        self.keep_alive = True
+        self.connecting: Optional[asyncio.Future] = None
+        self.created = 0
+        self.last_used = 0
         self._connection_factory = TCPConnection()
 
     async def make_connection(
@@ -48,13 +58,24 @@ class HTTPConnection:
         ssl: Optional[SSLContext]=None,
         timeout: Optional[float]=None
     ) -> None:
+        if self.connected and self.closed:
+            self.connected = False
+
         if self.connected is False or self.dns_address != dns_address or self.reset_connection:
+
+            if self.writer is not None:
+                self.abort()
+
             try:
                 reader, writer = await asyncio.wait_for(self._connection_factory.create(hostname, socket_config, ssl=ssl), timeout=timeout)
                 self.connected = True
 
                 self.reader = reader
                 self.writer = writer
+                self.keep_alive = True
+
+                self.created = time.monotonic()
+                self.last_used = self.created
 
                 self.dns_address = dns_address
                 self.port = port
@@ -69,6 +90,30 @@ class HTTPConnection:
             except Exception as e:
                 raise e
 
+    @property
+    def closed(self):
+        return (
+            self.reader is None or
+            self.reader._eof or
+            self.reader._exception is not None or
+            self.writer.is_closing()
+        )
+
+    @property
+    def reusable(self):
+        return self.connected and self.keep_alive and not self.closed
+
+    @property
+    def joinable(self):
+        connecting = self.connecting is not None and not self.connecting.done()
+        return connecting or self.reusable
+
+    def update_keep_alive(self, head: ResponseHead):
+        self.keep_alive = head.keep_alive
+
+        if self.keep_alive is False:
+            self.connected = False
+
     @property
     def empty(self):
         return not self.reader._buffer
@@ -77,7 +122,7 @@ class HTTPConnection:
         return self.reader.read(n=_DEFAULT_LIMIT)
 
     def readexactly(self, n_bytes: int):
-        return self.reader.read(n=n_bytes)
+        return self.reader.readexactly(n_bytes)
 
     def readuntil(self, sep=b'\n'):
         return self.reader.readuntil(separator=sep)
@@ -91,6 +136,17 @@ class HTTPConnection:
     def read_headers(self):
         return self.reader.read_headers()
 
+    def read_response_head(self):
+        return self.reader.read_response_head()
+
+    def abort(self):
+        try:
+            self.writer.transport.abort()
+        except Exception:
+            pass
+
+        self.connected = False
+
     async def close(self):
         try:
             await self._connection_factory.close()
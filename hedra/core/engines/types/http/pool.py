@@ -1,26 +1,156 @@
-
-from typing import List
+import math
+import time
+from typing import Dict, Hashable, List, Optional, Tuple
+from hedra.core.engines.types.common.connection_pool import HostConnectionPool
+from hedra.core.engines.types.common.url import URL
 from .connection import HTTPConnection
 
 
 class Pool:
 
     __slots__ = (
-        'size',
-        'connections',
-        'reset_connections'
+        'reset_connections',
+        'pipeline_depth',
+        'idle',
+        'pipelines',
+        'next_connection'
     )
 
-    def __init__(self, size: int, reset_connections: bool = False) -> None:
-        self.size = size
-        self.connections: List[HTTPConnection] = []
+    def __init__(
+        self,
+        size: int,
+        reset_connections: bool = False,
+        pipeline_depth: int=1,
+        idle_timeout: Optional[float]=None,
+        max_connection_age: Optional[float]=None
+    ) -> None:
         self.reset_connections = reset_connections
+        self.pipeline_depth = max(pipeline_depth, 1)
+        self.idle: HostConnectionPool[HTTPConnection] = HostConnectionPool(
+            size,
+            idle_timeout=idle_timeout,
+            max_connection_age=max_connection_age
+        )
+        self.pipelines: Dict[Hashable, List[HTTPConnection]] = {}
+        self.next_connection: Dict[Hashable, int] = {}
+
+    @property
+    def pipelined(self):
+        return self.pipeline_depth > 1
+
+    @property
+    def pipelines_per_host(self):
+        return math.ceil(self.size/self.pipeline_depth)
+
+    @property
+    def size(self) -> int:
+        return self.idle.size
+
+    @size.setter
+    def size(self, size: int):
+        self.resize(size)
+
+    @property
+    def idle_timeout(self):
+        return self.idle.idle_timeout
+
+    @property
+    def max_connection_age(self):
+        return self.idle.max_connection_age
+
+    @property
+    def connections(self) -> List[HTTPConnection]:
+        connections = list(self.idle)
+        for pipeline in self.pipelines.values():
+            connections.extend(pipeline)
+
+        return connections
+
+    @connections.setter
+    def connections(self, connections: List[HTTPConnection]):
+        self.clear()
+
+        for connection in connections:
+            self.release(None, connection)
+
+    @staticmethod
+    def host_key(url: URL) -> Tuple[str, str, int]:
+        return (
+            url.hostname,
+            url.ip_addr,
+            url.port
+        )
 
     def create_pool(self) -> None:
-        for _ in range(self.size):
-            self.connections.append(
-                HTTPConnection(self.reset_connections)
-            )
+        # Connections are created per host on demand (or on warm up)
+        # so there is nothing to allocate ahead of time.
+        pass
+
+    def acquire(self, host_key: Hashable) -> HTTPConnection:
+        connection = self.idle.acquire(host_key)
+
+        if connection is None:
+            connection = HTTPConnection(self.reset_connections)
+
+        return connection
+
+    def release(self, host_key: Hashable, connection: HTTPConnection) -> None:
+        self.idle.release(host_key, connection)
+
+    def select_pipelined(self, host_key: Hashable) -> HTTPConnection:
+        pipeline = self.pipelines.get(host_key)
+        if pipeline is None:
+            pipeline = []
+            self.pipelines[host_key] = pipeline
+
+        connections_count = len(pipeline)
+        next_connection = self.next_connection.get(host_key, 0)
+
+        for _ in range(connections_count):
+            connection = pipeline[next_connection % connections_count]
+            next_connection = (next_connection + 1) % connections_count
+
+            if connection.pending == 0 and connection.connected and self.idle.healthy(connection, time.monotonic()) is False:
+                connection.abort()
+
+            if connection.pending == 0 or (
+                connection.pending < self.pipeline_depth and connection.joinable
+            ):
+                self.next_connection[host_key] = next_connection
+                return connection
+
+        connection = HTTPConnection(self.reset_connections)
+        pipeline.append(connection)
+
+        return connection
+
+    def add_pipelined(self, host_key: Hashable, connection: HTTPConnection) -> None:
+        pipeline = self.pipelines.get(host_key)
+        if pipeline is None:
+            pipeline = []
+            self.pipelines[host_key] = pipeline
+
+        pipeline.append(connection)
+
+    def resize(self, size: int) -> None:
+        self.idle.resize(size)
+
+        for pipeline in self.pipelines.values():
+            while len(pipeline) > self.pipelines_per_host and pipeline[-1].pending == 0:
+                pipeline.pop().abort()
+
+    def reap(self) -> int:
+        return self.idle.reap()
+
+    def clear(self) -> None:
+        self.idle.clear()
+
+        for pipeline in self.pipelines.values():
+            for connection in pipeline:
+                connection.abort()
+
+        self.pipelines.clear()
+        self.next_connection.clear()
 
     async def close(self):
         for connection in self.connections:
@@ -1,10 +1,11 @@
 from __future__ import annotations
 import json
 from gzip import decompress as gzip_decompress
-from typing import List, Union, Dict
+from typing import List, Optional, Union, Dict
 from zlib import decompress as zlib_decompress
 from hedra.core.engines.types.common.types import RequestTypes
 from hedra.core.engines.types.common.base_result import BaseResult
+from hedra.core.engines.types.common.protocols.shared.response_head import ResponseHead
 from .action import HTTPAction
 
 class HTTPResult(BaseResult):
@@ -18,8 +19,10 @@ class HTTPResult(BaseResult):
         'params',
         'query',
         'hostname',
-        'headers',
+        'head',
+        '_headers',
         'body',
+        'body_size',
         'response_code',
         '_version',
         '_reason',
@@ -49,27 +52,62 @@ class HTTPResult(BaseResult):
         self.query = action.url.query
         self.hostname = action.url.hostname
 
-        self.headers: Dict[bytes, bytes] = {}
+        self.head: Optional[ResponseHead] = None
+        self._headers: Optional[Dict[bytes, bytes]] = None
 
         self.body = bytearray()
+        self.body_size = 0
         self.response_code = None
         self._version = None
         self._reason = None
         self._status = None
 
+    def update_head(self, head: ResponseHead):
+        self.head = head
+        self.response_code = head.status_line
+        self._status = head.status
+        self._headers = None
+        self._reason = None
+        self._version = None
+
+    @property
+    def headers(self) -> Dict[bytes, bytes]:
+
+        if self._headers is None:
+            self._headers = self.head.headers if self.head else {}
+
+        return self._headers
+
+    @headers.setter
+    def headers(self, value: Dict[bytes, bytes]):
+        self._headers = value
+
+    def get_header(self, key: bytes, default: Optional[bytes]=None) -> Optional[bytes]:
+
+        # Single lookups are answered from the raw response head so the
+        # full header dict is only built when something asks for it.
+        if self._headers is None and self.head:
+            return self.head.get(key, default)
+
+        return self.headers.get(key, default)
+
     @property
     def content_type(self):
-        return self.headers.get(b'content-type')
+        return self.get_header(b'content-type')
 
     @property
     def compression(self):
-        return self.headers.get(b"content-encoding")
+        return self.get_header(b"content-encoding")
 
     @property
     def size(self):
-        if self.headers.get(b'content-length'):
-            return int(self.headers.get(b'content-length'))
+        content_length = self.get_header(b'content-length')
+        if content_length:
+            return int(content_length)
         
+        elif self.body_size:
+            return self.body_size
+
         elif self.body:
             return len(self.body)
         
@@ -5,10 +5,15 @@ from typing import (
     Union, 
     List, 
     Any, 
-    Tuple
+    Tuple,
+    Optional
 )
 from urllib.parse import urlencode
 from hedra.core.engines.types.common.base_action import BaseAction
+from hedra.core.engines.types.common.body_policy import (
+    BodyPolicy,
+    BodyPolicies
+)
 from hedra.core.engines.types.common.constants import NEW_LINE
 from hedra.core.engines.types.common.hooks import Hooks
 from hedra.core.engines.types.common import URL
@@ -32,11 +37,13 @@ class HTTP2Action(BaseAction):
         'is_stream',
         'ssl_context',
         'hpack_encoder',
+        'header_block_key',
         '_remote_settings',
         'event',
         'action_args',
         '_header_items',
-        'mutations'
+        'mutations',
+        'body_policy'
     )
     
     def __init__(
@@ -47,7 +54,9 @@ class HTTP2Action(BaseAction):
         headers: Dict[str, str] = {}, 
         data: Union[str, dict, Iterator, bytes, None] = None, 
         user: str=None, 
-        tags: List[Dict[str, str]] = []
+        tags: List[Dict[str, str]] = [],
+        body_policy: str=BodyPolicies.FULL,
+        body_limit: Optional[int]=None
     ) -> None:
         super(HTTP2Action, self).__init__(
             name,
@@ -69,7 +78,12 @@ class HTTP2Action(BaseAction):
         self.encoded_headers = None
         self.is_stream = False
         self.ssl_context = None
+        self.body_policy = BodyPolicy(
+            policy=body_policy,
+            limit=body_limit
+        )
         self.hpack_encoder = Encoder()
+        self.header_block_key: Tuple = ()
         self._remote_settings = Settings(
             client=False
         )
@@ -164,7 +178,11 @@ class HTTP2Action(BaseAction):
                 b"transfer-encoding",
             )
         ])
-        
+
+        # Connections encode against their own dynamic table and cache the
+        # resulting block under this key.
+        self.header_block_key = tuple(encoded_headers)
+
         encoded_headers = self.hpack_encoder.encode(encoded_headers)
         self.encoded_headers = [
             encoded_headers[i:i+self._remote_settings.max_frame_size]
@@ -7,7 +7,8 @@ from typing import (
     Union, 
     TypeVar, 
     Any, 
-    Optional
+    Optional,
+    List
 )
 from hedra.core.engines.types.common.base_engine import BaseEngine
 from hedra.core.engines.types.common.timeouts import Timeouts
@@ -33,7 +34,6 @@ class MercuryHTTP2Client(BaseEngine[Union[A, HTTP2Action], Union[R, HTTP2Result]
     __slots__ = (
         'session_id',
         'timeouts',
-        '_hosts',
         'registered',
         'closed',
         'sem',
@@ -49,7 +49,10 @@ class MercuryHTTP2Client(BaseEngine[Union[A, HTTP2Action], Union[R, HTTP2Result]
         concurrency: int = 10**3, 
         timeouts: Timeouts = Timeouts(), 
         reset_connections: bool=False,
-        tracing_session: Optional[TraceSession]=None
+        tracing_session: Optional[TraceSession]=None,
+        idle_timeout: Optional[float]=None,
+        max_connection_age: Optional[float]=None,
+        streams_per_connection: int=1
     ) -> None:
         super(
             MercuryHTTP2Client,
@@ -59,7 +62,6 @@ class MercuryHTTP2Client(BaseEngine[Union[A, HTTP2Action], Union[R, HTTP2Result]
         self.session_id = str(uuid.uuid4())
         self.timeouts = timeouts
 
-        self._hosts = {}
         self.registered: Dict[str, HTTP2Action] = {}
         self.closed = False
         
@@ -67,7 +69,10 @@ class MercuryHTTP2Client(BaseEngine[Union[A, HTTP2Action], Union[R, HTTP2Result]
         self.pool: HTTP2Pool = HTTP2Pool(
             concurrency, 
             self.timeouts, 
-            reset_connections=reset_connections
+            reset_connections=reset_connections,
+            idle_timeout=idle_timeout,
+            max_connection_age=max_connection_age,
+            streams_per_connection=streams_per_connection
         )
         self.tracing_session: Union[TraceSession, None] = tracing_session
 
@@ -85,37 +90,89 @@ class MercuryHTTP2Client(BaseEngine[Union[A, HTTP2Action], Union[R, HTTP2Result]
                 'socket_read_timeout': self.timeouts.socket_read_timeout,
                 'total_timeout': self.timeouts.total_timeout
             },
-            'reset_connections': self.pool.reset_connections
+            'reset_connections': self.pool.reset_connections,
+            'idle_timeout': self.pool.idle_timeout,
+            'max_connection_age': self.pool.max_connection_age,
+            'streams_per_connection': self.pool.streams_per_connection
         }
 
-    
-    async def set_pool(self, concurrency: int):
-        self.sem = Semaphore(value=concurrency)
-        self.pool = HTTP2Pool(
-            concurrency, 
-            self.timeouts,
-            reset_connections=self.pool.reset_connections
-        )
+    def resize_pool(self, concurrency: int):
+        if isinstance(self.sem, Semaphore):
+            self.sem.resize(concurrency - self.pool.size)
 
-        self.pool.create_pool()
+        else:
+            self.sem = Semaphore(value=concurrency)
+
+        self.pool.resize(concurrency)
+
+    async def set_pool(self, concurrency: int):
+        self.resize_pool(concurrency)
 
     def extend_pool(self, increased_capacity: int):
-        self.pool.size += increased_capacity
-        self.pool.create_pool()
-    
-        self.sem = Semaphore(self.pool.size)
+        self.resize_pool(self.pool.size + increased_capacity)
 
     def shrink_pool(self, decrease_capacity: int):
-        self.pool.size -= decrease_capacity
-        self.pool.create_pool()
-
-        self.sem = Semaphore(self.pool.size)
+        self.resize_pool(self.pool.size - decrease_capacity)
+
+    async def warm(self, action: HTTP2Action, connections: int):
+        host_key = self.pool.host_key(action.url)
+
+        if self.pool.multiplexed:
+            return await self._warm_multiplexed(action, connections)
+
+        warmed: List[HTTP2Connection] = [
+            self.pool.create_connection() for _ in range(min(connections, self.pool.size))
+        ]
+
+        results = await asyncio.gather(*[
+            connection.connect(
+                action.url.hostname,
+                action.url.ip_addr,
+                action.url.port,
+                action.url.socket_config,
+                ssl=action.ssl_context,
+                timeout=self.timeouts.connect_timeout
+            ) for connection in warmed
+        ], return_exceptions=True)
+
+        warmed_count = 0
+        for connection, result in zip(warmed, results):
+            if isinstance(result, Exception):
+                continue
+
+            self.pool.release(host_key, connection)
+            warmed_count += 1
+
+        return warmed_count
+
+    async def _warm_multiplexed(self, action: HTTP2Action, connections: int):
+        host_key = self.pool.host_key(action.url)
+        warmed = [
+            self.pool.create_multiplexed(host_key) for _ in range(
+                min(connections, self.pool.connections_per_host)
+            )
+        ]
+
+        results = await asyncio.gather(*[
+            connection.open(
+                action.url.hostname,
+                action.url.ip_addr,
+                action.url.port,
+                action.url.socket_config,
+                ssl=action.ssl_context,
+                timeout=self.timeouts.connect_timeout
+            ) for connection in warmed
+        ], return_exceptions=True)
+
+        return len([
+            result for result in results if not isinstance(result, Exception)
+        ])
 
     async def prepare(self, request: HTTP2Action) -> Coroutine[Any, Any, None]:
         try:
             request.ssl_context = self.ssl_context
 
-            if self._hosts.get(request.url.hostname) is None:
+            if request.url.load_resolved() is False:
                 socket_configs = await request.url.lookup()
 
                 for ip_addr, configs in socket_configs.items():
@@ -141,6 +198,8 @@ class MercuryHTTP2Client(BaseEngine[Union[A, HTTP2Action], Union[R, HTTP2Result]
                                 )
 
                                 request.url.socket_config = config
+                                request.url.ip_addr = ip_addr
+                                request.url.has_ip_addr = True
                                 break
 
                             except Exception as e:
@@ -152,10 +211,7 @@ class MercuryHTTP2Client(BaseEngine[Union[A, HTTP2Action], Union[R, HTTP2Result]
                 if request.url.socket_config is None:
                         raise Exception('Connection Failed')
                 
-                self._hosts[request.url.hostname] = request.url.ip_addr
-                        
-            else:
-                request.url.ip_addr = self._hosts[request.url.hostname]
+                request.url.store_resolved()
 
             if request.is_setup is False:
                 request.setup()
@@ -192,8 +248,9 @@ class MercuryHTTP2Client(BaseEngine[Union[A, HTTP2Action], Union[R, HTTP2Result]
                     response
                 )
 
-            pipe = self.pool.pipes.pop()
-            connection = self.pool.connections.pop()
+            pipe, connection = self.pool.acquire(
+                self.pool.host_key(action.url)
+            )
         
             try:
 
@@ -286,15 +343,18 @@ class MercuryHTTP2Client(BaseEngine[Union[A, HTTP2Action], Union[R, HTTP2Result]
                             if not event.is_set():
                                 event.set()      
 
-                self.pool.pipes.append(pipe)
-                self.pool.connections.append(connection)
+                self.pool.release(
+                    self.pool.host_key(action.url),
+                    connection,
+                    pipe=pipe
+                )
                 
             except Exception as e:
                 response.complete = time.monotonic()
                 response._status = 400
                 response.error = str(e)
 
-                self.pool.reset()
+                self.pool.reset(connection, pipe=pipe)
 
                 if trace and trace.on_request_exception:
                     await trace.on_request_exception(response)
@@ -1,6 +1,8 @@
 import asyncio
+import time
 from ssl import SSLContext
 from typing import Tuple, Optional, Union
+from hedra.core.engines.types.common.encoder import Encoder
 from hedra.core.engines.types.common.timeouts import Timeouts
 from hedra.core.engines.types.common.types import RequestTypes
 from hedra.core.engines.types.common.protocols.tcp import TCPConnection
@@ -33,7 +35,9 @@ class HTTP2Connection:
         'remote_settings_dict',
         'settings_frame',
         'headers_frame',
-        'window_update_frame'
+        'window_update_frame',
+        'created',
+        'last_used'
     )
 
     def __init__(self, stream_id: int, timeouts: Timeouts, concurrency: int, reset_connection: bool, stream_type: RequestTypes) -> None:
@@ -50,6 +54,8 @@ class HTTP2Connection:
         self.concurrency = concurrency
         self.dns_address = None
         self.port = None
+        self.created = 0
+        self.last_used = 0
 
         self.connection = TCPConnection(stream_type)
         self.lock = asyncio.Lock()
@@ -103,16 +109,27 @@ class HTTP2Connection:
                     )
 
                     self.connected = True
+                    self.created = time.monotonic()
+                    self.last_used = self.created
                     self.stream_id = self.init_id
                     self.dns_address = dns_address
                     self.port = port
 
                     self.stream.reader = reader
                     self.stream.writer = writer
+                    self.stream.reset_connection = True
+
+                    # HPACK state belongs to the socket, so a new socket
+                    # starts from an empty dynamic table.
+                    self.stream.header_encoder = Encoder()
                   
                     self.stream.headers_frame = self.headers_frame
                     self.stream.window_frame = self.window_update_frame
 
+                    self.stream.stream_id = self.stream_id
+                    self.stream.headers_frame.stream_id = self.stream_id
+                    self.stream.window_frame.stream_id = self.stream_id
+
                 else:
 
                     self.stream_id += 2# self.concurrency
@@ -135,5 +152,27 @@ class HTTP2Connection:
             except Exception as e:
                 raise e
 
+    @property
+    def closed(self):
+        reader = self.stream.reader
+        return (
+            reader is None or
+            reader._eof or
+            reader._exception is not None or
+            self.stream.writer.is_closing()
+        )
+
+    @property
+    def reusable(self):
+        return self.connected and not self.closed
+
+    def abort(self):
+        try:
+            self.stream.writer.transport.abort()
+        except Exception:
+            pass
+
+        self.connected = False
+
     async def close(self):
         await self.connection.close()
\ No newline at end of file
@@ -1,6 +1,10 @@
 from typing import Dict, List, Tuple, Union
 from hedra.core.engines.types.common.decoder import Decoder
 from hedra.core.engines.types.common.encoder import Encoder
+from hedra.core.engines.types.http2.frames.types.attributes import (
+    FLAG_END_STREAM,
+    FLAG_PRIORITY
+)
 from .base_event import BaseEvent
 
 
@@ -26,8 +30,8 @@ class DeferredHeaders(BaseEvent):
         self.hpack_table = encoder.header_table
         self.raw_headers = frame.data
         self.stream_ended = None
-        self.end_stream = 'END_STREAM' in frame.flags
-        self.priority = 'PRIORITY' in frame.flags
+        self.end_stream = frame.flag_byte & FLAG_END_STREAM > 0
+        self.priority = frame.flag_byte & FLAG_PRIORITY > 0
         self.encoding = encoding
         self.priority_updated = None
 
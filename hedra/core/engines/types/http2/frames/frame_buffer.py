@@ -6,19 +6,14 @@ h2/frame_buffer
 A data structure that provides a way to iterate over a byte buffer in terms of
 frames.
 """
-import struct
-from .types.attributes import (
-    _STRUCT_HBBBL
-)
-from .types import *
-from hyperframe.exceptions import InvalidFrameError, InvalidDataError
+from typing import Iterator, List, Union
 from .types.base_frame import Frame
 from .types.attributes import (
-    Flag,
-    Flags,
+    FLAG_END_HEADERS,
+    FLAG_PADDED,
+    FLAG_PRIORITY,
     _STRUCT_HBBBL,
     _STRUCT_H,
-    _STRUCT_B,
     _STRUCT_LL,
     _STRUCT_LB,
     _STRUCT_L,
@@ -30,219 +25,192 @@ class FrameBuffer:
 
     __slots__ = (
         'data',
+        'offset',
         'max_frame_size',
-        '_headers_buffer',
-        'frames_map'
+        '_headers_buffer'
     )
 
     """
     This is a data structure that expects to act as a buffer for HTTP/2 data
     that allows iteraton in terms of H2 frames.
+
+    Received chunks are kept as immutable bytes and walked with a read
+    offset, so frame payloads can be handed out as memoryviews without
+    copying. The buffer is only compacted when a chunk ends part way
+    through a frame.
     """
     def __init__(self):
-        self.data = bytearray()
+        self.data = b''
+        self.offset = 0
         self.max_frame_size = 0
-        self._headers_buffer = []
+        self._headers_buffer: List[Frame] = []
 
-    # The methods below support the iterator protocol.
-    def __iter__(self):
-        while len(self.data) >= 9:
-            try:
-                
-                fields = _STRUCT_HBBBL.unpack(self.data[:9])
-
-                # First 24 bits are frame length.
-                length = (fields[0] << 8) + fields[1]
-                type = fields[2]
-                flags = fields[3]
-                stream_id = fields[4] & 0x7FFFFFFF
-
-                frame = Frame(stream_id, type, parsed_flag_byte=flags)
-
-            except (InvalidDataError, InvalidFrameError) as e:  # pragma: no cover
-                raise Exception(
-                    "Received frame with invalid header: %s" % str(e)
-                )
+    def __len__(self):
+        return len(self.data) - self.offset
 
-            # Next, check that we have enough length to parse the frame body. If
-            # not, bail, leaving the frame header data in the buffer for next time.
-            if len(self.data) < length + 9:
-                break
+    def feed(self, data: Union[bytes, bytearray]) -> None:
 
-            body_data = self.data[9:9+length]
+        if self.offset >= len(self.data):
+            self.data = bytes(data)
 
-            if frame.type == 0xA:
-                # ALTSVC
+        else:
+            self.data = self.data[self.offset:] + data
 
-                origin_len = _STRUCT_H.unpack(body_data[0:2])[0]
-                frame.origin = body_data[2:2+origin_len]
+        self.offset = 0
 
-                if len(frame.origin) != origin_len:
-                    raise Exception("Invalid ALTSVC frame body.")
+    # The methods below support the iterator protocol.
+    def __iter__(self) -> Iterator[Frame]:
+        data = self.data
+        data_view = memoryview(data)
+        data_size = len(data)
 
-                frame.field = body_data[2+origin_len:]
-                frame.body_len = len(body_data)
+        while data_size - self.offset >= 9:
+            offset = self.offset
 
-            elif frame.type == 0x09:
-                # CONTINUATION
-                frame.data = body_data
-                frame.body_len = len(body_data)
+            length_high, length_low, frame_type, flag_byte, stream_id = _STRUCT_HBBBL.unpack_from(data, offset)
 
-            elif frame.type == 0x0:
-                # DATA
-                padding_data_offset = 0
-                frame.pad_length = 0
+            # First 24 bits are frame length.
+            length = (length_high << 8) + length_low
 
-                if 'PADDED' in frame.flags:  # type: ignore
-                    frame.pad_length = struct.unpack('!B', body_data[:1])[0]
-                    padding_data_offset = 1
+            # Check that we have enough length to parse the frame body. If
+            # not, bail, leaving the frame header data in the buffer for
+            # next time.
+            start = offset + 9
+            end = start + length
 
-                data_length = len(body_data)
-                frame.data = (
-                    body_data[padding_data_offset:data_length-frame.pad_length]
-                )
-                frame.body_len = data_length
+            if end > data_size:
+                break
 
-            elif frame.type == 0x07:
-                # GOAWAY
+            # At this point, as we know we'll use or discard the entire
+            # frame, we can advance the read offset.
+            self.offset = end
 
-                frame.last_stream_id, frame.error_code = _STRUCT_LL.unpack(body_data[:8])
-                frame.body_len = len(body_data)
+            frame = Frame(
+                stream_id & 0x7FFFFFFF,
+                frame_type,
+                parsed_flag_byte=flag_byte
+            )
 
-                if len(body_data) > 8:
-                    frame.additional_data = body_data[8:]
+            frame.body_len = length
 
-            elif frame.type == 0x01:
-                # HEADERS
-                padding_data_offset = 0
+            if frame_type == 0x0:
+                # DATA
+                if flag_byte & FLAG_PADDED:
+                    frame.pad_length = data[start]
+                    start += 1
 
-                if 'PADDED' in frame.flags:  # type: ignore
-                    frame.pad_length = struct.unpack('!B', body_data[:1])[0]
-                    padding_data_offset = 1
-        
-                body_data = body_data[padding_data_offset:]
+                frame.data = data_view[start:end - frame.pad_length]
 
-                if 'PRIORITY' in frame.flags:
-                    frame.depends_on, frame.stream_weight = _STRUCT_LB.unpack(body_data[:5])
+            elif frame_type == 0x01:
+                # HEADERS
+                if flag_byte & FLAG_PADDED:
+                    frame.pad_length = data[start]
+                    start += 1
+
+                if flag_byte & FLAG_PRIORITY:
+                    frame.depends_on, frame.stream_weight = _STRUCT_LB.unpack_from(data, start)
                     frame.exclusive = True if frame.depends_on >> 31 else False
                     frame.depends_on &= 0x7FFFFFFF
-                    padding_data_offset = 5
+                    start += 5
 
-                else:
-                    padding_data_offset = 0
+                # Header blocks are decoded later, so they are copied out
+                # rather than pinning the whole receive buffer.
+                frame.data = data[start:end - frame.pad_length]
 
-                data_length = len(body_data)
-                frame.body_len = data_length
-                frame.data = body_data[padding_data_offset:data_length-frame.pad_length]
+            elif frame_type == 0x03:
+                # RESET
+                frame.error_code = _STRUCT_L.unpack_from(data, start)[0]
 
-            elif frame.type == 0x06:
+            elif frame_type == 0x04:
+                # SETTINGS
+                for setting_offset in range(start, end, 6):
+                    name, value = _STRUCT_HL.unpack_from(data, setting_offset)
+                    frame.settings[name] = value
+
+            elif frame_type == 0x08:
+                # WINDOW UPDATE
+                frame.window_increment = _STRUCT_L.unpack_from(data, start)[0] & 0x7FFFFFFF
+
+            elif frame_type == 0x09:
+                # CONTINUATION
+                frame.data = data[start:end]
+
+            elif frame_type == 0x07:
+                # GOAWAY
+                frame.last_stream_id, frame.error_code = _STRUCT_LL.unpack_from(data, start)
+                frame.last_stream_id &= 0x7FFFFFFF
+
+                if length > 8:
+                    frame.additional_data = data[start + 8:end]
+
+            elif frame_type == 0x06:
                 # PING
-                frame.opaque_data = body_data
-                frame.body_len = 8
+                frame.opaque_data = data[start:end]
 
-            elif frame.type == 0x02:
+            elif frame_type == 0x02:
                 # PRIORITY
-
-                try:
-                    frame.depends_on, frame.stream_weight = _STRUCT_LB.unpack(body_data[:5])
-                except struct.error:
+                if length < 5:
                     raise Exception("Invalid Priority data")
 
+                frame.depends_on, frame.stream_weight = _STRUCT_LB.unpack_from(data, start)
                 frame.exclusive = True if frame.depends_on >> 31 else False
                 frame.depends_on &= 0x7FFFFFFF
 
-                frame.body_len = 5
-
-            elif frame.type == 0x05:
+            elif frame_type == 0x05:
                 # PUSH PROMISE
-                padding_data_offset = 0
-                frame.pad_length = 0
-                if 'PADDED' in frame.flags:  # type: ignore
-                    try:
-                        frame.pad_length = struct.unpack('!B', body_data[:1])[0]
-                    except struct.error:
-                        raise Exception("Invalid Padding data")
-                    padding_data_offset = 1
-
-                frame.promised_stream_id = _STRUCT_L.unpack(
-                    body_data[padding_data_offset:padding_data_offset + 4]
-                )[0]
-
-                data_len = len(body_data)
-                frame.data = body_data[padding_data_offset + 4:data_len-frame.pad_length]
-                frame.body_len = data_len
-
-            elif frame.type == 0x03:
-                # RESET
-                frame.error_code = _STRUCT_L.unpack(body_data)[0]
-                frame.body_len = 4
+                if flag_byte & FLAG_PADDED:
+                    frame.pad_length = data[start]
+                    start += 1
 
-            elif frame.type == 0x04:
-                # SETTINGS
-                body_len = 0
-                for i in range(0, len(body_data), 6):
-
-                    name, value = _STRUCT_HL.unpack(body_data[i:i+6])
-
-                    frame.settings[name] = value
-                    body_len += 6
-
-                frame.body_len = body_len
+                frame.promised_stream_id = _STRUCT_L.unpack_from(data, start)[0]
+                frame.data = data[start + 4:end - frame.pad_length]
 
-            elif frame.type == 0x08:
-                # WINDOW UPDATE
-                frame.window_increment = _STRUCT_L.unpack(body_data)[0]
-                frame.body_len = 4
+            elif frame_type == 0xA:
+                # ALTSVC
+                origin_len = _STRUCT_H.unpack_from(data, start)[0]
+                frame.origin = data[start + 2:start + 2 + origin_len]
 
-            # At this point, as we know we'll use or discard the entire frame, we
-            # can update the data.
-            del self.data[:9+length]
+                if len(frame.origin) != origin_len:
+                    raise Exception("Invalid ALTSVC frame body.")
 
-            # Pass the frame through the heaer buffer.
-            # f = self._update_header_buffer(f)
-            is_headers_or_push_promise = frame.frame_type == 'HEADERS' or frame.frame_type == 'PUSHPROMISE'
+                frame.field = data[start + 2 + origin_len:end]
 
+            # Pass the frame through the header buffer.
             if self._headers_buffer:
-                stream_id = self._headers_buffer[0].stream_id
                 valid_frame = (
-                    frame is not None and
-                    frame.frame_type == 'CONTINUATION' and
-                    frame.stream_id == stream_id
+                    frame_type == 0x09 and
+                    frame.stream_id == self._headers_buffer[0].stream_id
                 )
 
-                if valid_frame == False:
+                if valid_frame is False:
                     raise Exception("Invalid frame during header block.")
 
                 # Append the frame to the buffer.
                 self._headers_buffer.append(frame)
 
-                # If this is the end of the header block, then we want to build a
-                # mutant HEADERS frame that's massive. Use the original one we got,
-                # then set END_HEADERS and set its data appopriately. If it's not
-                # the end of the block, lose the current frame: we can't yield it.
-                if 'END_HEADERS' in frame.flags:
+                # If this is the end of the header block, then we want to
+                # build a mutant HEADERS frame that's massive. Use the
+                # original one we got, then set END_HEADERS and set its data
+                # appopriately. If it's not the end of the block, lose the
+                # current frame: we can't yield it.
+                if flag_byte & FLAG_END_HEADERS:
                     frame = self._headers_buffer[0]
-                    frame.flags.add('END_HEADERS')
+                    frame.flag_byte |= FLAG_END_HEADERS
+                    frame._flags = None
 
-                    frame_data = bytearray()
-                    for header_frame in self._headers_buffer:
-                        frame_data.extend(header_frame)
+                    frame.data = b''.join([
+                        header_frame.data for header_frame in self._headers_buffer
+                    ])
 
-                    frame.data = frame_data
                     self._headers_buffer = []
 
                 else:
-                    frame = None
-            elif is_headers_or_push_promise and 'END_HEADERS' not in frame.flags:
-                # This is the start of a headers block! Save the frame off and then
-                # act like we didn't receive one.
+                    continue
+
+            elif (frame_type == 0x01 or frame_type == 0x05) and not flag_byte & FLAG_END_HEADERS:
+                # This is the start of a headers block! Save the frame off
+                # and then act like we didn't receive one.
                 self._headers_buffer.append(frame)
-                frame = None
-
-            # If we got a frame we didn't understand or shouldn't yield, rather
-            # than return None it'd be better if we just tried to get the next
-            # frame in the sequence instead. Recurse back into ourselves to do
-            # that. This is safe because the amount of work we have to do here is
-            # strictly bounded by the length of the buffer.
-            if frame:
-                yield frame
\ No newline at end of file
+                continue
+
+            yield frame
@@ -18,5 +18,10 @@ from .frame_length import (
 )
 from .frame_flags import (
     Flag,
-    Flags
+    Flags,
+    FLAG_END_STREAM,
+    FLAG_ACK,
+    FLAG_END_HEADERS,
+    FLAG_PADDED,
+    FLAG_PRIORITY
 )
\ No newline at end of file
@@ -59,3 +59,12 @@ class Flags(MutableSet):  # type: ignore
         #         )
         #     )
         return self._flags.add(value)
+
+
+# Flag bits as they appear in the frame header, so parsed frames can be
+# checked with a mask instead of building a set of flag names.
+FLAG_END_STREAM = 0x01
+FLAG_ACK = 0x01
+FLAG_END_HEADERS = 0x04
+FLAG_PADDED = 0x08
+FLAG_PRIORITY = 0x20
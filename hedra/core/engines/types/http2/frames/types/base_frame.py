@@ -8,7 +8,7 @@ data and logic for aiding the connection when it comes to reading from the
 socket.
 """
 import sys
-from typing import Any, Optional,  List, Iterable
+from typing import Any, Optional, Iterable
 from hedra.core.engines.types.http2.stream import Stream
 from hedra.core.engines.types.http2.events.remote_settings_changed_event import RemoteSettingsChanged
 from hedra.core.engines.types.http2.events.settings_acknowledged_event import SettingsAcknowledged
@@ -27,6 +27,7 @@ from hedra.core.engines.types.http2.events.window_updated_event import WindowUpd
 from .attributes import (
     Flag,
     Flags,
+    FLAG_PADDED,
     _STRUCT_HBBBL,
     _STRUCT_H,
     _STRUCT_B,
@@ -38,12 +39,39 @@ from .attributes import (
 from .utils import raw_data_repr
 
 
+CONTINUATION_FLAGS = (
+    Flag('END_HEADERS', 0x04),
+)
+
+DATA_FLAGS = (
+    Flag('END_STREAM', 0x01),
+    Flag('PADDED', 0x08),
+)
+
+HEADERS_FLAGS = (
+    Flag('END_STREAM', 0x01),
+    Flag('END_HEADERS', 0x04),
+    Flag('PADDED', 0x08),
+    Flag('PRIORITY', 0x20),
+)
+
+ACK_FLAGS = (
+    Flag('ACK', 0x01),
+)
+
+PUSH_PROMISE_FLAGS = (
+    Flag('END_HEADERS', 0x04),
+    Flag('PADDED', 0x08)
+)
+
+NO_FLAGS = ()
+
+
 class Frame:
     __slots__ = (
         'stream_id', 
-        'flags',
+        '_flags',
         'body_len',
-        'flags',
         'type',
         'frame_type',
         'data',
@@ -107,18 +135,16 @@ class Frame:
         self.opaque_data = b''
         self.promised_stream_id = 0
         self.window_increment = 0
-        self.flag_byte = 0x0
-        self.defined_flags: List[Flag] = []
+        self.flag_byte = parsed_flag_byte
+        self.defined_flags: Iterable[Flag] = NO_FLAGS
 
-        #: The flags set for this frame.
-        self.flags = Flags(self.defined_flags)
+        # Flag names are only decoded on access, parsed frames are
+        # checked against flag_byte with a bitmask instead.
+        self._flags: Optional[Flags] = None
 
         #: The frame length, excluding the nine-byte header.
         self.body_len = 0
 
-        for flag in flags:
-            self.flags.add(flag)
-
         if self.type == 0xA:
             # ALTSVC
             self.origin = kwargs.get('origin', b'')
@@ -127,19 +153,14 @@ class Frame:
         elif self.type == 0x09:
             # CONTINUATION
 
-            self.defined_flags = [
-                Flag('END_HEADERS', 0x04)
-            ]
+            self.defined_flags = CONTINUATION_FLAGS
 
             self.data = kwargs.get('data')
 
         elif self.type == 0x0:
             # DATA
 
-            self.defined_flags = [
-                Flag('END_STREAM', 0x01),
-                Flag('PADDED', 0x08),
-            ]
+            self.defined_flags = DATA_FLAGS
 
             self.pad_length = kwargs.get('pad_length', 0)
             self.data = kwargs.get('data', b'')
@@ -152,12 +173,7 @@ class Frame:
 
         elif self.type == 0x01:
             # HEADERS
-            self.defined_flags = [
-                Flag('END_STREAM', 0x01),
-                Flag('END_HEADERS', 0x04),
-                Flag('PADDED', 0x08),
-                Flag('PRIORITY', 0x20),
-            ]
+            self.defined_flags = HEADERS_FLAGS
 
             self.data = kwargs.get('data', b'')
             self.pad_length = kwargs.get('pad_length', 0)
@@ -168,9 +184,7 @@ class Frame:
         elif self.type == 0x06:
             # PING
 
-            self.defined_flags = [
-                Flag('ACK', 0x01)
-            ]
+            self.defined_flags = ACK_FLAGS
 
             self.opaque_data = kwargs.get('opaque_data', b'')
 
@@ -182,10 +196,7 @@ class Frame:
 
         elif self.type == 0x05:
             # PUSH PROMISE
-            self.defined_flags = [
-                Flag('END_HEADERS', 0x04),
-                Flag('PADDED', 0x08)
-            ]
+            self.defined_flags = PUSH_PROMISE_FLAGS
 
             self.promised_stream_id = kwargs.get('promised_stream_id', 0)
             self.pad_length = kwargs.get('pad_length', 0)
@@ -197,9 +208,7 @@ class Frame:
 
         elif self.type == 0x04:
             # SETTINGS
-            self.defined_flags = [
-                Flag('ACK', 0x01)
-            ]
+            self.defined_flags = ACK_FLAGS
 
             self.settings = kwargs.get('settings', {})
 
@@ -209,11 +218,21 @@ class Frame:
 
         else:
             # EXTENSION
-            self.flag_byte = kwargs.get('flag_byte', 0x0)
+            self.flag_byte = kwargs.get('flag_byte', parsed_flag_byte)
 
-        for flag, flag_bit in self.defined_flags:
-            if parsed_flag_byte & flag_bit:
-                self.flags.add(flag)
+        for flag in flags:
+            self.flags.add(flag)
+
+    @property
+    def flags(self) -> Flags:
+        if self._flags is None:
+            self._flags = Flags(self.defined_flags)
+
+            for flag, flag_bit in self.defined_flags:
+                if self.flag_byte & flag_bit:
+                    self._flags.add(flag)
+
+        return self._flags
 
     def __repr__(self) -> str:
         body_repr = self._body_repr(),
@@ -231,12 +250,24 @@ class Frame:
         flow control.
         """
         padding_len = 0
-        if 'PADDED' in self.flags:
+        if self.flag_bits & FLAG_PADDED:
             # Account for extra 1-byte padding length field, which is still
             # present if possibly zero-valued.
             padding_len = self.pad_length + 1
         return len(self.data) + padding_len
 
+    @property
+    def flag_bits(self) -> int:
+        if self._flags is None:
+            return self.flag_byte
+
+        flag_bits = 0
+        for flag, flag_bit in self.defined_flags:
+            if flag in self._flags:
+                flag_bits |= flag_bit
+
+        return flag_bits
+
     def parse_flags(self, flag_byte: int) -> Flags:
 
         for flag, flag_bit in self.defined_flags:
@@ -348,10 +379,7 @@ class Frame:
 
         self.body_len = len(body)
 
-
-        for flag, flag_bit in self.defined_flags:
-            if flag in self.flags:
-                flags |= flag_bit
+        flags |= self.flag_bits
 
         header = _STRUCT_HBBBL.pack(
             (self.body_len >> 8) & 0xFFFF,  # Length spread over top 24 bits
@@ -518,7 +546,7 @@ class Frame:
             # HEADER_TABLE_SIZE changes by the remote part affect our encoder: cf.
             # RFC 7540 Section 6.5.2.
             if  header_table_size_change:
-                connection._encoder.header_table_size = header_table_size_change.new_value
+                stream.header_encoder.header_table_size = header_table_size_change.new_value
 
             if max_frame_size_change:
                 stream.max_outbound_frame_size = max_frame_size_change.new_value
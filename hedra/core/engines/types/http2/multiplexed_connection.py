@@ -0,0 +1,515 @@
+import asyncio
+import time
+from collections import deque
+from ssl import SSLContext
+from typing import (
+    Deque,
+    Dict,
+    Optional,
+    Tuple
+)
+from hedra.core.engines.types.common.encoder import Encoder
+from hedra.core.engines.types.common.timeouts import Timeouts
+from hedra.core.engines.types.common.types import RequestTypes
+from hedra.core.engines.types.common.protocols.shared.reader import Reader
+from hedra.core.engines.types.common.protocols.shared.writer import Writer
+from hedra.core.engines.types.common.protocols.tcp import TCPConnection
+from hedra.core.engines.types.http2.errors.types import ErrorCodes
+from hedra.core.engines.types.http2.streams.stream_settings import Settings
+from hedra.core.engines.types.http2.streams.stream_settings_codes import SettingCodes
+from hedra.core.engines.types.http2.windows.window_manager import WindowManager
+from .frames import FrameBuffer
+from .frames.types.base_frame import Frame
+from .frames.types.attributes import (
+    FLAG_ACK,
+    FLAG_END_STREAM
+)
+from .multiplexed_stream import MultiplexedStream
+
+
+# Stream IDs are 31 bit and client initiated streams are odd.
+MAX_STREAM_ID = 2**31 - 1
+
+
+class MultiplexedConnection:
+    READ_NUM_BYTES=65536
+    CONNECTION_WINDOW=2**24
+
+    __slots__ = (
+        'timeouts',
+        'stream_limit',
+        'stream_type',
+        'connected',
+        'dns_address',
+        'port',
+        'created',
+        'last_used',
+        'connection',
+        'reader',
+        'writer',
+        'lock',
+        'streams',
+        'next_stream_id',
+        'active',
+        'pending',
+        'goaway',
+        'error',
+        'local_settings',
+        'remote_settings',
+        'settings_received',
+        'window_updated',
+        'outbound_window',
+        'max_outbound_frame_size',
+        'inbound',
+        'frame_buffer',
+        'header_encoder',
+        'slot_waiters',
+        'reader_task'
+    )
+
+    def __init__(
+        self,
+        timeouts: Timeouts,
+        stream_limit: int,
+        stream_type: RequestTypes
+    ) -> None:
+        self.timeouts = timeouts
+        self.stream_limit = stream_limit
+        self.stream_type = stream_type
+        self.connected = False
+        self.dns_address = None
+        self.port = None
+        self.created = 0
+        self.last_used = 0
+
+        self.connection = TCPConnection(stream_type)
+        self.reader: Optional[Reader] = None
+        self.writer: Optional[Writer] = None
+        self.lock = asyncio.Lock()
+
+        self.streams: Dict[int, MultiplexedStream] = {}
+        self.next_stream_id = 1
+        self.active = 0
+        self.pending = 0
+        self.goaway = False
+        self.error: Optional[str] = None
+
+        self.local_settings = Settings(
+            client=True,
+            initial_values={
+                SettingCodes.ENABLE_PUSH: 0,
+                SettingCodes.MAX_CONCURRENT_STREAMS: stream_limit,
+                SettingCodes.MAX_HEADER_LIST_SIZE: 65535,
+            }
+        )
+        del self.local_settings[SettingCodes.ENABLE_CONNECT_PROTOCOL]
+
+        self.remote_settings = Settings(
+            client=False
+        )
+
+        self.settings_received = asyncio.Event()
+        self.window_updated = asyncio.Event()
+
+        # The connection window is not affected by SETTINGS, so both
+        # sides start from the RFC 7540 default.
+        self.outbound_window = self.remote_settings.initial_window_size
+        self.max_outbound_frame_size = self.remote_settings.max_frame_size
+        self.inbound = WindowManager(self.CONNECTION_WINDOW)
+
+        self.frame_buffer = FrameBuffer()
+        self.header_encoder = Encoder()
+        self.slot_waiters: Deque[asyncio.Future] = deque()
+        self.reader_task: Optional[asyncio.Task] = None
+
+    @property
+    def max_streams(self) -> int:
+        return min(
+            self.stream_limit,
+            self.remote_settings.max_concurrent_streams
+        )
+
+    @property
+    def available(self) -> int:
+        return self.max_streams - self.pending
+
+    @property
+    def closed(self) -> bool:
+        return (
+            self.error is not None or
+            self.reader is None or
+            self.reader._eof or
+            self.writer.is_closing()
+        )
+
+    @property
+    def reusable(self) -> bool:
+        # Connections that have started to drain keep serving the streams
+        # they already carry but are never handed new ones.
+        return (
+            self.connected and
+            not self.closed and
+            not self.goaway and
+            self.next_stream_id < MAX_STREAM_ID
+        )
+
+    async def connect(
+        self,
+        hostname: str,
+        dns_address: str,
+        port: int,
+        socket_config: Tuple[int, int, int, int, Tuple[int, int]],
+        ssl: Optional[SSLContext]=None,
+        timeout: Optional[float]=None
+    ) -> MultiplexedStream:
+
+        if self.connected is False:
+            await self.open(
+                hostname,
+                dns_address,
+                port,
+                socket_config,
+                ssl=ssl,
+                timeout=timeout
+            )
+
+        stream = MultiplexedStream(self.timeouts)
+        await asyncio.wait_for(
+            self.reserve(stream),
+            timeout=timeout
+        )
+
+        return stream
+
+    async def open(
+        self,
+        hostname: str,
+        dns_address: str,
+        port: int,
+        socket_config: Tuple[int, int, int, int, Tuple[int, int]],
+        ssl: Optional[SSLContext]=None,
+        timeout: Optional[float]=None
+    ) -> None:
+
+        # Every stream assigned to this connection waits on the same
+        # handshake rather than opening a socket of its own.
+        async with self.lock:
+
+            if self.connected:
+                return
+
+            if self.error:
+                raise Exception(self.error)
+
+            try:
+                self.reader, self.writer = await asyncio.wait_for(
+                    self.connection.create_http2(
+                        hostname,
+                        socket_config=socket_config,
+                        ssl=ssl
+                    ),
+                    timeout=timeout
+                )
+
+                self.dns_address = dns_address
+                self.port = port
+
+                settings_frame = Frame(
+                    0,
+                    0x04,
+                    settings={
+                        setting_name: setting_value for setting_name, setting_value in self.local_settings.items()
+                    }
+                )
+
+                window_frame = Frame(
+                    0,
+                    0x08,
+                    window_increment=self.CONNECTION_WINDOW - self.remote_settings.initial_window_size
+                )
+
+                self.writer.write(
+                    b'PRI * HTTP/2.0\r\n\r\nSM\r\n\r\n' + settings_frame.serialize() + window_frame.serialize()
+                )
+
+                self.reader_task = asyncio.create_task(
+                    self._read_frames()
+                )
+
+                # The server's SETTINGS carry MAX_CONCURRENT_STREAMS, so no
+                # stream is opened until they arrive.
+                await asyncio.wait_for(
+                    self.settings_received.wait(),
+                    timeout=timeout
+                )
+
+                if self.error:
+                    raise Exception(self.error)
+
+                self.connected = True
+                self.created = time.monotonic()
+                self.last_used = self.created
+
+            except asyncio.TimeoutError:
+                self.abort()
+                raise Exception('Connection timed out.')
+
+            except ConnectionResetError:
+                self.abort()
+                raise Exception('Connection reset.')
+
+            except Exception as connection_error:
+                self.abort()
+                raise connection_error
+
+    async def reserve(self, stream: MultiplexedStream) -> None:
+        loop = asyncio.get_running_loop()
+
+        while self.active >= self.max_streams:
+
+            if not self.reusable:
+                raise Exception(self.error or 'Connection closed.')
+
+            waiter = loop.create_future()
+            self.slot_waiters.append(waiter)
+
+            await waiter
+
+        if not self.reusable:
+            raise Exception(self.error or 'Connection closed.')
+
+        self.active += 1
+        stream.reserved = True
+
+    def open_stream(self, stream: MultiplexedStream) -> int:
+
+        # IDs are assigned when headers are written rather than when the
+        # slot is reserved so they always reach the server in order.
+        stream.stream_id = self.next_stream_id
+        self.next_stream_id += 2
+
+        stream.inbound = WindowManager(self.local_settings.initial_window_size)
+        stream.outbound_window = self.remote_settings.initial_window_size
+
+        self.streams[stream.stream_id] = stream
+
+        return stream.stream_id
+
+    def close_stream(self, stream: MultiplexedStream) -> None:
+
+        if stream.stream_id in self.streams:
+            del self.streams[stream.stream_id]
+
+            if stream.ended is False and not self.closed:
+                self.write(
+                    Frame(
+                        stream.stream_id,
+                        0x03,
+                        error_code=ErrorCodes.CANCEL
+                    ).serialize()
+                )
+
+        if stream.reserved:
+            stream.reserved = False
+            self.active -= 1
+
+            while self.slot_waiters:
+                waiter = self.slot_waiters.popleft()
+                if not waiter.done():
+                    waiter.set_result(None)
+                    break
+
+        self.last_used = time.monotonic()
+
+    async def wait_for_window(self, stream: MultiplexedStream) -> None:
+
+        if stream.error:
+            raise Exception(stream.error)
+
+        self.window_updated.clear()
+        await self.window_updated.wait()
+
+    def write(self, data: bytes) -> None:
+        self.writer._transport.write(data)
+
+    async def _read_frames(self) -> None:
+
+        error = 'Connection closed.'
+
+        try:
+            while True:
+                data = await self.reader.read(self.READ_NUM_BYTES)
+                if not data:
+                    break
+
+                self.frame_buffer.feed(data)
+                self.frame_buffer.max_frame_size = self.max_outbound_frame_size
+
+                # Control frames generated while reading a chunk are
+                # coalesced into a single write.
+                outbound = bytearray()
+                for frame in self.frame_buffer:
+                    self._process_frame(frame, outbound)
+
+                if outbound:
+                    self.write(outbound)
+
+        except asyncio.CancelledError:
+            error = 'Connection closed.'
+
+        except Exception as read_error:
+            error = str(read_error)
+
+        self._terminate(error)
+
+    def _process_frame(self, frame: Frame, outbound: bytearray) -> None:
+
+        if frame.type == 0x0:
+            # DATA
+            flow_controlled_length = frame.flow_controlled_length
+
+            self.inbound.window_consumed(flow_controlled_length)
+            connection_increment = self.inbound.process_bytes(flow_controlled_length)
+
+            if connection_increment:
+                outbound.extend(
+                    Frame(0, 0x08, window_increment=connection_increment).serialize()
+                )
+
+            stream = self.streams.get(frame.stream_id)
+            if stream is None:
+                return
+
+            stream.inbound.window_consumed(flow_controlled_length)
+            stream.deliver(frame)
+
+            if not frame.flag_byte & FLAG_END_STREAM:
+                stream_increment = stream.inbound.process_bytes(flow_controlled_length)
+
+                if stream_increment:
+                    outbound.extend(
+                        Frame(frame.stream_id, 0x08, window_increment=stream_increment).serialize()
+                    )
+
+        elif frame.type == 0x01:
+            # HEADERS
+            stream = self.streams.get(frame.stream_id)
+            if stream:
+                stream.deliver(frame)
+
+        elif frame.type == 0x03:
+            # RESET
+            stream = self.streams.get(frame.stream_id)
+            if stream:
+                stream.ended = True
+                stream.fail(f'Connection - {frame.stream_id} err: stream reset - {self._error_name(frame.error_code)}')
+                self.window_updated.set()
+
+        elif frame.type == 0x04:
+            # SETTINGS
+            if frame.flag_byte & FLAG_ACK:
+                self.local_settings.acknowledge()
+                return
+
+            self.remote_settings.update(frame.settings)
+            changes = self.remote_settings.acknowledge()
+
+            initial_window_size_change = changes.get(SettingCodes.INITIAL_WINDOW_SIZE)
+            header_table_size_change = changes.get(SettingCodes.HEADER_TABLE_SIZE)
+            max_frame_size_change = changes.get(SettingCodes.MAX_FRAME_SIZE)
+
+            if initial_window_size_change:
+                window_delta = initial_window_size_change.new_value - initial_window_size_change.original_value
+
+                for stream in self.streams.values():
+                    stream.outbound_window += window_delta
+
+            # HEADER_TABLE_SIZE changes by the remote part affect our encoder: cf.
+            # RFC 7540 Section 6.5.2.
+            if header_table_size_change:
+                self.header_encoder.header_table_size = header_table_size_change.new_value
+
+            if max_frame_size_change:
+                self.max_outbound_frame_size = max_frame_size_change.new_value
+
+            ack_frame = Frame(0, 0x04)
+            ack_frame.flags.add('ACK')
+            outbound.extend(ack_frame.serialize())
+
+            self.settings_received.set()
+            self.window_updated.set()
+            self._wake_slot_waiters()
+
+        elif frame.type == 0x06:
+            # PING
+            if not frame.flag_byte & FLAG_ACK:
+                ping_frame = Frame(0, 0x06, opaque_data=frame.opaque_data)
+                ping_frame.flags.add('ACK')
+                outbound.extend(ping_frame.serialize())
+
+        elif frame.type == 0x07:
+            # GOAWAY
+            self.goaway = True
+
+            for stream_id, stream in list(self.streams.items()):
+                if stream_id > frame.last_stream_id:
+                    stream.fail(f'Connection - {stream_id} err: connection terminated - {self._error_name(frame.error_code)}')
+
+            self.window_updated.set()
+            self._wake_slot_waiters()
+
+        elif frame.type == 0x08:
+            # WINDOW UPDATE
+            if frame.stream_id == 0:
+                self.outbound_window += frame.window_increment
+
+            else:
+                stream = self.streams.get(frame.stream_id)
+                if stream:
+                    stream.outbound_window += frame.window_increment
+
+            self.window_updated.set()
+
+    def _error_name(self, error_code: int) -> str:
+        try:
+            return ErrorCodes(error_code).name
+
+        except ValueError:
+            return str(error_code)
+
+    def _wake_slot_waiters(self) -> None:
+        while self.slot_waiters:
+            waiter = self.slot_waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+
+    def _terminate(self, error: str) -> None:
+        if self.error is None:
+            self.error = error
+
+        self.connected = False
+
+        for stream in self.streams.values():
+            stream.fail(self.error)
+
+        self.settings_received.set()
+        self.window_updated.set()
+        self._wake_slot_waiters()
+
+    def abort(self):
+        try:
+            self.writer.transport.abort()
+
+        except Exception:
+            pass
+
+        if self.reader_task and not self.reader_task.done():
+            self.reader_task.cancel()
+
+        self._terminate('Connection closed.')
+
+    async def close(self):
+        if self.reader_task and not self.reader_task.done():
+            self.reader_task.cancel()
+
+        await self.connection.close()
@@ -0,0 +1,169 @@
+import asyncio
+from typing import Optional
+from hedra.core.engines.types.http2.config import H2Configuration
+from hedra.core.engines.types.http2.events.deferred_headers_event import DeferredHeaders
+from hedra.core.engines.types.tracing.trace_session import Trace
+from .action import HTTP2Action
+from .frames.types.base_frame import Frame
+from .frames.types.attributes import FLAG_END_STREAM
+from .multiplexed_connection import MultiplexedConnection
+from .multiplexed_stream import MultiplexedStream
+from .result import HTTP2Result
+
+
+class MultiplexedPipe:
+
+    __slots__ = (
+        'connection',
+        'stream'
+    )
+
+    CONFIG = H2Configuration(
+        validate_inbound_headers=False,
+    )
+
+    def __init__(self, connection: MultiplexedConnection) -> None:
+        self.connection = connection
+        self.stream: Optional[MultiplexedStream] = None
+
+    def send_request_headers(self, request: HTTP2Action, stream: MultiplexedStream):
+        self.stream = stream
+        stream_id = self.connection.open_stream(stream)
+
+        end_stream = request.encoded_data is None
+
+        # The block is encoded against the connection's dynamic table, so
+        # it has to be written before any other stream encodes headers.
+        header_block = self.connection.header_encoder.encode_cached(
+            request.header_block_key
+        )
+
+        max_frame_size = self.connection.max_outbound_frame_size
+
+        headers_frame = Frame(stream_id, 0x01, data=header_block[:max_frame_size])
+
+        if end_stream:
+            headers_frame.flags.add('END_STREAM')
+
+        if len(header_block) <= max_frame_size:
+            headers_frame.flags.add('END_HEADERS')
+
+        header_frames = bytearray(headers_frame.serialize())
+
+        for offset in range(max_frame_size, len(header_block), max_frame_size):
+            continuation_frame = Frame(
+                stream_id,
+                0x09,
+                data=header_block[offset:offset + max_frame_size]
+            )
+
+            if offset + max_frame_size >= len(header_block):
+                continuation_frame.flags.add('END_HEADERS')
+
+            header_frames.extend(continuation_frame.serialize())
+
+        # A header block must not be interleaved with frames from other
+        # streams, so it is always written in one call.
+        self.connection.write(header_frames)
+
+    async def submit_request_body(
+        self,
+        request: HTTP2Action,
+        stream: MultiplexedStream,
+        data: Optional[bytes]=None,
+        end_stream: bool=True
+    ) -> None:
+        connection = self.connection
+
+        if data is None:
+            data = request.encoded_data
+
+        if not data and end_stream:
+            data_frame = Frame(stream.stream_id, 0x0)
+            data_frame.flags.add('END_STREAM')
+            connection.write(data_frame.serialize())
+
+        while data:
+            flow = min(
+                stream.outbound_window,
+                connection.outbound_window,
+                connection.max_outbound_frame_size
+            )
+
+            if flow <= 0:
+                await connection.wait_for_window(stream)
+                continue
+
+            chunk_size = min(len(data), flow)
+            chunk, data = data[:chunk_size], data[chunk_size:]
+
+            stream.outbound_window -= chunk_size
+            connection.outbound_window -= chunk_size
+
+            data_frame = Frame(stream.stream_id, 0x0, data=chunk)
+
+            if len(data) == 0 and end_stream:
+                data_frame.flags.add('END_STREAM')
+
+            connection.write(data_frame.serialize())
+
+    async def receive_response(
+        self,
+        action: HTTP2Action,
+        response: HTTP2Result,
+        stream: MultiplexedStream,
+        trace: Trace
+    ):
+
+        done = False
+        while done is False:
+
+            try:
+                frame = await asyncio.wait_for(
+                    stream.next_frame(),
+                    timeout=stream.timeouts.socket_read_timeout
+                )
+
+            except asyncio.TimeoutError as timeout:
+                response._status = 408
+                response.error = str(timeout)
+
+                return response
+
+            if frame.type == 0x01:
+                # HEADERS
+                deferred_headers = DeferredHeaders(
+                    stream.encoder,
+                    frame,
+                    self.CONFIG.header_encoding
+                )
+
+                done = deferred_headers.end_stream
+                response.deferred_headers = deferred_headers
+
+                if trace and trace.on_response_headers_received:
+                    await trace.on_response_headers_received(
+                        trace.span,
+                        action,
+                        response
+                    )
+
+            elif frame.type == 0x0:
+                # DATA
+                done = frame.flag_byte & FLAG_END_STREAM > 0
+
+                response.body_size += action.body_policy.keep(
+                    response.body,
+                    frame.data
+                )
+
+                if trace and trace.on_response_data_received:
+                    await trace.on_response_data_received(
+                        trace.span,
+                        action,
+                        response
+                    )
+
+        stream.ended = True
+
+        return response
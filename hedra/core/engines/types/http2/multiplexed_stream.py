@@ -0,0 +1,61 @@
+import asyncio
+from collections import deque
+from typing import Deque, Optional
+from hedra.core.engines.types.common.encoder import Encoder
+from hedra.core.engines.types.common.timeouts import Timeouts
+from hedra.core.engines.types.http2.windows.window_manager import WindowManager
+from .frames.types.base_frame import Frame
+
+
+class MultiplexedStream:
+
+    __slots__ = (
+        'stream_id',
+        'timeouts',
+        'encoder',
+        'frames',
+        'waiter',
+        'inbound',
+        'outbound_window',
+        'reserved',
+        'ended',
+        'error'
+    )
+
+    def __init__(self, timeouts: Timeouts) -> None:
+        self.stream_id = 0
+        self.timeouts = timeouts
+        self.encoder: Optional[Encoder] = None
+        self.frames: Deque[Frame] = deque()
+        self.waiter: Optional[asyncio.Future] = None
+        self.inbound: Optional[WindowManager] = None
+        self.outbound_window = 0
+        self.reserved = False
+        self.ended = False
+        self.error: Optional[str] = None
+
+    def deliver(self, frame: Frame) -> None:
+        self.frames.append(frame)
+        self._wake()
+
+    def fail(self, error: str) -> None:
+        if self.error is None:
+            self.error = error
+
+        self._wake()
+
+    async def next_frame(self) -> Frame:
+
+        while len(self.frames) == 0:
+
+            if self.error:
+                raise Exception(self.error)
+
+            self.waiter = asyncio.get_running_loop().create_future()
+            await self.waiter
+
+        return self.frames.popleft()
+
+    def _wake(self) -> None:
+        if self.waiter and not self.waiter.done():
+            self.waiter.set_result(None)
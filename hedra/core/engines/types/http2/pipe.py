@@ -1,5 +1,5 @@
 import asyncio
-from hedra.core.engines.types.common.encoder import Encoder
+from typing import Optional
 from hedra.core.engines.types.common.decoder import Decoder
 from hedra.core.engines.types.common.hpack.table import HeaderTable
 from hedra.core.engines.types.http2.config import H2Configuration
@@ -21,6 +21,10 @@ from .action import HTTP2Action
 from .result import HTTP2Result
 from .windows import WindowManager
 from .frames.types.base_frame import Frame
+from .frames.types.attributes import (
+    FLAG_ACK,
+    FLAG_END_STREAM
+)
 
 
 class HTTP2Pipe:
@@ -28,7 +32,6 @@ class HTTP2Pipe:
         '_h2_state',
         'connected',
         'concurrency',
-        '_encoder',
         '_decoder',
         '_init_sent',
         'stream_id',
@@ -51,7 +54,6 @@ class HTTP2Pipe:
     def __init__(self, concurrency):
         self.connected = False
         self.concurrency = concurrency
-        self._encoder = Encoder()
         self._decoder = Decoder()
         self._decoder.header_table = HeaderTable()
         self._decoder.max_allowed_table_size = self._decoder.header_table.maxsize
@@ -106,7 +108,9 @@ class HTTP2Pipe:
 
         self._headers_sent = False
 
-        if self._init_sent is False or stream.reset_connection:
+        # Pipes are pooled separately from connections, so the connection
+        # preface is sent whenever the stream is on a freshly opened socket.
+        if stream.reset_connection:
 
             window_increment = 65536
 
@@ -114,6 +118,7 @@ class HTTP2Pipe:
 
             stream.write(bytes(stream.connection_data))
             self._init_sent = True
+            stream.reset_connection = False
 
             self.outbound_flow_control_window = self.remote_settings.initial_window_size
 
@@ -124,13 +129,10 @@ class HTTP2Pipe:
         stream.current_outbound_window_size = self.remote_settings.initial_window_size
 
         end_stream = request.encoded_data is None
-        encoded_headers = request.encoded_headers
 
-        if request.hpack_encoder.header_table.maxsize != self._encoder.header_table.maxsize:
-            request.hpack_encoder.header_table_size = self._encoder.header_table.maxsize
-            request._setup_headers()
-    
-        stream.headers_frame.data = encoded_headers[0]
+        stream.headers_frame.data = stream.header_encoder.encode_cached(
+            request.header_block_key
+        )
         headers_frame = stream.headers_frame
         if end_stream:
             headers_frame.flags.add('END_STREAM')
@@ -171,7 +173,7 @@ class HTTP2Pipe:
                 
                 return response
 
-            stream.frame_buffer.data.extend(data)
+            stream.frame_buffer.feed(data)
             stream.frame_buffer.max_frame_size = stream.max_outbound_frame_size
 
             write_data = bytearray()
@@ -184,7 +186,7 @@ class HTTP2Pipe:
                     if frame.type == 0x0:
                         # DATA
 
-                        end_stream = 'END_STREAM' in frame.flags
+                        end_stream = frame.flag_byte & FLAG_END_STREAM
                         flow_controlled_length = frame.flow_controlled_length
                         frame_data = frame.data
 
@@ -205,8 +207,8 @@ class HTTP2Pipe:
                             if end_stream:
                                 done = True
 
-                            stream_events[0].data = frame_data
-                            stream_events[0].flow_controlled_length = flow_controlled_length
+                            event.data = frame_data
+                            event.flow_controlled_length = flow_controlled_length
 
                             if trace and trace.on_response_data_received:
                                 await trace.on_response_data_received(
@@ -267,7 +269,7 @@ class HTTP2Pipe:
                     elif frame.type == 0x04:
                         # SETTINGS
 
-                        if 'ACK' in frame.flags:
+                        if frame.flag_byte & FLAG_ACK:
 
                             changes = self.local_settings.acknowledge()
                     
@@ -312,7 +314,7 @@ class HTTP2Pipe:
                         # HEADER_TABLE_SIZE changes by the remote part affect our encoder: cf.
                         # RFC 7540 Section 6.5.2.
                         if  header_table_size_change:
-                            self._encoder.header_table_size = header_table_size_change.new_value
+                            stream.header_encoder.header_table_size = header_table_size_change.new_value
 
                         if max_frame_size_change:
                             stream.max_outbound_frame_size = max_frame_size_change.new_value
@@ -390,15 +392,26 @@ class HTTP2Pipe:
                 if event.data is None:
                     event.data = b''
 
-                response.body.extend(event.data)
+                response.body_size += action.body_policy.keep(
+                    response.body,
+                    event.data
+                )
 
             if done:
                 break
 
         return response
 
-    async def submit_request_body(self, request: HTTP2Action, stream: Stream) -> None:
-        data = request.encoded_data
+    async def submit_request_body(
+        self,
+        request: HTTP2Action,
+        stream: Stream,
+        data: Optional[bytes]=None,
+        end_stream: bool=True
+    ) -> None:
+
+        if data is None:
+            data = request.encoded_data
         
         while data:
             local_flow = stream.current_outbound_window_size
@@ -423,7 +436,8 @@ class HTTP2Pipe:
 
             stream.write(df.serialize())
 
-        df = Frame(stream.stream_id, 0x0)
-        df.flags.add('END_STREAM')
+        if end_stream:
+            df = Frame(stream.stream_id, 0x0)
+            df.flags.add('END_STREAM')
 
-        stream.write(df.serialize())
\ No newline at end of file
+            stream.write(df.serialize())
\ No newline at end of file
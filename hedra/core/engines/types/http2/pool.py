@@ -1,58 +1,248 @@
+import math
+import time
 from random import randrange
-from typing import List
+from typing import Dict, Hashable, List, Optional, Tuple, Union
+from hedra.core.engines.types.common.connection_pool import HostConnectionPool
 from hedra.core.engines.types.common.timeouts import Timeouts
 from hedra.core.engines.types.common.types import RequestTypes
+from hedra.core.engines.types.common.url import URL
 from .pipe import HTTP2Pipe
 from .connection import HTTP2Connection
+from .multiplexed_connection import MultiplexedConnection
+from .multiplexed_pipe import MultiplexedPipe
 
 
 class HTTP2Pool:
 
     __slots__ = (
-        'size',
-        'connections',
+        'idle',
         'pipes',
         'timeouts',
         'reset_connections',
-        'pool_type'
+        'pool_type',
+        'streams_per_connection',
+        'multiplexed_connections'
     )
 
-    def __init__(self, size: int, timeouts: Timeouts, reset_connections: bool=False) -> None:
-        self.size = size
-        self.connections: List[HTTP2Connection] = []
+    def __init__(
+        self,
+        size: int,
+        timeouts: Timeouts,
+        reset_connections: bool=False,
+        idle_timeout: Optional[float]=None,
+        max_connection_age: Optional[float]=None,
+        streams_per_connection: int=1
+    ) -> None:
+        self.idle: HostConnectionPool[HTTP2Connection] = HostConnectionPool(
+            size,
+            idle_timeout=idle_timeout,
+            max_connection_age=max_connection_age
+        )
         self.pipes: List[HTTP2Pipe] = []
         self.timeouts = timeouts
         self.reset_connections = reset_connections
         self.pool_type: RequestTypes = RequestTypes.HTTP2
+        self.streams_per_connection = max(streams_per_connection, 1)
+        self.multiplexed_connections: Dict[Hashable, List[MultiplexedConnection]] = {}
+
+    @property
+    def multiplexed(self):
+        return self.streams_per_connection > 1
+
+    @property
+    def connections_per_host(self):
+        return math.ceil(self.size/self.streams_per_connection)
+
+    @property
+    def size(self) -> int:
+        return self.idle.size
+
+    @size.setter
+    def size(self, size: int):
+        self.resize(size)
+
+    @property
+    def idle_timeout(self):
+        return self.idle.idle_timeout
+
+    @property
+    def max_connection_age(self):
+        return self.idle.max_connection_age
+
+    @property
+    def connections(self) -> List[Union[HTTP2Connection, MultiplexedConnection]]:
+        connections = list(self.idle)
+        for multiplexed in self.multiplexed_connections.values():
+            connections.extend(multiplexed)
+
+        return connections
+
+    @connections.setter
+    def connections(self, connections: List[HTTP2Connection]):
+        self.idle.clear()
+
+        for connection in connections:
+            self.release(None, connection)
+
+    @staticmethod
+    def host_key(url: URL) -> Tuple[str, str, int]:
+        return (
+            url.hostname,
+            url.ip_addr,
+            url.port
+        )
 
     def create_pool(self) -> None:
+        if self.multiplexed:
+            # Multiplexed connections carry their own protocol state, so
+            # they are opened per host on demand (or on warm up).
+            return
 
         self.pipes = [ HTTP2Pipe(self.size) for _ in range(self.size) ]
-        
-        self.connections = [
-            HTTP2Connection(
-                randrange(1, 2**20 + 2, 2), 
-                self.timeouts, 
-                self.size, 
-                self.reset_connections,
-                self.pool_type
-            ) for _ in range(0, self.size * 2, 2)
-        ]
-
-
-    def reset(self):
-        self.pipes.append(HTTP2Pipe(self.size))
-
-        self.connections.append(
-            HTTP2Connection(
-                randrange(1, 2**20 + 2, 2), 
-                self.timeouts, 
-                self.size, 
-                self.reset_connections,
-                self.pool_type
-            )
+
+    def create_connection(self) -> HTTP2Connection:
+        return HTTP2Connection(
+            randrange(1, 2**20 + 2, 2),
+            self.timeouts,
+            self.size,
+            self.reset_connections,
+            self.pool_type
+        )
+
+    def create_multiplexed(self, host_key: Hashable) -> MultiplexedConnection:
+        connection = MultiplexedConnection(
+            self.timeouts,
+            self.streams_per_connection,
+            self.pool_type
         )
 
+        multiplexed = self.multiplexed_connections.get(host_key)
+        if multiplexed is None:
+            multiplexed = []
+            self.multiplexed_connections[host_key] = multiplexed
+
+        multiplexed.append(connection)
+
+        return connection
+
+    def select_multiplexed(self, host_key: Hashable) -> MultiplexedConnection:
+        multiplexed = self.multiplexed_connections.get(host_key, [])
+        now = time.monotonic()
+
+        selected: Optional[MultiplexedConnection] = None
+        capacity = 0
+        for connection in list(multiplexed):
+
+            usable = connection.connected is False or (
+                connection.reusable and self.idle.healthy(connection, now)
+            )
+
+            if usable is False or connection.error:
+                # Draining connections stay open until their last stream
+                # is released.
+                if connection.pending == 0:
+                    multiplexed.remove(connection)
+                    connection.abort()
+
+                continue
+
+            capacity += connection.max_streams
+
+            if selected is None or connection.pending < selected.pending:
+                selected = connection
+
+        # Servers may advertise a lower MAX_CONCURRENT_STREAMS than we
+        # would like, so extra connections are opened until the streams
+        # they allow cover the pool size.
+        if selected is None or (
+            selected.available < 1 and capacity < self.size
+        ):
+            selected = self.create_multiplexed(host_key)
+
+        selected.pending += 1
+
+        return selected
+
+    def acquire(self, host_key: Hashable) -> Tuple[Union[HTTP2Pipe, MultiplexedPipe], Union[HTTP2Connection, MultiplexedConnection]]:
+
+        if self.multiplexed:
+            connection = self.select_multiplexed(host_key)
+            return MultiplexedPipe(connection), connection
+
+        if len(self.pipes) > 0:
+            pipe = self.pipes.pop()
+
+        else:
+            pipe = HTTP2Pipe(self.size)
+
+        connection = self.idle.acquire(host_key)
+        if connection is None:
+            connection = self.create_connection()
+
+        return pipe, connection
+
+    def release(
+        self,
+        host_key: Hashable,
+        connection: Union[HTTP2Connection, MultiplexedConnection],
+        pipe: Optional[Union[HTTP2Pipe, MultiplexedPipe]]=None
+    ) -> None:
+
+        if isinstance(connection, MultiplexedConnection):
+            self.release_multiplexed(connection, pipe)
+            return
+
+        if pipe is not None and len(self.pipes) < self.size:
+            self.pipes.append(pipe)
+
+        self.idle.release(host_key, connection)
+
+    def release_multiplexed(
+        self,
+        connection: MultiplexedConnection,
+        pipe: Optional[MultiplexedPipe]=None
+    ) -> None:
+        connection.pending -= 1
+
+        if pipe and pipe.stream:
+            connection.close_stream(pipe.stream)
+
+    def reset(
+        self,
+        connection: Optional[Union[HTTP2Connection, MultiplexedConnection]]=None,
+        pipe: Optional[Union[HTTP2Pipe, MultiplexedPipe]]=None
+    ):
+
+        if isinstance(connection, MultiplexedConnection):
+            # Only the failed stream is reset, the other streams sharing
+            # the connection are left running. Dead connections are pruned
+            # on the next acquire.
+            self.release_multiplexed(connection, pipe)
+            return
+
+        if connection is not None:
+            connection.abort()
+
+        if len(self.pipes) < self.size:
+            self.pipes.append(HTTP2Pipe(self.size))
+
+    def resize(self, size: int) -> None:
+        self.idle.resize(size)
+
+        del self.pipes[size:]
+
+        for multiplexed in self.multiplexed_connections.values():
+            capacity = sum([
+                connection.max_streams for connection in multiplexed
+            ])
+
+            while len(multiplexed) > 1 and multiplexed[-1].pending == 0 and capacity - multiplexed[-1].max_streams >= size:
+                capacity -= multiplexed[-1].max_streams
+                multiplexed.pop().abort()
+
+    def reap(self) -> int:
+        return self.idle.reap()
+
     async def close(self):
         for connection in self.connections:
             await connection.close()
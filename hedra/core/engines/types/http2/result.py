@@ -21,6 +21,7 @@ class HTTP2Result(BaseResult):
         'query',
         'hostname',
         'body',
+        'body_size',
         'response_code',
         'deferred_headers',
         '_headers',
@@ -55,6 +56,7 @@ class HTTP2Result(BaseResult):
         self.hostname = action.url.hostname
         self._headers: Dict[bytes, bytes] = {}
         self.body = bytearray()
+        self.body_size = 0
         
         self.response_code: str = None
         self.deferred_headers: DeferredHeaders = None
@@ -145,6 +147,9 @@ class HTTP2Result(BaseResult):
             if content_length:
                 self._size = int(content_length)
 
+            elif self.body_size > 0:
+                self._size = self.body_size
+
             elif len(self.body) > 0:
                 self._size = len(self.body)
             
@@ -28,6 +28,7 @@ class Stream:
         '_authority',
         'frame_buffer',
         'encoder',
+        'header_encoder',
         '_remote_settings',
         '_remote_settings_dict',
         'settings_frame',
@@ -60,6 +61,7 @@ class Stream:
         self._authority = None
         self.frame_buffer = None
         self.encoder: Encoder = None
+        self.header_encoder: Encoder = None
         self._remote_settings = Settings(
             client=False
         )
@@ -1,20 +1,14 @@
 import asyncio
 import time
 import uuid
-from collections import deque
-from typing import Dict, Any, Union, Coroutine, TypeVar, Optional
+from typing import Dict, Any, List, Union, Coroutine, TypeVar, Optional
 from hedra.core.engines.types.common.base_engine import BaseEngine
 from hedra.core.engines.types.common.ssl import get_default_ssl_context
 from hedra.core.engines.types.common.timeouts import Timeouts
 from hedra.core.engines.types.common.concurrency import Semaphore
-from hedra.core.engines.types.common.protocols.udp.quic_protocol import (
-    HeadersState,
-    ResponseFrameCollection,
-    FrameType,
-    encode_frame
-)
+from hedra.core.engines.types.common.protocols.udp.quic_protocol import ResponseFrameCollection
 from hedra.core.engines.types.tracing.trace_session import (
-    TraceSession, 
+    TraceSession,
     Trace
 )
 
@@ -30,6 +24,14 @@ A = TypeVar('A')
 R = TypeVar('R')
 
 
+# Only requests that are safe to replay may be sent as 0-RTT data.
+EARLY_DATA_METHODS = (
+    'GET',
+    'HEAD',
+    'OPTIONS'
+)
+
+
 @unstable
 class MercuryHTTP3Client(BaseEngine[Union[A, HTTP3Action], Union[R, HTTP3Result]]):
 
@@ -37,7 +39,6 @@ class MercuryHTTP3Client(BaseEngine[Union[A, HTTP3Action], Union[R, HTTP3Result]
         'session_id',
         'timeouts',
         'registered',
-        '_hosts',
         'closed',
         'sem',
         'pool',
@@ -49,11 +50,12 @@ class MercuryHTTP3Client(BaseEngine[Union[A, HTTP3Action], Union[R, HTTP3Result]
     )
 
     def __init__(
-        self, 
-        concurrency: int=10**3, 
-        timeouts: Timeouts = Timeouts(), 
+        self,
+        concurrency: int=10**3,
+        timeouts: Timeouts = Timeouts(),
         reset_connections: bool=False,
-        tracing_session: Optional[TraceSession]=None
+        tracing_session: Optional[TraceSession]=None,
+        streams_per_connection: int=1
     ) -> None:
         super().__init__()
 
@@ -61,11 +63,14 @@ class MercuryHTTP3Client(BaseEngine[Union[A, HTTP3Action], Union[R, HTTP3Result]
         self.timeouts = timeouts
 
         self.registered: Dict[str, HTTP3Action] = {}
-        self._hosts = {}
         self.closed = False
 
-        self.sem = asyncio.Semaphore(value=concurrency)
-        self.pool = Pool(concurrency, reset_connections=reset_connections)
+        self.sem = Semaphore(value=concurrency)
+        self.pool = Pool(
+            concurrency,
+            reset_connections=reset_connections,
+            streams_per_connection=streams_per_connection
+        )
         self.tracing_session: Union[TraceSession, None] = tracing_session
         self.logger = HedraLogger()
         self.logger.initialize()
@@ -74,7 +79,7 @@ class MercuryHTTP3Client(BaseEngine[Union[A, HTTP3Action], Union[R, HTTP3Result]
         self.waiter = None
 
         self.ssl_context = get_default_ssl_context()
-    
+
     def config_to_dict(self):
         return {
             'concurrency': self.pool.size,
@@ -83,40 +88,68 @@ class MercuryHTTP3Client(BaseEngine[Union[A, HTTP3Action], Union[R, HTTP3Result]
                 'socket_read_timeout': self.timeouts.socket_read_timeout,
                 'total_timeout': self.timeouts.total_timeout
             },
-            'reset_connections': self.pool.reset_connections
+            'reset_connections': self.pool.reset_connections,
+            'streams_per_connection': self.pool.streams_per_connection
         }
 
+    def resize_pool(self, concurrency: int):
+        if isinstance(self.sem, Semaphore):
+            self.sem.resize(concurrency - self.pool.size)
+
+        else:
+            self.sem = Semaphore(value=concurrency)
+
+        self.pool.resize(concurrency)
 
     async def set_pool(self, concurrency: int):
-        self.sem = asyncio.Semaphore(value=concurrency)
-        self.pool = Pool(concurrency, reset_connections=self.pool.reset_connections)
-        self.pool.create_pool()
+        self.resize_pool(concurrency)
 
     def extend_pool(self, increased_capacity: int):
-        self.pool.size += increased_capacity
-        for _ in range(increased_capacity):
-            self.pool.connections.append(
-                HTTP3Connection(self.pool.reset_connections)
-            )
-        
-        self.sem = Semaphore(self.pool.size)
+        self.resize_pool(self.pool.size + increased_capacity)
 
     def shrink_pool(self, decrease_capacity: int):
-        self.pool.size -= decrease_capacity
-        self.pool.connections = self.pool.connections[:self.pool.size]
-        self.sem = Semaphore(self.pool.size)
-    
+        self.resize_pool(self.pool.size - decrease_capacity)
+
+    async def warm(self, action: HTTP3Action, connections: int):
+        host_key = self.pool.host_key(action.url)
+        warmed: List[HTTP3Connection] = [
+            self.pool.create_connection() for _ in range(
+                min(connections, self.pool.connections_per_host)
+            )
+        ]
+
+        results = await asyncio.gather(*[
+            connection.make_connection(
+                action.url.ip_addr,
+                action.url.port,
+                action.url.socket_config,
+                server_name=action.url.hostname,
+                timeout=self.timeouts.connect_timeout
+            ) for connection in warmed
+        ], return_exceptions=True)
+
+        warmed_count = 0
+        for connection, result in zip(warmed, results):
+            if isinstance(result, Exception):
+                connection.abort()
+                continue
+
+            self.pool.add(host_key, connection)
+            warmed_count += 1
+
+        return warmed_count
+
     async def prepare(self, action: HTTP3Action) -> Coroutine[Any, Any, None]:
         try:
-                
-            if self._hosts.get(action.url.hostname) is None:
+
+            if action.url.load_resolved() is False:
                 socket_configs = await asyncio.wait_for(action.url.lookup(), timeout=self.timeouts.connect_timeout)
-            
+
                 for ip_addr, configs in socket_configs.items():
                     for config in configs:
 
-                        connection = HTTP3Connection()
-                        
+                        connection = self.pool.create_connection()
+
                         try:
                             await connection.make_connection(
                                 ip_addr,
@@ -129,10 +162,17 @@ class MercuryHTTP3Client(BaseEngine[Union[A, HTTP3Action], Union[R, HTTP3Result]
                             action.url.socket_config = config
                             action.url.ip_addr = ip_addr
                             action.url.has_ip_addr = True
+
+                            # The probe connection is kept, and its session
+                            # ticket lets later connections resume.
+                            self.pool.add(
+                                self.pool.host_key(action.url),
+                                connection
+                            )
                             break
 
                         except Exception as e:
-                            pass
+                            connection.abort()
 
                     if action.url.socket_config:
                         break
@@ -140,22 +180,14 @@ class MercuryHTTP3Client(BaseEngine[Union[A, HTTP3Action], Union[R, HTTP3Result]
                 if action.url.socket_config is None:
                     raise Exception('Connection Failed')
 
-                self._hosts[action.url.hostname] = {
-                    'ip_addr': action.url.ip_addr,
-                    'socket_config': action.url.socket_config
-                }
-
-            else:
-                host_config = self._hosts[action.url.hostname]
-                action.url.ip_addr = host_config.get('ip_addr')
-                action.url.socket_config = host_config.get('socket_config')
+                action.url.store_resolved()
 
             if action.is_setup is False:
                 action.setup()
 
             self.registered[action.name] = action
 
-        except Exception as e:       
+        except Exception as e:
             raise e
 
     async def execute_prepared_request(self, action: HTTP3Action) -> Coroutine[Any, Any, HTTP3Result]:
@@ -164,7 +196,7 @@ class MercuryHTTP3Client(BaseEngine[Union[A, HTTP3Action], Union[R, HTTP3Result]
         if self.tracing_session:
             trace = self.tracing_session.create_trace()
             await trace.on_request_start(action)
-  
+
         response = HTTP3Result(action)
         response.wait_start = time.monotonic()
         self.active += 1
@@ -175,7 +207,7 @@ class MercuryHTTP3Client(BaseEngine[Union[A, HTTP3Action], Union[R, HTTP3Result]
                 action,
                 response
             )
- 
+
         async with self.sem:
 
             if trace and trace.on_connection_queued_end:
@@ -184,11 +216,13 @@ class MercuryHTTP3Client(BaseEngine[Union[A, HTTP3Action], Union[R, HTTP3Result]
                     action,
                     response
                 )
-            
+
+            connection = self.pool.acquire(
+                self.pool.host_key(action.url)
+            )
+
             try:
 
-                connection = self.pool.connections.pop()
-                
                 if action.hooks.listen:
                     event = asyncio.Event()
                     action.hooks.channel_events.append(event)
@@ -212,7 +246,8 @@ class MercuryHTTP3Client(BaseEngine[Union[A, HTTP3Action], Union[R, HTTP3Result]
                     action.url.port,
                     action.url.socket_config,
                     server_name=action.url.hostname,
-                    timeout=self.timeouts.connect_timeout
+                    timeout=self.timeouts.connect_timeout,
+                    early_data=action.method in EARLY_DATA_METHODS
                 )
 
                 response.connect_end = time.monotonic()
@@ -224,35 +259,9 @@ class MercuryHTTP3Client(BaseEngine[Union[A, HTTP3Action], Union[R, HTTP3Result]
                         response
                     )
 
-                stream_id = connection.protocol._quic.get_next_available_stream_id()
-                
-                stream = connection.protocol._get_or_create_stream(stream_id)
-                if stream.headers_send_state == HeadersState.AFTER_TRAILERS:
-                    raise Exception("HEADERS frame is not allowed in this state")
-
-                encoder, frame_data = connection.protocol._encoder.encode(
-                    stream_id, 
-                    action.encoded_headers
-                )
-
-                connection.protocol._encoder_bytes_sent += len(encoder)
-                connection.protocol._quic.send_stream_data(
-                    connection.protocol._local_encoder_stream_id, 
-                    encoder
-                )
-
-                # update state and send headers
-                if stream.headers_send_state == HeadersState.INITIAL:
-                    stream.headers_send_state = HeadersState.AFTER_HEADERS
-                else:
-                    stream.headers_send_state = HeadersState.AFTER_TRAILERS
-
-                connection.protocol._quic.send_stream_data(
-                    stream_id, encode_frame(
-                        FrameType.HEADERS, 
-                        frame_data
-                    ), 
-                    not action.encoded_data
+                stream_id, waiter = connection.protocol.send_request(
+                    action.encoded_headers,
+                    action.encoded_data
                 )
 
                 if trace and trace.on_request_headers_sent:
@@ -262,25 +271,6 @@ class MercuryHTTP3Client(BaseEngine[Union[A, HTTP3Action], Union[R, HTTP3Result]
                         response
                     )
 
-                if action.encoded_data:
-                    stream = connection.protocol._get_or_create_stream(stream_id)
-                    if stream.headers_send_state != HeadersState.AFTER_HEADERS:
-                        raise Exception("DATA frame is not allowed in this state")
-
-                    connection.protocol._quic.send_stream_data(
-                        stream_id, encode_frame(
-                            FrameType.DATA, 
-                            action.encoded_data
-                        ), 
-                        True
-                    )
-                    
-
-                waiter = connection.protocol._loop.create_future()
-                connection.protocol._request_events[stream_id] = deque()
-                connection.protocol._request_waiter[stream_id] = waiter
-                connection.protocol.transmit()
-
                 response.write_end = time.monotonic()
 
                 if action.encoded_data and trace and trace.on_request_data_sent:
@@ -290,14 +280,14 @@ class MercuryHTTP3Client(BaseEngine[Union[A, HTTP3Action], Union[R, HTTP3Result]
                             response
                         )
 
-                response_frames: ResponseFrameCollection = await asyncio.wait_for(
-                    waiter,
-                    timeout=self.timeouts.total_timeout
+                response_frames = await self._receive_response(
+                    connection,
+                    response,
+                    stream_id,
+                    waiter
                 )
 
-                headers: Dict[str, Union[bytes, int]] = {}
-                for header_key, header_value in response_frames.headers_frame.headers:
-                    headers[header_key] = header_value
+                headers = self._set_response(action, response, response_frames)
 
                 if trace and trace.on_response_headers_received:
                     await trace.on_response_headers_received(
@@ -305,8 +295,7 @@ class MercuryHTTP3Client(BaseEngine[Union[A, HTTP3Action], Union[R, HTTP3Result]
                         action,
                         response
                     )
-                
-                response.headers = headers
+
                 status = response.status
 
                 if status >= 300 and status < 400:
@@ -317,7 +306,7 @@ class MercuryHTTP3Client(BaseEngine[Union[A, HTTP3Action], Union[R, HTTP3Result]
                             action,
                             response
                         )
-                    
+
                     elapsed_time = 0
                     redirect_time_start = time.time()
 
@@ -326,8 +315,8 @@ class MercuryHTTP3Client(BaseEngine[Union[A, HTTP3Action], Union[R, HTTP3Result]
                         if elapsed_time > self.timeouts.total_timeout:
                             response.status = 408
                             raise Exception('Request timed out while redirecting.')
-                        
-                        redirect_url = str(headers.get(b'location'))
+
+                        redirect_url = headers.get(b'location', b'').decode()
                         if redirect_url.startswith('http') is False:
                             action.url.path = redirect_url
                             action.encoded_headers = None
@@ -339,76 +328,40 @@ class MercuryHTTP3Client(BaseEngine[Union[A, HTTP3Action], Union[R, HTTP3Result]
                             action.is_setup = False
                             await self.prepare(action)
 
+                            # A different host needs its own pooled
+                            # connection.
+                            self.pool.release(connection)
+                            connection = self.pool.acquire(
+                                self.pool.host_key(action.url)
+                            )
+
                             await connection.make_connection(
                                 action.url.ip_addr,
                                 action.url.port,
                                 action.url.socket_config,
                                 server_name=action.url.hostname,
-                                timeout=self.timeouts.connect_timeout
+                                timeout=self.timeouts.connect_timeout,
+                                early_data=action.method in EARLY_DATA_METHODS
                             )
 
                         response.connect_end = time.monotonic()
-                            
-                        stream_id = connection.protocol._quic.get_next_available_stream_id()
-                        
-                        stream = connection.protocol._get_or_create_stream(stream_id)
-                        if stream.headers_send_state == HeadersState.AFTER_TRAILERS:
-                            raise Exception("HEADERS frame is not allowed in this state")
-
-                        encoder, frame_data = connection.protocol._encoder.encode(
-                            stream_id, 
-                            action.encoded_headers
-                        )
-
-                        connection.protocol._encoder_bytes_sent += len(encoder)
-                        connection.protocol._quic.send_stream_data(
-                            connection.protocol._local_encoder_stream_id, 
-                            encoder
-                        )
 
-                        # update state and send headers
-                        if stream.headers_send_state == HeadersState.INITIAL:
-                            stream.headers_send_state = HeadersState.AFTER_HEADERS
-                        else:
-                            stream.headers_send_state = HeadersState.AFTER_TRAILERS
-                        connection.protocol._quic.send_stream_data(
-                            stream_id, encode_frame(
-                                FrameType.HEADERS, 
-                                frame_data
-                            ), 
-                            not action.encoded_data
+                        stream_id, waiter = connection.protocol.send_request(
+                            action.encoded_headers,
+                            action.encoded_data
                         )
 
-                        if action.encoded_data:
-                            stream = connection.protocol._get_or_create_stream(stream_id)
-                            if stream.headers_send_state != HeadersState.AFTER_HEADERS:
-                                raise Exception("DATA frame is not allowed in this state")
-
-                            connection.protocol._quic.send_stream_data(
-                                stream_id, encode_frame(
-                                    FrameType.DATA, 
-                                    action.encoded_data
-                                ), 
-                                True
-                            )
-                            
-
-                        waiter = connection.protocol._loop.create_future()
-                        connection.protocol._request_events[stream_id] = deque()
-                        connection.protocol._request_waiter[stream_id] = waiter
-                        connection.protocol.transmit()
-
                         response.write_end = time.monotonic()
 
-                        response_frames: ResponseFrameCollection = await asyncio.wait_for(
-                            waiter,
-                            timeout=self.timeouts.total_timeout
+                        response_frames = await self._receive_response(
+                            connection,
+                            response,
+                            stream_id,
+                            waiter
                         )
 
-                        for header_key, header_value in response_frames.headers_frame.headers:
-                            headers[header_key] = header_value
+                        headers = self._set_response(action, response, response_frames)
 
-                        response.headers = headers
                         status = response.status
                         if status >= 200 and status < 300:
                             break
@@ -425,9 +378,6 @@ class MercuryHTTP3Client(BaseEngine[Union[A, HTTP3Action], Union[R, HTTP3Result]
                         response
                     )
 
-                response.headers = headers
-                self.pool.connections.append(connection)
-
                 if action.hooks.after:
                     response = await self.execute_after(action, response)
                     action.setup()
@@ -442,22 +392,24 @@ class MercuryHTTP3Client(BaseEngine[Union[A, HTTP3Action], Union[R, HTTP3Result]
                         ) for channel in action.hooks.channels
                     ])
 
-                    for listener in action.hooks.listeners: 
+                    for listener in action.hooks.listeners:
                         if len(listener.hooks.channel_events) > 0:
                             listener.setup()
                             event = listener.hooks.channel_events.pop()
                             if not event.is_set():
-                                event.set()       
+                                event.set()
 
             except Exception as e:
                 response.complete = time.monotonic()
                 response.error = str(e)
 
-                self.pool.connections.append(HTTP3Connection(reset_connection=self.pool.reset_connections))
-
                 if trace and trace.on_request_exception:
                     await trace.on_request_exception(response)
 
+            # Failed streams do not take down the connection - a terminated
+            # connection is re-opened by the next stream to use it.
+            self.pool.release(connection)
+
             self.active -= 1
             if self.waiter and self.active <= self.pool.size:
 
@@ -473,6 +425,59 @@ class MercuryHTTP3Client(BaseEngine[Union[A, HTTP3Action], Union[R, HTTP3Result]
 
             return response
 
+    async def _receive_response(
+        self,
+        connection: HTTP3Connection,
+        response: HTTP3Result,
+        stream_id: int,
+        waiter: asyncio.Future
+    ) -> ResponseFrameCollection:
+
+        protocol = connection.protocol
+        sent_at = protocol._loop.time()
+
+        try:
+            return await asyncio.wait_for(
+                waiter,
+                timeout=self.timeouts.total_timeout
+            )
+
+        except asyncio.TimeoutError:
+            response._status = 408
+
+            # Nothing heard from the peer since the request went out, so
+            # the connection is likely dead (e.g. the server restarted).
+            # Drop it rather than leaving every stream on it to time out
+            # until QUIC's idle timeout fires.
+            if protocol.last_received < sent_at:
+                connection.abort()
+
+            raise Exception('Request timed out.')
+
+        finally:
+            protocol.release_stream(stream_id)
+
+    def _set_response(
+        self,
+        action: HTTP3Action,
+        response: HTTP3Result,
+        response_frames: ResponseFrameCollection
+    ) -> Dict[bytes, bytes]:
+        headers: Dict[bytes, bytes] = {}
+        for header_key, header_value in response_frames.headers_frame.headers:
+            headers[header_key] = header_value
+
+        response.headers = headers
+        response._status = None
+
+        response.body = bytearray()
+        response.body_size = action.body_policy.keep(
+            response.body,
+            response_frames.body
+        )
+
+        return headers
+
     async def close(self):
         if self.closed is False:
             await self.pool.close()
@@ -2,7 +2,9 @@ from __future__ import annotations
 import asyncio
 from typing import Optional, Tuple
 from hedra.core.engines.types.common.protocols import UDPConnection
+from hedra.core.engines.types.common.protocols.udp.quic_endpoint import QuicEndpoint
 from hedra.core.engines.types.common.protocols.udp.quic_protocol import QuicProtocol
+from .session_tickets import SessionTicketStore
 
 
 class HTTP3Connection:
@@ -16,10 +18,17 @@ class HTTP3Connection:
         'connected',
         'reset_connection',
         'pending',
+        'endpoint',
+        'session_tickets',
         '_connection_factory'
     )
 
-    def __init__(self, reset_connection: bool=False) -> None:
+    def __init__(
+        self,
+        reset_connection: bool=False,
+        endpoint: Optional[QuicEndpoint]=None,
+        session_tickets: Optional[SessionTicketStore]=None
+    ) -> None:
         self.dns_address: str = None
         self.port: int = None
         self.ip_addr = None
@@ -29,28 +38,73 @@ class HTTP3Connection:
         self.connected = False
         self.reset_connection = reset_connection
         self.pending = 0
+        self.endpoint = endpoint
+        self.session_tickets = session_tickets
         self._connection_factory = UDPConnection()
 
+    @property
+    def reusable(self) -> bool:
+        return self.connected and self.protocol is not None and self.protocol.closed is False
+
     async def make_connection(
-        self, 
+        self,
         dns_address: str,
-        port: int, 
+        port: int,
         socket_config: Tuple[int, int, int, int, Tuple[int, int]],
         server_name: str=None,
-        timeout: Optional[float]=None
+        timeout: Optional[float]=None,
+        early_data: bool=False
     ) -> None:
-    
-        if self.connected is False or self.dns_address != dns_address or self.reset_connection:
+
+        if self.reusable and self.dns_address == dns_address and self.reset_connection is False:
+            if early_data or self.protocol.connected:
+                return
+
+        async with self.lock:
+
+            # Streams sharing the connection wait on the first reconnect
+            # rather than each opening their own. Requests that may not be
+            # sent as 0-RTT wait for the handshake to complete.
+            if self.reusable and self.dns_address == dns_address and self.reset_connection is False:
+                if early_data is False and self.protocol.connected is False:
+                    try:
+                        await asyncio.wait_for(
+                            self.protocol.wait_connected(),
+                            timeout=timeout
+                        )
+
+                    except asyncio.TimeoutError:
+                        self.abort()
+                        raise Exception('Connection timed out.')
+
+                    except ConnectionError:
+                        self.abort()
+                        raise Exception('Connection terminated.')
+
+                return
+
+            self.abort()
+
+            session_ticket = None
+            session_ticket_handler = None
+            if self.session_tickets:
+                session_ticket = self.session_tickets.take(server_name)
+                session_ticket_handler = self.session_tickets.add
+
             try:
                 self.protocol = await asyncio.wait_for(
                     self._connection_factory.create_http3(
                         socket_config=socket_config,
-                        server_name=server_name
+                        server_name=server_name,
+                        endpoint=self.endpoint,
+                        session_ticket=session_ticket,
+                        session_ticket_handler=session_ticket_handler,
+                        early_data=early_data
                     ),
-                     
+
                     timeout=timeout
                 )
-                    
+
                 self.connected = True
 
                 self.dns_address = dns_address
@@ -62,9 +116,17 @@ class HTTP3Connection:
             except ConnectionResetError:
                 raise Exception('Connection reset.')
 
+            except ConnectionError:
+                raise Exception('Connection terminated.')
+
             except Exception as e:
                 raise e
 
-    async def close(self):
-        if self.protocol:
+    def abort(self):
+        if self.protocol and self.protocol.closed is False:
             self.protocol.close()
+
+        self.connected = False
+
+    async def close(self):
+        self.abort()
@@ -1,27 +1,113 @@
-
-from typing import List
+import math
+from typing import Dict, Hashable, List, Optional, Tuple
+from hedra.core.engines.types.common.protocols.udp.quic_endpoint import QuicEndpoint
+from hedra.core.engines.types.common.url import URL
 from .connection import HTTP3Connection
+from .session_tickets import SessionTicketStore
 
 
 class Pool:
 
     __slots__ = (
         'size',
-        'connections',
-        'reset_connections'
+        'reset_connections',
+        'streams_per_connection',
+        'endpoint',
+        'session_tickets',
+        'hosts'
     )
 
-    def __init__(self, size: int, reset_connections: bool = False) -> None:
+    def __init__(
+        self,
+        size: int,
+        reset_connections: bool = False,
+        streams_per_connection: int=1
+    ) -> None:
         self.size = size
-        self.connections: List[HTTP3Connection] = []
         self.reset_connections = reset_connections
 
+        # Resetting connections tears down every stream sharing them, so
+        # each request gets its own connection in that mode.
+        self.streams_per_connection = 1 if reset_connections else max(streams_per_connection, 1)
+
+        self.endpoint = QuicEndpoint()
+        self.session_tickets = SessionTicketStore()
+        self.hosts: Dict[Hashable, List[HTTP3Connection]] = {}
+
+    @property
+    def connections_per_host(self) -> int:
+        return math.ceil(self.size/self.streams_per_connection)
+
+    @property
+    def connections(self) -> List[HTTP3Connection]:
+        connections: List[HTTP3Connection] = []
+        for host_connections in self.hosts.values():
+            connections.extend(host_connections)
+
+        return connections
+
+    @staticmethod
+    def host_key(url: URL) -> Tuple[str, str, int]:
+        return (
+            url.hostname,
+            url.ip_addr,
+            url.port
+        )
+
     def create_pool(self) -> None:
-        for _ in range(self.size):
-            self.connections.append(
-                HTTP3Connection(self.reset_connections)
-            )
+        # Connections are opened per host on demand (or on warm up) since
+        # each carries its own QUIC and QPACK state.
+        pass
+
+    def create_connection(self) -> HTTP3Connection:
+        return HTTP3Connection(
+            self.reset_connections,
+            endpoint=self.endpoint,
+            session_tickets=self.session_tickets
+        )
+
+    def add(self, host_key: Hashable, connection: HTTP3Connection) -> None:
+        host_connections = self.hosts.get(host_key)
+        if host_connections is None:
+            host_connections = []
+            self.hosts[host_key] = host_connections
+
+        host_connections.append(connection)
+
+    def acquire(self, host_key: Hashable) -> HTTP3Connection:
+        host_connections = self.hosts.get(host_key, [])
+
+        selected: Optional[HTTP3Connection] = None
+        for connection in list(host_connections):
+
+            if connection.pending >= self.streams_per_connection:
+                continue
+
+            if selected is None or connection.pending < selected.pending:
+                selected = connection
+
+        if selected is None:
+            selected = self.create_connection()
+            self.add(host_key, selected)
+
+        selected.pending += 1
+
+        return selected
+
+    def release(self, connection: HTTP3Connection) -> None:
+        connection.pending -= 1
+
+    def resize(self, size: int) -> None:
+        self.size = size
+        connections_per_host = self.connections_per_host
+
+        for host_connections in self.hosts.values():
+            while len(host_connections) > connections_per_host and host_connections[-1].pending == 0:
+                host_connections.pop().abort()
 
     async def close(self):
         for connection in self.connections:
             await connection.close()
+
+        self.endpoint.close()
+        self.session_tickets.clear()
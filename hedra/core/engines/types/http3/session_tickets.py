@@ -0,0 +1,56 @@
+from collections import deque
+from typing import Deque, Dict, Optional
+
+try:
+    from aioquic.tls import SessionTicket
+
+except ImportError:
+    SessionTicket = object
+
+
+class SessionTicketStore:
+
+    __slots__ = (
+        'max_tickets',
+        'tickets',
+        'issued',
+        'used'
+    )
+
+    '''
+    TLS session tickets issued to pooled connections, kept per server name
+    so reconnects can resume (and send 0-RTT data) instead of paying for a
+    full handshake. Tickets are handed out once each, newest first, since
+    servers commonly reject reused tickets for 0-RTT.
+    '''
+
+    def __init__(self, max_tickets: int=16) -> None:
+        self.max_tickets = max_tickets
+        self.tickets: Dict[str, Deque[SessionTicket]] = {}
+        self.issued = 0
+        self.used = 0
+
+    def add(self, ticket: SessionTicket) -> None:
+        tickets = self.tickets.get(ticket.server_name)
+
+        if tickets is None:
+            tickets = deque(maxlen=self.max_tickets)
+            self.tickets[ticket.server_name] = tickets
+
+        tickets.append(ticket)
+        self.issued += 1
+
+    def take(self, server_name: str) -> Optional[SessionTicket]:
+        tickets = self.tickets.get(server_name)
+
+        while tickets:
+            ticket = tickets.pop()
+
+            if ticket.is_valid:
+                self.used += 1
+                return ticket
+
+        return None
+
+    def clear(self) -> None:
+        self.tickets.clear()
@@ -5,6 +5,7 @@ from typing import (
     List, 
     Coroutine, 
     Any, 
+    Optional,
     Union
 )
 from hedra.core.engines.types.common import Timeouts
@@ -30,12 +31,18 @@ class MercuryPlaywrightClient(BaseEngine[PlaywrightCommand, PlaywrightResult]):
         'active',
         'waiter',
         '_discarded_context_groups',
-        '_discarded_contexts',
         '_pending_context_groups',
         '_playwright_setup'
     )
 
-    def __init__(self,  concurrency: int = 500, group_size: int=50, timeouts: Timeouts = Timeouts()) -> None:
+    def __init__(
+        self,
+        concurrency: int = 500,
+        group_size: int=50,
+        timeouts: Timeouts = Timeouts(),
+        commands_per_context: Optional[int]=None,
+        max_browser_memory: Optional[int]=None
+    ) -> None:
         super(
             MercuryPlaywrightClient,
             self
@@ -43,7 +50,12 @@ class MercuryPlaywrightClient(BaseEngine[PlaywrightCommand, PlaywrightResult]):
         
         self.session_id = str(uuid.uuid4())
 
-        self.pool = ContextPool(concurrency, group_size)
+        self.pool = ContextPool(
+            concurrency,
+            group_size,
+            commands_per_context=commands_per_context,
+            max_browser_memory=max_browser_memory
+        )
         self.timeouts = timeouts
         self.registered: Dict[str, PlaywrightCommand] = {}
         self.closed = False
@@ -54,7 +66,6 @@ class MercuryPlaywrightClient(BaseEngine[PlaywrightCommand, PlaywrightResult]):
         self.waiter = None
 
         self._discarded_context_groups: List[ContextGroup] = []
-        self._discarded_contexts = []
         self._pending_context_groups: List[ContextGroup] = []
         self._playwright_setup = False
     
@@ -62,6 +73,8 @@ class MercuryPlaywrightClient(BaseEngine[PlaywrightCommand, PlaywrightResult]):
         return {
             'concurrency': self.pool.size,
             'group_size': self.pool.group_size,
+            'commands_per_context': self.pool.commands_per_context,
+            'max_browser_memory': self.pool.max_browser_memory,
             'timeouts': self.timeouts,
             'context_config': {
                 **self.config.data,
@@ -69,9 +82,45 @@ class MercuryPlaywrightClient(BaseEngine[PlaywrightCommand, PlaywrightResult]):
             }
         }
 
-    async def set_pool(self, concurrency: int):
+    def resize_pool(self, concurrency: int):
+
+        if self._playwright_setup is False:
+            self.pool = ContextPool(
+                concurrency,
+                self.pool.group_size,
+                commands_per_context=self.pool.commands_per_context,
+                max_browser_memory=self.pool.max_browser_memory
+            )
+
+        else:
+
+            while self.pool.size < concurrency:
+                context_group = self.pool.create_group(
+                    self.config,
+                    min(self.pool.group_size, concurrency - self.pool.size)
+                )
+
+                self._pending_context_groups.append(context_group)
+                self.pool.contexts.append(context_group)
+                self.pool.size += context_group.concurrency
+
+            # Surplus groups are closed with the client since commands may
+            # still be running on them.
+            while len(self.pool.contexts) > 1 and self.pool.size - self.pool.contexts[-1].concurrency >= concurrency:
+                context_group = self.pool.contexts.pop()
+
+                if context_group in self._pending_context_groups:
+                    self._pending_context_groups.remove(context_group)
+
+                else:
+                    self._discarded_context_groups.append(context_group)
+
+                self.pool.size -= context_group.concurrency
+
         self.sem = asyncio.Semaphore(value=concurrency)
-        self.pool = ContextPool(concurrency, reset_connections=self.pool.reset_connections)
+
+    async def set_pool(self, concurrency: int):
+        self.resize_pool(concurrency)
 
     async def setup(self, config: ContextConfig=None):
 
@@ -81,8 +130,9 @@ class MercuryPlaywrightClient(BaseEngine[PlaywrightCommand, PlaywrightResult]):
         if self._playwright_setup is False:
             self.config = config
             self.pool.create_pool(self.config)
-            for context_group in self.pool:
-                await context_group.create()
+            await asyncio.gather(*[
+                context_group.create() for context_group in self.pool
+            ])
 
             self._playwright_setup = True
 
@@ -96,49 +146,22 @@ class MercuryPlaywrightClient(BaseEngine[PlaywrightCommand, PlaywrightResult]):
         self.registered[command.name] = command
 
     def extend_pool(self, increased_capacity: int):
-        self.pool.size += increased_capacity
-        for _ in range(increased_capacity):
-            context_group = ContextGroup(
-                **self.config,
-                concurrency=int(self.pool.size/self.pool.group_size)
-            )
-
-            self._pending_context_groups.append(context_group)
-
-            self.pool.contexts.append(context_group)
-        
-        self.sem = asyncio.Semaphore(self.pool.size)
+        self.resize_pool(self.pool.size + increased_capacity)
 
     def shrink_pool(self, decrease_capacity: int):
-        self.pool.size -= decrease_capacity
-
-        for context_group in self.pool.contexts[self.pool.size:]:
-            self._discarded_context_groups.append(context_group)
-
-        self.pool.contexts = self.pool.contexts[:self.pool.size]
-
-        for context_group in self.pool.contexts:
-            group_size = int(self.pool.size/self.pool.group_size)
-
-            for context in context_group.contexts[group_size:]:
-                self._discarded_contexts.append(context)
-
-            context_group.contexts = context_group.contexts[:group_size]
-            context_group.librarians = context_group.librarians[:group_size]
-
-        self.sem = asyncio.Semaphore(self.pool.size)
-
+        self.resize_pool(self.pool.size - decrease_capacity)
 
     async def execute_prepared_command(self, command: PlaywrightCommand) -> Coroutine[Any, Any, PlaywrightResult]:
 
-        for pending_context in self._pending_context_groups:
+        while self._pending_context_groups:
+            pending_context = self._pending_context_groups.pop()
             await pending_context.create()
 
         result = PlaywrightResult(command, type=RequestTypes.PLAYWRIGHT)
         self.active += 1
         
         async with self.sem:
-            context = self.pool.contexts.pop()
+            context = self.pool.select()
             try:
 
                 if command.hooks.listen:
@@ -167,11 +190,8 @@ class MercuryPlaywrightClient(BaseEngine[PlaywrightCommand, PlaywrightResult]):
                             if not event.is_set():
                                 event.set()  
 
-                self.pool.contexts.append(context)
-
             except Exception as e:
                 result.error = e
-                self.pool.contexts.append(context)
 
             self.active -= 1
             if self.waiter and self.active <= self.pool.size:
@@ -190,8 +210,6 @@ class MercuryPlaywrightClient(BaseEngine[PlaywrightCommand, PlaywrightResult]):
             for context_group in self._discarded_context_groups:
                 await context_group.close()
 
-            for context in self._discarded_contexts:
-                await context.close()
+            await self.pool.close()
 
             self.closed = True
-                    
\ No newline at end of file
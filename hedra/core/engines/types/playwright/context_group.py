@@ -1,21 +1,53 @@
-
 import asyncio
 import time
 from hedra.tools.data_structures import AsyncList
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from .command import PlaywrightCommand
 from .result import PlaywrightResult
 from .command_librarian import CommandLibrarian
+from .shared_browser import (
+    SharedBrowser,
+    get_shared_browser,
+    get_browser_memory
+)
 
 
 try:
-    
-    from playwright.async_api import async_playwright
+
     from playwright.async_api import Geolocation
+    from playwright.async_api import BrowserContext, Page
 
 except Exception:
-    async_playwright = lambda: None
     Geolocation = None
+    BrowserContext = Any
+    Page = Any
+
+
+class PooledContext:
+
+    __slots__ = (
+        'context',
+        'page',
+        'librarian',
+        'commands',
+        'generation',
+        'browser_generation'
+    )
+
+    def __init__(
+        self,
+        context: BrowserContext,
+        page: Page,
+        generation: int,
+        browser_generation: int
+    ) -> None:
+        self.context = context
+        self.page = page
+        self.librarian = CommandLibrarian(page)
+        self.commands = 0
+        self.generation = generation
+        self.browser_generation = browser_generation
+
 
 class ContextGroup:
 
@@ -27,23 +59,52 @@ class ContextGroup:
         'permissions',
         'color_scheme',
         'concurrency',
-        'librarians',
+        'commands_per_context',
+        'max_browser_memory',
+        'memory_check_interval',
+        'memory_low_water',
+        'min_recycle_interval',
+        'last_memory_check',
+        'last_recycle',
+        'recycled_over_cap',
+        'generation',
+        'recycled',
+        'browser_restarts',
         'config',
         'options',
+        'browser',
+        'shared_browser',
         'contexts',
+        'created',
         'sem'
     )
 
+    '''
+    A fixed number of browser contexts, each with a warm page. Contexts are
+    closed and replaced after commands_per_context commands, when their
+    page has closed or crashed, or when the worker's browser processes
+    grow past max_browser_memory (MB). If memory is still over the cap
+    min_recycle_interval seconds after the contexts were replaced, the
+    shared browser is restarted instead. Neither happens again until
+    min_recycle_interval has passed, and memory must drop under
+    memory_low_water of the cap before contexts alone are replaced again.
+    '''
+
     def __init__(
-        self, 
-        browser_type: str=None, 
-        device_type: str=None, 
-        locale: str=None, 
-        geolocation: Geolocation=None, 
-        permissions: List[str]=None, 
-        color_scheme: str=None, 
+        self,
+        browser_type: str=None,
+        device_type: str=None,
+        locale: str=None,
+        geolocation: Geolocation=None,
+        permissions: List[str]=None,
+        color_scheme: str=None,
         concurrency: int=None,
-        options: Dict[str, Any]=None
+        options: Dict[str, Any]=None,
+        commands_per_context: Optional[int]=None,
+        max_browser_memory: Optional[int]=None,
+        memory_check_interval: float=1,
+        memory_low_water: float=0.8,
+        min_recycle_interval: float=30
     ) -> None:
         self.browser_type = browser_type
         self.device_type = device_type
@@ -52,30 +113,38 @@ class ContextGroup:
         self.permissions = permissions
         self.color_scheme = color_scheme
         self.concurrency = concurrency
-        self.librarians: List[CommandLibrarian] = []
+        self.commands_per_context = commands_per_context
+        self.max_browser_memory = max_browser_memory
+        self.memory_check_interval = memory_check_interval
+        self.memory_low_water = memory_low_water
+        self.min_recycle_interval = min_recycle_interval
+        self.last_memory_check = 0
+        self.last_recycle = 0
+        self.recycled_over_cap = False
+        self.generation = 0
+        self.recycled = 0
+        self.browser_restarts = 0
         self.config = {}
-        self.options = options
-        self.contexts = []
+        self.options = options or {}
+        self.browser = None
+        self.shared_browser: Optional[SharedBrowser] = None
+        self.contexts: List[PooledContext] = []
+        self.created = False
         self.sem = asyncio.Semaphore(value=concurrency)
 
-    async def create(self) -> None:
-
-        playwright = await async_playwright().start()
+    @property
+    def idle(self) -> int:
+        return len(self.contexts)
 
-        if self.browser_type == "safari" or self.browser_type == "webkit":
-            self.browser = await playwright.webkit.launch()
-
-        elif self.browser_type == "firefox":
-            self.browser = await playwright.firefox.launch()
-
-        else:
-            self.browser = await playwright.chromium.launch()
+    async def create(self) -> None:
 
+        self.shared_browser = get_shared_browser(self.browser_type)
+        self.browser = await self.shared_browser.acquire()
 
         self.config = {}
 
         if self.device_type:
-            device = playwright.devices[self.device_type]
+            device = self.shared_browser.playwright.devices[self.device_type]
 
             self.config = {
                 **device,
@@ -94,33 +163,45 @@ class ContextGroup:
         if self.color_scheme:
             self.config['color_scheme'] = self.color_scheme
 
+        self.contexts = await asyncio.gather(*[
+            self._open_context() for _ in range(self.concurrency)
+        ])
 
-        has_options = len(self.config) > 0
+        self.created = True
 
-        for _ in range(self.concurrency):
+    async def _open_context(self) -> PooledContext:
+        context, browser_generation = await self.shared_browser.new_context(
+            **self.config
+        )
 
-            if has_options:        
-                context = await self.browser.new_context(
-                    **self.config
-                )
-    
-            else:
-                context = await self.browser.new_context()
-                
-            self.contexts.append(context)
+        try:
             page = await context.new_page()
-            command_librarian = CommandLibrarian(page)
 
-            self.librarians.append(command_librarian)
+        except Exception as page_error:
+            try:
+                await context.close()
+
+            except Exception:
+                pass
+
+            await self.shared_browser.release_context(browser_generation)
+            raise page_error
+
+        return PooledContext(
+            context,
+            page,
+            self.generation,
+            browser_generation
+        )
 
     async def execute(self, command: PlaywrightCommand):
         result = PlaywrightResult(command)
         await self.sem.acquire()
         start = 0
-        librarian = self.librarians.pop()
+        pooled = self.contexts.pop()
 
         try:
-            playwright_command = librarian.get(command.command)
+            playwright_command = pooled.librarian.get(command.command)
 
             start = time.time()
 
@@ -130,20 +211,92 @@ class ContextGroup:
 
             result.time = elapsed
 
-            self.librarians.append(librarian)
-            self.sem.release()
-
-            return result
-
         except Exception as e:
             elapsed = time.time() - start
             result.time = elapsed
             result.error = e
 
-            self.librarians.append(librarian)
-            self.sem.release()
+        try:
+            # Recycling happens after the command is timed, so its cost
+            # is paid by the slot rather than the measured command.
+            pooled = await self._recycle(pooled)
+
+        except Exception:
+            pass
+
+        self.contexts.append(pooled)
+        self.sem.release()
+
+        return result
+
+    async def _recycle(self, pooled: PooledContext) -> PooledContext:
+        pooled.commands += 1
+
+        if self.max_browser_memory is not None:
+            await self._check_memory()
+
+        # Another group may have restarted the shared browser, which
+        # is closed once every context opened on the old one is.
+        if self.browser is not self.shared_browser.browser:
+            self.browser = self.shared_browser.browser
+            self.generation += 1
+
+        if (
+            pooled.page.is_closed()
+        ) or (
+            self.commands_per_context and pooled.commands >= self.commands_per_context
+        ) or (
+            pooled.generation < self.generation
+        ):
+            await self._close_context(pooled)
+            pooled = await self._open_context()
+            self.recycled += 1
+
+        return pooled
+
+    async def _check_memory(self) -> None:
+        now = time.monotonic()
+
+        if now - self.last_memory_check < self.memory_check_interval:
+            return
+
+        self.last_memory_check = now
+
+        browser_memory = get_browser_memory()
+        max_memory = self.max_browser_memory * 1024**2
+
+        if browser_memory < max_memory * self.memory_low_water:
+            self.recycled_over_cap = False
+            return
+
+        if browser_memory <= max_memory or now - self.last_recycle < self.min_recycle_interval:
+            return
 
-            return result
+        self.last_recycle = now
+
+        if self.recycled_over_cap:
+            # Replacing contexts did not bring memory back under the
+            # cap, so the growth is in the browser's own processes.
+            await self.shared_browser.restart()
+            self.browser = self.shared_browser.browser
+            self.browser_restarts += 1
+            self.recycled_over_cap = False
+
+        else:
+            self.recycled_over_cap = True
+
+        # Every context opened before the limit was crossed is replaced
+        # as it is next released.
+        self.generation += 1
+
+    async def _close_context(self, pooled: PooledContext):
+        try:
+            await pooled.context.close()
+
+        except Exception:
+            pass
+
+        await self.shared_browser.release_context(pooled.browser_generation)
 
     async def execute_batch(self, command: PlaywrightCommand, timeout: float=None):
         return await asyncio.wait([
@@ -152,10 +305,14 @@ class ContextGroup:
 
     async def close(self):
         try:
-            for context in self.contexts:
-                await context.close()
-                
-            await self.browser.close()
-        
+            for pooled in self.contexts:
+                await self._close_context(pooled)
+
+            self.contexts = []
+
+            if self.shared_browser:
+                await self.shared_browser.release()
+                self.shared_browser = None
+
         except Exception:
             pass
@@ -1,3 +1,5 @@
+import math
+from typing import List, Optional
 from .context_group import ContextGroup
 from .context_config import ContextConfig
 
@@ -7,15 +9,25 @@ class ContextPool:
     __slots__ = (
         'size',
         'group_size',
-        'group_count',
+        'groups_count',
+        'commands_per_context',
+        'max_browser_memory',
         'contexts'
     )
 
-    def __init__(self, pool_size, group_size) -> None:
+    def __init__(
+        self,
+        pool_size: int,
+        group_size: Optional[int]=None,
+        commands_per_context: Optional[int]=None,
+        max_browser_memory: Optional[int]=None
+    ) -> None:
         self.size = pool_size
-        self.group_size = group_size
-        self.groups_count = int(pool_size/group_size)
-        self.contexts = []
+        self.group_size = min(group_size or 50, pool_size)
+        self.groups_count = math.ceil(pool_size/self.group_size)
+        self.commands_per_context = commands_per_context
+        self.max_browser_memory = max_browser_memory
+        self.contexts: List[ContextGroup] = []
 
     def __iter__(self):
         for context_group in self.contexts:
@@ -25,10 +37,35 @@ class ContextPool:
         for context_group in self.contexts:
             yield context_group
 
+    def create_group(self, config: ContextConfig, concurrency: int) -> ContextGroup:
+        return ContextGroup(
+            **config.data,
+            concurrency=concurrency,
+            options=config.options,
+            commands_per_context=self.commands_per_context,
+            max_browser_memory=self.max_browser_memory
+        )
+
     def create_pool(self, config: ContextConfig):
-        self.contexts = [
-            ContextGroup(
-                **config.data,
-                concurrency=self.group_size
-            ) for _ in range(self.groups_count)
-        ]
\ No newline at end of file
+        self.contexts = []
+        remaining = self.size
+
+        for _ in range(self.groups_count):
+            concurrency = min(self.group_size, remaining)
+            self.contexts.append(
+                self.create_group(config, concurrency)
+            )
+
+            remaining -= concurrency
+
+    def select(self) -> ContextGroup:
+        return max(
+            [
+                context_group for context_group in self.contexts if context_group.created
+            ],
+            key=lambda context_group: context_group.idle
+        )
+
+    async def close(self):
+        for context_group in self.contexts:
+            await context_group.close()
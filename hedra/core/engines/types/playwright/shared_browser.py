@@ -0,0 +1,193 @@
+import asyncio
+import psutil
+from collections import defaultdict
+from typing import Any, Dict, Optional, Tuple
+
+try:
+
+    from playwright.async_api import async_playwright
+    from playwright.async_api import Browser, BrowserContext, Playwright
+
+except Exception:
+    async_playwright = lambda: None
+    Browser = Any
+    BrowserContext = Any
+    Playwright = Any
+
+
+class SharedBrowser:
+
+    __slots__ = (
+        'browser_type',
+        'playwright',
+        'browser',
+        'loop',
+        'refs',
+        'lock',
+        'generation',
+        'open_contexts',
+        'retired'
+    )
+
+    '''
+    One browser process per browser type per worker. Context groups
+    acquire it rather than launching their own, and it is closed once the
+    last group releases it. Restarting replaces the browser for new
+    contexts, but the old one stays open until the last context opened on
+    it is closed.
+    '''
+
+    def __init__(self, browser_type: str) -> None:
+        self.browser_type = browser_type
+        self.playwright: Optional[Playwright] = None
+        self.browser: Optional[Browser] = None
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.refs = 0
+        self.lock = asyncio.Lock()
+        self.generation = 0
+        self.open_contexts: Dict[int, int] = defaultdict(int)
+        self.retired: Dict[int, Tuple[Browser, Playwright]] = {}
+
+    @property
+    def running(self) -> bool:
+        return self.browser is not None and self.browser.is_connected()
+
+    async def acquire(self) -> Browser:
+
+        async with self.lock:
+
+            if self.running is False:
+                await self._launch()
+
+            self.refs += 1
+
+        return self.browser
+
+    async def new_context(self, **config: Any) -> Tuple[BrowserContext, int]:
+        generation = self.generation
+        self.open_contexts[generation] += 1
+
+        try:
+            context = await self.browser.new_context(**config)
+
+        except Exception as context_error:
+            await self.release_context(generation)
+            raise context_error
+
+        return context, generation
+
+    async def release_context(self, generation: int):
+        self.open_contexts[generation] -= 1
+
+        if self.open_contexts[generation] > 0:
+            return
+
+        del self.open_contexts[generation]
+
+        retired = self.retired.pop(generation, None)
+        if retired:
+            await self._close_browser(*retired)
+
+    async def _launch(self):
+        self.loop = asyncio.get_running_loop()
+        self.generation += 1
+        self.playwright = await async_playwright().start()
+
+        if self.browser_type == "safari" or self.browser_type == "webkit":
+            self.browser = await self.playwright.webkit.launch()
+
+        elif self.browser_type == "firefox":
+            self.browser = await self.playwright.firefox.launch()
+
+        else:
+            self.browser = await self.playwright.chromium.launch()
+
+    async def restart(self) -> Browser:
+
+        async with self.lock:
+            generation = self.generation
+            browser = self.browser
+            playwright = self.playwright
+
+            # The replacement is launched first so groups never see the
+            # shared browser unset.
+            await self._launch()
+
+            if self.open_contexts.get(generation, 0) > 0:
+                self.retired[generation] = (browser, playwright)
+
+            else:
+                await self._close_browser(browser, playwright)
+
+        return self.browser
+
+    async def release(self):
+
+        async with self.lock:
+            self.refs -= 1
+
+            if self.refs > 0:
+                return
+
+            await self.close()
+
+    async def close(self):
+        for browser, playwright in self.retired.values():
+            await self._close_browser(browser, playwright)
+
+        await self._close_browser(self.browser, self.playwright)
+
+        self.browser = None
+        self.playwright = None
+        self.refs = 0
+        self.open_contexts.clear()
+        self.retired.clear()
+
+    async def _close_browser(
+        self,
+        browser: Optional[Browser],
+        playwright: Optional[Playwright]
+    ):
+        try:
+            if browser:
+                await browser.close()
+
+            if playwright:
+                await playwright.stop()
+
+        except Exception:
+            pass
+
+
+_shared_browsers: Dict[str, SharedBrowser] = {}
+
+
+def get_shared_browser(browser_type: str) -> SharedBrowser:
+    loop = asyncio.get_running_loop()
+    shared_browser = _shared_browsers.get(browser_type)
+
+    # Playwright connections are bound to the loop that started them.
+    if shared_browser is None or (
+        shared_browser.loop is not None and shared_browser.loop is not loop
+    ):
+        shared_browser = SharedBrowser(browser_type)
+        _shared_browsers[browser_type] = shared_browser
+
+    return shared_browser
+
+
+def get_browser_memory() -> int:
+    '''
+    Resident memory in bytes of this worker's child processes - the
+    Playwright drivers and the browsers they launched.
+    '''
+    memory = 0
+
+    for child in psutil.Process().children(recursive=True):
+        try:
+            memory += child.memory_info().rss
+
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            pass
+
+    return memory
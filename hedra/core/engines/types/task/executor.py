@@ -0,0 +1,128 @@
+import asyncio
+import inspect
+import multiprocessing
+import os
+import time
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor
+)
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Optional,
+    Tuple
+)
+
+
+class TaskExecutorTypes:
+    THREAD='thread'
+    PROCESS='process'
+
+
+_executors: Dict[Tuple[int, str, Optional[str]], Executor] = {}
+_stage_instances: Dict[type, Any] = {}
+
+
+def _import_task_module(path: str):
+    from hedra.core.graphs.stages.base.import_tools import import_from_path
+
+    # Spawned processes re-import the graph under the same module name
+    # so task functions unpickle by reference.
+    import_from_path(path)
+
+
+def _get_stage_instance(stage_type: type) -> Any:
+    stage = _stage_instances.get(stage_type)
+    if stage is None:
+        stage = stage_type()
+        _stage_instances[stage_type] = stage
+
+    return stage
+
+
+def prepare_worker(stage_type: Optional[type]) -> bool:
+    if stage_type is not None:
+        _get_stage_instance(stage_type)
+
+    return True
+
+
+def execute_blocking(
+    call: Callable[..., Any],
+    stage_type: Optional[type],
+    kwargs: Dict[str, Any]
+) -> Tuple[Any, float]:
+    '''
+    Runs a task inside a pool worker, returning its result and how long
+    it ran for, so time spent queued for a worker can be told apart.
+    '''
+    if stage_type is not None:
+        call = call.__get__(
+            _get_stage_instance(stage_type),
+            stage_type
+        )
+
+    start = time.perf_counter()
+
+    result = call(**kwargs)
+    if inspect.iscoroutine(result):
+        result = asyncio.run(result)
+
+    return result, time.perf_counter() - start
+
+
+def get_task_executor(
+    executor_type: str,
+    call: Callable[..., Any],
+    max_workers: int
+) -> Executor:
+
+    source_path: Optional[str] = None
+    if executor_type == TaskExecutorTypes.PROCESS:
+        source_path = inspect.getfile(
+            inspect.unwrap(getattr(call, '__func__', call))
+        )
+
+    # Pools are per worker process and shared by every runner in it.
+    executor_key = (
+        os.getpid(),
+        executor_type,
+        source_path
+    )
+
+    executor = _executors.get(executor_key)
+    if executor is not None:
+        return executor
+
+    if executor_type == TaskExecutorTypes.THREAD:
+        executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix='hedra-task'
+        )
+
+    elif executor_type == TaskExecutorTypes.PROCESS:
+        executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_import_task_module,
+            initargs=(source_path,)
+        )
+
+    else:
+        raise Exception(f'Unknown task executor - {executor_type} - valid executors are {TaskExecutorTypes.THREAD} and {TaskExecutorTypes.PROCESS}.')
+
+    _executors[executor_key] = executor
+
+    return executor
+
+
+def shutdown_task_executors():
+    pid = os.getpid()
+
+    for executor_key, executor in list(_executors.items()):
+        if executor_key[0] == pid:
+            executor.shutdown(wait=False, cancel_futures=True)
+            del _executors[executor_key]
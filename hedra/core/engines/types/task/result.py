@@ -13,7 +13,9 @@ class TaskResult(BaseResult):
         'start',
         'complete',
         'data',
-        'error'
+        'error',
+        'queue_time',
+        'run_time'
     )
 
     def __init__(self, task: Task, error: Exception=None):
@@ -34,5 +36,8 @@ class TaskResult(BaseResult):
         self.start = 0
         self.complete = 0
 
+        self.queue_time = 0
+        self.run_time = 0
+
         self.data = None
         self.error = error
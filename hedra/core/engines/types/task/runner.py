@@ -1,4 +1,6 @@
 import asyncio
+import inspect
+import psutil
 import time
 import uuid
 from typing import (
@@ -6,7 +8,9 @@ from typing import (
     Union, 
     Coroutine, 
     Any, 
-    Optional
+    Optional,
+    Callable,
+    Tuple
 )
 from hedra.core.engines.types.common.base_engine import BaseEngine
 from hedra.core.engines.types.common.timeouts import Timeouts
@@ -18,6 +22,12 @@ from hedra.core.engines.types.tracing.trace_session import (
     Trace
 )
 
+from .executor import (
+    execute_blocking,
+    get_task_executor,
+    prepare_worker,
+    TaskExecutorTypes
+)
 from .task import Task
 from .result import TaskResult
 
@@ -34,14 +44,16 @@ class MercuryTaskRunner(BaseEngine[Task, Union[BaseResult, TaskResult]]):
         'active',
         'waiter',
         'closed',
-        'tracing_session'
+        'tracing_session',
+        'task_workers'
     )
 
     def __init__(
         self, 
         concurrency: int=10**3, 
         timeouts: Timeouts = Timeouts(),
-        tracing_session: Optional[TraceSession]=None
+        tracing_session: Optional[TraceSession]=None,
+        task_workers: Optional[int]=None
     ) -> None:
         super(
             MercuryTaskRunner,
@@ -64,6 +76,7 @@ class MercuryTaskRunner(BaseEngine[Task, Union[BaseResult, TaskResult]]):
         self.active = 0
         self.waiter = None
         self.tracing_session: TraceSession = tracing_session
+        self.task_workers = task_workers or psutil.cpu_count(logical=False)
 
     async def set_pool(self, concurrency: int):
         self.pool = SimpleContext()
@@ -129,10 +142,20 @@ class MercuryTaskRunner(BaseEngine[Task, Union[BaseResult, TaskResult]]):
                         result
                     )
 
-                result: BaseResult = await task.execute(**{
+                task_args = {
                     name: value for name, value in task.task_args.items() if name in task.params
-                })
-                
+                }
+
+                if task.executor:
+                    result = await self._execute_blocking(task, task_args, start)
+
+                else:
+                    result: BaseResult = await task.execute(**task_args)
+
+                    # Tasks run on the loop are never queued, so all of
+                    # their time is running time.
+                    result.write_end = start
+
                 result.name = task.name
                 result.source = task.source
                 result.user = task.metadata.user
@@ -157,6 +180,7 @@ class MercuryTaskRunner(BaseEngine[Task, Union[BaseResult, TaskResult]]):
 
                 result.wait_start = wait_start
                 result.start = start
+                result.write_end = start
                 result.complete = time.monotonic()
                 result.error = str(e)
 
@@ -186,5 +210,83 @@ class MercuryTaskRunner(BaseEngine[Task, Union[BaseResult, TaskResult]]):
 
             return result
 
+    async def warm(self, task: Task, connections: int) -> int:
+
+        if task.executor is None:
+            return 0
+
+        executor = get_task_executor(
+            task.executor,
+            task.execute,
+            self.task_workers
+        )
+
+        _, stage_type = self._get_blocking_call(task)
+        loop = asyncio.get_running_loop()
+
+        # Starting workers here keeps pool start up out of the first
+        # tasks' queue time.
+        warmed = await asyncio.gather(*[
+            loop.run_in_executor(
+                executor,
+                prepare_worker,
+                stage_type
+            ) for _ in range(self.task_workers)
+        ])
+
+        return len(warmed)
+
+    def _get_blocking_call(self, task: Task) -> Tuple[Callable[..., Any], Optional[type]]:
+        call = task.execute
+
+        # Bound stage methods can't be pickled, so process workers bind
+        # the task to their own instance of the stage.
+        if task.executor == TaskExecutorTypes.PROCESS and inspect.ismethod(call):
+            return call.__func__, type(call.__self__)
+
+        return call, None
+
+    async def _execute_blocking(
+        self, 
+        task: Task, 
+        task_args: Dict[str, Any],
+        start: float
+    ) -> Union[BaseResult, TaskResult]:
+
+        executor = get_task_executor(
+            task.executor,
+            task.execute,
+            self.task_workers
+        )
+
+        call, stage_type = self._get_blocking_call(task)
+
+        data, run_time = await asyncio.get_running_loop().run_in_executor(
+            executor,
+            execute_blocking,
+            call,
+            stage_type,
+            task_args
+        )
+
+        elapsed = time.monotonic() - start
+
+        result = data
+        if not isinstance(data, BaseResult):
+            result = TaskResult(task)
+            result.data = data
+
+        queue_time = max(elapsed - run_time, 0)
+
+        if isinstance(result, TaskResult):
+            result.queue_time = queue_time
+            result.run_time = run_time
+
+        # Tasks have no write phase, so write_end marks when the task
+        # left the queue and began running.
+        result.write_end = start + queue_time
+
+        return result
+
     async def close(self):
         pass
@@ -1,5 +1,5 @@
 import inspect
-from typing import Coroutine, Dict, List, Any
+from typing import Coroutine, Dict, List, Any, Optional
 from hedra.core.engines.types.common.base_action import BaseAction
 from hedra.core.engines.types.common.hooks import Hooks
 from hedra.core.engines.types.common.types import RequestTypes
@@ -21,7 +21,8 @@ class Task(BaseAction):
         'args',
         'params',
         'task_args',
-        'mutations'
+        'mutations',
+        'executor'
     )
 
     def __init__(
@@ -30,7 +31,8 @@ class Task(BaseAction):
         task_action: Coroutine,
         source: str=None,
         user: str=None, 
-        tags: List[Dict[str, str]] = []
+        tags: List[Dict[str, str]] = [],
+        executor: Optional[str]=None
     ):
         super(Task, self).__init__(
             name,
@@ -41,6 +43,7 @@ class Task(BaseAction):
         self.type = RequestTypes.TASK
         self.source = source
         self.execute = task_action
+        self.executor = executor
         self.hooks: Hooks[Task] = Hooks()
 
 
@@ -1,5 +1,5 @@
 import json
-from typing import Dict, Iterator, Union, List, Any
+from typing import Dict, Iterator, Union, List, Any, Optional
 from urllib.parse import urlencode
 from hedra.core.engines.types.common.base_action import BaseAction
 from hedra.core.engines.types.common.hooks import Hooks
@@ -22,7 +22,9 @@ class UDPAction(BaseAction):
         'ssl_context',
         'event',
         'action_args',
-        'mutations'
+        'mutations',
+        'correlation_offset',
+        'correlation_length'
     )
     
     def __init__(
@@ -32,7 +34,9 @@ class UDPAction(BaseAction):
         wait_for_response: bool = False, 
         data: Union[str, dict, Iterator, bytes, None] = None, 
         user: str=None, 
-        tags: List[Dict[str, str]] = []
+        tags: List[Dict[str, str]] = [],
+        correlation_offset: Optional[int] = None,
+        correlation_length: int = 2
     ) -> None:
         super(UDPAction, self).__init__(
             name,
@@ -41,6 +45,11 @@ class UDPAction(BaseAction):
         )
 
         self.wait_for_response = wait_for_response
+
+        # Where batched sends stamp, and replies carry, the key used to
+        # match a reply to its request. None matches replies in order.
+        self.correlation_offset = correlation_offset
+        self.correlation_length = correlation_length
         self.type = RequestTypes.UDP
 
         address_family, protocol = self.protocols[self.type]
@@ -0,0 +1,359 @@
+from __future__ import annotations
+import asyncio
+import socket
+import time
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union
+)
+from .datagram_io import (
+    MMsgDatagramIO,
+    PortableDatagramIO,
+    create_datagram_io
+)
+
+
+class PendingDatagram:
+
+    __slots__ = (
+        'key',
+        'sequence',
+        'payload',
+        'future',
+        'sent',
+        'deadline'
+    )
+
+    def __init__(
+        self,
+        key: Union[int, bytes],
+        sequence: int,
+        payload: Optional[bytes],
+        future: Optional[asyncio.Future]
+    ) -> None:
+        self.key = key
+        self.sequence = sequence
+        self.payload = payload
+        self.future = future
+        self.sent: Optional[float] = None
+        self.deadline: Optional[float] = None
+
+
+class BatchedUDPConnection:
+
+    __slots__ = (
+        'dns_address',
+        'port',
+        'socket',
+        'loop',
+        'connected',
+        'closed',
+        'lock',
+        'io',
+        'read_timeout',
+        'correlation_offset',
+        'correlation_length',
+        'sequence',
+        'outbound',
+        'pending',
+        'flush_handle',
+        'sweep_handle',
+        'writing',
+        'sent',
+        'received',
+        'lost',
+        'unmatched'
+    )
+
+    '''
+    Shares one non-blocking socket between every in-flight action for a
+    host. Datagrams queued during a loop iteration are flushed together on
+    the next one and replies are drained as a batch whenever the socket
+    is readable.
+
+    With a correlation key configured, a rolling sequence number is
+    written into each outbound datagram at correlation_offset and replies
+    are matched on the same bytes (e.g. the 2-byte DNS transaction ID).
+    Otherwise replies are matched to requests in the order they were sent.
+    '''
+
+    def __init__(
+        self,
+        read_timeout: float,
+        batch_size: int=64,
+        correlation_offset: Optional[int]=None,
+        correlation_length: int=2
+    ) -> None:
+        self.dns_address: str = None
+        self.port: int = None
+        self.socket: Optional[socket.socket] = None
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.connected = False
+        self.closed = False
+        self.lock = asyncio.Lock()
+        self.io: Union[MMsgDatagramIO, PortableDatagramIO] = create_datagram_io(batch_size)
+        self.read_timeout = read_timeout
+
+        self.correlation_offset = correlation_offset
+        self.correlation_length = correlation_length
+        self.sequence = 0
+
+        self.outbound: List[PendingDatagram] = []
+        self.pending: Dict[Union[int, bytes], PendingDatagram] = {}
+        self.flush_handle: Optional[asyncio.Handle] = None
+        self.sweep_handle: Optional[asyncio.TimerHandle] = None
+        self.writing = False
+
+        self.sent = 0
+        self.received = 0
+        self.lost = 0
+        self.unmatched = 0
+
+    async def make_connection(
+        self,
+        dns_address: str,
+        port: int,
+        socket_config: Tuple[int, int, int, int, Tuple[int, int]],
+        timeout: Optional[float]=None
+    ) -> None:
+
+        if self.connected:
+            return
+
+        async with self.lock:
+
+            if self.connected:
+                return
+
+            family, type_, _, _, address = socket_config
+
+            self.loop = asyncio.get_event_loop()
+            self.socket = socket.socket(family=family, type=type_)
+            self.socket.setblocking(False)
+
+            try:
+                await asyncio.wait_for(
+                    self.loop.sock_connect(self.socket, address),
+                    timeout=timeout
+                )
+
+            except asyncio.TimeoutError:
+                self.socket.close()
+                raise Exception('Connection timed out.')
+
+            except Exception as connection_error:
+                self.socket.close()
+                raise connection_error
+
+            self.loop.add_reader(self.socket.fileno(), self._read_ready)
+
+            self.dns_address = dns_address
+            self.port = port
+            self.connected = True
+
+    def send(
+        self,
+        payload: Optional[bytes],
+        wait_for_response: bool
+    ) -> Optional[asyncio.Future]:
+
+        if self.connected is False:
+            raise Exception('Connection closed.')
+
+        sequence = self.sequence
+        self.sequence += 1
+
+        key = sequence
+        if payload and self.correlation_offset is not None:
+            key_space = 256 ** self.correlation_length
+            key = (sequence % key_space).to_bytes(
+                self.correlation_length,
+                'big'
+            )
+
+            # Queued datagrams are in sequence order, so the key can only
+            # repeat one of theirs once the queue spans the key space.
+            outbound = self.outbound
+            if key in self.pending or (outbound and sequence - outbound[0].sequence >= key_space):
+                raise Exception('Correlation key space exhausted - too many datagrams in flight.')
+
+            offset = self.correlation_offset
+            payload = b''.join([
+                payload[:offset],
+                key,
+                payload[offset + self.correlation_length:]
+            ])
+
+        future: Optional[asyncio.Future] = None
+        if wait_for_response:
+            future = self.loop.create_future()
+
+        datagram = PendingDatagram(key, sequence, payload, future)
+
+        if payload:
+            self.outbound.append(datagram)
+
+            if self.flush_handle is None and self.writing is False:
+                self.flush_handle = self.loop.call_soon(self._flush)
+
+        elif future:
+            # Receive-only actions claim the next unmatched reply.
+            self._track(datagram, time.monotonic())
+
+        return future
+
+    def _flush(self) -> None:
+        self.flush_handle = None
+
+        outbound = self.outbound
+        if not outbound:
+            return
+
+        try:
+            sent_count = self.io.send(
+                self.socket,
+                [datagram.payload for datagram in outbound]
+            )
+
+        except Exception as send_error:
+            self._fail(outbound, str(send_error))
+            self.outbound = []
+            return
+
+        sent_at = time.monotonic()
+        for datagram in outbound[:sent_count]:
+            datagram.payload = None
+
+            if datagram.future:
+                self._track(datagram, sent_at)
+
+        self.sent += sent_count
+
+        if sent_count < len(outbound):
+            # The socket buffer is full - resume once it drains.
+            self.outbound = outbound[sent_count:]
+
+            if self.writing is False:
+                self.writing = True
+                self.loop.add_writer(self.socket.fileno(), self._write_ready)
+
+        else:
+            self.outbound = []
+
+    def _write_ready(self) -> None:
+        self.writing = False
+        self.loop.remove_writer(self.socket.fileno())
+        self._flush()
+
+    def _track(self, datagram: PendingDatagram, sent_at: float) -> None:
+        datagram.sent = sent_at
+        datagram.deadline = sent_at + self.read_timeout
+        self.pending[datagram.key] = datagram
+
+        if self.sweep_handle is None:
+            self.sweep_handle = self.loop.call_at(
+                datagram.deadline,
+                self._sweep
+            )
+
+    def _read_ready(self) -> None:
+
+        try:
+            datagrams = self.io.receive(self.socket)
+
+        except Exception as receive_error:
+            # Retryable and ICMP errors are handled by receive(), so the
+            # socket is no longer usable. The pool replaces closed
+            # connections.
+            self._shutdown(f'Connection lost - {str(receive_error)}')
+            return
+
+        received_at = time.monotonic()
+        pending = self.pending
+        offset = self.correlation_offset
+        end = None if offset is None else offset + self.correlation_length
+
+        for data in datagrams:
+            self.received += 1
+
+            if offset is None:
+                key = next(iter(pending), None)
+
+            else:
+                key = data[offset:end]
+
+            datagram = pending.pop(key, None)
+            if datagram is None:
+                self.unmatched += 1
+                continue
+
+            future = datagram.future
+            if not future.done():
+                future.set_result((datagram.sent, received_at, data))
+
+    def _sweep(self) -> None:
+        self.sweep_handle = None
+
+        # Datagrams share one timeout and are tracked in send order, so
+        # only the oldest entries can have expired.
+        now = time.monotonic()
+        pending = self.pending
+
+        while pending:
+            key = next(iter(pending))
+            datagram = pending[key]
+
+            if datagram.deadline > now:
+                self.sweep_handle = self.loop.call_at(
+                    datagram.deadline,
+                    self._sweep
+                )
+                break
+
+            del pending[key]
+            self.lost += 1
+
+            if not datagram.future.done():
+                datagram.future.set_result((datagram.sent, None, None))
+
+    def _fail(self, datagrams: List[PendingDatagram], error: str) -> None:
+        for datagram in datagrams:
+            if datagram.future and not datagram.future.done():
+                datagram.future.set_exception(Exception(error))
+
+    async def close(self):
+        self._shutdown('Connection closed.')
+
+    def _shutdown(self, error: str) -> None:
+
+        if self.closed:
+            return
+
+        self.connected = False
+        self.closed = True
+
+        if self.flush_handle:
+            self.flush_handle.cancel()
+
+        if self.sweep_handle:
+            self.sweep_handle.cancel()
+
+        try:
+            self.loop.remove_reader(self.socket.fileno())
+
+            if self.writing:
+                self.loop.remove_writer(self.socket.fileno())
+
+            self.socket.close()
+
+        except Exception:
+            pass
+
+        self._fail(self.outbound, error)
+        self._fail(list(self.pending.values()), error)
+
+        self.outbound = []
+        self.pending = {}
@@ -1,7 +1,7 @@
 import asyncio
 import time
 import uuid
-from typing import Dict, Coroutine, Any
+from typing import Dict, Coroutine, Any, Optional
 from hedra.core.engines.types.common.base_engine import BaseEngine
 from hedra.core.engines.types.common.ssl import get_default_ssl_context
 from hedra.core.engines.types.common.timeouts import Timeouts
@@ -16,16 +16,23 @@ class MercuryUDPClient(BaseEngine[UDPAction, UDPResult]):
     __slots__ = (
         'session_id',
         'timeouts',
-        '_hosts',
+        'registered',
         'closed',
         'sem',
         'pool',
         'active',
         'waiter',
-        'ssl_context'
+        'ssl_context',
+        'batch_datagrams'
     )
 
-    def __init__(self, concurrency: int=10**3, timeouts: Timeouts = Timeouts(), reset_connections: bool=False) -> None:
+    def __init__(
+        self,
+        concurrency: int=10**3,
+        timeouts: Timeouts = Timeouts(),
+        reset_connections: bool=False,
+        batch_datagrams: bool=False
+    ) -> None:
         super(
             MercuryUDPClient,
             self
@@ -35,7 +42,6 @@ class MercuryUDPClient(BaseEngine[UDPAction, UDPResult]):
         self.timeouts = timeouts
 
         self.registered: Dict[str, UDPConnection] = {}
-        self._hosts = {}
         self.closed = False
 
         self.sem = asyncio.Semaphore(value=concurrency)
@@ -45,6 +51,7 @@ class MercuryUDPClient(BaseEngine[UDPAction, UDPResult]):
         self.waiter = None
 
         self.ssl_context = get_default_ssl_context()
+        self.batch_datagrams = batch_datagrams
 
     def config_to_dict(self):
         return {
@@ -54,12 +61,16 @@ class MercuryUDPClient(BaseEngine[UDPAction, UDPResult]):
                 'socket_read_timeout': self.timeouts.socket_read_timeout,
                 'total_timeout': self.timeouts.total_timeout
             },
-            'reset_connections': self.pool.reset_connections
+            'reset_connections': self.pool.reset_connections,
+            'batch_datagrams': self.batch_datagrams
         }
     
     async def set_pool(self, concurrency: int):
         self.sem = asyncio.Semaphore(value=concurrency)
+        batched_connections = self.pool.batched_connections
+
         self.pool = Pool(concurrency, reset_connections=self.pool.reset_connections)
+        self.pool.batched_connections = batched_connections
         self.pool.create_pool()
 
     async def prepare(self, action: UDPAction) -> Coroutine[Any, Any, None]:
@@ -67,7 +78,7 @@ class MercuryUDPClient(BaseEngine[UDPAction, UDPResult]):
             if action.url.is_ssl:
                 action.ssl_context = self.ssl_context
 
-            if self._hosts.get(action.url.hostname) is None:
+            if action.url.load_resolved() is False:
 
                     socket_configs = await asyncio.wait_for(action.url.lookup(), timeout=self.timeouts.connect_timeout)
               
@@ -98,15 +109,7 @@ class MercuryUDPClient(BaseEngine[UDPAction, UDPResult]):
                     if action.url.socket_config is None:
                         raise Exception('Connection Failed')
                     
-                    self._hosts[action.url.hostname] = {
-                        'ip_addr': action.url.ip_addr,
-                        'socket_config': action.url.socket_config
-                    }
-
-            else:
-                host_config = self._hosts[action.url.hostname]
-                action.url.ip_addr = host_config.get('ip_addr')
-                action.url.socket_config = host_config.get('socket_config')
+                    action.url.store_resolved()
 
             if action.is_setup is False:
                 action.setup()
@@ -137,7 +140,9 @@ class MercuryUDPClient(BaseEngine[UDPAction, UDPResult]):
         self.active += 1
  
         async with self.sem:
-            connection = self.pool.connections.pop()
+            connection: Optional[UDPConnection] = None
+            if self.batch_datagrams is False:
+                connection = self.pool.connections.pop()
             
             try:
 
@@ -152,30 +157,34 @@ class MercuryUDPClient(BaseEngine[UDPAction, UDPResult]):
 
                 response.start = time.monotonic()
 
-                await connection.make_connection(
-                    action.url.ip_addr,
-                    action.url.port,
-                    action.url.socket_config,
-                    timeout=self.timeouts.connect_timeout
-                )
-
-                response.connect_end = time.monotonic()
-                
-                if action.encoded_data:
-                    if action.is_stream:
-                        action.write_chunks(connection)
-
-                    else:
-                        connection.write(action.encoded_data)
-
-                response.write_end = time.monotonic()
-                
-                if action.wait_for_response:
-                    response.body = await connection.readuntil()
-         
-                response.complete = time.monotonic()
+                if self.batch_datagrams:
+                    await self._execute_batched(action, response)
+
+                else:
+                    await connection.make_connection(
+                        action.url.ip_addr,
+                        action.url.port,
+                        action.url.socket_config,
+                        timeout=self.timeouts.connect_timeout
+                    )
+
+                    response.connect_end = time.monotonic()
+                    
+                    if action.encoded_data:
+                        if action.is_stream:
+                            action.write_chunks(connection)
 
-                self.pool.connections.append(connection)
+                        else:
+                            connection.write(action.encoded_data)
+
+                    response.write_end = time.monotonic()
+                    
+                    if action.wait_for_response:
+                        response.body = await connection.readuntil()
+            
+                    response.complete = time.monotonic()
+
+                    self.pool.connections.append(connection)
 
                 if action.hooks.after:
                     response = await self.execute_after(action, response)
@@ -199,7 +208,8 @@ class MercuryUDPClient(BaseEngine[UDPAction, UDPResult]):
                 response.complete = time.monotonic()
                 response.error = str(e)
 
-                self.pool.connections.append(UDPConnection(reset_connection=self.pool.reset_connections))
+                if connection:
+                    self.pool.connections.append(UDPConnection(reset_connection=self.pool.reset_connections))
 
             self.active -= 1
             if self.waiter and self.active <= self.pool.size:
@@ -213,6 +223,48 @@ class MercuryUDPClient(BaseEngine[UDPAction, UDPResult]):
 
             return response
 
+    async def _execute_batched(self, action: UDPAction, response: UDPResult):
+
+        connection = self.pool.get_batched(
+            action.url.ip_addr,
+            action.url.port,
+            self.timeouts.socket_read_timeout,
+            correlation_offset=action.correlation_offset,
+            correlation_length=action.correlation_length
+        )
+
+        await connection.make_connection(
+            action.url.ip_addr,
+            action.url.port,
+            action.url.socket_config,
+            timeout=self.timeouts.connect_timeout
+        )
+
+        response.connect_end = time.monotonic()
+
+        # The datagram goes out with everything else queued this loop
+        # iteration, so write_end is the actual send time when a reply
+        # is awaited.
+        reply = connection.send(
+            action.encoded_data,
+            action.wait_for_response
+        )
+
+        if reply is None:
+            response.write_end = time.monotonic()
+            response.complete = response.write_end
+            return
+
+        sent, received, data = await reply
+        response.write_end = sent
+
+        if received is None:
+            response.lost = True
+            raise Exception('Datagram lost.')
+
+        response.complete = received
+        response.body = data
+
     async def close(self):
         if self.closed is False:
             await self.pool.close()
@@ -0,0 +1,273 @@
+import ctypes
+import ctypes.util
+import errno
+import socket
+import sys
+from typing import List, Optional, Union
+
+
+MAX_DATAGRAM_SIZE = 65536
+MSG_DONTWAIT = getattr(socket, 'MSG_DONTWAIT', 0)
+RETRY_ERRNOS = (
+    errno.EAGAIN,
+    errno.EWOULDBLOCK,
+    errno.EINTR
+)
+
+# ICMP errors (e.g. port unreachable) surface on the next call against a
+# connected UDP socket. They say nothing about the datagrams in the batch.
+IGNORED_ERRNOS = (
+    errno.ECONNREFUSED,
+    errno.EHOSTUNREACH,
+    errno.ENETUNREACH
+)
+
+
+class IOVec(ctypes.Structure):
+    _fields_ = [
+        ('iov_base', ctypes.c_char_p),
+        ('iov_len', ctypes.c_size_t)
+    ]
+
+
+class MsgHdr(ctypes.Structure):
+    _fields_ = [
+        ('msg_name', ctypes.c_void_p),
+        ('msg_namelen', ctypes.c_uint32),
+        ('msg_iov', ctypes.POINTER(IOVec)),
+        ('msg_iovlen', ctypes.c_size_t),
+        ('msg_control', ctypes.c_void_p),
+        ('msg_controllen', ctypes.c_size_t),
+        ('msg_flags', ctypes.c_int)
+    ]
+
+
+class MMsgHdr(ctypes.Structure):
+    _fields_ = [
+        ('msg_hdr', MsgHdr),
+        ('msg_len', ctypes.c_uint)
+    ]
+
+
+def _load_libc() -> Optional[ctypes.CDLL]:
+
+    if not sys.platform.startswith('linux'):
+        return None
+
+    try:
+        libc = ctypes.CDLL(
+            ctypes.util.find_library('c') or 'libc.so.6',
+            use_errno=True
+        )
+
+        libc.sendmmsg.argtypes = [
+            ctypes.c_int,
+            ctypes.POINTER(MMsgHdr),
+            ctypes.c_uint,
+            ctypes.c_int
+        ]
+        libc.sendmmsg.restype = ctypes.c_int
+
+        libc.recvmmsg.argtypes = [
+            ctypes.c_int,
+            ctypes.POINTER(MMsgHdr),
+            ctypes.c_uint,
+            ctypes.c_int,
+            ctypes.c_void_p
+        ]
+        libc.recvmmsg.restype = ctypes.c_int
+
+        return libc
+
+    except (OSError, AttributeError):
+        return None
+
+
+_libc = _load_libc()
+
+
+class PortableDatagramIO:
+
+    __slots__ = (
+        'batch_size',
+        'max_datagram_size'
+    )
+
+    '''
+    One send()/recv() call per datagram. Used wherever sendmmsg/recvmmsg
+    are unavailable.
+    '''
+
+    def __init__(self, batch_size: int, max_datagram_size: int=MAX_DATAGRAM_SIZE) -> None:
+        self.batch_size = batch_size
+        self.max_datagram_size = max_datagram_size
+
+    def send(self, sock: socket.socket, payloads: List[bytes]) -> int:
+        sent = 0
+
+        for payload in payloads:
+            try:
+                sock.send(payload)
+
+            except (BlockingIOError, InterruptedError):
+                break
+
+            except OSError as send_error:
+                if send_error.errno not in IGNORED_ERRNOS:
+                    raise send_error
+
+            sent += 1
+
+        return sent
+
+    def receive(self, sock: socket.socket) -> List[bytes]:
+        datagrams: List[bytes] = []
+
+        for _ in range(self.batch_size):
+            try:
+                datagrams.append(
+                    sock.recv(self.max_datagram_size)
+                )
+
+            except (BlockingIOError, InterruptedError):
+                break
+
+            except OSError as receive_error:
+                if receive_error.errno not in IGNORED_ERRNOS:
+                    raise receive_error
+
+        return datagrams
+
+
+class MMsgDatagramIO:
+
+    __slots__ = (
+        'batch_size',
+        'max_datagram_size',
+        '_send_iovecs',
+        '_send_messages',
+        '_receive_buffer',
+        '_receive_view',
+        '_receive_iovecs',
+        '_receive_messages'
+    )
+
+    '''
+    Moves up to batch_size datagrams per system call with sendmmsg/recvmmsg
+    (Linux). Outbound payloads are referenced in place; inbound datagrams
+    land in one preallocated buffer and are copied out once.
+    '''
+
+    def __init__(self, batch_size: int, max_datagram_size: int=MAX_DATAGRAM_SIZE) -> None:
+        self.batch_size = batch_size
+        self.max_datagram_size = max_datagram_size
+
+        self._send_iovecs = (IOVec * batch_size)()
+        self._send_messages = (MMsgHdr * batch_size)()
+
+        self._receive_buffer = ctypes.create_string_buffer(batch_size * max_datagram_size)
+        self._receive_view = memoryview(self._receive_buffer).cast('B')
+        self._receive_iovecs = (IOVec * batch_size)()
+        self._receive_messages = (MMsgHdr * batch_size)()
+
+        buffer_address = ctypes.addressof(self._receive_buffer)
+
+        for idx in range(batch_size):
+            self._send_messages[idx].msg_hdr.msg_iov = ctypes.pointer(self._send_iovecs[idx])
+            self._send_messages[idx].msg_hdr.msg_iovlen = 1
+
+            receive_iovec = self._receive_iovecs[idx]
+            receive_iovec.iov_base = ctypes.cast(
+                buffer_address + (idx * max_datagram_size),
+                ctypes.c_char_p
+            )
+            receive_iovec.iov_len = max_datagram_size
+
+            self._receive_messages[idx].msg_hdr.msg_iov = ctypes.pointer(receive_iovec)
+            self._receive_messages[idx].msg_hdr.msg_iovlen = 1
+
+    def send(self, sock: socket.socket, payloads: List[bytes]) -> int:
+        iovecs = self._send_iovecs
+        sent = 0
+
+        while sent < len(payloads):
+            batch = payloads[sent:sent + self.batch_size]
+
+            for idx, payload in enumerate(batch):
+                iovec = iovecs[idx]
+                iovec.iov_base = payload
+                iovec.iov_len = len(payload)
+
+            result = _libc.sendmmsg(
+                sock.fileno(),
+                self._send_messages,
+                len(batch),
+                MSG_DONTWAIT
+            )
+
+            if result < 0:
+                error_number = ctypes.get_errno()
+
+                if error_number in RETRY_ERRNOS:
+                    break
+
+                elif error_number in IGNORED_ERRNOS:
+                    # sendmmsg only fails if the first datagram was not
+                    # sent, so drop it as PortableDatagramIO does rather
+                    # than retrying the batch against a lasting error.
+                    sent += 1
+                    continue
+
+                raise OSError(error_number, f'sendmmsg failed - {errno.errorcode.get(error_number, error_number)}')
+
+            sent += result
+
+            if result < len(batch):
+                break
+
+        return sent
+
+    def receive(self, sock: socket.socket) -> List[bytes]:
+        result = _libc.recvmmsg(
+            sock.fileno(),
+            self._receive_messages,
+            self.batch_size,
+            MSG_DONTWAIT,
+            None
+        )
+
+        if result < 0:
+            error_number = ctypes.get_errno()
+
+            if error_number in RETRY_ERRNOS or error_number in IGNORED_ERRNOS:
+                return []
+
+            raise OSError(error_number, f'recvmmsg failed - {errno.errorcode.get(error_number, error_number)}')
+
+        messages = self._receive_messages
+        view = self._receive_view
+        max_datagram_size = self.max_datagram_size
+
+        datagrams: List[bytes] = []
+        for idx in range(result):
+            offset = idx * max_datagram_size
+            datagrams.append(
+                view[offset:offset + messages[idx].msg_len].tobytes()
+            )
+
+        return datagrams
+
+
+def mmsg_available() -> bool:
+    return _libc is not None
+
+
+def create_datagram_io(
+    batch_size: int,
+    max_datagram_size: int=MAX_DATAGRAM_SIZE
+) -> Union[MMsgDatagramIO, PortableDatagramIO]:
+
+    if mmsg_available():
+        return MMsgDatagramIO(batch_size, max_datagram_size)
+
+    return PortableDatagramIO(batch_size, max_datagram_size)
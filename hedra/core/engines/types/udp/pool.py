@@ -1,5 +1,5 @@
-
-from typing import List
+from typing import Dict, List, Optional, Tuple
+from .batched_connection import BatchedUDPConnection
 from .connection import UDPConnection
 
 
@@ -8,7 +8,8 @@ class Pool:
     __slots__ = (
         'size',
         'connections',
-        'reset_connections'
+        'reset_connections',
+        'batched_connections'
     )
 
     def __init__(self, size: int, reset_connections: bool = False) -> None:
@@ -16,6 +17,7 @@ class Pool:
         
         self.connections: List[UDPConnection] = []
         self.reset_connections = reset_connections
+        self.batched_connections: Dict[Tuple[str, int, Optional[int], int], BatchedUDPConnection] = {}
 
     def create_pool(self) -> None:
         for _ in range(self.size):
@@ -23,6 +25,34 @@ class Pool:
                 UDPConnection(self.reset_connections)
             )
 
+    def get_batched(
+        self,
+        ip_addr: str,
+        port: int,
+        read_timeout: float,
+        correlation_offset: Optional[int]=None,
+        correlation_length: int=2
+    ) -> BatchedUDPConnection:
+
+        # Actions only share a socket if they also agree on where the
+        # correlation key lives in the datagram.
+        connection_key = (ip_addr, port, correlation_offset, correlation_length)
+        connection = self.batched_connections.get(connection_key)
+
+        if connection is None or connection.closed:
+            connection = BatchedUDPConnection(
+                read_timeout,
+                correlation_offset=correlation_offset,
+                correlation_length=correlation_length
+            )
+
+            self.batched_connections[connection_key] = connection
+
+        return connection
+
     async def close(self):
         for connection in self.connections:
             await connection.close()
+
+        for batched_connection in self.batched_connections.values():
+            await batched_connection.close()
@@ -18,8 +18,9 @@ class UDPResult(BaseResult):
         'hostname',
         'body',
         'response_code',
+        'lost',
         '_version',
-        '_reason'
+        '_reason',
         '_status'
     )
 
@@ -48,6 +49,7 @@ class UDPResult(BaseResult):
 
         self.body = bytearray()
         self.response_code = None
+        self.lost = False
         self._version = None
         self._reason = None
         self._status = None
@@ -63,7 +65,7 @@ class UDPResult(BaseResult):
 
     @property
     def data(self) -> Union[str, dict, None]:
-        return self.body.decode()
+        return self.body.decode(errors='replace')
 
     @property
     def status(self) -> Union[int, None]:
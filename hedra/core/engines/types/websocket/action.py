@@ -1,4 +1,5 @@
-from typing import Dict, Iterator, Union, List, Any
+import json
+from typing import Dict, Iterator, Union, List, Any, Optional, Tuple
 from hedra.core.engines.types.common.hooks import Hooks
 from hedra.core.engines.types.common.types import RequestTypes
 from hedra.core.engines.types.http.action import HTTPAction
@@ -6,7 +7,11 @@ from .utils import (
     pack_hostname,
     create_sec_websocket_key
 )
-from .constants import WEBSOCKETS_VERSION
+from .constants import (
+    OPCODE_BINARY,
+    OPCODE_TEXT,
+    WEBSOCKETS_VERSION
+)
 
 
 class WebsocketAction(HTTPAction):
@@ -38,15 +43,58 @@ class WebsocketAction(HTTPAction):
         self.action_args: Dict[str, Any] = {}
         self.type = RequestTypes.WEBSOCKET
         self.hooks: Hooks[WebsocketAction] = Hooks()
+        self.websocket_key: Optional[str] = None
+        self.encoded_messages: List[Tuple[int, bytes]] = []
+
+    @property
+    def size(self):
+        return sum([
+            len(payload) for _, payload in self.encoded_messages
+        ])
+
+    def setup(self):
+
+        if self.encoded_data is None:
+            self._setup_data()
+
+        if self.encoded_headers is None:
+            self._setup_headers()
+
+    def _setup_data(self):
+
+        messages = self._data
+        if messages is None:
+            messages = []
+
+        elif not isinstance(messages, list):
+            messages = [messages]
+
+        self.encoded_messages = [
+            self._encode_message(message) for message in messages
+        ]
+
+        self.encoded_data = b''.join([
+            payload for _, payload in self.encoded_messages
+        ])
+
+    def _encode_message(self, message: Any) -> Tuple[int, bytes]:
+
+        if isinstance(message, (bytes, bytearray)):
+            return OPCODE_BINARY, bytes(message)
+
+        elif isinstance(message, str):
+            return OPCODE_TEXT, message.encode()
+
+        return OPCODE_TEXT, json.dumps(message).encode()
 
     def _setup_headers(self):
 
         if self.url.hostname is None:
             raise Exception(f'Invalid url - {self.url.full}. Please provide a url of the format - ws(s)://<HOST>/<PATH>')
 
-        for header_name, header_value in self._headers.items():
-            header_name_lowered = header_name.lower()
-            self._headers[header_name_lowered] = header_value
+        self._headers = {
+            header_name.lower(): header_value for header_name, header_value in self._headers.items()
+        }
 
         headers = [
             "GET %s HTTP/1.1" % self.url.path,
@@ -87,6 +135,8 @@ class WebsocketAction(HTTPAction):
         else:
             key = self._headers.get("header", {}).get('Sec-WebSocket-Key')
 
+        self.websocket_key = key
+
         if not header or 'Sec-WebSocket-Version' not in header:
             headers.append(f"Sec-WebSocket-Version: {WEBSOCKETS_VERSION}")
 
@@ -1,15 +1,15 @@
 import time
 import asyncio
 import uuid
-from typing import Dict, Coroutine, Any
+from typing import Dict, Coroutine, Any, List, Optional, Union
 from hedra.core.engines.types.common.timeouts import Timeouts
 from hedra.core.engines.types.common.base_engine import BaseEngine
+from hedra.core.engines.types.common.concurrency import Semaphore
 from hedra.core.engines.types.common.ssl import get_default_ssl_context
 from .connection import WebsocketConnection
 from .pool import Pool
 from .action import WebsocketAction
 from .result import WebsocketResult
-from .utils import get_header_bits, get_message_buffer_size
 
 
 class MercuryWebsocketClient(BaseEngine[WebsocketAction, WebsocketResult]):
@@ -18,7 +18,6 @@ class MercuryWebsocketClient(BaseEngine[WebsocketAction, WebsocketResult]):
         'session_id',
         'timeouts',
         'registered',
-        '_hosts',
         'closed',
         'sem',
         'pool',
@@ -27,18 +26,32 @@ class MercuryWebsocketClient(BaseEngine[WebsocketAction, WebsocketResult]):
         'ssl_context'
     )
 
+    def __init__(
+        self,
+        concurrency: int = 10 ** 3,
+        timeouts: Timeouts = Timeouts(),
+        reset_connections: bool=False,
+        idle_timeout: Optional[float]=None,
+        max_connection_age: Optional[float]=None
+    ) -> None:
+        super(
+            MercuryWebsocketClient,
+            self
+        ).__init__()
 
-    def __init__(self, concurrency: int = 10 ** 3, timeouts: Timeouts = Timeouts(), reset_connections: bool=False) -> None:
-        
         self.session_id = str(uuid.uuid4())
         self.timeouts = timeouts
 
         self.registered: Dict[str, WebsocketAction] = {}
-        self._hosts = {}
         self.closed = False
 
-        self.sem = asyncio.Semaphore(value=concurrency)
-        self.pool = Pool(concurrency, reset_connections=reset_connections)
+        self.sem = Semaphore(value=concurrency)
+        self.pool = Pool(
+            concurrency,
+            reset_connections=reset_connections,
+            idle_timeout=idle_timeout,
+            max_connection_age=max_connection_age
+        )
         self.pool.create_pool()
         self.active = 0
         self.waiter = None
@@ -53,35 +66,62 @@ class MercuryWebsocketClient(BaseEngine[WebsocketAction, WebsocketResult]):
                 'socket_read_timeout': self.timeouts.socket_read_timeout,
                 'total_timeout': self.timeouts.total_timeout
             },
-            'reset_connections': self.pool.reset_connections
+            'reset_connections': self.pool.reset_connections,
+            'idle_timeout': self.pool.idle_timeout,
+            'max_connection_age': self.pool.max_connection_age
         }
-    
+
+    def resize_pool(self, concurrency: int):
+        if isinstance(self.sem, Semaphore):
+            self.sem.resize(concurrency - self.pool.size)
+
+        else:
+            self.sem = Semaphore(value=concurrency)
+
+        self.pool.resize(concurrency)
+
     async def set_pool(self, concurrency: int):
-        self.sem = asyncio.Semaphore(value=concurrency)
-        self.pool = Pool(concurrency, reset_connections=self.pool.reset_connections)
-        self.pool.create_pool()
+        self.resize_pool(concurrency)
 
-    
     def extend_pool(self, increased_capacity: int):
-        self.pool.size += increased_capacity
-        for _ in range(increased_capacity):
-            self.pool.connections.append(
-                WebsocketConnection(self.pool.reset_connections)
-            )
-        
-        self.sem = asyncio.Semaphore(self.pool.size)
+        self.resize_pool(self.pool.size + increased_capacity)
 
     def shrink_pool(self, decrease_capacity: int):
-        self.pool.size -= decrease_capacity
-        self.pool.connections = self.pool.connections[:self.pool.size]
-        self.sem = asyncio.Semaphore(self.pool.size)
-        
+        self.resize_pool(self.pool.size - decrease_capacity)
+
+    async def warm(self, action: WebsocketAction, connections: int):
+        host_key = self.pool.host_key(action.url)
+
+        warmed: List[WebsocketConnection] = [
+            WebsocketConnection(self.pool.reset_connections) for _ in range(
+                min(connections, self.pool.size)
+            )
+        ]
+
+        results = await asyncio.gather(*[
+            self._connect(
+                action,
+                connection
+            ) for connection in warmed
+        ], return_exceptions=True)
+
+        warmed_count = 0
+        for connection, result in zip(warmed, results):
+            if isinstance(result, Exception):
+                connection.abort()
+                continue
+
+            self.pool.release(host_key, connection)
+            warmed_count += 1
+
+        return warmed_count
+
     async def prepare(self, action: WebsocketAction) -> Coroutine[Any, Any, None]:
         try:
             if action.url.is_ssl:
                 action.ssl_context = self.ssl_context
 
-            if self._hosts.get(action.url.hostname) is None:
+            if action.url.load_resolved() is False:
 
                     socket_configs = await action.url.lookup()
                     for ip_addr, configs in socket_configs.items():
@@ -93,7 +133,8 @@ class MercuryWebsocketClient(BaseEngine[WebsocketAction, WebsocketResult]):
                                     ip_addr,
                                     action.url.port,
                                     config,
-                                    ssl=action.ssl_context
+                                    ssl=action.ssl_context,
+                                    timeout=self.timeouts.connect_timeout
                                 )
 
                                 action.url.socket_config = config
@@ -109,16 +150,8 @@ class MercuryWebsocketClient(BaseEngine[WebsocketAction, WebsocketResult]):
 
                     if action.url.socket_config is None:
                         raise Exception('Connection Failed')
-                    
-                    self._hosts[action.url.hostname] = {
-                        'ip_addr': action.url.ip_addr,
-                        'socket_config': action.url.socket_config
-                    }
 
-            else:
-                host_config = self._hosts[action.url.hostname]
-                action.url.ip_addr = host_config.get('ip_addr')
-                action.url.socket_config = host_config.get('socket_config')
+                    action.url.store_resolved()
 
             if action.is_setup is False:
                 action.setup()
@@ -126,10 +159,28 @@ class MercuryWebsocketClient(BaseEngine[WebsocketAction, WebsocketResult]):
             self.registered[action.name] = action
 
             return action
-        
+
         except Exception as e:
             raise e
 
+    async def _connect(self, action: WebsocketAction, connection: WebsocketConnection):
+        await connection.make_connection(
+            action.url.hostname,
+            action.url.ip_addr,
+            action.url.port,
+            action.url.socket_config,
+            ssl=action.ssl_context,
+            timeout=self.timeouts.connect_timeout
+        )
+
+        await asyncio.wait_for(
+            connection.upgrade(
+                action.encoded_headers,
+                action.websocket_key
+            ),
+            timeout=self.timeouts.connect_timeout
+        )
+
     async def execute_prepared_request(self, action: WebsocketAction) -> Coroutine[Any, Any, WebsocketResult]:
 
         response = WebsocketResult(action)
@@ -138,10 +189,13 @@ class MercuryWebsocketClient(BaseEngine[WebsocketAction, WebsocketResult]):
 
         async with self.sem:
 
-            connection = self.pool.connections.pop()
+            host_key = self.pool.host_key(action.url)
+            connection: Union[WebsocketConnection, None] = None
 
             try:
 
+                connection = self.pool.acquire(host_key)
+
                 if action.hooks.listen:
                     event = asyncio.Event()
                     action.hooks.channel_events.append(event)
@@ -153,42 +207,36 @@ class MercuryWebsocketClient(BaseEngine[WebsocketAction, WebsocketResult]):
 
                 response.start = time.monotonic()
 
-                await connection.make_connection(
-                    action.name,
-                    action.url.ip_addr,
-                    action.url.port,
-                    ssl=action.ssl_context,
-                    timeout=self.timeouts.connect_timeout
-                )
+                # The upgrade handshake is only paid when the pooled
+                # connection is new; after that actions are just frames.
+                await self._connect(action, connection)
 
+                response.response_code = connection.upgrade_line
+                response.headers = connection.upgrade_headers
                 response.connect_end = time.monotonic()
 
-                connection.write(action.encoded_headers)
-                
-                if action.encoded_data is not None:
-                    if action.is_stream:
-                        action.write_chunks(connection)
+                if len(action.encoded_messages) > 0:
+                    for opcode, payload in action.encoded_messages:
+                        response.sent.append(time.monotonic())
+                        connection.send(opcode, payload)
 
-                    else:
-                        connection.write(action.encoded_data)
+                        response.write_end = time.monotonic()
 
-                response.write_end = time.monotonic()
+                        await self._receive_message(
+                            action,
+                            connection,
+                            response
+                        )
 
-                line = await asyncio.wait_for(connection.readuntil(), self.timeouts.socket_read_timeout)
+                else:
+                    response.write_end = response.connect_end
 
-                response.response_code = line
-                raw_headers = b''
-                async for key, value, header_line in connection.iter_headers(connection):
-                    response.headers[key] = value
-                    raw_headers += header_line
+                    await self._receive_message(
+                        action,
+                        connection,
+                        response
+                    )
 
-                if action.encoded_data is not None:
-                    header_bits = get_header_bits(raw_headers)
-                    header_content_length = get_message_buffer_size(header_bits)
-                    
-                if action.method == 'GET':
-                    response.body = await asyncio.wait_for(connection.readexactly(min(16384, header_content_length)), self.timeouts.total_timeout)
-                
                 response.complete = time.monotonic()
 
                 if action.hooks.after:
@@ -202,22 +250,21 @@ class MercuryWebsocketClient(BaseEngine[WebsocketAction, WebsocketResult]):
                         ) for channel in action.hooks.channels
                     ])
 
-                    for listener in action.hooks.listeners: 
+                    for listener in action.hooks.listeners:
                         if len(listener.hooks.channel_events) > 0:
                             listener.setup()
                             event = listener.hooks.channel_events.pop()
                             if not event.is_set():
-                                event.set()   
+                                event.set()
 
-                self.pool.connections.append(connection)
+                self.pool.release(host_key, connection)
 
             except Exception as e:
                 response.complete = time.monotonic()
                 response.error = str(e)
 
-                self.pool.connections.append(
-                    WebsocketConnection(reset_connection=self.pool.reset_connections) 
-                )
+                if connection:
+                    connection.abort()
 
             self.active -= 1
             if self.waiter and self.active <= self.pool.size:
@@ -227,12 +274,31 @@ class MercuryWebsocketClient(BaseEngine[WebsocketAction, WebsocketResult]):
                     self.waiter = None
 
                 except asyncio.InvalidStateError:
-                    self.waiter = None 
+                    self.waiter = None
 
             return response
 
+    async def _receive_message(
+        self,
+        action: WebsocketAction,
+        connection: WebsocketConnection,
+        response: WebsocketResult
+    ):
+        _, payload = await asyncio.wait_for(
+            connection.receive(),
+            timeout=self.timeouts.socket_read_timeout
+        )
+
+        response.received.append(time.monotonic())
+        response.body_size += action.body_policy.keep(
+            response.body,
+            payload
+        )
+
+        if action.body_policy.max_size is None:
+            response.messages.append(payload)
+
     async def close(self):
         if self.closed is False:
             await self.pool.close()
             self.closed = True
-
@@ -1,11 +1,169 @@
+from ssl import SSLContext
+from typing import Dict, List, Optional, Tuple
 from hedra.core.engines.types.http.connection import HTTPConnection
+from .constants import (
+    CLOSE_NORMAL,
+    OPCODE_CONTINUATION,
+    OPCODE_CLOSE,
+    OPCODE_PING,
+    OPCODE_PONG
+)
+from .frames import (
+    _STRUCT_H,
+    _STRUCT_Q,
+    decode_close,
+    encode_close,
+    encode_frame,
+    is_control,
+    mask_payload
+)
+from .utils import create_sec_websocket_accept
 
 
 class WebsocketConnection(HTTPConnection):
 
+    __slots__ = (
+        'upgraded',
+        'upgrade_line',
+        'upgrade_headers'
+    )
 
     def __init__(self, reset_connection: bool = False) -> None:
         super().__init__(reset_connection)
+        self.upgraded = False
+        self.upgrade_line: Optional[bytes] = None
+        self.upgrade_headers: Dict[bytes, bytes] = {}
 
-    def iter_headers(self):
-        return self.reader.iter_headers()
\ No newline at end of file
+    async def make_connection(
+        self,
+        hostname: str,
+        dns_address: str,
+        port: int,
+        socket_config: Tuple[int, int, int, int, Tuple[int, int]],
+        ssl: Optional[SSLContext]=None,
+        timeout: Optional[float]=None
+    ) -> None:
+        writer = self.writer
+
+        await super().make_connection(
+            hostname,
+            dns_address,
+            port,
+            socket_config,
+            ssl=ssl,
+            timeout=timeout
+        )
+
+        # A new socket has to go through the upgrade handshake again.
+        if self.writer is not writer:
+            self.upgraded = False
+
+    @property
+    def reusable(self):
+        return self.upgraded and super().reusable
+
+    async def upgrade(self, encoded_headers: bytes, key: str) -> None:
+
+        if self.upgraded:
+            return
+
+        self.write(encoded_headers)
+
+        head = await self.read_response_head()
+        self.upgrade_line = head.status_line
+
+        if head.status != 101:
+            self.connected = False
+            raise Exception(f'Websocket upgrade failed - {self.upgrade_line.decode().strip()}')
+
+        accept = head.get(b'sec-websocket-accept')
+        if accept != create_sec_websocket_accept(key):
+            self.connected = False
+            raise Exception('Websocket upgrade failed - invalid Sec-WebSocket-Accept.')
+
+        self.upgrade_headers = head.headers
+        self.upgraded = True
+
+    def send(self, opcode: int, payload: bytes) -> None:
+        self.write(
+            encode_frame(opcode, payload)
+        )
+
+    async def receive_frame(self) -> Tuple[bool, int, bytes]:
+        first_byte, second_byte = await self.reader.readexactly(2)
+
+        fin = first_byte & 0x80 > 0
+        opcode = first_byte & 0x0F
+        length = second_byte & 0x7F
+
+        if length == 126:
+            (length,) = _STRUCT_H.unpack(await self.reader.readexactly(2))
+
+        elif length == 127:
+            (length,) = _STRUCT_Q.unpack(await self.reader.readexactly(8))
+
+        mask: Optional[bytes] = None
+        if second_byte & 0x80:
+            mask = await self.reader.readexactly(4)
+
+        payload = await self.reader.readexactly(length)
+
+        if mask:
+            payload = mask_payload(payload, mask)
+
+        return fin, opcode, payload
+
+    async def receive(self) -> Tuple[int, bytes]:
+        '''
+        Returns the next complete data message, reassembling fragments and
+        answering control frames interleaved with them.
+        '''
+
+        message_opcode: Optional[int] = None
+        fragments: List[bytes] = []
+
+        while True:
+            fin, opcode, payload = await self.receive_frame()
+
+            if is_control(opcode):
+
+                if opcode == OPCODE_PING:
+                    self.send(OPCODE_PONG, payload)
+
+                elif opcode == OPCODE_CLOSE:
+                    code, reason = decode_close(payload)
+                    self.close_frame(code)
+
+                    raise Exception(f'Websocket closed by server - {code} {reason}'.strip())
+
+                continue
+
+            if opcode != OPCODE_CONTINUATION:
+
+                if message_opcode is not None:
+                    raise Exception('Websocket protocol error - new message before previous message completed.')
+
+                message_opcode = opcode
+
+            elif message_opcode is None:
+                raise Exception('Websocket protocol error - unexpected continuation frame.')
+
+            fragments.append(payload)
+
+            if fin:
+                if len(fragments) == 1:
+                    return message_opcode, fragments[0]
+
+                return message_opcode, b''.join(fragments)
+
+    def close_frame(self, code: int=CLOSE_NORMAL) -> None:
+
+        if self.upgraded and self.writer and not self.writer.is_closing():
+            self.write(encode_close(code))
+
+        self.upgraded = False
+        self.connected = False
+
+    def abort(self):
+        self.upgraded = False
+        super().abort()
@@ -0,0 +1,77 @@
+import os
+import struct
+from typing import Tuple, Union
+from .constants import OPCODE_CLOSE
+
+
+_STRUCT_BB = struct.Struct('!BB')
+_STRUCT_BBH = struct.Struct('!BBH')
+_STRUCT_BBQ = struct.Struct('!BBQ')
+_STRUCT_H = struct.Struct('!H')
+_STRUCT_Q = struct.Struct('!Q')
+
+MASK_BIT = 0x80
+FIN_BIT = 0x80
+
+
+def mask_payload(payload: Union[bytes, bytearray, memoryview], mask: bytes) -> bytes:
+    payload_length = len(payload)
+
+    if payload_length == 0:
+        return b''
+
+    # XOR the whole payload against the repeated mask in one big integer
+    # operation rather than byte by byte.
+    repeated_mask = (mask * (payload_length // 4 + 1))[:payload_length]
+
+    return (
+        int.from_bytes(payload, 'little') ^ int.from_bytes(repeated_mask, 'little')
+    ).to_bytes(payload_length, 'little')
+
+
+def encode_frame(opcode: int, payload: bytes, fin: bool=True) -> bytes:
+
+    first_byte = opcode
+    if fin:
+        first_byte |= FIN_BIT
+
+    payload_length = len(payload)
+
+    if payload_length < 126:
+        header = _STRUCT_BB.pack(first_byte, MASK_BIT | payload_length)
+
+    elif payload_length < 65536:
+        header = _STRUCT_BBH.pack(first_byte, MASK_BIT | 126, payload_length)
+
+    else:
+        header = _STRUCT_BBQ.pack(first_byte, MASK_BIT | 127, payload_length)
+
+    # Client frames must always be masked, with a fresh key per frame.
+    mask = os.urandom(4)
+
+    return b''.join([
+        header,
+        mask,
+        mask_payload(payload, mask)
+    ])
+
+
+def encode_close(code: int, reason: bytes=b'') -> bytes:
+    return encode_frame(
+        OPCODE_CLOSE,
+        _STRUCT_H.pack(code) + reason
+    )
+
+
+def decode_close(payload: bytes) -> Tuple[int, str]:
+
+    if len(payload) < 2:
+        return 1005, ''
+
+    (code,) = _STRUCT_H.unpack_from(payload)
+    return code, payload[2:].decode(errors='replace')
+
+
+def is_control(opcode: int) -> bool:
+    return opcode & 0x8 > 0
+
@@ -1,27 +1,88 @@
-
-from typing import List
+from typing import Hashable, List, Optional, Tuple
+from hedra.core.engines.types.common.connection_pool import HostConnectionPool
+from hedra.core.engines.types.common.url import URL
 from .connection import WebsocketConnection
 
 
 class Pool:
 
     __slots__ = (
-        'size',
-        'connections',
-        'reset_connections'
+        'reset_connections',
+        'idle'
     )
 
-    def __init__(self, size: int, reset_connections: bool = False) -> None:
-        self.size = size
-        self.connections: List[WebsocketConnection] = []
+    def __init__(
+        self,
+        size: int,
+        reset_connections: bool = False,
+        idle_timeout: Optional[float]=None,
+        max_connection_age: Optional[float]=None
+    ) -> None:
         self.reset_connections = reset_connections
+        self.idle: HostConnectionPool[WebsocketConnection] = HostConnectionPool(
+            size,
+            idle_timeout=idle_timeout,
+            max_connection_age=max_connection_age
+        )
+
+    @property
+    def size(self) -> int:
+        return self.idle.size
+
+    @size.setter
+    def size(self, size: int):
+        self.resize(size)
+
+    @property
+    def idle_timeout(self):
+        return self.idle.idle_timeout
+
+    @property
+    def max_connection_age(self):
+        return self.idle.max_connection_age
+
+    @property
+    def connections(self) -> List[WebsocketConnection]:
+        return list(self.idle)
+
+    @staticmethod
+    def host_key(url: URL) -> Tuple[str, str, int, str]:
+        # An upgraded connection is bound to the endpoint it was
+        # upgraded on, so the path is part of the key.
+        return (
+            url.hostname,
+            url.ip_addr,
+            url.port,
+            url.path
+        )
 
     def create_pool(self) -> None:
-        for _ in range(self.size):
-            self.connections.append(
-                WebsocketConnection(self.reset_connections)
-            )
+        # Connections are created and upgraded per endpoint on demand.
+        pass
+
+    def acquire(self, host_key: Hashable) -> WebsocketConnection:
+        connection = self.idle.acquire(host_key)
+
+        if connection is None:
+            connection = WebsocketConnection(self.reset_connections)
+
+        return connection
+
+    def release(self, host_key: Hashable, connection: WebsocketConnection) -> None:
+        self.idle.release(host_key, connection)
+
+    def resize(self, size: int) -> None:
+        self.idle.resize(size)
+
+    def reap(self) -> int:
+        return self.idle.reap()
+
+    def clear(self) -> None:
+        self.idle.clear()
 
     async def close(self):
         for connection in self.connections:
+            connection.close_frame()
             await connection.close()
+
+        self.idle.clear()
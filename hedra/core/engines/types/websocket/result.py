@@ -1,3 +1,4 @@
+from typing import List
 from hedra.core.engines.types.common.types import RequestTypes
 from hedra.core.engines.types.http.result import HTTPResult
 from .action import WebsocketAction
@@ -7,4 +8,26 @@ class WebsocketResult(HTTPResult):
 
     def __init__(self, action: WebsocketAction, error: Exception = None) -> None:
         super().__init__(action, error)      
-        self.type = RequestTypes.WEBSOCKET
\ No newline at end of file
+        self.type = RequestTypes.WEBSOCKET
+        self.messages: List[bytes] = []
+        self.sent: List[float] = []
+        self.received: List[float] = []
+
+    @property
+    def message_timings(self) -> List[float]:
+        '''
+        Round trip latency of each received message, measured from the
+        matching sent message (or from when the connection was ready when
+        only listening).
+        '''
+
+        timings: List[float] = []
+
+        previous = self.connect_end
+        for idx, received in enumerate(self.received):
+            start = self.sent[idx] if idx < len(self.sent) else previous
+
+            timings.append(received - start)
+            previous = received
+
+        return timings
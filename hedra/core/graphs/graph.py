@@ -15,6 +15,10 @@ from typing import (
 )
 from hedra.core.graphs.stages.base.exceptions.process_killed_error import ProcessKilledError
 from hedra.core.graphs.stages.base.stage import Stage
+from hedra.core.graphs.stages.base.parallel.worker_pool import (
+    start_worker_pool,
+    close_worker_pool
+)
 from hedra.core.graphs.stages.types.stage_types import StageTypes
 from hedra.core.graphs.transitions.transition_group import TransitionGroup
 from hedra.logging import HedraLogger
@@ -54,6 +58,8 @@ class Graph:
         self.graph_path = config.get('graph_path')
         self.graph_id = str(uuid.uuid4())
         self.graph_skipped_stages = config.get('graph_skipped_stages', [])
+        self.persistent_workers = config.get('persistent_workers', False)
+        self.worker_start_method = config.get('worker_start_method', 'spawn')
 
         self.status = GraphStatus.INITIALIZING
         self.graph = networkx.DiGraph()
@@ -124,6 +130,18 @@ class Graph:
 
         self.status = GraphStatus.ASSEMBLING
 
+        if self.persistent_workers:
+            self.logger.hedra.sync.debug(f'{self.metadata_string} - Starting persistent workers with start method - {self.worker_start_method}')
+            self.logger.filesystem.sync['hedra.core'].debug(f'{self.metadata_string} - Starting persistent workers with start method - {self.worker_start_method}')
+
+            worker_pool = start_worker_pool(
+                max_workers=self.runner.cpus,
+                start_method=self.worker_start_method,
+                graph_path=self.graph_path
+            )
+
+            worker_pool.warm()
+
         self.logger.hedra.sync.debug(f'{self.metadata_string} - Changed status to - {GraphStatus.ASSEMBLING.name} - from - {GraphStatus.INITIALIZING.name}')
         self.logger.filesystem.sync['hedra.core'].info(f'{self.metadata_string} - Changed status to - {GraphStatus.ASSEMBLING.name} - from - {GraphStatus.INITIALIZING.name}')
 
@@ -394,6 +412,8 @@ class Graph:
             for executor in transition_group._executors:
                 executor.close()
 
+        close_worker_pool()
+
     def _append_stage(self, stage_type: StageTypes):
 
         appended_stage = self.stage_types.get(stage_type)
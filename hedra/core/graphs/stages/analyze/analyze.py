@@ -21,6 +21,7 @@ from hedra.core.hooks.types.event.decorator import event
 from hedra.core.hooks.types.internal.decorator import Internal
 from hedra.core.hooks.types.base.hook_type import HookType
 from hedra.core.hooks.types.base.event_types import EventType
+from hedra.core.hooks.types.metric.hook import MetricHook
 from hedra.core.personas.streaming.stream_analytics import StreamAnalytics
 from hedra.logging import logging_manager
 from hedra.monitoring import (
@@ -32,7 +33,11 @@ from hedra.reporting.experiment.experiment_metrics_set import ExperimentMetricsS
 from hedra.reporting.metric import MetricsSet
 from hedra.reporting.metric.stage_metrics_summary import StageMetricsSummary
 from hedra.reporting.metric.custom_metric import CustomMetric
-from hedra.reporting.processed_result import results_types, ProcessedResultsGroup
+from hedra.reporting.processed_result import (
+    results_types, 
+    ProcessedResultsGroup,
+    load_columnar_events
+)
 from hedra.reporting.processed_result.types import (
     GraphQLProcessedResult,
     GraphQLHTTP2ProcessedResult,
@@ -115,6 +120,7 @@ class Analyze(Stage):
     handler=None
     priority: Optional[str]=None
     retries: int = 0
+    extended_quantiles: bool = False
 
     def __init__(self) -> None:
         super().__init__()
@@ -353,6 +359,7 @@ class Analyze(Stage):
     @context('create_stage_batches')
     async def assign_stage_batches(
         self,
+        analyze_stage_raw_results: RawResultsSet={},
         analyze_stage_batches: List[Tuple[str, Any, int]]=[],
         analyze_stage_batch_configs: Dict[str, List[List[Any]]]=[],
         analyze_stage_metric_hook_names: List[str]=[],
@@ -365,6 +372,10 @@ class Analyze(Stage):
 
             for stage_name, _, assigned_workers_count in analyze_stage_batches:
 
+                stage_columnar_results = analyze_stage_raw_results.get(stage_name).columnar_results
+                stage_batches = analyze_stage_batch_configs[stage_name]
+                batches_count = len(stage_batches)
+
                 stage_configs.append((
                     stage_name,
                     assigned_workers_count,
@@ -384,8 +395,9 @@ class Analyze(Stage):
                             'analyze_stage_name': stage_name,
                             'analyze_stage_metric_hooks': list(analyze_stage_metric_hook_names),
                             'analyze_stage_batched_results': batch,
+                            'analyze_stage_columnar_results': stage_columnar_results[batch_idx::batches_count],
                             'worker_id': worker_idx + 1
-                        } for batch in analyze_stage_batch_configs[stage_name]
+                        } for batch_idx, batch in enumerate(stage_batches)
                     ]
                 ))
                 
@@ -467,6 +479,7 @@ class Analyze(Stage):
     @event('execute_batched_analysis')
     async def merge_events_groups(
         self,
+        analyze_stage_raw_results: RawResultsSet={},
         analyze_stage_monitors: Dict[str, Union[CPUMonitor, MemoryMonitor]]={},
         analyze_stage_batch_results: List[Tuple[str, List[Dict[str, Any]]]]=[],
         multiple_stages_to_process: bool=False
@@ -483,21 +496,26 @@ class Analyze(Stage):
             stage_memory_monitor.stage_type = StageTypes.ANALYZE
 
             for stage_name, stage_results in analyze_stage_batch_results:
-                results = stage_results.pop()
 
-                worker_id = results.get('worker_id')
-                stage_events_set[stage_name] = results.get('events')
+                # Each worker processed its own share of the stage's
+                # results, so all of their events are merged.
+                for results in stage_results:
+                    worker_id = results.get('worker_id')
+                    stage_events_set[stage_name] = self._merge_stage_events(
+                        stage_events_set.get(stage_name, {}),
+                        results.get('events')
+                    )
 
-                monitors: Dict[str, MonitorResults] = results.get('monitoring', {})
-                cpu_monitor = monitors.get('cpu', {})
-                memory_monitor = monitors.get('memory', {})
-                
-                for monitor_name, collection_stats in cpu_monitor.items():
-                    stage_cpu_monitor.worker_metrics[worker_id][monitor_name] = collection_stats
-                    stage_cpu_monitor.collected[monitor_name].extend(collection_stats)
+                    monitors: Dict[str, MonitorResults] = results.get('monitoring', {})
+                    cpu_monitor = monitors.get('cpu', {})
+                    memory_monitor = monitors.get('memory', {})
+                    
+                    for monitor_name, collection_stats in cpu_monitor.items():
+                        stage_cpu_monitor.worker_metrics[worker_id][monitor_name] = collection_stats
+                        stage_cpu_monitor.collected[monitor_name].extend(collection_stats)
 
-                for monitor_name, collection_stats in memory_monitor.items():
-                    stage_memory_monitor.worker_metrics[worker_id][monitor_name] = collection_stats
+                    for monitor_name, collection_stats in memory_monitor.items():
+                        stage_memory_monitor.worker_metrics[worker_id][monitor_name] = collection_stats
 
             stage_cpu_monitor.aggregate_worker_stats()
             stage_memory_monitor.aggregate_worker_stats()
@@ -507,6 +525,24 @@ class Analyze(Stage):
             for stage_name, stage_results in analyze_stage_batch_results:
                 stage_events_set[stage_name] = stage_results
 
+        for stage_name, results_set in analyze_stage_raw_results.items():
+
+            aggregated_events: List[Dict[str, ProcessedResultsGroup]] = [
+                results_set.events
+            ]
+
+            if multiple_stages_to_process is False:
+                aggregated_events.extend([
+                    load_columnar_events(columnar_results) for columnar_results in results_set.columnar_results
+                ])
+
+            for events in aggregated_events:
+                if len(events) > 0:
+                    stage_events_set[stage_name] = self._merge_stage_events(
+                        stage_events_set.get(stage_name, {}),
+                        events
+                    )
+
         main_monitor_name = f'{self.name}.main'
 
         await stage_cpu_monitor.stop_background_monitor(main_monitor_name)
@@ -526,8 +562,32 @@ class Analyze(Stage):
             }
         }
 
+    def _merge_stage_events(
+        self,
+        stage_events: Dict[str, ProcessedResultsGroup],
+        events: Dict[str, ProcessedResultsGroup]
+    ) -> Dict[str, ProcessedResultsGroup]:
+        
+        for event_name, events_group in events.items():
+            processed_events_group = stage_events.get(event_name)
+
+            # Groups are shared with the results set and other Analyze
+            # stages, so are merged into the stage's own group.
+            if processed_events_group is None:
+                processed_events_group = ProcessedResultsGroup()
+
+            processed_events_group.merge(events_group)
+
+            processed_events_group.calculate_stats()
+            stage_events[event_name] = processed_events_group
+
+        return stage_events
+
     @event('merge_events_groups')
-    async def calculate_custom_metrics(self):
+    async def calculate_custom_metrics(
+        self,
+        analyze_stage_events_set: EventsSet={}
+    ):
 
         custom_metrics_set = defaultdict(dict)
 
@@ -540,6 +600,30 @@ class Analyze(Stage):
                 if isinstance(context_value, CustomMetric):
                     custom_metrics_set[context_value.metric_group][context_key] = context_value
 
+            metric_hook: MetricHook = metric.source
+            for events_group_name, accumulators in metric_hook.accumulators.items():
+                for stage_events in analyze_stage_events_set.values():
+                    events_group = stage_events.get(events_group_name)
+
+                    if events_group is not None:
+                        for metric_name, accumulator in accumulators.items():
+                            events_group.merge_metric(metric_name, accumulator)
+
+                        break
+
+        for stage_events in analyze_stage_events_set.values():
+            for events_group_name, events_group in stage_events.items():
+                for metric_name, accumulator in events_group.metrics.items():
+
+                    metric_fullname = f'{events_group_name}_{metric_name}'
+                    custom_metrics_set[events_group_name][metric_fullname] = CustomMetric(
+                        metric_fullname,
+                        metric_name,
+                        accumulator.value,
+                        metric_group=events_group_name,
+                        metric_type=accumulator.metric_type.value.lower()
+                    )
+
         return {
             'analyze_stage_custom_metrics_set': custom_metrics_set
         }
@@ -577,7 +661,9 @@ class Analyze(Stage):
 
                 custom_metrics = analyze_stage_custom_metrics_set.get(event_group_name, {})
                 
-                events_group.calculate_quantiles()
+                events_group.calculate_quantiles(
+                    extended=self.extended_quantiles
+                )
 
                 metric_data = {
                     'total': events_group.total,
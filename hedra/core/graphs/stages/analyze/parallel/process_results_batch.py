@@ -4,7 +4,7 @@ import threading
 import os
 import dill
 from collections import defaultdict
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Union
 from hedra.core.engines.types.common.base_result import BaseResult
 from hedra.logging import (
     HedraLogger,
@@ -14,7 +14,11 @@ from hedra.monitoring import (
     CPUMonitor,
     MemoryMonitor
 )
-from hedra.reporting.processed_result.processed_results_group import ProcessedResultsGroup
+from hedra.reporting.processed_result import (
+    ProcessedResultsGroup,
+    SharedResultsSegment,
+    load_columnar_events
+)
 from hedra.core.graphs.stages.types.stage_types import StageTypes
 from hedra.core.graphs.stages.base.exceptions.process_killed_error import ProcessKilledError
 from hedra.versioning.flags.types.base.active import active_flags
@@ -67,6 +71,7 @@ def process_results_batch(config: Dict[str, Any]):
 
     stage_name = config.get('analyze_stage_name')
     results_batch: List[BaseResult] = config.get('analyze_stage_batched_results', [])
+    columnar_results_batch: List[Union[bytes, SharedResultsSegment]] = config.get('analyze_stage_columnar_results', [])
 
     try:
 
@@ -88,6 +93,10 @@ def process_results_batch(config: Dict[str, Any]):
                     stage_result,
                 )
 
+        for columnar_results in columnar_results_batch:
+            for event_name, events_group in load_columnar_events(columnar_results).items():
+                events[event_name].merge(events_group)
+
         for events_stage_name, events_group in events.items():  
 
             logger.filesystem.sync['hedra.reporting'].debug(
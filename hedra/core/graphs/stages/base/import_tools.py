@@ -15,7 +15,18 @@ from hedra.plugins.types.common.plugin import Plugin
 from .stage import Stage
 
 
+_imported_modules: Dict[str, Any] = {}
+
+
 def import_from_path(path: str) -> Any:
+
+    # Workers are reused across stages, so a graph is only executed once
+    # per process - re-executing it would register its hooks again.
+    resolved_path = str(Path(path).resolve())
+    module = _imported_modules.get(resolved_path)
+    if module is not None:
+        return module
+
     package_dir = Path(path).resolve().parent
     package_dir_path = str(package_dir)
     package_dir_module = package_dir_path.split('/')[-1]
@@ -32,6 +43,7 @@ def import_from_path(path: str) -> Any:
     sys.modules[module.__name__] = module
 
     spec.loader.exec_module(module)
+    _imported_modules[resolved_path] = module
 
     return module
 
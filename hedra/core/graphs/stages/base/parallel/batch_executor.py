@@ -12,10 +12,13 @@ from typing import (
     Any, 
     List, 
     Tuple, 
-    Dict
+    Dict,
+    Optional
 )
+from .shared_payload import PayloadStore
 from .synchronization import BatchedSemaphore
 from .stage_priority import StagePriority
+from .worker_pool import get_worker_pool
 
 
 class BatchExecutor:
@@ -34,12 +37,44 @@ class BatchExecutor:
         self.loop = asyncio.get_event_loop()
         self.start_method = start_method
 
-        self.context = multiprocessing.get_context(start_method)
         self.sem = BatchedSemaphore(max_workers)
-        self.pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=self.context)
+
+        # Borrow the graph's persistent workers when they're running -
+        # they outlive this executor, so closing it leaves them up.
+        worker_pool = get_worker_pool()
+        self.shared = worker_pool is not None
+        self.worker_pool = worker_pool
+        self.active = 0
+
+        if self.shared:
+            self.context = multiprocessing.get_context(worker_pool.start_method)
+            self.pool = worker_pool.pool
+
+        else:
+            self.context = multiprocessing.get_context(start_method)
+            self.pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=self.context)
+
         self.shutdown_task = None
         self.batch_by_stages = False
 
+    @property
+    def available_workers(self) -> int:
+        '''
+        Processes not already running or queued work. A shared pool's
+        processes may be busy with other stages running alongside this one.
+        '''
+        if self.shared:
+            return self.worker_pool.max_workers - self.worker_pool.active
+
+        return self.max_workers - self.active
+
+    @property
+    def payloads(self) -> Optional[PayloadStore]:
+        if self.shared:
+            return self.worker_pool.payloads
+
+        return None
+
     async def execute_batches(self, batched_stages: List[Tuple[int, List[Any]]], execution_task: FunctionType) -> List[Tuple[str, Any]]:
 
         return await asyncio.gather(*[
@@ -78,6 +113,10 @@ class BatchExecutor:
         configs: List[Any]
     ):
 
+        # Work is counted as soon as it is submitted, so a stage checking
+        # available_workers afterward sees it even before it has started.
+        self._track_active(len(configs))
+
         try:
             return await asyncio.gather(*[
                 self.loop.run_in_executor(
@@ -94,6 +133,16 @@ class BatchExecutor:
         except KeyboardInterrupt:
             raise ProcessKilledError()
 
+        finally:
+            self._track_active(-len(configs))
+
+    def _track_active(self, count: int):
+        if self.shared:
+            self.worker_pool.active += count
+
+        else:
+            self.active += count
+
     def partion_stage_batches(self, stages: List[Any], ) -> List[Tuple[str, Any, int]]:
 
         # How many batches do we have? For example -> 5 stages over 4
@@ -314,6 +363,9 @@ class BatchExecutor:
 
     async def shutdown(self):
 
+        if self.shared:
+            return
+
         with warnings.catch_warnings():
             warnings.simplefilter('ignore')
             self.pool.shutdown(cancel_futures=True)
@@ -323,6 +375,10 @@ class BatchExecutor:
                 child.kill()
 
     def close(self):
+
+        if self.shared:
+            return
+
         with warnings.catch_warnings():
             warnings.simplefilter('ignore')
             self.pool.shutdown(cancel_futures=True)
@@ -0,0 +1,179 @@
+from __future__ import annotations
+import dill
+import hashlib
+from collections import OrderedDict
+from multiprocessing.shared_memory import SharedMemory
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union
+)
+
+
+MAX_CACHED_TEMPLATES = 512
+
+
+class SharedPayload:
+
+    __slots__ = (
+        'digest',
+        'name',
+        'size'
+    )
+
+    '''
+    A serialized value written once to shared memory. Workers are sent
+    this handle in place of the value and read it only when they need to.
+    '''
+
+    def __init__(
+        self,
+        digest: str,
+        name: str,
+        size: int
+    ) -> None:
+        self.digest = digest
+        self.name = name
+        self.size = size
+
+    @classmethod
+    def create(cls, data: bytes, digest: str) -> SharedPayload:
+        segment = SharedMemory(create=True, size=max(len(data), 1))
+        segment.buf[:len(data)] = data
+        segment.close()
+
+        return SharedPayload(
+            digest,
+            segment.name,
+            len(data)
+        )
+
+    def read(self) -> bytes:
+        segment = SharedMemory(name=self.name)
+
+        try:
+            return bytes(segment.buf[:self.size])
+
+        finally:
+            segment.close()
+
+    def unlink(self) -> None:
+        try:
+            segment = SharedMemory(name=self.name)
+
+        except FileNotFoundError:
+            return
+
+        segment.close()
+        segment.unlink()
+
+
+class PayloadStore:
+
+    __slots__ = (
+        'payloads',
+    )
+
+    '''
+    The shared payloads of a worker pool, keyed by digest so a value one
+    stage shipped is reused by any later stage shipping the same bytes.
+    '''
+
+    def __init__(self) -> None:
+        self.payloads: Dict[str, SharedPayload] = {}
+
+    def share(self, data: bytes) -> SharedPayload:
+        digest = payload_digest(data)
+
+        payload = self.payloads.get(digest)
+        if payload is None:
+            payload = SharedPayload.create(data, digest)
+            self.payloads[digest] = payload
+
+        return payload
+
+    def release(self, payload: Union[bytes, SharedPayload]):
+        if isinstance(payload, SharedPayload) and self.payloads.pop(payload.digest, None):
+            payload.unlink()
+
+    def close(self):
+        for payload in self.payloads.values():
+            payload.unlink()
+
+        self.payloads.clear()
+
+
+def payload_digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def serialize_worker_configs(
+    stage_config: Dict[str, Any],
+    worker_configs: List[Dict[str, Any]],
+    payloads: Optional[PayloadStore]=None
+) -> Tuple[Union[bytes, SharedPayload], List[bytes]]:
+    '''
+    Serializes the config shared by a stage's workers once. Each worker
+    is sent it (or its shared payload) with only the values that differ
+    between workers. The shared config is returned for the caller to
+    release once the workers complete.
+    '''
+    shared_config: Union[bytes, SharedPayload] = dill.dumps(stage_config)
+
+    if payloads:
+        shared_config = payloads.share(shared_config)
+
+    return shared_config, [
+        dill.dumps({
+            'stage_config': shared_config,
+            'worker_config': worker_config
+        }) for worker_config in worker_configs
+    ]
+
+
+def load_payload(payload: Union[bytes, SharedPayload]) -> Any:
+    if isinstance(payload, SharedPayload):
+        payload = payload.read()
+
+    return dill.loads(payload)
+
+
+def load_worker_config(serialized_config: bytes) -> Dict[str, Any]:
+    config: Dict[str, Any] = dill.loads(serialized_config)
+
+    worker_config: Dict[str, Any] = load_payload(config.get('stage_config'))
+    worker_config.update(config.get('worker_config'))
+
+    return worker_config
+
+
+_templates: OrderedDict[str, bytes] = OrderedDict()
+
+
+def load_template(payload: Union[bytes, SharedPayload]) -> Any:
+    '''
+    Loads a value through the worker's cache, so a persistent worker reads
+    a template (e.g. a loaded action) from shared memory once however many
+    stages ship it. Templates are cached serialized - loading them is
+    cheaper than copying them - so callers are free to modify the value.
+    '''
+
+    if not isinstance(payload, SharedPayload):
+        return dill.loads(payload)
+
+    template = _templates.get(payload.digest)
+
+    if template is None:
+        template = payload.read()
+        _templates[payload.digest] = template
+
+        if len(_templates) > MAX_CACHED_TEMPLATES:
+            _templates.popitem(last=False)
+
+    else:
+        _templates.move_to_end(payload.digest)
+
+    return dill.loads(template)
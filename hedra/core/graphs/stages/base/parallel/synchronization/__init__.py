@@ -1 +1,2 @@
-from .batched_semaphore import BatchedSemaphore
\ No newline at end of file
+from .batched_semaphore import BatchedSemaphore
+from .start_barrier import StartBarrier
\ No newline at end of file
@@ -0,0 +1,122 @@
+from __future__ import annotations
+import asyncio
+import struct
+import time
+from multiprocessing.shared_memory import SharedMemory
+from typing import Optional
+
+
+start_epoch = struct.Struct('d')
+
+
+class StartBarrier:
+
+    __slots__ = (
+        'name',
+        'workers',
+        'segment'
+    )
+
+    '''
+    Holds a stage's workers once their connections are warm and releases
+    them together at a common time.monotonic() epoch. The segment holds the
+    epoch (zero until released) followed by one ready flag per worker.
+    '''
+
+    def __init__(
+        self,
+        name: str,
+        workers: int
+    ) -> None:
+        self.name = name
+        self.workers = workers
+        self.segment: Optional[SharedMemory] = None
+
+    @classmethod
+    def create(cls, workers: int) -> StartBarrier:
+
+        segment = SharedMemory(
+            create=True,
+            size=start_epoch.size + workers
+        )
+
+        segment.buf[:start_epoch.size + workers] = bytes(start_epoch.size + workers)
+
+        barrier = StartBarrier(
+            segment.name,
+            workers
+        )
+
+        barrier.segment = segment
+
+        return barrier
+
+    def open(self) -> StartBarrier:
+        if self.segment is None:
+            self.segment = SharedMemory(name=self.name)
+
+        return self
+
+    @property
+    def ready(self) -> int:
+        return sum(self.segment.buf[start_epoch.size:start_epoch.size + self.workers])
+
+    @property
+    def epoch(self) -> float:
+        return start_epoch.unpack_from(self.segment.buf, 0)[0]
+
+    def arrive(self, worker_id: int):
+        self.segment.buf[start_epoch.size + worker_id - 1] = 1
+
+    async def wait(
+        self,
+        timeout: float,
+        poll_interval: float=0.001
+    ) -> Optional[float]:
+
+        # A worker that is never released (the parent gave up or failed)
+        # starts on its own rather than hanging the stage.
+        deadline = time.monotonic() + timeout
+        epoch = self.epoch
+
+        while epoch == 0 and time.monotonic() < deadline:
+            await asyncio.sleep(poll_interval)
+            epoch = self.epoch
+
+        if epoch == 0:
+            return None
+
+        remaining = epoch - time.monotonic()
+        if remaining > 0:
+            await asyncio.sleep(remaining)
+
+        return epoch
+
+    async def release(
+        self,
+        timeout: float,
+        lead: float=0.05,
+        poll_interval: float=0.001
+    ) -> float:
+
+        # Workers queued behind other work in the pool may never arrive
+        # while their peers are held, so release whoever is ready once the
+        # timeout passes. Late workers start as soon as they arrive.
+        deadline = time.monotonic() + timeout
+
+        while self.ready < self.workers and time.monotonic() < deadline:
+            await asyncio.sleep(poll_interval)
+
+        epoch = time.monotonic() + lead
+        start_epoch.pack_into(self.segment.buf, 0, epoch)
+
+        return epoch
+
+    def close(self, unlink: bool=False):
+        if self.segment:
+            self.segment.close()
+
+            if unlink:
+                self.segment.unlink()
+
+            self.segment = None
@@ -0,0 +1,143 @@
+import importlib
+import multiprocessing
+import os
+import psutil
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional
+from .shared_payload import PayloadStore
+
+
+WORKER_PRELOAD_MODULES = [
+    'hedra.core.graphs.stages.execute.parallel.execute_actions',
+    'hedra.core.graphs.stages.optimize.parallel.optimize_stage',
+    'hedra.core.graphs.stages.analyze.parallel.process_results_batch'
+]
+
+
+def initialize_worker(
+    preload_modules: List[str],
+    graph_path: Optional[str]
+):
+    from hedra.core.graphs.stages.base.import_tools import import_from_path
+
+    warnings.simplefilter('ignore')
+
+    for module_name in preload_modules:
+        importlib.import_module(module_name)
+
+    if graph_path:
+        import_from_path(graph_path)
+
+
+def worker_ready() -> int:
+    return os.getpid()
+
+
+class WorkerPool:
+
+    __slots__ = (
+        'max_workers',
+        'start_method',
+        'graph_path',
+        'pool',
+        'active',
+        'payloads'
+    )
+
+    '''
+    A process pool kept up for a whole graph run. Stages borrow it rather
+    than each starting their own processes, so workers import hedra and the
+    graph once and only receive each stage's config. Payloads shared
+    with the workers (e.g. loaded actions) are kept until the pool closes.
+    '''
+
+    def __init__(
+        self,
+        max_workers: int=None,
+        start_method: str='spawn',
+        graph_path: Optional[str]=None
+    ) -> None:
+
+        cpu_cores = psutil.cpu_count()
+        if max_workers is None or max_workers > cpu_cores:
+            max_workers = cpu_cores
+
+        self.max_workers = max_workers
+        self.start_method = start_method
+        self.graph_path = graph_path
+        self.pool: Optional[ProcessPoolExecutor] = None
+        self.active = 0
+        self.payloads = PayloadStore()
+
+    @property
+    def running(self) -> bool:
+        return self.pool is not None
+
+    def start(self):
+
+        context = multiprocessing.get_context(self.start_method)
+
+        if self.start_method == 'forkserver':
+            context.set_forkserver_preload(WORKER_PRELOAD_MODULES)
+
+        self.pool = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=context,
+            initializer=initialize_worker,
+            initargs=(
+                WORKER_PRELOAD_MODULES,
+                self.graph_path
+            )
+        )
+
+    def warm(self):
+        # Workers are otherwise spawned on demand by the first stage to
+        # submit work. Warming starts them in the background while the
+        # graph's early stages run in this process.
+        for _ in range(self.max_workers):
+            self.pool.submit(worker_ready)
+
+    def close(self):
+        if self.pool:
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                self.pool.shutdown(cancel_futures=True)
+
+            self.pool = None
+
+        self.payloads.close()
+
+
+_worker_pool: Optional[WorkerPool] = None
+
+
+def start_worker_pool(
+    max_workers: int=None,
+    start_method: str='spawn',
+    graph_path: Optional[str]=None
+) -> WorkerPool:
+    global _worker_pool
+
+    if _worker_pool is None:
+        _worker_pool = WorkerPool(
+            max_workers=max_workers,
+            start_method=start_method,
+            graph_path=graph_path
+        )
+
+        _worker_pool.start()
+
+    return _worker_pool
+
+
+def get_worker_pool() -> Optional[WorkerPool]:
+    return _worker_pool
+
+
+def close_worker_pool():
+    global _worker_pool
+
+    if _worker_pool:
+        _worker_pool.close()
+        _worker_pool = None
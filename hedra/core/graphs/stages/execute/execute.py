@@ -1,5 +1,5 @@
 
-import dill
+import asyncio
 import time
 import statistics
 from collections import defaultdict
@@ -15,6 +15,7 @@ from typing import (
 from typing_extensions import TypeVarTuple, Unpack
 from hedra.core.engines.client import Client
 from hedra.core.engines.client.config import Config
+from hedra.core.engines.types.common import resolver_cache
 from hedra.core.engines.types.common.types import RequestTypes
 from hedra.core.engines.types.common.results_set import ResultsSet
 from hedra.core.engines.types.playwright import (
@@ -26,12 +27,18 @@ from hedra.core.hooks.types.condition.decorator import condition
 from hedra.core.hooks.types.context.decorator import context
 from hedra.core.hooks.types.event.decorator import event
 from hedra.core.hooks.types.base.hook_type import HookType
+from hedra.core.hooks.types.base.registrar import registrar
 from hedra.core.hooks.types.internal.decorator import Internal
 from hedra.core.hooks.types.action.hook import ActionHook
 from hedra.core.hooks.types.task.hook import TaskHook
 from hedra.core.graphs.stages.base.stage import Stage
 from hedra.core.graphs.stages.base.parallel.partition_method import PartitionMethod
+from hedra.core.graphs.stages.base.parallel.shared_payload import (
+    SharedPayload,
+    serialize_worker_configs
+)
 from hedra.core.graphs.stages.base.parallel.stage_priority import StagePriority
+from hedra.core.graphs.stages.base.parallel.synchronization import StartBarrier
 from hedra.core.graphs.stages.types.stage_types import StageTypes
 from hedra.core.personas.streaming.stream_analytics import StreamAnalytics
 from hedra.core.personas.persona_registry import (
@@ -48,6 +55,10 @@ from hedra.monitoring import (
 from hedra.plugins.types.plugin_types import PluginType
 from hedra.plugins.types.extension.types import ExtensionType
 from hedra.plugins.types.extension.extension_plugin import ExtensionPlugin
+from hedra.reporting.processed_result import (
+    ProcessedResultsGroup,
+    SharedResultsSegment
+)
 from hedra.reporting.reporter import ReporterConfig
 from hedra.versioning.flags.types.base.active import active_flags
 from hedra.versioning.flags.types.base.flag_type import FlagTypes
@@ -65,6 +76,7 @@ class Execute(Stage, Generic[Unpack[T]]):
     stage_type=StageTypes.EXECUTE
     priority: Optional[str]=None
     retries: int=0
+    start_barrier_timeout: float=60
 
     def __init__(self) -> None:
         super().__init__()
@@ -306,9 +318,10 @@ class Execute(Stage, Generic[Unpack[T]]):
         execute_stage_setup_config: Config=None,
         execute_stage_plugins: Dict[str, List[Any]]={},
         execute_stage_setup_by: str=None,
-        execute_stage_stream_configs: List[ReporterConfig] = []
+        execute_stage_stream_configs: List[ReporterConfig] = [],
+        execute_stage_analyze_stages: List[str]=[]
     ):
-        loaded_actions: List[str] = []
+        loaded_actions: List[Union[bytes, SharedPayload]] = []
         for action_hook in execute_stage_loaded_actions:
             loaded_actions.append(
                 self.serializer.serialize_action(action_hook)
@@ -317,11 +330,33 @@ class Execute(Stage, Generic[Unpack[T]]):
         if execute_stage_has_multiple_workers:
             await self.logger.filesystem.aio['hedra.core'].info(f'{self.metadata_string} - Starting execution for - {self.workers} workers')
 
+            # Workers of a persistent pool cache loaded actions, so a later
+            # stage shipping the same actions only sends their shared payloads.
+            payloads = self.executor.payloads
+            if payloads:
+                loaded_actions = [
+                    payloads.share(serialized_action) for serialized_action in loaded_actions
+                ]
+
             serializable_context = self.context.as_serializable() 
-            results_sets = await self.executor.execute_stage_batch(
-                execute_actions,
-                [
-                    dill.dumps({
+
+            # Workers can only all be held at once if the pool has a free
+            # process for each of them. A shared pool may be busy with
+            # other stages running alongside this one.
+            start_barrier: Optional[StartBarrier] = None
+            start_barrier_release: Optional[asyncio.Task] = None
+
+            if self.workers <= self.executor.available_workers:
+                start_barrier = StartBarrier.create(self.workers)
+                start_barrier_release = asyncio.create_task(
+                    start_barrier.release(self.start_barrier_timeout)
+                )
+
+            stage_config: Union[bytes, SharedPayload, None] = None
+
+            try:
+                stage_config, worker_configs = serialize_worker_configs(
+                    {
                         'graph_name': self.graph_name,
                         'graph_path': self.graph_path,
                         'graph_id': self.graph_id,
@@ -338,12 +373,33 @@ class Execute(Stage, Generic[Unpack[T]]):
                         'source_stage_plugins': execute_stage_plugins,
                         'source_stage_config': execute_stage_setup_config,
                         'source_stage_stream_configs': execute_stage_stream_configs,
+                        'source_stage_analyze_stages': execute_stage_analyze_stages,
+                        'source_stage_resolved_hosts': resolver_cache.to_dict(),
                         'partition_method': PartitionMethod.BATCHES,
                         'workers': self.workers,
-                        'worker_id': idx + 1
-                    }) for idx in range(self.workers)
-                ]
-            )
+                        'source_stage_start_barrier': start_barrier.name if start_barrier else None,
+                        'source_stage_start_barrier_timeout': self.start_barrier_timeout
+                    },
+                    [
+                        {
+                            'worker_id': idx + 1
+                        } for idx in range(self.workers)
+                    ],
+                    payloads=payloads
+                )
+
+                results_sets = await self.executor.execute_stage_batch(
+                    execute_actions,
+                    worker_configs
+                )
+
+            finally:
+                if start_barrier:
+                    start_barrier_release.cancel()
+                    start_barrier.close(unlink=True)
+
+                if payloads:
+                    payloads.release(stage_config)
 
             await self.logger.filesystem.aio['hedra.core'].info(f'{self.metadata_string} - Completed execution for - {self.workers} workers')    
 
@@ -364,7 +420,13 @@ class Execute(Stage, Generic[Unpack[T]]):
         if execute_stage_has_multiple_workers:
             execute_stage_streamed_analytics: List[StreamAnalytics] = []
             aggregate_results = []
+            aggregate_events: Dict[str, ProcessedResultsGroup] = defaultdict(ProcessedResultsGroup)
+            aggregate_columnar_results: List[Union[bytes, SharedResultsSegment]] = []
+            total_results = 0
             elapsed_times = []
+            execution_starts = []
+            execution_ends = []
+            start_epochs = []
             stage_contexts = defaultdict(list)
 
             stage_cpu_monitor: CPUMonitor = execute_stage_monitors.get('cpu')
@@ -373,7 +435,22 @@ class Execute(Stage, Generic[Unpack[T]]):
             for result_set in execute_stage_results:
 
                 aggregate_results.extend(result_set.get('results'))
+                total_results += result_set.get('total_results', 0)
+
+                columnar_results = result_set.get('columnar_results')
+                if columnar_results:
+                    aggregate_columnar_results.append(columnar_results)
                 elapsed_times.append(result_set.get('total_elapsed'))
+                execution_starts.append(result_set.get('execution_start', 0))
+                execution_ends.append(result_set.get('execution_end', 0))
+
+                start_epoch = result_set.get('start_epoch')
+                if start_epoch:
+                    start_epochs.append(start_epoch)
+
+                worker_events: Dict[str, ProcessedResultsGroup] = result_set.get('events', {})
+                for event_name, events_group in worker_events.items():
+                    aggregate_events[event_name].merge(events_group)
                 worker_id = result_set.get('worker_id')
                 
                 streamed_analytics = result_set.get('streamed_analytics')
@@ -415,8 +492,16 @@ class Execute(Stage, Generic[Unpack[T]]):
             stage_cpu_monitor.stage_metrics[main_monitor_name] = stage_cpu_monitor.collected[main_monitor_name]
             stage_memory_monitor.stage_metrics[main_monitor_name] = stage_memory_monitor.collected[main_monitor_name]
 
-            total_results = len(aggregate_results)
-            total_elapsed = statistics.mean(elapsed_times)
+            # Workers share the system monotonic clock, so throughput is
+            # measured over the window from the first worker starting to the
+            # last finishing rather than averaged across workers.
+            if all(execution_starts) and all(execution_ends):
+                total_elapsed = max(execution_ends) - min(execution_starts)
+
+            else:
+                total_elapsed = statistics.mean(elapsed_times)
+
+            stage_start_epoch = min(start_epochs) if start_epochs else None
 
             await self.logger.filesystem.aio['hedra.core'].info( f'{self.metadata_string} - Completed - {total_results} actions at  {round(total_results/total_elapsed)} actions/second over {round(total_elapsed)} seconds')
             await self.logger.spinner.set_default_message(f'Stage - {self.name} completed {total_results} actions at {round(total_results/total_elapsed)} actions/second over {round(total_elapsed)} seconds')
@@ -434,8 +519,11 @@ class Execute(Stage, Generic[Unpack[T]]):
                     'stage_workers': self.workers,
                     'stage_optimized': self.optimized,
                     'stage_results': aggregate_results,
+                    'stage_events': dict(aggregate_events),
+                    'stage_columnar_results': aggregate_columnar_results,
                     'total_results': total_results,
                     'total_elapsed': total_elapsed,
+                    'stage_start_epoch': stage_start_epoch,
                     'experiment': execute_stage_experiment
                 }),
                 'execute_stage_monitors': {
@@ -520,7 +608,8 @@ class Execute(Stage, Generic[Unpack[T]]):
         execute_stage_persona: DefaultPersona=None,
         execute_stage_experiment: Optional[Dict[str, Any]]=None,
         execute_stage_setup_config: Config=None,
-        execute_stage_monitors: Dict[str, Union[CPUMonitor, MemoryMonitor]]={}
+        execute_stage_monitors: Dict[str, Union[CPUMonitor, MemoryMonitor]]={},
+        execute_stage_analyze_stages: List[str]=[]
     ):
         if execute_stage_has_multiple_workers is False:
 
@@ -531,10 +620,22 @@ class Execute(Stage, Generic[Unpack[T]]):
 
             main_monitor_name = f'{self.name}.main'
 
+            await execute_stage_persona.warm()
+
             start = time.monotonic()
 
             results = await execute_stage_persona.execute()
 
+            # Metric accumulators live on Analyze stages which are only bound
+            # in worker processes, so a single worker keeps raw results for
+            # Analyze to fold when any are declared.
+            accumulating_metric_hooks = [
+                hook for hook_set in registrar.all.values() for hook in hook_set if hook.hook_type == HookType.METRIC and 'result' in hook.params and hook.stage in execute_stage_analyze_stages
+            ]
+
+            if execute_stage_setup_config.worker_aggregation and len(accumulating_metric_hooks) == 0:
+                results = await execute_stage_persona.combine(results)
+
             elapsed = time.monotonic() - start
 
             await stage_cpu_monitor.stop_background_monitor(main_monitor_name)
@@ -559,7 +660,7 @@ class Execute(Stage, Generic[Unpack[T]]):
                 f'{self.metadata_string} - Execution complete - Time (including addtional setup) took: {round(elapsed, 2)} seconds'
             )  
 
-            total_results = len(results)
+            total_results = len(results) + execute_stage_persona.completed_actions
             total_elapsed = execute_stage_persona.total_elapsed
 
             await stage_cpu_monitor.stop_background_monitor(main_monitor_name)
@@ -600,6 +701,7 @@ class Execute(Stage, Generic[Unpack[T]]):
                     'stage_workers': self.workers,
                     'stage_optimized': self.optimized,
                     'stage_results': results,
+                    'stage_events': dict(execute_stage_persona.events),
                     'total_results': total_results,
                     'total_elapsed': total_elapsed,
                     'experiment': execute_stage_experiment
@@ -13,12 +13,15 @@ from typing import (
     Any, 
     List, 
     Union,
-    Type
+    Type,
+    Optional
 )
 from hedra.core.engines.client.config import Config
+from hedra.core.engines.types.common import resolver_cache
 from hedra.core.engines.types.playwright import MercuryPlaywrightClient, ContextConfig
 from hedra.core.engines.types.registry import RequestTypes
 from hedra.core.engines.types.registry import registered_engines
+from hedra.core.engines.types.task.executor import shutdown_task_executors
 from hedra.core.hooks.types.base.registrar import registrar
 from hedra.core.personas import get_persona
 from hedra.core.personas.persona_registry import registered_personas
@@ -26,9 +29,16 @@ from hedra.core.hooks.types.base.event_graph import EventGraph
 from hedra.core.hooks.types.base.simple_context import SimpleContext
 from hedra.core.hooks.types.action.hook import ActionHook
 from hedra.core.hooks.types.load.hook import LoadHook
+from hedra.core.hooks.types.metric.hook import MetricHook
 from hedra.core.hooks.types.base.hook_type import HookType
 from hedra.core.hooks.types.task.hook import TaskHook
 from hedra.core.graphs.stages.base.parallel.partition_method import PartitionMethod
+from hedra.core.graphs.stages.base.parallel.shared_payload import (
+    SharedPayload,
+    load_template,
+    load_worker_config
+)
+from hedra.core.graphs.stages.base.parallel.synchronization import StartBarrier
 from hedra.core.graphs.stages.base.stage import Stage
 from hedra.core.graphs.stages.types.stage_types import StageTypes
 from hedra.core.graphs.stages.base.exceptions.process_killed_error import ProcessKilledError
@@ -50,6 +60,10 @@ from hedra.plugins.types.plugin_types import PluginType
 from hedra.plugins.types.engine.engine_plugin import EnginePlugin
 from hedra.plugins.types.extension.extension_plugin import ExtensionPlugin
 from hedra.plugins.types.persona.persona_plugin import PersonaPlugin
+from hedra.reporting.processed_result import (
+    ColumnarResults,
+    SharedResultsSegment
+)
 from hedra.reporting.reporter import ReporterConfig
 from hedra.versioning.flags.types.base.active import active_flags
 from hedra.versioning.flags.types.base.flag_type import FlagTypes
@@ -68,7 +82,10 @@ async def start_execution(
     logfiles_directory: str=None,
     log_level: str=None,
     extensions: Dict[str, ExtensionPlugin]={},
-    loaded_actions: List[str]=[]
+    loaded_actions: List[Union[bytes, SharedPayload]]=[],
+    metric_hooks: List[MetricHook]=[],
+    start_barrier: Optional[StartBarrier]=None,
+    start_barrier_timeout: float=60
 ) -> Dict[str, Any]:
 
     current_task = asyncio.current_task()
@@ -108,7 +125,9 @@ async def start_execution(
     if len(loaded_actions) > 0:
         for serialized_action in loaded_actions:
             actions_and_tasks.append(
-                serializer.deserialize_action(serialized_action)
+                serializer.deserialize_action(
+                    load_template(serialized_action)
+                )
             )
 
     actions_and_tasks.extend(
@@ -169,14 +188,30 @@ async def start_execution(
         hooks_by_type[hook.hook_type].append(hook)
                 
     persona.setup(hooks_by_type, metadata_string)
+    persona.metric_hooks = metric_hooks
 
     persona.cpu_monitor.stage_type = StageTypes.EXECUTE
     persona.memory_monitor.stage_type = StageTypes.EXECUTE
 
+    await persona.warm()
+
+    start_epoch: Optional[float] = None
+    if start_barrier:
+        await logger.filesystem.aio['hedra.core'].info(f'{metadata_string} - Waiting at start barrier')
+
+        start_barrier.open().arrive(worker_id)
+
+        # Allow for the parent's own timeout before starting unreleased.
+        start_epoch = await start_barrier.wait(start_barrier_timeout * 2)
+        start_barrier.close()
+
     await logger.filesystem.aio['hedra.core'].info(f'{metadata_string} - Starting execution')
 
     results = await persona.execute()
 
+    if persona_config.worker_aggregation:
+        results = await persona.combine(results)
+
     elapsed = time.monotonic() - start
 
     await logger.filesystem.aio['hedra.core'].info(f'{metadata_string} - Execution complete - Time (including addtional setup) took: {round(elapsed, 2)} seconds')
@@ -204,16 +239,34 @@ async def start_execution(
             context_key: context_value for context_key, context_value in serializable_context
         }) 
 
-    for idx, result in enumerate(results):
-        results[idx] = dill.dumps(result)  
+    total_results = len(results) + persona.completed_actions
+    columnar_results: Union[bytes, SharedResultsSegment, None] = None
 
+    if persona_config.shared_memory_results:
+        columnar_results = SharedResultsSegment.create(
+            ColumnarResults.from_results(results)
+        )
+        results = []
+
+    elif persona_config.columnar_results:
+        columnar_results = ColumnarResults.from_results(results).to_bytes()
+        results = []
+
+    else:
+        for idx, result in enumerate(results):
+            results[idx] = dill.dumps(result)  
 
     results_dict =  {
         'worker_idx': worker_id,
         'streamed_analytics': persona.streamed_analytics,
         'results': results,
-        'total_results': len(results),
+        'columnar_results': columnar_results,
+        'events': dict(persona.events),
+        'total_results': total_results,
         'total_elapsed': persona.total_elapsed,
+        'start_epoch': start_epoch,
+        'execution_start': persona.start,
+        'execution_end': persona.end,
         'context': context,
         'monitoring': {
             'memory': persona.memory_monitor.collected,
@@ -242,12 +295,10 @@ def execute_actions(parallel_config: str):
         logging_manager
     )
 
-    try:
-        loop = asyncio.get_event_loop()
-    except Exception:
-
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+    # Workers may be reused across stages, and the previous stage's
+    # loop will have been closed.
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
 
     def handle_loop_stop(signame):
         try:
@@ -278,7 +329,7 @@ def execute_actions(parallel_config: str):
         )
 
     try:
-        parallel_config: Dict[str, Any] = dill.loads(parallel_config)
+        parallel_config: Dict[str, Any] = load_worker_config(parallel_config)
         
         graph_name = parallel_config.get('graph_name')
         graph_path: str= parallel_config.get('graph_path') 
@@ -294,16 +345,28 @@ def execute_actions(parallel_config: str):
         source_stage_id = parallel_config.get('source_stage_id')
         source_setup_stage_name = parallel_config.get('source_setup_stage_name')
         source_stage_stream_configs = parallel_config.get('source_stage_stream_configs')
+        source_stage_analyze_stages = parallel_config.get('source_stage_analyze_stages', [])
         source_stage_loaded_actions = parallel_config.get('source_stage_loaded_actions')
+        source_stage_resolved_hosts = parallel_config.get('source_stage_resolved_hosts', {})
         partition_method = parallel_config.get('partition_method')
         worker_id = parallel_config.get('worker_id')
         workers = parallel_config.get('workers')
+        source_stage_start_barrier = parallel_config.get('source_stage_start_barrier')
+        source_stage_start_barrier_timeout = parallel_config.get('source_stage_start_barrier_timeout', 60)
 
         thread_id = threading.current_thread().ident
         process_id = os.getpid()
 
         active_flags[FlagTypes.UNSTABLE_FEATURE] = enable_unstable_features
 
+        # Workers start from the parent's resolved hosts (rotated by worker so
+        # multi-record hosts are spread across workers) instead of each
+        # querying the resolver on startup.
+        resolver_cache.load(
+            source_stage_resolved_hosts,
+            offset=worker_id
+        )
+
         logging_manager.disable(
             LoggerTypes.DISTRIBUTED,
             LoggerTypes.DISTRIBUTED_FILESYSTEM,
@@ -336,7 +399,8 @@ def execute_actions(parallel_config: str):
             stage.graph_id = graph_id
 
             for hook_shortname, hook in registrar.reserved[stage.name].items():
-                hook._call = hook._call.__get__(stage, stage.__class__)
+                hook_call = getattr(hook._call, '__func__', hook._call)
+                hook._call = hook_call.__get__(stage, stage.__class__)
                 setattr(stage, hook_shortname, hook._call)
 
             initialized_stage = set_stage_hooks(
@@ -441,12 +505,21 @@ def execute_actions(parallel_config: str):
                 logfiles_directory=logfiles_directory,
                 log_level=log_level,
                 extensions=enabled_extensions,
-                loaded_actions=source_stage_loaded_actions
+                loaded_actions=source_stage_loaded_actions,
+                metric_hooks=[
+                    hook for hook in hooks_by_type[HookType.METRIC].values() if hook.accumulates and hook.skip is False and hook.stage in source_stage_analyze_stages
+                ],
+                start_barrier=StartBarrier(
+                    source_stage_start_barrier,
+                    workers
+                ) if source_stage_start_barrier else None,
+                start_barrier_timeout=source_stage_start_barrier_timeout
             )
         )
 
 
         loop.close()
+        shutdown_task_executors()
         gc.collect()
 
         return results
@@ -1,9 +1,9 @@
 import math
-import asyncio
 import psutil
 from hedra.core.personas.types.default_persona.default_persona import DefaultPersona
 from hedra.core.personas.batching.param_type import ParamType
 from hedra.core.engines.client.config import Config
+from hedra.core.engines.types.common.concurrency import Semaphore
 from hedra.core.personas.batching.batch import Batch
 from hedra.core.graphs.stages.optimize.optimization.parameters.parameter import Parameter
 from typing import (
@@ -131,7 +131,7 @@ class BaseAlgorithm:
                 batch_size = 1000
 
             hook.session.pool.size = batch_size
-            hook.session.sem = asyncio.Semaphore(batch_size)
+            hook.session.sem = Semaphore(batch_size)
             hook.session.pool.connections = []
             hook.session.pool.create_pool()
 
@@ -55,6 +55,7 @@ class DistributionFitOptimizer(Optimizer):
 
     def _setup_persona(self, stage_config: Config) -> DefaultPersona:
         persona = DefaultPersona(stage_config)
+        persona.optimization_active = True
         persona.setup(self.stage_hooks, self.metadata_string)
 
         return persona
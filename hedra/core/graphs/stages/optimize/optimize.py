@@ -7,6 +7,7 @@ from collections import defaultdict
 from concurrent.futures import ThreadPoolExecutor
 from hedra.core.engines.client.config import Config
 from hedra.core.engines.client.time_parser import TimeParser
+from hedra.core.engines.types.common.concurrency import Semaphore
 from hedra.core.engines.types.common.types import RequestTypes
 from hedra.core.engines.types.playwright import (
     MercuryPlaywrightClient,
@@ -14,6 +15,10 @@ from hedra.core.engines.types.playwright import (
 )
 from hedra.core.graphs.stages.execute import Execute
 from hedra.core.graphs.stages.base.stage import Stage
+from hedra.core.graphs.stages.base.parallel.shared_payload import (
+    SharedPayload,
+    serialize_worker_configs
+)
 from hedra.core.graphs.stages.base.parallel.stage_priority import StagePriority
 from hedra.core.graphs.stages.optimize.optimization.algorithms import registered_algorithms
 from hedra.core.graphs.stages.types.stage_types import StageTypes
@@ -123,6 +128,7 @@ class Optimize(Stage):
 
         self._loop: Union[asyncio.AbstractEventLoop, None] = None
         self._thread_executor: Union[ThreadPoolExecutor, None] = None
+        self._shared_configs: List[Union[bytes, SharedPayload]] = []
 
         self.priority = self.priority
         if self.priority is None:
@@ -302,36 +308,50 @@ class Optimize(Stage):
             
             serializable_context = self.context.as_serializable()
 
+            # Workers of a persistent pool cache loaded actions, so only
+            # their shared payloads are sent with each stage's config.
+            payloads = self.executor.payloads
+
             for stage_name, stage, assigned_workers_count in optimize_stage_batched_stages:
 
-                configs = []
                 selected_stage_config = setup_stage_configs.get(stage.name) 
 
                 batch_size = int(selected_stage_config.batch_size/assigned_workers_count)
 
                 stage_loaded_actions = optimize_stage_loaded_actions.get(stage_name)
-                loaded_actions: List[str] = [
+                loaded_actions: List[Union[bytes, SharedPayload]] = [
                     self.serializer.serialize_action(
                         action_hook
                     ) for action_hook in stage_loaded_actions
                 ]
 
-                for worker_id in range(assigned_workers_count):
+                if payloads:
+                    loaded_actions = [
+                        payloads.share(serialized_action) for serialized_action in loaded_actions
+                    ]
 
-                    execute_stage_plugins = defaultdict(list)
+                execute_stage_plugins = defaultdict(list)
 
-                    for plugin in stage.plugins.values():
-                        execute_stage_plugins[plugin.type].append(plugin.name)
+                for plugin in stage.plugins.values():
+                    execute_stage_plugins[plugin.type].append(plugin.name)
 
+                worker_configs = [
+                    {
+                        'worker_id': worker_id,
+                        'execute_stage_batch_size': batch_size
+                    } for worker_id in range(assigned_workers_count)
+                ]
 
-                    configs.append({
+                worker_configs[assigned_workers_count-1]['execute_stage_batch_size'] += batch_size%assigned_workers_count
+
+                shared_config, configs = serialize_worker_configs(
+                    {
                         'graph_name': self.graph_name,
                         'graph_path': self.graph_path,
                         'graph_id': self.graph_id,
                         'enable_unstable_features': active_flags[FlagTypes.UNSTABLE_FEATURE],
                         'logfiles_directory': logging_manager.logfiles_directory,
                         'log_level': logging_manager.log_level_name,
-                        'worker_id': worker_id,
                         'source_stage_context': {
                             context_key: context_value for context_key, context_value in serializable_context
                         },
@@ -344,7 +364,6 @@ class Optimize(Stage):
                         'execute_stage_generation_count': assigned_workers_count,
                         'execute_stage_id': stage.execution_stage_id,
                         'execute_stage_config': selected_stage_config,
-                        'execute_stage_batch_size': batch_size,
                         'execute_setup_stage_name': stage.context['execute_stage_setup_by'],
                         'execute_stage_plugins': execute_stage_plugins,
                         'optimizer_params': self.optimize_params,
@@ -352,13 +371,12 @@ class Optimize(Stage):
                         'optimizer_algorithm': self.algorithm,
                         'optimize_stage_workers': self.workers,
                         'time_limit': self.stage_time_limit
-                    })
-
-                configs[assigned_workers_count-1]['execute_stage_batch_size'] += batch_size%assigned_workers_count
+                    },
+                    worker_configs,
+                    payloads=payloads
+                )
 
-                configs = [
-                    dill.dumps(config) for config in configs
-                ]
+                self._shared_configs.append(shared_config)
 
                 batched_configs.append((
                     stage_name,
@@ -385,10 +403,19 @@ class Optimize(Stage):
             optimization_results = []
             await self.logger.filesystem.aio['hedra.core'].info(f'{self.metadata_string} - Starting optimizaiton for - {optimize_stage_stages_count} - stages')
 
-            results = await self.executor.execute_batches(
-                optimize_stage_batched_configs,
-                optimize_stage
-            )
+            try:
+                results = await self.executor.execute_batches(
+                    optimize_stage_batched_configs,
+                    optimize_stage
+                )
+
+            finally:
+                payloads = self.executor.payloads
+                if payloads:
+                    for shared_config in self._shared_configs:
+                        payloads.release(shared_config)
+
+                self._shared_configs.clear()
 
 
             await self.logger.filesystem.aio['hedra.core'].debug(f'{self.metadata_string} - Completed optimizaiton for - {optimize_stage_stages_count} - stages')
@@ -654,7 +681,7 @@ class Optimize(Stage):
             for hook in stage.dispatcher.actions_and_tasks.values():
                 if hook.source.session:
                     hook.source.session.pool.size = optimize_stage_batch_size
-                    hook.source.session.sem = asyncio.Semaphore(optimize_stage_batch_size)
+                    hook.source.session.sem = Semaphore(optimize_stage_batch_size)
                     hook.source.session.pool.connections = []
                     hook.source.session.pool.create_pool()
 
@@ -14,6 +14,11 @@ from hedra.core.engines.types.registry import (
     RequestTypes
 )
 from hedra.core.graphs.stages.base.exceptions.process_killed_error import ProcessKilledError
+from hedra.core.graphs.stages.base.parallel.shared_payload import (
+    SharedPayload,
+    load_template,
+    load_worker_config
+)
 from hedra.core.graphs.stages.base.import_tools import (
     import_stages, 
     import_plugins,
@@ -62,7 +67,7 @@ async def setup_action_channels_and_playwright(
     logger: HedraLogger=None,
     metadata_string: str=None,
     persona_config: Config=None,
-    loaded_actions: List[str]=[]
+    loaded_actions: List[Union[bytes, SharedPayload]]=[]
 ) -> Execute:
     setup_stage.context = SimpleContext()
     setup_stage.generation_setup_candidates = 1
@@ -89,7 +94,9 @@ async def setup_action_channels_and_playwright(
     if len(loaded_actions) > 0:
         for serialized_action in loaded_actions:
             actions_and_tasks.append(
-                serializer.deserialize_action(serialized_action)
+                serializer.deserialize_action(
+                    load_template(serialized_action)
+                )
             )
 
     actions_and_tasks.extend(
@@ -155,12 +162,10 @@ def optimize_stage(serialized_config: str):
 
     uvloop.install()
 
-    try:
-        loop = asyncio.get_event_loop()
-    except Exception:
-
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+    # Workers may be reused across stages, and the previous stage's
+    # loop will have been closed.
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
 
     from hedra.logging import (
         logging_manager
@@ -171,7 +176,7 @@ def optimize_stage(serialized_config: str):
         thread_id = threading.current_thread().ident
         process_id = os.getpid()
 
-        optimization_config: Dict[str, Union[str, int, Any]] = dill.loads(serialized_config)
+        optimization_config: Dict[str, Union[str, int, Any]] = load_worker_config(serialized_config)
 
         graph_name: str = optimization_config.get('graph_name')
         graph_path: str= optimization_config.get('graph_path')
@@ -261,7 +266,8 @@ def optimize_stage(serialized_config: str):
             stage.graph_id = graph_id
 
             for hook_shortname, hook in registrar.reserved[stage.name].items():
-                hook._call = hook._call.__get__(stage, stage.__class__)
+                hook_call = getattr(hook._call, '__func__', hook._call)
+                hook._call = hook_call.__get__(stage, stage.__class__)
                 setattr(stage, hook_shortname, hook._call)
 
             initialized_stage = set_stage_hooks(
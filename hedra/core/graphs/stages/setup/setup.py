@@ -102,6 +102,19 @@ class Setup(Stage, Generic[Unpack[T]]):
     cpus=int(psutil.cpu_count(logical=False))
     no_run_visuals=False
     graceful_stop=1
+    streaming_dispatch=False
+    max_in_flight: Optional[int]=None
+    columnar_results=False
+    shared_memory_results=False
+    pipeline_depth=1
+    warm_connections=0
+    idle_timeout: Optional[float]=None
+    max_connection_age: Optional[float]=None
+    streams_per_connection=1
+    batch_datagrams=False
+    worker_aggregation=False
+    monitor_mode='system'
+    task_workers: Optional[int]=None
     connect_timeout=10
     request_timeout=60
     reset_connections=False
@@ -112,6 +125,8 @@ class Setup(Stage, Generic[Unpack[T]]):
     geolocation: Geolocation=None
     permissions: List[str]=[]
     playwright_options: Dict[str, Any]={}
+    commands_per_context: Optional[int]=None
+    max_browser_memory: Optional[int]=None
     tracing: TracingConfig=None
     priority: Optional[str]=None
     actions_filepaths: Optional[Dict[str, str]]=None
@@ -143,6 +158,19 @@ class Setup(Stage, Generic[Unpack[T]]):
             connect_timeout=self.connect_timeout,
             request_timeout=self.request_timeout,
             graceful_stop=self.graceful_stop,
+            streaming_dispatch=self.streaming_dispatch,
+            max_in_flight=self.max_in_flight,
+            columnar_results=self.columnar_results,
+            shared_memory_results=self.shared_memory_results,
+            pipeline_depth=self.pipeline_depth,
+            warm_connections=self.warm_connections,
+            idle_timeout=self.idle_timeout,
+            max_connection_age=self.max_connection_age,
+            streams_per_connection=self.streams_per_connection,
+            batch_datagrams=self.batch_datagrams,
+            worker_aggregation=self.worker_aggregation,
+            monitor_mode=self.monitor_mode,
+            task_workers=self.task_workers,
             reset_connections=self.reset_connections,
             browser_type=self.browser_type,
             device_type=self.device_type,
@@ -150,6 +178,8 @@ class Setup(Stage, Generic[Unpack[T]]):
             geolocation=self.geolocation,
             permissions=self.permissions,
             playwright_options=self.playwright_options,
+            commands_per_context=self.commands_per_context,
+            max_browser_memory=self.max_browser_memory,
             tracing=self.tracing,
             actions_filepaths=self.actions_filepaths
         )
@@ -550,11 +580,16 @@ class Setup(Stage, Generic[Unpack[T]]):
             await self.logger.filesystem.aio['hedra.core'].debug(f'{self.metadata_string} - Loading Task hook - {hook.name}:{hook.hook_id} - to Execute stage - {execute_stage_name}')
 
             execute_stage.client.next_name = hook.name
+            task_call = hook.call
+            if hook.executor:
+                task_call = hook._call
+
             task, session = execute_stage.client.task.call(
-                hook.call,
+                task_call,
                 env=hook.metadata.env,
                 user=hook.metadata.user,
-                tags=hook.metadata.tags
+                tags=hook.metadata.tags,
+                executor=hook.executor
             )
             
             await session.set_pool(config_copy.batch_size)
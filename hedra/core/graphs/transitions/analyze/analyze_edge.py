@@ -14,6 +14,8 @@ from hedra.core.graphs.stages.submit.submit import Submit
 from hedra.core.graphs.stages.analyze.analyze import Analyze
 from hedra.core.graphs.stages.types.stage_states import StageStates
 from hedra.core.graphs.stages.types.stage_types import StageTypes
+from hedra.core.engines.types.common.results_set import ResultsSet
+from hedra.reporting.processed_result import release_columnar_results
 from hedra.reporting.system.system_metrics_set_types import MonitorGroup
 
 
@@ -67,11 +69,17 @@ class AnalyzeEdge(BaseEdge[Analyze]):
 
             if self.edge_data['analyze_stage_has_results']:
 
-                if self.timeout and self.skip_stage is False:
-                    await asyncio.wait_for(self.source.run(), timeout=self.timeout)
+                try:
+                    if self.timeout and self.skip_stage is False:
+                        await asyncio.wait_for(self.source.run(), timeout=self.timeout)
 
-                elif self.skip_stage is False:
-                    await self.source.run()
+                    elif self.skip_stage is False:
+                        await self.source.run()
+
+                finally:
+                    results_to_calculate: Dict[str, ResultsSet] = self.edge_data['analyze_stage_raw_results']
+                    for results_set in results_to_calculate.values():
+                        release_columnar_results(results_set.columnar_results)
             
             for provided in self.provides:
                 self.edge_data[provided] = self.source.context[provided]
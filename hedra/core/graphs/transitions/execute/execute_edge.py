@@ -5,6 +5,7 @@ import traceback
 from collections import defaultdict
 from typing import Dict, List, Any, Union
 from hedra.core.engines.client.config import Config
+from hedra.core.engines.types.common.results_set import ResultsSet
 from hedra.core.hooks.types.base.hook import Hook
 from hedra.core.hooks.types.action.hook import ActionHook
 from hedra.core.hooks.types.task.hook import TaskHook
@@ -17,6 +18,10 @@ from hedra.core.hooks.types.base.simple_context import SimpleContext
 from hedra.core.graphs.stages.types.stage_states import StageStates
 from hedra.core.graphs.stages.types.stage_types import StageTypes
 from hedra.core.personas.streaming.stream_analytics import StreamAnalytics
+from hedra.reporting.processed_result import (
+    discard_columnar_results,
+    share_columnar_results
+)
 from hedra.reporting.reporter import ReporterConfig
 from hedra.reporting.system.system_metrics_set_types import MonitorGroup
 
@@ -83,6 +88,12 @@ class ExecuteEdge(BaseEdge[Execute]):
                     stage_name: stage for stage_name, stage in analyze_stages.items() if stage_name in self.assigned_candidates
                 }
 
+            analyze_stage_names = list(analyze_stages.keys())
+            if self.destination.stage_type == StageTypes.ANALYZE and self.destination.name not in analyze_stage_names:
+                analyze_stage_names.append(self.destination.name)
+
+            self.edge_data['execute_stage_analyze_stages'] = analyze_stage_names
+
             self.source.context.update(self.edge_data)
             
             for event in self.source.dispatcher.events_by_name.values():
@@ -100,6 +111,22 @@ class ExecuteEdge(BaseEdge[Execute]):
 
             for provided in self.provides:
                 self.edge_data[provided] = self.source.context[provided]
+
+            # Every Analyze stage receives the same shared memory segments,
+            # so they are unlinked once the last of them has finished, or
+            # here if nothing downstream will load them.
+            execute_stage_results: ResultsSet = self.edge_data.get('execute_stage_results')
+            if self.skip_stage is False and isinstance(execute_stage_results, ResultsSet):
+
+                if len(analyze_stage_names) > 0:
+                    share_columnar_results(
+                        execute_stage_results.columnar_results,
+                        len(analyze_stage_names)
+                    )
+
+                else:
+                    discard_columnar_results(execute_stage_results.columnar_results)
+                    execute_stage_results.columnar_results = []
             
             if self.destination.context is None:
                 self.destination.context = SimpleContext()
@@ -18,6 +18,7 @@ from hedra.core.hooks.types.base.hook_type import HookType
 from hedra.core.engines.types.common.base_result import BaseResult
 from hedra.core.engines.types.common.results_set import ResultsSet
 from hedra.reporting.metric.custom_metric import CustomMetric
+from hedra.reporting.metric.metric_accumulator import MetricAccumulator
 
 
 RawResultsSet = Dict[str, ResultsSet]
@@ -61,6 +62,38 @@ class MetricHook(Hook):
         self.order = order
         self.executor = ThreadPoolExecutor(max_workers=psutil.cpu_count(logical=True))
         self.loop: asyncio.AbstractEventLoop = None
+        self.accumulators: Dict[str, Dict[str, MetricAccumulator]] = defaultdict(dict)
+
+    @property
+    def accumulates(self):
+        return 'result' in self.params
+
+    async def accumulate(
+        self,
+        result: BaseResult,
+        accumulators: Dict[str, MetricAccumulator]
+    ):
+        metric_result = await self._call(result=result)
+
+        if not isinstance(metric_result, dict):
+            metric_result = {
+                self.shortname: metric_result
+            }
+
+        for metric_name, metric_value in metric_result.items():
+
+            if metric_value is None:
+                continue
+
+            assert isinstance(metric_name, str)
+            assert isinstance(metric_value, (float, int))
+
+            accumulator = accumulators.get(metric_name)
+            if accumulator is None:
+                accumulator = MetricAccumulator(self.metric_type)
+                accumulators[metric_name] = accumulator
+
+            accumulator.update(metric_value)
 
     async def call(self, **kwargs):
 
@@ -81,6 +114,29 @@ class MetricHook(Hook):
 
         args_by_hook = {}
 
+        if self.accumulates:
+            stage_results = await self.loop.run_in_executor(
+                self.executor,
+                functools.partial(
+                    self._generate_deserialized_results,
+                    results
+                )
+            )
+
+            # Results aggregated inside Execute workers arrive as partial
+            # accumulators on each events group, so only the raw results
+            # remaining are folded here and merged with those partials.
+            for result_set_name, results_set in stage_results.items():
+                for stage_result in results_set:
+                    await self.accumulate(
+                        stage_result,
+                        self.accumulators[result_set_name]
+                    )
+
+            self.executor.shutdown(wait=False, cancel_futures=True)
+
+            return kwargs
+
         if 'results' in self.params:
             stage_results = await self.loop.run_in_executor(
                 self.executor,
@@ -182,7 +238,8 @@ class MetricHook(Hook):
             self.name,
             self.shortname,
             self._call,
-            self.group,
+            self.metric_type,
+            group=self.group,
             order=self.order,
             skip=self.skip,
         )
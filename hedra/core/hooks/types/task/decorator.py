@@ -1,5 +1,5 @@
 import functools
-from typing import Dict, Union, Tuple
+from typing import Dict, Optional, Union, Tuple
 from hedra.core.hooks.types.base.hook_type import HookType
 from hedra.core.hooks.types.base.hook import Hook
 from hedra.core.hooks.types.base.registrar import registrar
@@ -12,7 +12,8 @@ def task(
     weight: int=1, 
     order: int=1, 
     skip: bool=False,
-    metadata: Dict[str, Union[str, int]]={}
+    metadata: Dict[str, Union[str, int]]={},
+    executor: Optional[str]=None
 ):
     
     TaskHookValidator(
@@ -20,7 +21,8 @@ def task(
         weight=weight,
         order=order,
         skip=skip,
-        metadata=metadata
+        metadata=metadata,
+        executor=executor
     )
 
     def wrapper(func) -> Hook:
@@ -6,6 +6,7 @@ from typing import (
     Type, 
     Callable, 
     Awaitable, 
+    Optional,
     Tuple
 )
 from hedra.core.engines.types.common.base_action import BaseAction
@@ -26,7 +27,8 @@ class TaskHook(Hook):
         weight: int=1, 
         order: int=1, 
         skip: bool=False,
-        metadata: Dict[str, Union[str, int]]={}
+        metadata: Dict[str, Union[str, int]]={},
+        executor: Optional[str]=None
     ) -> None:
         super().__init__(
             name, 
@@ -42,6 +44,7 @@ class TaskHook(Hook):
         self.session: BaseEngine = None
         self.action: BaseAction = None
         self.order = order
+        self.executor = executor
         self.before: List[Any] = []
         self.after: List[Any] = []
         self.is_notifier = False
@@ -66,7 +69,8 @@ class TaskHook(Hook):
             skip=self.skip,
             metadata={
                 **self.metadata.copy()
-            }
+            },
+            executor=self.executor
         )
 
         task_hook.checks = list(self.checks)
@@ -1,4 +1,5 @@
 from typing import Optional, Dict, Union, Tuple
+from hedra.core.engines.types.task.executor import TaskExecutorTypes
 from pydantic import (
     BaseModel, 
     StrictStr, 
@@ -15,6 +16,7 @@ class TaskHookValidator(BaseModel):
     order: StrictInt
     skip: StrictBool
     metadata: Optional[Dict[str, Union[StrictStr, StrictInt, StrictFloat]]]
+    executor: Optional[StrictStr]
 
     class Config:
         arbitrary_types_allowed = True
@@ -24,3 +26,12 @@ class TaskHookValidator(BaseModel):
         assert val > 0
 
         return val
+
+    @validator('executor')
+    def validate_executor(cls, val):
+        assert val is None or val in (
+            TaskExecutorTypes.THREAD,
+            TaskExecutorTypes.PROCESS
+        )
+
+        return val
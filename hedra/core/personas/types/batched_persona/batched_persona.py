@@ -23,12 +23,12 @@ class BatchedPersona(DefaultPersona):
         action_idx = 0
         max_pool_size = math.ceil(self.batch.size * (psutil.cpu_count(logical=False) * 2)/self.workers)
 
-        start = time.time()
+        start = time.monotonic()
         while elapsed < total_time:
             yield action_idx
             
             await asyncio.sleep(0)
-            elapsed = time.time() - start
+            elapsed = time.monotonic() - start
             idx += 1
 
             if idx%self.batch.size == 0:
@@ -3,19 +3,26 @@ import asyncio
 import psutil
 import uuid
 import math
+from collections import defaultdict
 from typing import (
+    Awaitable,
+    Callable,
     Dict, 
     List, 
+    Set,
+    Tuple,
     Union,
     Optional
 )
 from hedra.logging import HedraLogger
 from asyncio import Task
 from hedra.core.hooks.types.base.hook_type import HookType
+from hedra.core.hooks.types.base.hook import Hook
 from hedra.core.personas.batching.batch import Batch
 from hedra.core.hooks.types.action.hook import ActionHook
 from hedra.core.hooks.types.task.hook import TaskHook
 from hedra.core.engines.client.config import Config
+from hedra.core.engines.types.common.base_result import BaseResult
 from hedra.core.personas.types.types import PersonaTypes
 from hedra.core.personas.streaming import (
     Stream,
@@ -26,6 +33,7 @@ from hedra.monitoring import (
     MemoryMonitor
 )
 from hedra.reporting.processed_result.results import results_types
+from hedra.reporting.processed_result.processed_results_group import ProcessedResultsGroup
 from hedra.reporting.reporter import (
     Reporter,
     ReporterConfig
@@ -98,7 +106,15 @@ class DefaultPersona:
         'collection_interval',
         'bypass_cleanup',
         'cpu_monitor',
-        'memory_monitor'
+        'memory_monitor',
+        'streaming_dispatch',
+        'max_in_flight',
+        'warm_connections',
+        'worker_aggregation',
+        'monitor_mode',
+        'metric_hooks',
+        'accumulating',
+        'events'
     )    
 
     def __init__(self, config: Config):
@@ -145,8 +161,22 @@ class DefaultPersona:
         self.collection_interval: int = 1
         self.pending: List[asyncio.Task] = []
         self.bypass_cleanup: bool = False
-        self.cpu_monitor = CPUMonitor()
-        self.memory_monitor = MemoryMonitor()
+        self.monitor_mode = config.monitor_mode
+
+        # Process local monitoring samples this worker (and its children)
+        # from a timer on the running loop instead of polling system wide
+        # CPU usage from a thread pool.
+        process_local = self.monitor_mode == 'process'
+        self.cpu_monitor = CPUMonitor(process_local=process_local)
+        self.memory_monitor = MemoryMonitor(process_local=process_local)
+
+        self.streaming_dispatch = config.streaming_dispatch
+        self.max_in_flight = config.max_in_flight
+        self.warm_connections = config.warm_connections
+        self.worker_aggregation = config.worker_aggregation
+        self.metric_hooks: List[Hook] = []
+        self.accumulating: List[BaseResult] = []
+        self.events: Dict[str, ProcessedResultsGroup] = defaultdict(ProcessedResultsGroup)
 
     def setup(
             self, 
@@ -195,6 +225,38 @@ class DefaultPersona:
         for hook in self._hooks:
             await hook.session.set_pool(concurrency)
 
+    async def warm(self):
+
+        # Sessions shared across hooks are only warmed once per host so
+        # connection setup stays outside of the timed execution window.
+        # Task executor pools are always started, one per task.
+        warm_targets = {}
+        for hook in self._hooks:
+
+            if hook.hook_type == HookType.TASK:
+                warm_targets[hook.name] = hook
+                continue
+
+            elif self.warm_connections < 1:
+                continue
+
+            url = getattr(hook.action, 'url', None)
+            host_key = (
+                hook.session.session_id,
+                getattr(url, 'hostname', None),
+                getattr(url, 'port', None)
+            )
+
+            if host_key not in warm_targets:
+                warm_targets[host_key] = hook
+
+        await asyncio.gather(*[
+            hook.session.warm(
+                hook.action,
+                self.warm_connections
+            ) for hook in warm_targets.values()
+        ])
+
     async def execute(self):
         hooks = self._hooks
         hook_names = ', '.join([
@@ -223,13 +285,21 @@ class DefaultPersona:
             await self.start_stream()
 
             self.start = time.monotonic()
-            completed, pending = await asyncio.wait([
-                loop.create_task(
-                    self.stream.execute_action(
-                        hooks[action_idx]
-                    )
-                ) async for action_idx in self.generator(total_time)
-            ], timeout=self.graceful_stop)
+
+            if self.streaming_dispatch and self.optimization_active is False:
+                completed, pending = await self.dispatch_streaming(
+                    total_time,
+                    self.stream.execute_action
+                )
+
+            else:
+                completed, pending = await asyncio.wait([
+                    loop.create_task(
+                        self.stream.execute_action(
+                            hooks[action_idx]
+                        )
+                    ) async for action_idx in self.generator(total_time)
+                ], timeout=self.graceful_stop)
 
             self.end = time.monotonic()
 
@@ -247,13 +317,21 @@ class DefaultPersona:
             await self.memory_monitor.start_background_monitor(monitor_name)
 
             self.start = time.monotonic()
-            completed, pending = await asyncio.wait([
-                loop.create_task(
-                    hooks[action_idx].session.execute_prepared_request(
-                        hooks[action_idx].action
-                    )
-                ) async for action_idx in self.generator(total_time)
-            ], timeout=self.graceful_stop)
+
+            if self.streaming_dispatch and self.optimization_active is False:
+                completed, pending = await self.dispatch_streaming(
+                    total_time,
+                    self.execute_hook
+                )
+
+            else:
+                completed, pending = await asyncio.wait([
+                    loop.create_task(
+                        hooks[action_idx].session.execute_prepared_request(
+                            hooks[action_idx].action
+                        )
+                    ) async for action_idx in self.generator(total_time)
+                ], timeout=self.graceful_stop)
 
             self.end = time.monotonic()
 
@@ -306,7 +384,7 @@ class DefaultPersona:
 
             await self.logger.filesystem.aio['hedra.core'].info(f'{self.metadata_string} - Closed session - {hook.session.session_id} - for Hook - {hook.name}:{hook.hook_id}. Took: {round(session_closed_elapsed, 2)} seconds')
         
-        self.total_actions = len(set(results))
+        self.total_actions = len(set(results)) + self.completed_actions
         self.total_elapsed = self.end - self.start
         self.optimized_params = None
 
@@ -314,6 +392,105 @@ class DefaultPersona:
 
         return results
 
+    async def dispatch_streaming(
+        self,
+        total_time: int,
+        execute_action: Callable[[Union[ActionHook, TaskHook]], Awaitable[BaseResult]]
+    ) -> Tuple[List[asyncio.Task], Set[asyncio.Task]]:
+
+        # Tasks are reaped as they complete and their results fed straight
+        # into the persona's events groups, so neither Tasks nor results
+        # accumulate over the course of the run.
+        loop = asyncio.get_running_loop()
+        hooks = self._hooks
+
+        max_in_flight = self.max_in_flight
+        if max_in_flight is None:
+            max_in_flight = math.ceil(self.batch.size * (psutil.cpu_count(logical=False)**2)/self.workers)
+
+        in_flight: Set[asyncio.Task] = set()
+        window_open = asyncio.Event()
+        window_open.set()
+
+        def reap(task: asyncio.Task):
+            in_flight.discard(task)
+
+            if task.cancelled() is False and task.exception() is None:
+                self.aggregate(task.result())
+
+            if len(in_flight) < max_in_flight:
+                window_open.set()
+
+        start = time.monotonic()
+
+        async for action_idx in self.generator(total_time):
+            task = loop.create_task(
+                execute_action(hooks[action_idx])
+            )
+
+            in_flight.add(task)
+            task.add_done_callback(reap)
+
+            if len(self.accumulating) > 0:
+                await self.accumulate_metrics()
+
+            if len(in_flight) >= max_in_flight:
+                window_open.clear()
+
+                try:
+                    max_wait = total_time - (time.monotonic() - start)
+                    await asyncio.wait_for(
+                        window_open.wait(),
+                        timeout=max(max_wait, 0)
+                    )
+
+                except asyncio.TimeoutError:
+                    pass
+
+        if len(in_flight) > 0:
+            await asyncio.wait(
+                set(in_flight), 
+                timeout=self.graceful_stop
+            )
+
+        await self.accumulate_metrics()
+
+        return [], set(in_flight)
+
+    def aggregate(self, result: BaseResult):
+        if isinstance(result, BaseResult):
+            self.events[result.name].add(
+                self.stage_name,
+                result
+            )
+
+            if len(self.metric_hooks) > 0:
+                self.accumulating.append(result)
+
+            self.completed_actions += 1
+
+    async def accumulate_metrics(self):
+        accumulating = self.accumulating
+        self.accumulating = []
+
+        for result in accumulating:
+            metrics = self.events[result.name].metrics
+
+            for metric_hook in self.metric_hooks:
+                await metric_hook.accumulate(result, metrics)
+
+    async def combine(self, results: List[BaseResult]) -> List[BaseResult]:
+
+        # Folds results into partial events groups (counts, error tallies,
+        # timing sketches and metric accumulators) so workers hand Analyze
+        # partials to merge instead of every raw result.
+        for result in results:
+            self.aggregate(result)
+
+        await self.accumulate_metrics()
+
+        return []
+
     async def generator(self, total_time):
         elapsed = 0
         max_pool_size = math.ceil(self.batch.size * (psutil.cpu_count(logical=False)**2)/self.workers)
@@ -337,6 +514,11 @@ class DefaultPersona:
             
             action_idx = (action_idx+1)%self.actions_count
 
+    def execute_hook(self, hook: Union[ActionHook, TaskHook]) -> Awaitable[BaseResult]:
+        return hook.session.execute_prepared_request(
+            hook.action
+        )
+
     async def start_stream(self):
         self._loop = asyncio.get_event_loop()
         await self.logger.filesystem.aio['hedra.core'].info(f'{self.metadata_string} - Live Updates enabled')
@@ -69,14 +69,19 @@ class GRPCActionParser(BaseParser):
             user=generator_action.user,
             tags=[
                 tag.dict() for tag in generator_action.tags
-            ]
+            ],
+            stream_type=generator_action.stream_type,
+            compression=generator_action.compression
         )
 
         session = MercuryGRPCClient(
             concurrency=self.config.batch_size,
             timeouts=self.timeouts,
             reset_connections=self.config.reset_connections,
-            tracing_session=self.config.tracing
+            tracing_session=self.config.tracing,
+            idle_timeout=self.config.idle_timeout,
+            max_connection_age=self.config.max_connection_age,
+            streams_per_connection=self.config.streams_per_connection
         )
 
         await session.prepare(action)
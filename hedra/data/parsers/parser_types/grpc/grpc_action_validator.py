@@ -27,4 +27,6 @@ class GRPCActionValidator(BaseModel):
     weight: Optional[Union[StrictInt, StrictFloat]]
     order: Optional[StrictInt]
     user: Optional[StrictStr]
-    tags: List[GRPCActionTag]=[]
\ No newline at end of file
+    tags: List[GRPCActionTag]=[]
+    stream_type: StrictStr='UNARY'
+    compression: Optional[StrictStr]
\ No newline at end of file
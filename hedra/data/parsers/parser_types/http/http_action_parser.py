@@ -70,7 +70,10 @@ class HTTPActionParser(BaseParser):
             concurrency=self.config.batch_size,
             timeouts=self.timeouts,
             reset_connections=self.config.reset_connections,
-            tracing_session=self.config.tracing
+            tracing_session=self.config.tracing,
+            pipeline_depth=self.config.pipeline_depth,
+            idle_timeout=self.config.idle_timeout,
+            max_connection_age=self.config.max_connection_age
         )
 
         await session.prepare(action)
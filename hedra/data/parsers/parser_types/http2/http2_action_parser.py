@@ -64,7 +64,10 @@ class HTTP2ActionParser(BaseParser):
             concurrency=self.config.batch_size,
             timeouts=self.timeouts,
             reset_connections=self.config.reset_connections,
-            tracing_session=self.config.tracing
+            tracing_session=self.config.tracing,
+            idle_timeout=self.config.idle_timeout,
+            max_connection_age=self.config.max_connection_age,
+            streams_per_connection=self.config.streams_per_connection
         )
 
         await session.prepare(action)
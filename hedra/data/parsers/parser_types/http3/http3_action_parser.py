@@ -66,7 +66,8 @@ class HTTP3ActionParser(BaseParser):
             concurrency=self.config.batch_size,
             timeouts=self.timeouts,
             reset_connections=self.config.reset_connections,
-            tracing_session=self.config.tracing
+            tracing_session=self.config.tracing,
+            streams_per_connection=self.config.streams_per_connection
         )
 
         await session.prepare(action)
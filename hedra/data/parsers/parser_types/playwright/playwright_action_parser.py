@@ -123,7 +123,9 @@ class PlaywrightActionParser(BaseParser):
         session = MercuryPlaywrightClient(
             concurrency=self.config.batch_size,
             timeouts=self.timeouts,
-            group_size=self.config.group_size
+            group_size=self.config.group_size,
+            commands_per_context=self.config.commands_per_context,
+            max_browser_memory=self.config.max_browser_memory
         )
 
         await session.setup(
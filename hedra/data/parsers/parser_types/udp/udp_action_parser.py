@@ -53,14 +53,16 @@ class UDPActionParser(BaseParser):
             user=generator_action.user,
             tags=[
                 tag.dict() for tag in generator_action.tags
-            ]
+            ],
+            correlation_offset=generator_action.correlation_offset,
+            correlation_length=generator_action.correlation_length
         )
 
         session = MercuryUDPClient(
             concurrency=self.config.batch_size,
             timeouts=self.timeouts,
             reset_connections=self.config.reset_connections,
-            tracing_session=self.config.tracing
+            batch_datagrams=self.config.batch_datagrams
         )
 
         await session.prepare(action)
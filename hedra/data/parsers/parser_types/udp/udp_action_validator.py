@@ -22,6 +22,8 @@ class UDPActionValidator(BaseModel):
     name: StrictStr
     url: AnyHttpUrl
     wait_for_response: StrictBool=False
+    correlation_offset: Optional[StrictInt]
+    correlation_length: StrictInt=2
     data: Optional[Union[StrictStr, Json]]
     weight: Optional[Union[StrictInt, StrictFloat]]
     order: Optional[StrictInt]
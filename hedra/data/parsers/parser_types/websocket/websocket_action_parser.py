@@ -64,7 +64,8 @@ class WebsocketActionParser(BaseParser):
             concurrency=self.config.batch_size,
             timeouts=self.timeouts,
             reset_connections=self.config.reset_connections,
-            tracing_session=self.config.tracing
+            idle_timeout=self.config.idle_timeout,
+            max_connection_age=self.config.max_connection_age
         )
 
         await session.prepare(action)
@@ -68,7 +68,9 @@ class GraphQLSerializer(BaseSerializer):
             timeouts=Timeouts(
                 **client_config.get('timeouts', {})
             ),
-            reset_connections=client_config.get('reset_sessions')
+            reset_connections=client_config.get('reset_sessions'),
+            idle_timeout=client_config.get('idle_timeout'),
+            max_connection_age=client_config.get('max_connection_age')
         )
     
     def result_to_serializable(
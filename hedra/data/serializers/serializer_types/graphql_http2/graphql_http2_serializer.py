@@ -67,7 +67,10 @@ class GraphQLHTTP2Serializer(BaseSerializer):
             timeouts=Timeouts(
                 **client_config.get('timeouts', {})
             ),
-            reset_connections=client_config.get('reset_sessions')
+            reset_connections=client_config.get('reset_sessions'),
+            idle_timeout=client_config.get('idle_timeout'),
+            max_connection_age=client_config.get('max_connection_age'),
+            streams_per_connection=client_config.get('streams_per_connection', 1)
         )
     
     def result_to_serializable(
@@ -2,6 +2,7 @@ from hedra.core.engines.types.common.timeouts import Timeouts
 from hedra.core.engines.types.grpc.action import GRPCAction
 from hedra.core.engines.types.grpc.client import MercuryGRPCClient
 from hedra.core.engines.types.grpc.result import GRPCResult
+from hedra.core.engines.types.grpc.stream_types import GRPCStreamTypes
 from hedra.core.engines.types.common.types import RequestTypes
 from hedra.data.serializers.serializer_types.common.base_serializer import BaseSerializer
 from typing import List, Dict, Union, Any
@@ -31,6 +32,8 @@ class GRPCSerializer(BaseSerializer):
             'headers': action._headers,
             'data': action.data,
             'is_stream': action.is_stream,
+            'stream_type': action.stream_type,
+            'compression': action.codec.compression,
             'is_setup': action.is_setup,
             'action_args': action.action_args,
         }
@@ -50,7 +53,9 @@ class GRPCSerializer(BaseSerializer):
             headers=action.get('headers'),
             data=action.get('data'),
             user=metadata.get('user'),
-            tags=metadata.get('tags', [])
+            tags=metadata.get('tags', []),
+            stream_type=action.get('stream_type', GRPCStreamTypes.UNARY),
+            compression=action.get('compression')
         )
 
         grpc_action.url.ip_addr = url_config.get('ip_addr')
@@ -67,7 +72,10 @@ class GRPCSerializer(BaseSerializer):
             timeouts=Timeouts(
                 **client_config.get('timeouts', {})
             ),
-            reset_connections=client_config.get('reset_sessions')
+            reset_connections=client_config.get('reset_sessions'),
+            idle_timeout=client_config.get('idle_timeout'),
+            max_connection_age=client_config.get('max_connection_age'),
+            streams_per_connection=client_config.get('streams_per_connection', 1)
         )
     
     def result_to_serializable(
@@ -3,6 +3,7 @@ from hedra.core.engines.types.http.action import HTTPAction
 from hedra.core.engines.types.http.client import MercuryHTTPClient
 from hedra.core.engines.types.http.result import HTTPResult
 from hedra.core.engines.types.common.types import RequestTypes
+from hedra.core.engines.types.common.body_policy import BodyPolicies
 from hedra.data.serializers.serializer_types.common.base_serializer import BaseSerializer
 from typing import List, Dict, Union, Any
 
@@ -35,6 +36,8 @@ class HTTPSerializer(BaseSerializer):
             'encoded_data': action.encoded_data,
             'is_stream': action.is_stream,
             'redirects': action.redirects,
+            'body_policy': action.body_policy.policy,
+            'body_limit': action.body_policy.limit,
             'is_setup': action.is_setup,
             'action_args': action.action_args,
         }
@@ -54,7 +57,9 @@ class HTTPSerializer(BaseSerializer):
             data=action.get('data'),
             user=metadata.get('user'),
             tags=metadata.get('tags', []),
-            redirects=action.get('redirects', 3)
+            redirects=action.get('redirects', 3),
+            body_policy=action.get('body_policy', BodyPolicies.FULL),
+            body_limit=action.get('body_limit')
         )
 
         http_action.url.ip_addr = url_config.get('ip_addr')
@@ -71,7 +76,10 @@ class HTTPSerializer(BaseSerializer):
             timeouts=Timeouts(
                 **client_config.get('timeouts', {})
             ),
-            reset_connections=client_config.get('reset_sessions')
+            reset_connections=client_config.get('reset_sessions'),
+            pipeline_depth=client_config.get('pipeline_depth', 1),
+            idle_timeout=client_config.get('idle_timeout'),
+            max_connection_age=client_config.get('max_connection_age')
         )
     
     def result_to_serializable(
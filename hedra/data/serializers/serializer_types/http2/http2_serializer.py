@@ -3,6 +3,7 @@ from hedra.core.engines.types.http2.action import HTTP2Action
 from hedra.core.engines.types.http2.client import MercuryHTTP2Client
 from hedra.core.engines.types.http2.result import HTTP2Result
 from hedra.core.engines.types.common.types import RequestTypes
+from hedra.core.engines.types.common.body_policy import BodyPolicies
 from hedra.data.serializers.serializer_types.common.base_serializer import BaseSerializer
 from typing import List, Dict, Union, Any
 
@@ -31,6 +32,8 @@ class HTTP2Serializer(BaseSerializer):
             'headers': action._headers,
             'data': action.data,
             'is_stream': action.is_stream,
+            'body_policy': action.body_policy.policy,
+            'body_limit': action.body_policy.limit,
             'is_setup': action.is_setup,
             'action_args': action.action_args,
         }
@@ -50,7 +53,9 @@ class HTTP2Serializer(BaseSerializer):
             headers=action.get('headers'),
             data=action.get('data'),
             user=metadata.get('user'),
-            tags=metadata.get('tags', [])
+            tags=metadata.get('tags', []),
+            body_policy=action.get('body_policy', BodyPolicies.FULL),
+            body_limit=action.get('body_limit')
         )
 
         http2_action.url.ip_addr = url_config.get('ip_addr')
@@ -67,7 +72,10 @@ class HTTP2Serializer(BaseSerializer):
             timeouts=Timeouts(
                 **client_config.get('timeouts', {})
             ),
-            reset_connections=client_config.get('reset_sessions')
+            reset_connections=client_config.get('reset_sessions'),
+            idle_timeout=client_config.get('idle_timeout'),
+            max_connection_age=client_config.get('max_connection_age'),
+            streams_per_connection=client_config.get('streams_per_connection', 1)
         )
     
     def result_to_serializable(
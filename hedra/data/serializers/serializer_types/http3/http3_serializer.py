@@ -71,7 +71,8 @@ class HTTP3Serializer(BaseSerializer):
             timeouts=Timeouts(
                 **client_config.get('timeouts', {})
             ),
-            reset_connections=client_config.get('reset_sessions')
+            reset_connections=client_config.get('reset_sessions'),
+            streams_per_connection=client_config.get('streams_per_connection', 1)
         )
     
     def result_to_serializable(
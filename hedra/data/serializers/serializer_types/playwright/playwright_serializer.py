@@ -123,7 +123,9 @@ class PlaywrightSerializer(BaseSerializer):
             group_size=client_config.get('group_size'),
             timeouts=Timeouts(
                 **client_config.get('timeouts', {})
-            )
+            ),
+            commands_per_context=client_config.get('commands_per_context'),
+            max_browser_memory=client_config.get('max_browser_memory')
         )
 
         playwright_client.config = ContextConfig(
@@ -24,7 +24,8 @@ class TaskSerializer(BaseSerializer):
             'source': task.source,
             'task_action': task.execute.__name__,
             'user': task.metadata.user,
-            'tags': task.metadata.tags
+            'tags': task.metadata.tags,
+            'executor': task.executor
         }
     
     def deserialize_task(
@@ -37,7 +38,8 @@ class TaskSerializer(BaseSerializer):
             None,
             source=task.get('source'),
             user=task.get('user'),
-            tags=task.get('tags', [])
+            tags=task.get('tags', []),
+            executor=task.get('executor')
         )
 
         return deserialized_task
@@ -47,7 +49,8 @@ class TaskSerializer(BaseSerializer):
             concurrency=client_config.get('concurrency'),
             timeouts=Timeouts(
                 **client_config.get('timeouts', {})
-            )
+            ),
+            task_workers=client_config.get('task_workers')
         )
     
     def result_to_serializable(
@@ -59,6 +62,8 @@ class TaskSerializer(BaseSerializer):
         return {
             **serialized_result,
             'data': result.data,
+            'queue_time': result.queue_time,
+            'run_time': result.run_time
         }
     
     def deserialize_result(
@@ -88,5 +93,7 @@ class TaskSerializer(BaseSerializer):
         task_result.connect_end = result.get('connect_end')
         task_result.write_end = result.get('write_end')
         task_result.complete = result.get('complete')
+        task_result.queue_time = result.get('queue_time', 0)
+        task_result.run_time = result.get('run_time', 0)
 
         return task_result
@@ -28,6 +28,8 @@ class UDPSerializer(BaseSerializer):
                 'has_ip_addr': action.url.has_ip_addr
             },
             'wait_for_response': action.wait_for_response,
+            'correlation_offset': action.correlation_offset,
+            'correlation_length': action.correlation_length,
             'data': action.data,
             'encoded_data': action.encoded_data,
             'is_stream': action.is_stream,
@@ -49,7 +51,9 @@ class UDPSerializer(BaseSerializer):
             wait_for_response=action.get('wait_for_response', False),
             data=action.get('data'),
             user=metadata.get('user'),
-            tags=metadata.get('tags', [])
+            tags=metadata.get('tags', []),
+            correlation_offset=action.get('correlation_offset'),
+            correlation_length=action.get('correlation_length', 2)
         )
 
         udp_action.url.ip_addr = url_config.get('ip_addr')
@@ -66,7 +70,8 @@ class UDPSerializer(BaseSerializer):
             timeouts=Timeouts(
                 **client_config.get('timeouts', {})
             ),
-            reset_connections=client_config.get('reset_sessions')
+            reset_connections=client_config.get('reset_sessions'),
+            batch_datagrams=client_config.get('batch_datagrams', False)
         )
     
     def result_to_serializable(
@@ -78,7 +83,7 @@ class UDPSerializer(BaseSerializer):
 
         body: Union[str, None] = None
         if result.body:
-            body = str(result.body.decode())
+            body = str(result.body.decode(errors='replace'))
 
         return {
             **serialized_result,
@@ -91,6 +96,7 @@ class UDPSerializer(BaseSerializer):
             'tags': result.tags,
             'user': result.user,
             'status': result.status,
+            'lost': result.lost,
             'error': str(result.error)
         }
     
@@ -118,6 +124,7 @@ class UDPSerializer(BaseSerializer):
 
         deserialized_result.body = body
         deserialized_result.status = result.get('status')
+        deserialized_result.lost = result.get('lost', False)
         deserialized_result.checks = result.get('checks')
         deserialized_result.wait_start = result.get('wait_start')
         deserialized_result.start = result.get('start')
@@ -45,6 +45,9 @@ class MercurySyncHTTPConnection(MercurySyncTCPConnection):
             env
         )
 
+        # HTTP is read and written as raw bytes.
+        self._framed = False
+
         self._waiters: Deque[asyncio.Future] = deque()
         self._connections: Dict[str, List[asyncio.Transport]] = defaultdict(list)
         self._http_socket: Union[socket.socket, None] = None
@@ -1,11 +1,11 @@
 
 import asyncio
-import pickle
 import socket
 import ssl
 import zstandard
 from collections import deque, defaultdict
 from hedra.distributed.connection.base.connection_type import ConnectionType
+from hedra.distributed.encoding import MessageCodec
 from hedra.distributed.encryption import AESGCMFernet
 from hedra.distributed.env import Env
 from hedra.distributed.env.time_parser import TimeParser
@@ -19,11 +19,14 @@ from typing import (
     Coroutine, 
     AsyncIterable,
     Union,
-    Optional
+    Optional,
+    List
 )
 from hedra.distributed.connection.tcp.protocols import (
     MercurySyncTCPClientProtocol,
-    MercurySyncTCPServerProtocol
+    MercurySyncTCPServerProtocol,
+    encode_frames,
+    decode_frames
 )
 
 
@@ -54,6 +57,8 @@ class MercurySyncTCPConnection:
         self._running = False
 
         self._client_transports: Dict[str, asyncio.Transport] = {}
+        self._bytes_transports: Dict[Tuple[str, int], asyncio.Transport] = {}
+        self._bytes_waiters: Dict[asyncio.Transport, Deque[asyncio.Future]] = defaultdict(deque)
         self._server: asyncio.Server = None
         self._loop: Union[asyncio.AbstractEventLoop, None] = None
         self._waiters: Dict[str, Deque[asyncio.Future]] = defaultdict(deque)
@@ -63,6 +68,11 @@ class MercurySyncTCPConnection:
         self._sent_values = deque()
         self.server_socket = None
         self._stream = False
+
+        # Messages written to a transport within one loop iteration are
+        # sent as a single length-prefixed, compressed frame.
+        self._framed = True
+        self._write_buffers: Dict[asyncio.Transport, List[bytes]] = {}
         
         self._client_key_path: Union[str, None] = None
         self._client_cert_path: Union[str, None] = None
@@ -74,6 +84,7 @@ class MercurySyncTCPConnection:
         self._server_ssl_context: Union[ssl.SSLContext, None] = None
         
         self._encryptor = AESGCMFernet(env)
+        self._codec = MessageCodec()
         self._semaphore: Union[asyncio.Semaphore, None] = None
         self._compressor: Union[zstandard.ZstdCompressor, None] = None
         self._decompressor: Union[zstandard.ZstdDecompressor, None] = None
@@ -135,7 +146,8 @@ class MercurySyncTCPConnection:
 
             server = self._loop.create_server(
                 lambda: MercurySyncTCPServerProtocol(
-                    self.read
+                    self.read,
+                    framed=self._framed
                 ),
                 sock=self.server_socket,
                 ssl=self._server_ssl_context
@@ -209,7 +221,8 @@ class MercurySyncTCPConnection:
 
             server = await self._loop.create_server(
                 lambda: MercurySyncTCPServerProtocol(
-                    self.read
+                    self.read,
+                    framed=self._framed
                 ),
                 sock=self.server_socket,
                 ssl=self._server_ssl_context
@@ -283,7 +296,8 @@ class MercurySyncTCPConnection:
 
                 client_transport, _ = await self._loop.create_connection(
                     lambda: MercurySyncTCPClientProtocol(
-                        self.read
+                        self.read,
+                        framed=self._framed
                     ),
                     sock=tcp_socket,
                     ssl=self._client_ssl_context
@@ -348,6 +362,43 @@ class MercurySyncTCPConnection:
 
                     self._pending_responses.pop()
 
+    def _write(
+        self,
+        transport: asyncio.Transport,
+        item: bytes
+    ):
+        write_buffer = self._write_buffers.get(transport)
+
+        if write_buffer is None:
+            self._write_buffers[transport] = [item]
+            self._loop.call_soon(self._flush_writes, transport)
+
+        else:
+            write_buffer.append(item)
+
+    def _flush_writes(
+        self,
+        transport: asyncio.Transport
+    ):
+        items = self._write_buffers.pop(transport, None)
+
+        if not items or transport.is_closing():
+            return
+
+        try:
+            encrypted_message = self._encryptor.encrypt(
+                encode_frames(items)
+            )
+
+            compressed = self._compressor.compress(encrypted_message)
+
+            transport.write(
+                encode_frames([compressed])
+            )
+
+        except (Exception, socket.error):
+            pass
+
     async def send(
         self, 
         event_name: bytes,
@@ -370,7 +421,7 @@ class MercurySyncTCPConnection:
 
                     client_transport = self._client_transports.get(address)
 
-                item = pickle.dumps(
+                item = self._codec.encode_envelope(
                     (
                         'request',
                         self.id_generator.generate(),
@@ -378,13 +429,9 @@ class MercurySyncTCPConnection:
                         data,
                         self.host,
                         self.port
-                    ),
-                    protocol=pickle.HIGHEST_PROTOCOL
+                    )
                 )
 
-                encrypted_message = self._encryptor.encrypt(item)
-                compressed = self._compressor.compress(encrypted_message)
-
                 if client_transport.is_closing():
                     return (
                         self.id_generator.generate(),
@@ -395,7 +442,7 @@ class MercurySyncTCPConnection:
                         )
                     )
 
-                client_transport.write(compressed)
+                self._write(client_transport, item)
 
                 waiter = self._loop.create_future()
                 self._waiters[event_name].append(waiter)
@@ -437,32 +484,15 @@ class MercurySyncTCPConnection:
         async with self._semaphore:
 
             try:
-                self._last_call.append(event_name)
-
-                client_transport = self._client_transports.get(address)
-                if client_transport is None:
-                    await self.connect_client(
-                        address,
-                        cert_path=self._client_cert_path,
-                        key_path=self._client_key_path
-                    )
-
-                    client_transport = self._client_transports.get(address)
+                client_transport = self._bytes_transports.get(address)
+                if client_transport is None or client_transport.is_closing():
+                    self._bytes_waiters.pop(client_transport, None)
+                    client_transport = await self._connect_bytes_client(address)
 
-                if client_transport.is_closing():
-                    return (
-                        self.id_generator.generate(),
-                        Message(
-                            host=self.host,
-                            port=self.port,
-                            error='Transport closed.'
-                        )
-                    )
+                waiter = self._loop.create_future()
+                self._bytes_waiters[client_transport].append(waiter)
 
                 client_transport.write(data)
-
-                waiter = self._loop.create_future()
-                self._waiters[event_name].append(waiter)
                 
                 return await asyncio.wait_for(
                     waiter,
@@ -472,6 +502,48 @@ class MercurySyncTCPConnection:
             except (Exception, socket.error):
                 return b'Request timed out.'
 
+    async def _connect_bytes_client(
+        self,
+        address: Tuple[str, int]
+    ) -> asyncio.Transport:
+
+        # Peers sent raw bytes, such as DNS servers, neither frame nor
+        # encrypt their replies, so are read on their own connections.
+        self._loop = asyncio.get_event_loop()
+
+        tcp_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        tcp_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        await self._loop.run_in_executor(None, tcp_socket.connect, address)
+
+        tcp_socket.setblocking(False)
+
+        client_transport, _ = await self._loop.create_connection(
+            lambda: MercurySyncTCPClientProtocol(
+                self._read_bytes,
+                framed=False
+            ),
+            sock=tcp_socket,
+            ssl=self._client_ssl_context
+        )
+
+        self._bytes_transports[address] = client_transport
+
+        return client_transport
+
+    def _read_bytes(
+        self,
+        data: bytes,
+        transport: asyncio.Transport
+    ) -> None:
+        waiters = self._bytes_waiters[transport]
+
+        while bool(waiters):
+            waiter = waiters.popleft()
+
+            if waiter.done() is False:
+                waiter.set_result(data)
+                return
+
     
     async def stream(
         self, 
@@ -489,7 +561,7 @@ class MercurySyncTCPConnection:
 
 
                 if self._stream is False:
-                    item = pickle.dumps(
+                    item = self._codec.encode_envelope(
                         (
                             'stream_connect',
                             self.id_generator.generate(),
@@ -497,13 +569,12 @@ class MercurySyncTCPConnection:
                             data,
                             self.host,
                             self.port
-                        ),
-                        protocol=pickle.HIGHEST_PROTOCOL
+                        )
                     )
 
 
                 else:
-                    item = pickle.dumps(
+                    item = self._codec.encode_envelope(
                         (
                             'stream',
                             self.id_generator.generate(),
@@ -511,13 +582,9 @@ class MercurySyncTCPConnection:
                             data,
                             self.host,
                             self.port
-                        ),
-                        protocol=pickle.HIGHEST_PROTOCOL
+                        )
                     )
 
-                encrypted_message = self._encryptor.encrypt(item)
-                compressed = self._compressor.compress(encrypted_message)
-
                 if client_transport.is_closing():
                     yield (
                         self.id_generator.generate(),
@@ -528,7 +595,7 @@ class MercurySyncTCPConnection:
                         )
                     )
 
-                client_transport.write(compressed)
+                self._write(client_transport, item)
 
                 waiter = self._loop.create_future()
                 self._waiters[event_name].append(waiter)
@@ -544,7 +611,7 @@ class MercurySyncTCPConnection:
 
                     self._stream = True
 
-                    item = pickle.dumps(
+                    item = self._codec.encode_envelope(
                         (
                             'stream',
                             self.id_generator.generate(),
@@ -552,14 +619,10 @@ class MercurySyncTCPConnection:
                             data,
                             self.host,
                             self.port
-                        ),
-                        pickle.HIGHEST_PROTOCOL
+                        )
                     )
 
-                    encrypted_message = self._encryptor.encrypt(item)
-                    compressed = self._compressor.compress(encrypted_message)
-
-                    client_transport.write(compressed)
+                    self._write(client_transport, item)
 
                     waiter = self._loop.create_future()
                     self._waiters[event_name].append(waiter)
@@ -634,6 +697,18 @@ class MercurySyncTCPConnection:
 
         decrypted = self._encryptor.decrypt(decompressed)
 
+        for item in decode_frames(decrypted):
+            self._read_item(
+                item,
+                transport
+            )
+
+    def _read_item(
+        self,
+        item: bytes,
+        transport: asyncio.Transport
+    ) -> None:
+
         result: Tuple[
             str, 
             int, 
@@ -641,7 +716,7 @@ class MercurySyncTCPConnection:
             Any, 
             str, 
             int
-        ] = pickle.loads(decrypted)
+        ] = self._codec.decode_envelope(item)
 
         (
             message_type, 
@@ -770,22 +845,18 @@ class MercurySyncTCPConnection:
         try:
             if transport.is_closing() is False:
 
-                item = pickle.dumps(
+                item = self._codec.encode_envelope(
                     (
                         'response', 
                         self.id_generator.generate(),
                         event_name,
-                        response.to_data(), 
+                        response, 
                         self.host,
                         self.port
-                    ),
-                    protocol=pickle.HIGHEST_PROTOCOL
+                    )
                 )
 
-                encrypted_message = self._encryptor.encrypt(item)
-                compressed = self._compressor.compress(encrypted_message)
-
-                transport.write(compressed)
+                self._write(transport, item)
 
         except (Exception, socket.error):
             pass
@@ -803,22 +874,18 @@ class MercurySyncTCPConnection:
                 
                 try:
 
-                    item = pickle.dumps(
+                    item = self._codec.encode_envelope(
                         (
                             'response', 
                             self.id_generator.generate(),
                             event_name,
-                            response.to_data(), 
+                            response, 
                             self.host,
                             self.port
-                        ),
-                        protocol=pickle.HIGHEST_PROTOCOL
+                        )
                     )
 
-                    encrypted_message = self._encryptor.encrypt(item)
-                    compressed = self._compressor.compress(encrypted_message)
-
-                    transport.write(compressed)
+                    self._write(transport, item)
 
                 except (Exception, socket.error):
                     pass
@@ -834,22 +901,18 @@ class MercurySyncTCPConnection:
             try:
 
                 message = Message()
-                item = pickle.dumps(
+                item = self._codec.encode_envelope(
                     (
                         'response', 
                         self.id_generator.generate(),
                         event_name,
-                        message.to_data(), 
+                        message, 
                         self.host,
                         self.port
-                    ),
-                    protocol=pickle.HIGHEST_PROTOCOL
+                    )
                 )
 
-                encrypted_message = self._encryptor.encrypt(item)
-                compressed = self._compressor.compress(encrypted_message)
-
-                transport.write(compressed)
+                self._write(transport, item)
 
             except (Exception, socket.error):
                 pass
@@ -868,22 +931,18 @@ class MercurySyncTCPConnection:
                     error=error_message
                 )
 
-                item = pickle.dumps(
+                item = self._codec.encode_envelope(
                     (
                         'response', 
                         self.id_generator.generate(),
                         None,
-                        error.to_data(), 
+                        error, 
                         self.host,
                         self.port
-                    ),
-                    protocol=pickle.HIGHEST_PROTOCOL
+                    )
                 )
 
-                encrypted_message = self._encryptor.encrypt(item)
-                compressed = self._compressor.compress(encrypted_message)
-
-                transport.write(compressed)
+                self._write(transport, item)
 
             except (Exception, socket.error):
                 pass
@@ -891,9 +950,16 @@ class MercurySyncTCPConnection:
     async def close(self) -> None:
         self._stream = False
         self._running = False
+        self._write_buffers.clear()
 
         for client in self._client_transports.values():
             client.abort()
+
+        for client in self._bytes_transports.values():
+            client.abort()
+
+        self._bytes_transports.clear()
+        self._bytes_waiters.clear()
         
         if self._cleanup_task:
             self._cleanup_task.cancel()
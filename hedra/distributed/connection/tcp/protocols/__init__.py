@@ -1,2 +1,7 @@
+from .frame_decoder import (
+    FrameDecoder,
+    encode_frames,
+    decode_frames
+)
 from .mercury_sync_tcp_client_protocol import MercurySyncTCPClientProtocol
 from .mercury_sync_tcp_server_protocol import MercurySyncTCPServerProtocol
\ No newline at end of file
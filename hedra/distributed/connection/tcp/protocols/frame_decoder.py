@@ -0,0 +1,77 @@
+import struct
+from typing import List
+
+
+frame_header = struct.Struct('!I')
+
+
+def encode_frames(items: List[bytes]) -> bytes:
+    return b''.join([
+        frame_header.pack(len(item)) + item for item in items
+    ])
+
+
+def decode_frames(data: bytes) -> List[bytes]:
+    frames: List[bytes] = []
+
+    decoder = FrameDecoder()
+    decoder.feed(data, frames)
+
+    if decoder.pending:
+        raise Exception('Incomplete frame')
+
+    return frames
+
+
+class FrameDecoder:
+
+    __slots__ = (
+        'buffer',
+        'max_frame_size'
+    )
+
+    '''
+    Reassembles length-prefixed frames from a TCP stream, where reads
+    may split a frame or hold several.
+    '''
+
+    def __init__(
+        self,
+        max_frame_size: int=2**26
+    ) -> None:
+        self.buffer = bytearray()
+        self.max_frame_size = max_frame_size
+
+    @property
+    def pending(self) -> int:
+        return len(self.buffer)
+
+    def feed(
+        self,
+        data: bytes,
+        frames: List[bytes]
+    ):
+        buffer = self.buffer
+        buffer.extend(data)
+
+        offset = 0
+        buffer_size = len(buffer)
+
+        while buffer_size - offset >= frame_header.size:
+            frame_size, = frame_header.unpack_from(buffer, offset)
+
+            if frame_size > self.max_frame_size:
+                raise Exception(f'Frame of {frame_size} bytes exceeds max frame size of {self.max_frame_size} bytes')
+
+            frame_end = offset + frame_header.size + frame_size
+            if frame_end > buffer_size:
+                break
+
+            frames.append(
+                bytes(buffer[offset + frame_header.size:frame_end])
+            )
+
+            offset = frame_end
+
+        if offset:
+            del buffer[:offset]
@@ -1,5 +1,6 @@
 import asyncio
-from typing import Callable, Any
+from typing import Callable, Any, List, Optional
+from .frame_decoder import FrameDecoder
 
 
 class MercurySyncTCPClientProtocol(asyncio.Protocol):
@@ -8,12 +9,14 @@ class MercurySyncTCPClientProtocol(asyncio.Protocol):
         callback: Callable[
             [Any],
             bytes
-        ]
+        ],
+        framed: bool=False
     ):
         super().__init__()
         self.transport: asyncio.Transport = None
         self.loop = asyncio.get_event_loop()
         self.callback = callback
+        self.decoder: Optional[FrameDecoder] = FrameDecoder() if framed else None
 
         self.on_con_lost = self.loop.create_future()
 
@@ -21,10 +24,30 @@ class MercurySyncTCPClientProtocol(asyncio.Protocol):
         self.transport = transport
 
     def data_received(self, data: bytes):
-        self.callback(
-            data,
-            self.transport
-        )
+
+        if self.decoder is None:
+            self.callback(
+                data,
+                self.transport
+            )
+
+            return
+
+        frames: List[bytes] = []
+
+        try:
+            self.decoder.feed(data, frames)
+
+        except Exception:
+            # The stream can't be resynchronized after a bad length prefix.
+            self.transport.abort()
+            return
+
+        for frame in frames:
+            self.callback(
+                frame,
+                self.transport
+            )
 
     def connection_lost(self, exc):
         self.on_con_lost.set_result(True)
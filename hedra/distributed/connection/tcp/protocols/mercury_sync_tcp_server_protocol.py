@@ -1,5 +1,6 @@
 import asyncio
-from typing import Callable, Tuple
+from typing import Callable, List, Optional, Tuple
+from .frame_decoder import FrameDecoder
 
 
 class MercurySyncTCPServerProtocol(asyncio.Protocol):
@@ -11,10 +12,12 @@ class MercurySyncTCPServerProtocol(asyncio.Protocol):
                 Tuple[str, int]
             ],
             bytes
-        ]
+        ],
+        framed: bool=False
     ):
         super().__init__()
         self.callback = callback
+        self.decoder: Optional[FrameDecoder] = FrameDecoder() if framed else None
         self.transport: asyncio.Transport = None
         self.loop = asyncio.get_event_loop()
         self.on_con_lost = self.loop.create_future()
@@ -24,10 +27,30 @@ class MercurySyncTCPServerProtocol(asyncio.Protocol):
         self.transport = transport
 
     def data_received(self, data: bytes):
-        self.callback(
-            data,
-            self.transport
-        )
+
+        if self.decoder is None:
+            self.callback(
+                data,
+                self.transport
+            )
+
+            return
+
+        frames: List[bytes] = []
+
+        try:
+            self.decoder.feed(data, frames)
+
+        except Exception:
+            # The stream can't be resynchronized after a bad length prefix.
+            self.transport.abort()
+            return
+
+        for frame in frames:
+            self.callback(
+                frame,
+                self.transport
+            )
 
     def connection_lost(self, exc: Exception | None) -> None:
         self.on_con_lost.set_result(True)
\ No newline at end of file
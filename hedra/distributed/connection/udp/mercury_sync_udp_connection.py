@@ -2,7 +2,6 @@
 from __future__ import annotations
 import asyncio
 import traceback
-import pickle
 import socket
 import ssl
 import zstandard
@@ -10,6 +9,7 @@ from collections import deque, defaultdict
 from dtls import do_patch
 from hedra.distributed.connection.base.connection_type import ConnectionType
 from hedra.distributed.connection.udp.protocols import MercurySyncUDPProtocol
+from hedra.distributed.encoding import MessageCodec
 from hedra.distributed.encryption import AESGCMFernet
 from hedra.distributed.env import Env
 from hedra.distributed.env.time_parser import TimeParser
@@ -65,6 +65,7 @@ class MercurySyncUDPConnection:
         ).time
 
         self._encryptor = AESGCMFernet(env)
+        self._codec = MessageCodec()
         self._semaphore: Union[asyncio.Semaphore, None] = None
         self._compressor: Union[zstandard.ZstdCompressor, None] = None
         self._decompressor: Union[zstandard.ZstdDecompressor, None] = None
@@ -262,12 +263,12 @@ class MercurySyncUDPConnection:
         addr: Tuple[str, int]
     ) -> Tuple[int, Dict[str, Any]]:
 
-        item = pickle.dumps((
+        item = self._codec.encode_envelope((
             'request',
             self.id_generator.generate(),
             event_name,
             data
-        ), protocol=pickle.HIGHEST_PROTOCOL)
+        ))
 
         encrypted_message = self._encryptor.encrypt(item)
         compressed = self._compressor.compress(encrypted_message)
@@ -334,12 +335,12 @@ class MercurySyncUDPConnection:
         addr: Tuple[str, int]
     ) -> AsyncIterable[Tuple[int, Dict[str, Any]]]: 
 
-        item = pickle.dumps((
+        item = self._codec.encode_envelope((
             'stream',
             self.id_generator.generate(),
             event_name,
             data
-        ), protocol=pickle.HIGHEST_PROTOCOL)
+        ))
 
         encrypted_message = self._encryptor.encrypt(item)
         compressed = self._compressor.compress(encrypted_message)
@@ -399,7 +400,7 @@ class MercurySyncUDPConnection:
             int, 
             float, 
             Any
-        ] = pickle.loads(decrypted)
+        ] = self._codec.decode_envelope(decrypted)
 
         (
             message_type, 
@@ -506,14 +507,13 @@ class MercurySyncUDPConnection:
         
             response: Message = await coroutine
 
-            item = pickle.dumps(
+            item = self._codec.encode_envelope(
                 (
                     'response', 
                     self.id_generator.generate(),
                     event_name,
-                    response.to_data()
-                ),
-                protocol=pickle.HIGHEST_PROTOCOL
+                    response
+                )
             )
 
             encrypted_message = self._encryptor.encrypt(item)
@@ -536,14 +536,13 @@ class MercurySyncUDPConnection:
 
             try:
 
-                item = pickle.dumps(
+                item = self._codec.encode_envelope(
                     (
                         'response', 
                         self.id_generator.generate(),
                         event_name,
-                        response.to_data()
-                    ),
-                    protocol=pickle.HIGHEST_PROTOCOL
+                        response
+                    )
                 )
 
                 encrypted_message = self._encryptor.encrypt(item)
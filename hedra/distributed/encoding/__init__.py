@@ -0,0 +1,6 @@
+from .message_codec import MessageCodec
+from .message_schema import (
+    MessageSchema,
+    register_model,
+    get_schema
+)
\ No newline at end of file
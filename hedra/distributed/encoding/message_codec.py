@@ -0,0 +1,129 @@
+import msgpack
+from msgpack import unpackb
+from enum import Enum
+from typing import Any, List, Tuple
+from .message_schema import (
+    ADDRESS_FLAG,
+    compiled_schemas,
+    envelope_decoders,
+    get_schema,
+    is_registered
+)
+
+
+class MessageCodec:
+
+    __slots__ = (
+        '_packer',
+    )
+
+    '''
+    Replaces pickle for MercurySync messages with msgpack. Envelopes are
+    sent as a single array, with the set fields of a Message model in
+    place of the model, and models decode to dicts of those fields, as
+    Message.to_data() returns, for the receiver to parse with its
+    registered model. Dicts may be keyed by any scalar, not only str.
+    Types with no encoding raise rather than falling back to pickle, and
+    malformed, truncated, or too deeply nested data raises rather than
+    decoding partially.
+    '''
+
+    def __init__(self) -> None:
+        self._packer = msgpack.Packer(default=self._encode_value)
+
+    def encode_envelope(
+        self,
+        envelope: Tuple[Any, ...]
+    ) -> bytes:
+        '''
+        Encodes a (message_type, shard_id, event_name, data) envelope,
+        optionally followed by the sender's host and port.
+        '''
+
+        if len(envelope) > 4:
+            message_type, shard_id, event_name, data, host, port = envelope
+            key = ADDRESS_FLAG
+
+        else:
+            message_type, shard_id, event_name, data = envelope
+            key = 0
+            host = None
+            port = None
+
+        data_type = type(data)
+
+        schema = compiled_schemas.get(data_type)
+        if schema is None and is_registered(data_type):
+            schema = get_schema(data_type)
+
+        if schema and schema.encode_envelope:
+            encoded = schema.encode_envelope(
+                key,
+                message_type,
+                shard_id,
+                event_name,
+                host,
+                port,
+                data
+            )
+
+        else:
+            encoded: List[Any] = [
+                key,
+                message_type,
+                shard_id,
+                event_name,
+                host,
+                port,
+                data
+            ]
+
+        return self.dumps(encoded)
+
+    def decode_envelope(self, data: bytes) -> Tuple[Any, ...]:
+        try:
+            envelope: List[Any] = unpackb(data, strict_map_key=False)
+
+            return envelope_decoders[envelope[0]](envelope)
+
+        except (ValueError, TypeError, KeyError, IndexError) as decode_error:
+            raise Exception(f'Cannot decode message - {decode_error!r}.')
+
+    def dumps(self, value: Any) -> bytes:
+        try:
+            return self._packer.pack(value)
+
+        except (ValueError, OverflowError) as encode_error:
+            raise Exception(f'Cannot encode message - {encode_error!r}.')
+
+    def loads(self, data: bytes) -> Any:
+        try:
+            return unpackb(data, strict_map_key=False)
+
+        except (ValueError, TypeError) as decode_error:
+            raise Exception(f'Cannot decode message - {decode_error!r}.')
+
+    def _encode_value(self, value: Any) -> Any:
+        value_type = type(value)
+
+        schema = compiled_schemas.get(value_type)
+        if schema is None and is_registered(value_type):
+            schema = get_schema(value_type)
+
+        if schema:
+            return schema.encode(value)
+
+        elif isinstance(value, Enum):
+            return value.value
+
+        elif isinstance(value, (set, frozenset)):
+            return list(value)
+
+        elif hasattr(value_type, '__fields__'):
+            # Other models have no schema registered on the receiving
+            # side, so are sent as their set fields.
+            return {
+                name: field_value for name, field_value in value.__dict__.items() if field_value is not None
+            }
+
+        raise Exception(f'Cannot encode value of type - {value_type.__name__} - in a message.')
@@ -0,0 +1,264 @@
+from __future__ import annotations
+import zlib
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type
+)
+
+
+# Envelopes begin with a key - whether they include the sender's address,
+# whether their data is a model, and if so the model's schema id and which
+# of its fields are set. The fields that are set follow the envelope's
+# members in place of the model.
+ADDRESS_FLAG = 0b1
+MODEL_FLAG = 0b10
+SCHEMA_ID_SHIFT = 2
+BITMAP_SHIFT = 34
+MAX_SCHEMA_ID = 0xFFFFFFFF
+
+# Keeps envelope keys within msgpack's 64 bit integers. Models with more
+# fields are sent as the envelope's data.
+MAX_ENVELOPE_FIELDS = 30
+
+MAX_CACHED_DECODERS = 4096
+
+
+class MessageSchema:
+
+    __slots__ = (
+        'model',
+        'schema_id',
+        'fields',
+        'encode',
+        'encode_envelope',
+        'compiled'
+    )
+
+    '''
+    The fields of a Message model. Compiling a schema generates its encode
+    functions, which return the model's set fields as Message.to_data()
+    does without looping over the model's fields at runtime. Decoders are
+    generated for each combination of set fields received, so they build
+    the model's dict in one step.
+    '''
+
+    def __init__(
+        self,
+        model: Type[Any],
+        schema_id: int
+    ) -> None:
+        self.model = model
+        self.schema_id = schema_id
+        self.fields: List[str] = []
+        self.encode: Optional[Callable[[Any], Dict[str, Any]]] = None
+        self.encode_envelope: Optional[Callable[..., List[Any]]] = None
+        self.compiled = False
+
+    def compile(self) -> MessageSchema:
+
+        self.fields = get_model_fields(self.model)
+
+        encode_lines: List[str] = [
+            'def encode(message):',
+            '    values = message.__dict__',
+            '    encoded = {}'
+        ]
+
+        envelope_lines: List[str] = [
+            'def encode_envelope(key, message_type, shard_id, event_name, host, port, message):',
+            '    values = message.__dict__',
+            f'    key |= {(self.schema_id << SCHEMA_ID_SHIFT) | MODEL_FLAG}',
+            '    envelope = [None, message_type, shard_id, event_name, host, port]'
+        ]
+
+        for field_idx, field_name in enumerate(self.fields):
+            encode_lines.extend([
+                f'    value = values[{field_name!r}]',
+                '    if value is not None:',
+                f'        encoded[{field_name!r}] = value'
+            ])
+
+            envelope_lines.extend([
+                f'    value = values[{field_name!r}]',
+                '    if value is not None:',
+                f'        key |= {1 << (field_idx + BITMAP_SHIFT)}',
+                '        envelope.append(value)'
+            ])
+
+        encode_lines.append('    return encoded')
+        envelope_lines.extend([
+            '    envelope[0] = key',
+            '    return envelope'
+        ])
+
+        namespace: Dict[str, Any] = {}
+        exec('\n'.join(encode_lines), namespace)
+
+        if len(self.fields) <= MAX_ENVELOPE_FIELDS:
+            exec('\n'.join(envelope_lines), namespace)
+            self.encode_envelope = namespace['encode_envelope']
+
+        self.encode = namespace['encode']
+        self.compiled = True
+
+        compiled_schemas[self.model] = self
+
+        return self
+
+    def compile_envelope_decoder(
+        self,
+        address: int,
+        bitmap: int
+    ) -> Callable[[List[Any]], Tuple[Any, ...]]:
+
+        if bitmap >> len(self.fields):
+            raise Exception(f'Message envelope sets fields the model - {self.model.__name__} - does not have.')
+
+        set_fields = [
+            (field_idx, field_name) for field_idx, field_name in enumerate(self.fields) if bitmap & (1 << field_idx)
+        ]
+
+        values = ', '.join([
+            f'value_{field_idx}' for field_idx, _ in set_fields
+        ])
+
+        decoded = ', '.join([
+            f'{field_name!r}: value_{field_idx}' for field_idx, field_name in set_fields
+        ])
+
+        return compile_decoder(
+            address,
+            f'{values},' if values else '',
+            f'{{{decoded}}}'
+        )
+
+
+def compile_decoder(
+    address: int,
+    values: str,
+    data: str
+) -> Callable[[List[Any]], Tuple[Any, ...]]:
+
+    envelope = 'message_type, shard_id, event_name, decoded'
+    if address:
+        envelope = f'{envelope}, host, port'
+
+    lines = [
+        'def decode(envelope):',
+        f'    _, message_type, shard_id, event_name, host, port, {values} = envelope',
+        f'    decoded = {data}',
+        f'    return ({envelope})'
+    ]
+
+    namespace: Dict[str, Any] = {}
+    exec('\n'.join(lines), namespace)
+
+    return namespace['decode']
+
+
+def get_model_fields(model: Type[Any]) -> List[str]:
+    model_fields = getattr(model, 'model_fields', None)
+    if model_fields is None:
+        model_fields = model.__fields__
+
+    return list(model_fields)
+
+
+_schemas_by_model: Dict[Type[Any], MessageSchema] = {}
+_schemas_by_id: Dict[int, MessageSchema] = {}
+
+# Schemas are added once compiled, so the codec can look them up without
+# checking.
+compiled_schemas: Dict[Type[Any], MessageSchema] = {}
+
+
+class EnvelopeDecoders(dict):
+
+    __slots__ = ()
+
+    '''
+    The decoders for each envelope key received. Decoders for keys not
+    yet seen are compiled on lookup, so the codec finds them by key alone.
+    '''
+
+    def __missing__(self, key: Any) -> Callable[[List[Any]], Tuple[Any, ...]]:
+
+        if type(key) is not int or key < 0 or key & MODEL_FLAG == 0:
+            raise Exception('Malformed message envelope.')
+
+        schema = get_schema_by_id((key >> SCHEMA_ID_SHIFT) & MAX_SCHEMA_ID)
+
+        decoder = schema.compile_envelope_decoder(
+            key & ADDRESS_FLAG,
+            key >> BITMAP_SHIFT
+        )
+
+        if len(self) < MAX_CACHED_DECODERS:
+            self[key] = decoder
+
+        return decoder
+
+
+envelope_decoders = EnvelopeDecoders({
+    address: compile_decoder(
+        address,
+        'data,',
+        'data'
+    ) for address in (0, ADDRESS_FLAG)
+})
+
+
+def register_model(model: Type[Any]) -> MessageSchema:
+    schema = _schemas_by_model.get(model)
+    if schema:
+        return schema
+
+    # Ids are derived from the model's import path so peers running the
+    # same code agree on them without exchanging schemas.
+    model_path = f'{model.__module__}.{model.__qualname__}'
+    schema_id = zlib.crc32(model_path.encode())
+
+    existing = _schemas_by_id.get(schema_id)
+    if existing and f'{existing.model.__module__}.{existing.model.__qualname__}' != model_path:
+        raise Exception(f'Message model - {model_path} - has the same schema id as - {existing.model.__module__}.{existing.model.__qualname__}.')
+
+    schema = MessageSchema(
+        model,
+        schema_id
+    )
+
+    _schemas_by_model[model] = schema
+    _schemas_by_id[schema_id] = schema
+
+    return schema
+
+
+def is_registered(model: Type[Any]) -> bool:
+    return model in _schemas_by_model
+
+
+def get_schema(model: Type[Any]) -> MessageSchema:
+    schema = _schemas_by_model.get(model)
+    if schema is None:
+        schema = register_model(model)
+
+    if schema.compiled is False:
+        schema.compile()
+
+    return schema
+
+
+def get_schema_by_id(schema_id: int) -> MessageSchema:
+    schema = _schemas_by_id.get(schema_id)
+    if schema is None:
+        raise Exception(f'No Message model registered for schema id - {schema_id}.')
+
+    if schema.compiled is False:
+        schema.compile()
+
+    return schema
@@ -1,20 +1,97 @@
+import itertools
+import os
 import secrets
+import struct
+from collections import OrderedDict
+from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from hedra.distributed.env import Env
 
 
+session_header = struct.Struct('!8sQ')
+nonce_prefix = bytes(4)
+
+
 class AESGCMFernet:
 
-    def __init__(self, env: Env) -> None:
-        self.secret = env.MERCURY_SYNC_AUTH_SECRET
+    __slots__ = (
+        'secret',
+        'max_sessions',
+        'session_id',
+        'session_cipher',
+        'counter',
+        'pid',
+        'peer_ciphers'
+    )
+
+    '''
+    Each encryptor opens a session with a random id, and derives the
+    session's key from MERCURY_SYNC_AUTH_SECRET and that id. Messages
+    carry the session id and a counter nonce, so receivers derive and
+    cache one cipher per peer session instead of a key travelling with
+    every message.
+    '''
+
+    def __init__(
+        self,
+        env: Env,
+        max_sessions: int=1024
+    ) -> None:
+        self.secret = env.MERCURY_SYNC_AUTH_SECRET.encode()
+        self.max_sessions = max_sessions
+        self.peer_ciphers: OrderedDict[bytes, AESGCM] = OrderedDict()
+        self._open_session()
+
+    def _open_session(self):
+        self.session_id = secrets.token_bytes(8)
+        self.session_cipher = self._derive_cipher(self.session_id)
+        self.counter = itertools.count(1)
+        self.pid = os.getpid()
+
+    def _derive_cipher(self, session_id: bytes) -> AESGCM:
+        key = HKDF(
+            algorithm=hashes.SHA256(),
+            length=32,
+            salt=session_id,
+            info=b'hedra.distributed.session'
+        ).derive(self.secret)
+
+        return AESGCM(key)
+
+    def _get_peer_cipher(self, session_id: bytes) -> AESGCM:
+        cipher = self.peer_ciphers.get(session_id)
+
+        if cipher is None:
+            cipher = self._derive_cipher(session_id)
+            self.peer_ciphers[session_id] = cipher
+
+            if len(self.peer_ciphers) > self.max_sessions:
+                self.peer_ciphers.popitem(last=False)
+
+        return cipher
 
     def encrypt(self, data: bytes) -> bytes:
-        key = secrets.token_bytes(32)
-        nonce = secrets.token_bytes(12)
-        return key + nonce + AESGCM(key).encrypt(nonce, data, b"")
-    
+
+        # A forked child would otherwise reuse its parent's nonces.
+        if self.pid != os.getpid():
+            self._open_session()
+
+        counter = next(self.counter)
+        header = session_header.pack(self.session_id, counter)
+
+        return header + self.session_cipher.encrypt(
+            nonce_prefix + header[8:],
+            data,
+            header
+        )
+
     def decrypt(self, data: bytes) -> bytes:
-        key = data[:32]
-        nonce = data[32:44]
-        return AESGCM(key).decrypt(nonce, data[44:], b"")
-    
+        session_id, _ = session_header.unpack_from(data)
+        header = data[:session_header.size]
+
+        return self._get_peer_cipher(session_id).decrypt(
+            nonce_prefix + header[8:],
+            data[session_header.size:],
+            header
+        )
@@ -1,4 +1,5 @@
 from __future__ import annotations
+from hedra.distributed.encoding.message_schema import register_model
 from pydantic import BaseModel, StrictStr, StrictInt
 from typing import Optional
 
@@ -7,7 +8,14 @@ class Message(BaseModel):
     port: Optional[StrictInt]
     error: Optional[StrictStr]
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        register_model(cls)
+
     def to_data(self):
         return {
             name: value for name, value in self.__dict__.items() if value is not None
         }
+
+
+register_model(Message)
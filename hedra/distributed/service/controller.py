@@ -557,7 +557,7 @@ class Controller(Generic[*P]):
     ):
         shard_id, data = await self._udp.send(
             event_name,
-            message.to_data(),
+            message,
             (message.host, message.port)
         )
 
@@ -578,7 +578,7 @@ class Controller(Generic[*P]):
 
         shard_id, data = await self._tcp.send(
             event_name,
-            message.to_data(),
+            message,
             (message.host, message.port + 1)
         )
 
@@ -601,7 +601,7 @@ class Controller(Generic[*P]):
 
         async for response in self._udp.stream(
             event_name,
-            message.to_data(),
+            message,
             address
         ):
             shard_id, data = response
@@ -624,7 +624,7 @@ class Controller(Generic[*P]):
 
         async for response in self._tcp.stream(
             event_name,
-            message.to_data(),
+            message,
             address
         ):
             shard_id, data = response
@@ -229,7 +229,7 @@ class Service:
 
         shard_id, data = await self._udp_connection.send(
             event_name,
-            message.to_data(),
+            message,
             address
         )
 
@@ -251,7 +251,7 @@ class Service:
 
         shard_id, data = await self._tcp_connection.send(
             event_name,
-            message.to_data(),
+            message,
             address
         )
 
@@ -277,7 +277,7 @@ class Service:
 
         async for response in self._udp_connection.stream(
             event_name,
-            message.to_data(),
+            message,
             address
         ):
             shard_id, data = response
@@ -300,7 +300,7 @@ class Service:
 
         async for response in self._tcp_connection.stream(
             event_name,
-            message.to_data(),
+            message,
             address
         ):
             shard_id, data = response
@@ -1,2 +1,3 @@
 from .cpu import CPUMonitor
-from .memory import MemoryMonitor
\ No newline at end of file
+from .memory import MemoryMonitor
+from .process import ProcessMonitor
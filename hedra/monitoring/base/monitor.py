@@ -4,6 +4,11 @@ import psutil
 import signal
 from collections import defaultdict
 from concurrent.futures import ThreadPoolExecutor
+from hedra.monitoring.process import (
+    ProcessMonitor,
+    ProcessSample,
+    process_monitor
+)
 from .exceptions import MonitorKilledError
 from typing import (
     Dict, 
@@ -62,7 +67,11 @@ def handle_monitor_stop(
 
 class BaseMonitor:
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        process_local: bool=False,
+        monitor: ProcessMonitor=process_monitor
+    ) -> None:
         self.active: Dict[str, List[int]] = defaultdict(list)
         self.collected: Dict[str, List[int]] = defaultdict(list)
         self.cpu_count = psutil.cpu_count()
@@ -71,6 +80,8 @@ class BaseMonitor:
         self.stage_type: Union[Any, None] = None
         self.worker_metrics: WorkerMetrics = defaultdict(dict)
         self.is_execute_stage = False
+        self.process_local = process_local
+        self.process_monitor = monitor
 
         self._background_monitors: Dict[str, asyncio.Task] = {}
         self._sync_background_monitors: Dict[str, asyncio.Future] = {}
@@ -126,6 +137,13 @@ class BaseMonitor:
         monitor_name: str,
         interval_sec: Union[int, float]=1
     ):
+        if self.process_local:
+            # Process local monitors share a single timer on the running
+            # loop rather than polling from a thread pool.
+            self._running_monitors[monitor_name] = True
+            self.process_monitor.start(monitor_name)
+            return
+
         if self._loop is None:
             self._loop = asyncio.get_event_loop()
 
@@ -158,6 +176,9 @@ class BaseMonitor:
     def update_monitor(str, monitor_name: str) -> Union[int, float]:
         raise NotImplementedError('Monitor background update method must be implemented in non-base Monitor class.')
 
+    def store_process_samples(self, monitor_name: str, samples: List[ProcessSample]):
+        raise NotImplementedError('Store process samples method must be implemented in non-base Monitor class.')
+
     def store_monitor(self, monitor_name: str):
         self.collected[monitor_name] = list(self.active[monitor_name])
         del self.active[monitor_name]
@@ -218,6 +239,17 @@ class BaseMonitor:
         self,
         monitor_name: str
     ):
+        if self.process_local:
+
+            if self._running_monitors.get(monitor_name):
+                self.store_process_samples(
+                    monitor_name,
+                    self.process_monitor.stop(monitor_name)
+                )
+
+            self._running_monitors[monitor_name] = False
+            return
+
         self._running_monitors[monitor_name] = False
 
         if not self._background_monitors[monitor_name].cancelled():
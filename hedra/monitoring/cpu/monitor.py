@@ -1,20 +1,32 @@
 import psutil
 import itertools
 import statistics
+from collections import defaultdict
 from hedra.monitoring.base.monitor import BaseMonitor
-from typing import Optional
+from hedra.monitoring.process import ProcessSample
+from typing import Dict, List
 
 
 class CPUMonitor(BaseMonitor):
 
-    def __init__(self) -> None:
-        super().__init__()
+    def __init__(self, process_local: bool=False) -> None:
+        super().__init__(process_local=process_local)
+        self.loop_lag: Dict[str, List[float]] = defaultdict(list)
 
     def update_monitor(self, monitor_name: str):
         self.active[monitor_name].append(
             psutil.cpu_percent()
         )
 
+    def store_process_samples(self, monitor_name: str, samples: List[ProcessSample]):
+        self.collected[monitor_name].extend([
+            sample.cpu for sample in samples
+        ])
+
+        self.loop_lag[monitor_name].extend([
+            sample.loop_lag for sample in samples
+        ])
+
     def aggregate_worker_stats(self):
         
         monitor_stats = self._collect_worker_stats()
@@ -26,5 +38,3 @@ class CPUMonitor(BaseMonitor):
                     fillvalue=0
                 )
             ]
-
-        
\ No newline at end of file
@@ -1,14 +1,18 @@
 import os
 import psutil
 import itertools
+from collections import defaultdict
 from hedra.monitoring.base.monitor import BaseMonitor
+from hedra.monitoring.process import ProcessSample
+from typing import Dict, List
 
 
 class MemoryMonitor(BaseMonitor):
 
-    def __init__(self) -> None:
-        super().__init__()
+    def __init__(self, process_local: bool=False) -> None:
+        super().__init__(process_local=process_local)
         self.total_memory = psutil.virtual_memory().total
+        self.uss: Dict[str, List[int]] = defaultdict(list)
 
     def update_monitor(self, monitor_name: str):
         process = psutil.Process(os.getpid())
@@ -16,6 +20,15 @@ class MemoryMonitor(BaseMonitor):
 
         self.active[monitor_name].append(mem_info.rss)
 
+    def store_process_samples(self, monitor_name: str, samples: List[ProcessSample]):
+        self.collected[monitor_name].extend([
+            sample.rss for sample in samples
+        ])
+
+        self.uss[monitor_name].extend([
+            sample.uss for sample in samples
+        ])
+
     def aggregate_worker_stats(self):
         monitor_stats = self._collect_worker_stats()
 
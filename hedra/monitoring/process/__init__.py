@@ -0,0 +1,5 @@
+from .monitor import (
+    ProcessMonitor,
+    process_monitor
+)
+from .sample import ProcessSample
@@ -0,0 +1,263 @@
+import asyncio
+import os
+import psutil
+import time
+from collections import deque
+from typing import (
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union
+)
+from .sample import ProcessSample
+
+
+class ProcessMonitor:
+
+    __slots__ = (
+        'interval_sec',
+        'uss_interval_sec',
+        'max_samples',
+        'include_children',
+        'buffers',
+        'running',
+        'process',
+        '_pid',
+        '_loop',
+        '_timer',
+        '_expected',
+        '_last_sampled',
+        '_last_cpu_time',
+        '_child_cpu_times',
+        '_uss',
+        '_uss_sampled',
+        '_uss_future'
+    )
+
+    def __init__(
+        self,
+        interval_sec: Union[int, float]=1,
+        uss_interval_sec: Union[int, float]=10,
+        max_samples: int=3600,
+        include_children: bool=True
+    ) -> None:
+        self.interval_sec = interval_sec
+        self.uss_interval_sec = uss_interval_sec
+        self.max_samples = max_samples
+        self.include_children = include_children
+        self.buffers: Dict[str, Deque[ProcessSample]] = {}
+        self.running: Dict[str, int] = {}
+        self.process: Optional[psutil.Process] = None
+
+        self._pid: Optional[int] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._expected = 0
+        self._last_sampled = 0
+        self._last_cpu_time = 0
+        self._child_cpu_times: Dict[int, float] = {}
+        self._uss = 0
+        self._uss_sampled = 0
+        self._uss_future: Optional[asyncio.Future] = None
+
+    @property
+    def active(self) -> bool:
+        return self._timer is not None
+
+    def start(self, monitor_name: str) -> None:
+
+        if self.running.get(monitor_name, 0) < 1:
+            self.buffers[monitor_name] = deque(maxlen=self.max_samples)
+            self.running[monitor_name] = 0
+
+        self.running[monitor_name] += 1
+
+        loop = asyncio.get_running_loop()
+
+        # Workers fork or spawn with a copy of this module, so the
+        # process handle and timer are rebound per process and loop.
+        if self._pid != os.getpid() or self._loop is not loop:
+            self._reset(loop)
+
+        if self._timer is None:
+            self._expected = loop.time() + self.interval_sec
+            self._timer = loop.call_at(self._expected, self._sample)
+
+    def stop(self, monitor_name: str) -> List[ProcessSample]:
+
+        if self.running.get(monitor_name, 0) > 0:
+            self.running[monitor_name] -= 1
+
+        if self._timer and not any(self.running.values()):
+            self._timer.cancel()
+            self._timer = None
+
+        return list(
+            self.buffers.get(monitor_name, [])
+        )
+
+    def samples(self, monitor_name: str) -> List[ProcessSample]:
+        return list(
+            self.buffers.get(monitor_name, [])
+        )
+
+    def clear(self, monitor_name: str) -> None:
+        self.running.pop(monitor_name, None)
+        self.buffers.pop(monitor_name, None)
+
+    def _reset(self, loop: asyncio.AbstractEventLoop) -> None:
+
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+
+        self._pid = os.getpid()
+        self._loop = loop
+        self.process = psutil.Process(self._pid)
+        self._child_cpu_times = {}
+        self._uss = 0
+        self._uss_sampled = 0
+        self._uss_future = None
+        self._last_sampled = time.monotonic()
+        self._last_cpu_time = self._cpu_time()
+
+    def _cpu_time(self) -> float:
+        cpu_times = self.process.cpu_times()
+
+        # Children that have already exited are folded into the
+        # children_* counters, live children are tracked per pid below.
+        return sum([
+            cpu_times.user,
+            cpu_times.system,
+            cpu_times.children_user,
+            cpu_times.children_system
+        ])
+
+    def _uss_of(self, process: psutil.Process) -> int:
+        try:
+            return process.memory_full_info().uss
+
+        except psutil.AccessDenied:
+            return process.memory_info().rss
+
+    def _total_uss(self) -> int:
+        uss = self._uss_of(self.process)
+
+        if self.include_children:
+            for child in self.process.children(recursive=True):
+                try:
+                    uss += self._uss_of(child)
+
+                except (psutil.NoSuchProcess, psutil.ZombieProcess):
+                    continue
+
+        return uss
+
+    def _update_uss(self, sampled: float) -> None:
+
+        # USS walks /proc/<pid>/smaps for every process, which is too
+        # slow to do on the loop each tick. It is sampled on its own
+        # cadence in the default executor and the last value reused.
+        if self._uss_future or sampled - self._uss_sampled < self.uss_interval_sec:
+            return
+
+        self._uss_sampled = sampled
+        self._uss_future = self._loop.run_in_executor(None, self._total_uss)
+        self._uss_future.add_done_callback(self._store_uss)
+
+    def _store_uss(self, uss_future: asyncio.Future) -> None:
+        if self._uss_future is not uss_future:
+            return
+
+        self._uss_future = None
+
+        if not uss_future.cancelled() and uss_future.exception() is None:
+            self._uss = uss_future.result()
+
+    def _sample_children(self) -> Tuple[float, int]:
+        cpu_delta = 0
+        rss = 0
+
+        child_cpu_times: Dict[int, float] = {}
+
+        for child in self.process.children(recursive=True):
+            try:
+                with child.oneshot():
+                    child_times = child.cpu_times()
+                    child_cpu_time = child_times.user + child_times.system
+
+                    child_rss = child.memory_info().rss
+
+            except (psutil.NoSuchProcess, psutil.ZombieProcess):
+                continue
+
+            # Children seen for the first time only establish a baseline
+            # so startup time is not charged to a single interval.
+            cpu_delta += child_cpu_time - self._child_cpu_times.get(
+                child.pid,
+                child_cpu_time
+            )
+
+            child_cpu_times[child.pid] = child_cpu_time
+            rss += child_rss
+
+        self._child_cpu_times = child_cpu_times
+
+        return cpu_delta, rss
+
+    def _sample(self) -> None:
+        loop = self._loop
+        now = loop.time()
+
+        # Lag is how late the loop got around to running this callback.
+        loop_lag = max(now - self._expected, 0)
+
+        sampled = time.monotonic()
+        elapsed = sampled - self._last_sampled
+
+        try:
+            with self.process.oneshot():
+                cpu_time = self._cpu_time()
+                rss = self.process.memory_info().rss
+
+            cpu_delta = cpu_time - self._last_cpu_time
+
+            if self.include_children:
+                children_cpu_delta, children_rss = self._sample_children()
+
+                cpu_delta += children_cpu_delta
+                rss += children_rss
+
+        except psutil.Error:
+            cpu_delta = 0
+            cpu_time = self._last_cpu_time
+            rss = 0
+
+        self._update_uss(sampled)
+
+        cpu = 0
+        if elapsed > 0:
+            cpu = round(cpu_delta/elapsed * 100, 2)
+
+        sample = ProcessSample(
+            timestamp=sampled,
+            cpu=cpu,
+            rss=rss,
+            uss=self._uss,
+            loop_lag=loop_lag
+        )
+
+        for monitor_name, running in self.running.items():
+            if running > 0:
+                self.buffers[monitor_name].append(sample)
+
+        self._last_sampled = sampled
+        self._last_cpu_time = cpu_time
+
+        self._expected = loop.time() + self.interval_sec
+        self._timer = loop.call_at(self._expected, self._sample)
+
+
+process_monitor = ProcessMonitor()
@@ -0,0 +1,35 @@
+from typing import Dict, Union
+
+
+class ProcessSample:
+
+    __slots__ = (
+        'timestamp',
+        'cpu',
+        'rss',
+        'uss',
+        'loop_lag'
+    )
+
+    def __init__(
+        self,
+        timestamp: float=0,
+        cpu: float=0,
+        rss: int=0,
+        uss: int=0,
+        loop_lag: float=0
+    ) -> None:
+        self.timestamp = timestamp
+        self.cpu = cpu
+        self.rss = rss
+        self.uss = uss
+        self.loop_lag = loop_lag
+
+    def to_dict(self) -> Dict[str, Union[int, float]]:
+        return {
+            'timestamp': self.timestamp,
+            'cpu': self.cpu,
+            'rss': self.rss,
+            'uss': self.uss,
+            'loop_lag': self.loop_lag
+        }
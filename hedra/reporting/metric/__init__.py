@@ -1,4 +1,5 @@
 from .metrics_set import MetricsSet
 from .metrics_group import MetricsGroup
 from .custom_metric import CustomMetric
-from .metric_types import MetricType
\ No newline at end of file
+from .metric_types import MetricType
+from .metric_accumulator import MetricAccumulator
\ No newline at end of file
@@ -0,0 +1,79 @@
+from __future__ import annotations
+from typing import Union
+from hedra.reporting.stats import LatencyHistogram
+from .metric_types import (
+    metric_type_map,
+    MetricType
+)
+
+
+class MetricAccumulator:
+
+    __slots__ = (
+        'metric_type',
+        'count',
+        'total',
+        'last',
+        'histogram'
+    )
+
+    def __init__(
+        self,
+        metric_type: Union[MetricType, str]=MetricType.SAMPLE
+    ) -> None:
+
+        if isinstance(metric_type, str):
+            metric_type = metric_type_map.get(
+                metric_type,
+                MetricType.SAMPLE
+            )
+
+        self.metric_type = metric_type
+        self.count = 0
+        self.total = 0
+        self.last = 0
+        self.histogram: Union[LatencyHistogram, None] = None
+
+        if self.metric_type == MetricType.DISTRIBUTION:
+            self.histogram = LatencyHistogram()
+
+    def update(self, value: Union[int, float]):
+        self.count += 1
+        self.total += value
+        self.last = value
+
+        if self.histogram is not None:
+            self.histogram.update(value)
+
+        return self
+
+    def merge(self, other: MetricAccumulator):
+
+        if other.count == 0:
+            return self
+
+        self.count += other.count
+        self.total += other.total
+        self.last = other.last
+
+        if self.histogram is not None and other.histogram is not None:
+            self.histogram.merge(other.histogram)
+
+        return self
+
+    @property
+    def value(self) -> Union[int, float]:
+
+        if self.count == 0:
+            return 0
+
+        if self.metric_type == MetricType.COUNT:
+            return self.total
+
+        elif self.metric_type == MetricType.RATE:
+            return self.total/self.count
+
+        elif self.metric_type == MetricType.DISTRIBUTION:
+            return self.histogram.get()
+
+        return self.last
@@ -1,2 +1,10 @@
 from .results import results_types
-from .processed_results_group import ProcessedResultsGroup
\ No newline at end of file
+from .processed_results_group import ProcessedResultsGroup
+from .columnar_results import ColumnarResults
+from .shared_results_segment import (
+    SharedResultsSegment,
+    discard_columnar_results,
+    load_columnar_events,
+    release_columnar_results,
+    share_columnar_results
+)
\ No newline at end of file
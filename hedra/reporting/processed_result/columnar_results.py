@@ -0,0 +1,269 @@
+from __future__ import annotations
+import pickle
+import struct
+import numpy
+from typing import Any, Dict, List, Tuple, Union
+from hedra.core.engines.types.common.base_result import BaseResult
+from hedra.core.engines.types.common.types import RequestTypes
+from .processed_results_group import ProcessedResultsGroup
+
+
+columnar_results_dtype = numpy.dtype([
+    ('name', numpy.uint32),
+    ('source', numpy.uint32),
+    ('type', numpy.uint32),
+    ('tags', numpy.uint32),
+    ('error', numpy.int32),
+    ('status', numpy.int32),
+    ('wait_start', numpy.float64),
+    ('start', numpy.float64),
+    ('connect_end', numpy.float64),
+    ('write_end', numpy.float64),
+    ('complete', numpy.float64),
+    ('messages_start', numpy.uint32),
+    ('messages_count', numpy.uint32)
+])
+
+# Streaming results (gRPC, websockets) time each message. Those timings
+# are kept in their own column, with each row pointing at its span.
+message_timings_dtype = numpy.dtype(numpy.float64)
+
+header_length = struct.Struct('!Q')
+
+
+class ColumnarResults:
+
+    __slots__ = (
+        'names',
+        'sources',
+        'types',
+        'tags',
+        'errors',
+        'array',
+        'message_timings'
+    )
+
+    def __init__(
+        self,
+        names: List[str]=[],
+        sources: List[str]=[],
+        types: List[Union[RequestTypes, str]]=[],
+        tags: List[Tuple[Tuple[str, Any], ...]]=[],
+        errors: List[str]=[],
+        array: numpy.ndarray=None,
+        message_timings: numpy.ndarray=None
+    ) -> None:
+        self.names = list(names)
+        self.sources = list(sources)
+        self.types = list(types)
+        self.tags = list(tags)
+        self.errors = list(errors)
+
+        if array is None:
+            array = numpy.empty(0, dtype=columnar_results_dtype)
+
+        if message_timings is None:
+            message_timings = numpy.empty(0, dtype=message_timings_dtype)
+
+        self.array = array
+        self.message_timings = message_timings
+
+    def __len__(self):
+        return len(self.array)
+
+    @classmethod
+    def from_results(cls, results: List[BaseResult]) -> ColumnarResults:
+
+        interned: Dict[str, Dict[Any, int]] = {
+            'names': {},
+            'sources': {},
+            'types': {},
+            'tags': {},
+            'errors': {}
+        }
+
+        def intern(table: str, value: Any):
+            table_values = interned[table]
+            value_id = table_values.get(value)
+
+            if value_id is None:
+                value_id = len(table_values)
+                table_values[value] = value_id
+
+            return value_id
+
+        rows = []
+        message_timings: List[float] = []
+
+        for result in results:
+
+            if not isinstance(result, BaseResult):
+                continue
+
+            error_id = -1
+            if result.error is not None:
+                error_id = intern('errors', str(result.error))
+
+            status = getattr(result, 'status', None)
+            if not isinstance(status, int):
+                status = 0
+
+            messages_start = len(message_timings)
+            result_message_timings = getattr(result, 'message_timings', None)
+            if result_message_timings:
+                message_timings.extend(result_message_timings)
+
+            rows.append((
+                intern('names', result.name),
+                intern('sources', result.source),
+                intern('types', result.type),
+                intern('tags', tuple(
+                    (tag.get('name'), tag.get('value')) for tag in result.tags
+                )),
+                error_id,
+                status,
+                result.wait_start,
+                result.start,
+                result.connect_end,
+                result.write_end,
+                result.complete,
+                messages_start,
+                len(message_timings) - messages_start
+            ))
+
+        return ColumnarResults(
+            names=interned['names'],
+            sources=interned['sources'],
+            types=interned['types'],
+            tags=interned['tags'],
+            errors=interned['errors'],
+            array=numpy.array(rows, dtype=columnar_results_dtype),
+            message_timings=numpy.array(message_timings, dtype=message_timings_dtype)
+        )
+
+    @classmethod
+    def from_bytes(cls, buffer: Union[bytes, memoryview]) -> ColumnarResults:
+
+        buffer = memoryview(buffer)
+        (length,) = header_length.unpack_from(buffer)
+
+        header_end = header_length.size + length
+        header: Dict[str, List[Any]] = pickle.loads(buffer[header_length.size:header_end])
+
+        rows_count = header.pop('rows')
+        array_end = header_end + rows_count * columnar_results_dtype.itemsize
+
+        return ColumnarResults(
+            **header,
+            array=numpy.frombuffer(
+                buffer[header_end:array_end],
+                dtype=columnar_results_dtype
+            ),
+            message_timings=numpy.frombuffer(
+                buffer[array_end:],
+                dtype=message_timings_dtype
+            )
+        )
+
+    def header(self) -> bytes:
+        return pickle.dumps({
+            'names': self.names,
+            'sources': self.sources,
+            'types': self.types,
+            'tags': self.tags,
+            'errors': self.errors,
+            'rows': len(self.array)
+        }, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def to_bytes(self) -> bytes:
+        header = self.header()
+
+        return b''.join([
+            header_length.pack(len(header)),
+            header,
+            self.array.tobytes(),
+            self.message_timings.tobytes()
+        ])
+
+    def row_message_timings(self, rows: numpy.ndarray) -> numpy.ndarray:
+        counts = rows['messages_count'].astype(numpy.int64)
+        total = int(counts.sum())
+
+        if total == 0:
+            return numpy.empty(0, dtype=message_timings_dtype)
+
+        # Expands each row's (start, count) span into indexes of the
+        # message timings column without a Python loop over rows.
+        starts = rows['messages_start'].astype(numpy.int64)
+        row_offsets = numpy.cumsum(counts) - counts
+
+        indexes = numpy.repeat(starts - row_offsets, counts) + numpy.arange(total)
+
+        return self.message_timings[indexes]
+
+    def timings(self, rows: numpy.ndarray, result_type: Union[RequestTypes, str]) -> Dict[str, numpy.ndarray]:
+
+        if result_type == RequestTypes.TASK:
+            return {
+                'total': rows['complete'] - rows['start'],
+                'waiting': rows['start'] - rows['wait_start'],
+                'queued': rows['write_end'] - rows['start'],
+                'running': rows['complete'] - rows['write_end']
+            }
+
+        timings = {
+            'total': rows['complete'] - rows['start'],
+            'waiting': rows['start'] - rows['wait_start'],
+            'connecting': rows['connect_end'] - rows['start'],
+            'writing': rows['write_end'] - rows['connect_end'],
+            'reading': rows['complete'] - rows['write_end']
+        }
+
+        streamed = rows[rows['messages_count'] > 0]
+        if len(streamed) > 0:
+
+            if result_type == RequestTypes.GRPC:
+                timings['first_message'] = self.message_timings[
+                    streamed['messages_start'].astype(numpy.int64)
+                ]
+
+            timings['message'] = self.row_message_timings(streamed)
+
+        return timings
+
+    def to_events(self) -> Dict[str, ProcessedResultsGroup]:
+
+        events: Dict[str, ProcessedResultsGroup] = {}
+
+        for name_id, name in enumerate(self.names):
+            rows = self.array[self.array['name'] == name_id]
+
+            if len(rows) == 0:
+                continue
+
+            events_group = ProcessedResultsGroup()
+            events_group.source = self.sources[rows['source'][0]]
+
+            for tags_id in numpy.unique(rows['tags']).tolist():
+                events_group.tags.update(dict(self.tags[tags_id]))
+
+            errors = rows['error']
+            failed = errors[errors >= 0]
+
+            events_group.failed = len(failed)
+            events_group.succeeded = len(rows) - events_group.failed
+
+            error_ids, error_counts = numpy.unique(failed, return_counts=True)
+            for error_id, error_count in zip(error_ids.tolist(), error_counts.tolist()):
+                events_group.errors[self.errors[error_id]] += error_count
+
+            result_type = self.types[rows['type'][0]]
+            for timing_group, timings in self.timings(rows, result_type).items():
+                timings = timings[timings > 0]
+
+                if len(timings) > 0:
+                    events_group.timings[timing_group].update_many(timings)
+
+            events[name] = events_group
+
+        return events
@@ -1,14 +1,9 @@
 from __future__ import annotations
 import uuid
-import numpy
 from collections import defaultdict
 from typing import Any, Dict, Union
-from hedra.reporting.stats import (
-    Median,
-    Mean,
-    Variance,
-    StandardDeviation
-)
+from hedra.reporting.metric.metric_accumulator import MetricAccumulator
+from hedra.reporting.stats import LatencyHistogram
 from .results import results_types
 from .types.task_processed_result import TaskProcessedResult
 from .types.base_processed_result import BaseProcessedResult
@@ -31,29 +26,44 @@ class ProcessedResultsGroup:
         'succeeded',
         'failed',
         'errors',
-        '_streaming_mean',
-        '_streaming_variance',
-        '_streaming_stdev',
-        '_streaming_median'
+        'metrics'
     )
 
+    quantile_ranges = [ 
+        .10, 
+        .20, 
+        .25, 
+        .30, 
+        .40, 
+        .50, 
+        .60, 
+        .70, 
+        .75, 
+        .80, 
+        .90, 
+        .95, 
+        .99
+    ]
+
+    # Adds quantile_999th, which changes the columns reporters create, so
+    # it is only included when asked for.
+    extended_quantile_ranges = quantile_ranges + [
+        .999
+    ]
+
     def __init__(self) -> None:
 
         self.events_group_id = str(uuid.uuid4())
 
         self.groups: Dict[Dict[str, Union[int, float]]] = {}
-        self.timings = defaultdict(list)
+        self.timings: Dict[str, LatencyHistogram] = defaultdict(LatencyHistogram)
         self.source = None
         self.tags = {}
         self.total = 0
         self.succeeded = 0
         self.failed = 0
         self.errors = defaultdict(default_count)
-
-        self._streaming_mean = defaultdict(Mean)
-        self._streaming_variance = defaultdict(Variance)
-        self._streaming_stdev = defaultdict(StandardDeviation)
-        self._streaming_median = defaultdict(Median)
+        self.metrics: Dict[str, MetricAccumulator] = {}
 
     def add(
         self, 
@@ -79,69 +89,91 @@ class ProcessedResultsGroup:
             self.failed += 1
 
         for timing_group, timing in processed_result.timings.items():
-            if timing > 0:
-                self.timings[timing_group].append(timing)
+            if isinstance(timing, list):
+                # Streaming results record one timing per message.
+                self.timings[timing_group].update_many([
+                    message_timing for message_timing in timing if message_timing > 0
+                ])
+
+            elif timing > 0:
+                self.timings[timing_group].update(timing)
+
+    def merge(self, other: ProcessedResultsGroup):
+
+        if self.source is None:
+            self.source = other.source
+
+        self.tags.update(other.tags)
+        self.succeeded += other.succeeded
+        self.failed += other.failed
+
+        for error_message, error_count in other.errors.items():
+            self.errors[error_message] += error_count
+
+        for timing_group, histogram in other.timings.items():
+            self.timings[timing_group].merge(histogram)
+
+        for metric_name, accumulator in other.metrics.items():
+            self.merge_metric(metric_name, accumulator)
+
+        return self
+
+    def merge_metric(self, metric_name: str, accumulator: MetricAccumulator):
+        metric = self.metrics.get(metric_name)
+
+        if metric is None:
+            metric = MetricAccumulator(accumulator.metric_type)
+            self.metrics[metric_name] = metric
+
+        metric.merge(accumulator)
 
     def calculate_stats(self):
 
         self.total = self.succeeded + self.failed
 
-        for group_name, group_timings in self.timings.items():
-
-            if len(group_timings) == 0:
-                group_timings = [0]
+        for group_name, histogram in self.timings.items():
 
-            median = float((numpy.median(group_timings)))
-            mean = float(numpy.mean(group_timings, dtype=numpy.float64))
-            variance = float(numpy.var(group_timings, dtype=numpy.float64, ddof=1))
-            stdev = float(numpy.std(group_timings, dtype=numpy.float64))
+            minimum = histogram.minimum
+            maximum = histogram.maximum
 
-            self._streaming_median[group_name].update(median)
-            self._streaming_mean[group_name].update(mean)
-            self._streaming_variance[group_name].update(variance)
-            self._streaming_stdev[group_name].update(stdev)
+            if histogram.count == 0:
+                minimum = 0
+                maximum = 0
 
             self.groups[group_name] = {
                 group_name: {
-                    'median': median,
-                    'mean': mean,
-                    'variance': variance,
-                    'stdev': stdev,
-                    'minimum': min(group_timings),
-                    'maximum': max(group_timings)
+                    'median': histogram.quantile(0.5),
+                    'mean': histogram.mean,
+                    'variance': histogram.variance(),
+                    'stdev': histogram.stdev(),
+                    'minimum': minimum,
+                    'maximum': maximum
                 }
 
             }
 
-    def calculate_quantiles(self):
-
-        quantile_ranges = [ 
-            .10, 
-            .20, 
-            .25, 
-            .30, 
-            .40, 
-            .50, 
-            .60, 
-            .70, 
-            .75, 
-            .80, 
-            .90, 
-            .95, 
-            .99 
-        ]
-
-        for group_name, group_timings in self.timings.items():
-
-            if len(group_timings) == 0:
-                group_timings = [0]
+    def calculate_quantiles(self, extended: bool=False):
+
+        quantile_ranges = self.quantile_ranges
+        if extended:
+            quantile_ranges = self.extended_quantile_ranges
+
+        for group_name, histogram in self.timings.items():
 
             quantiles = {
-                f'quantile_{int(quantile_range * 100)}th': quantile for quantile, quantile_range in zip(
-                    numpy.quantile(
-                        numpy.array(group_timings), quantile_ranges),
+                self.quantile_name(quantile_range): quantile for quantile, quantile_range in zip(
+                    histogram.quantiles(quantile_ranges),
                     quantile_ranges
                 )
             }
             
-            self.groups[group_name]['quantiles'] = quantiles
\ No newline at end of file
+            self.groups[group_name]['quantiles'] = quantiles
+
+    @staticmethod
+    def quantile_name(quantile_range: float):
+        percentile = round(quantile_range * 100, 1)
+
+        if percentile.is_integer():
+            return f'quantile_{int(percentile)}th'
+
+        return f'quantile_{str(percentile).replace(".", "")}th'
\ No newline at end of file
@@ -0,0 +1,135 @@
+from __future__ import annotations
+import numpy
+from multiprocessing.shared_memory import SharedMemory
+from typing import Dict, List, Union
+from .columnar_results import (
+    ColumnarResults,
+    header_length
+)
+from .processed_results_group import ProcessedResultsGroup
+
+
+class SharedResultsSegment:
+
+    __slots__ = (
+        'name',
+        'size',
+        'consumers'
+    )
+
+    def __init__(
+        self,
+        name: str,
+        size: int
+    ) -> None:
+        self.name = name
+        self.size = size
+        self.consumers = 0
+
+    @classmethod
+    def create(cls, columnar_results: ColumnarResults) -> SharedResultsSegment:
+
+        header = columnar_results.header()
+        array_offset = header_length.size + len(header)
+        message_timings_offset = array_offset + columnar_results.array.nbytes
+        size = message_timings_offset + columnar_results.message_timings.nbytes
+
+        segment = SharedMemory(create=True, size=size)
+
+        header_length.pack_into(segment.buf, 0, len(header))
+        segment.buf[header_length.size:array_offset] = header
+
+        segment_array = numpy.ndarray(
+            columnar_results.array.shape,
+            dtype=columnar_results.array.dtype,
+            buffer=segment.buf,
+            offset=array_offset
+        )
+        segment_array[:] = columnar_results.array
+
+        segment_message_timings = numpy.ndarray(
+            columnar_results.message_timings.shape,
+            dtype=columnar_results.message_timings.dtype,
+            buffer=segment.buf,
+            offset=message_timings_offset
+        )
+        segment_message_timings[:] = columnar_results.message_timings
+
+        del segment_array
+        del segment_message_timings
+        segment.close()
+
+        return SharedResultsSegment(
+            segment.name,
+            size
+        )
+
+    def to_events(self) -> Dict[str, ProcessedResultsGroup]:
+
+        segment = SharedMemory(name=self.name)
+
+        try:
+            events = self._load_events(segment)
+
+        finally:
+            segment.close()
+
+        return events
+
+    def share(self, consumers: int) -> None:
+        self.consumers = consumers
+
+    def release(self) -> None:
+        self.consumers -= 1
+
+        if self.consumers < 1:
+            self.discard()
+
+    def discard(self) -> None:
+        try:
+            segment = SharedMemory(name=self.name)
+
+        except FileNotFoundError:
+            return
+
+        segment.close()
+        segment.unlink()
+
+    def _load_events(self, segment: SharedMemory) -> Dict[str, ProcessedResultsGroup]:
+        with segment.buf[:self.size] as buffer:
+            return ColumnarResults.from_bytes(buffer).to_events()
+
+
+def load_columnar_events(
+    columnar_results: Union[bytes, SharedResultsSegment]
+) -> Dict[str, ProcessedResultsGroup]:
+
+    if isinstance(columnar_results, SharedResultsSegment):
+        return columnar_results.to_events()
+
+    return ColumnarResults.from_bytes(columnar_results).to_events()
+
+
+def share_columnar_results(
+    columnar_results: List[Union[bytes, SharedResultsSegment]],
+    consumers: int
+) -> None:
+    for results in columnar_results:
+        if isinstance(results, SharedResultsSegment):
+            results.share(consumers)
+
+
+def release_columnar_results(
+    columnar_results: List[Union[bytes, SharedResultsSegment]]
+) -> None:
+    for results in columnar_results:
+        if isinstance(results, SharedResultsSegment):
+            results.release()
+
+
+def discard_columnar_results(
+    columnar_results: List[Union[bytes, SharedResultsSegment]]
+) -> None:
+    for results in columnar_results:
+        if isinstance(results, SharedResultsSegment):
+            results.discard()
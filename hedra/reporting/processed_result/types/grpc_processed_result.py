@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Dict, List, Union
 from hedra.core.engines.types.grpc import GRPCResult
 from .http2_processed_result import HTTP2ProcessedResult
 
@@ -16,4 +16,22 @@ class GRPCProcessedResult(HTTP2ProcessedResult):
         ).__init__(
             stage,
             result
-        )
\ No newline at end of file
+        )
+
+        self.stream_type = result.stream_type
+        self.message_timings: List[float] = result.message_timings
+
+        if len(self.message_timings) > 0:
+            self.timings['first_message'] = self.message_timings[0]
+            self.timings['message'] = self.message_timings
+
+    def to_dict(self) -> Dict[str, Union[str, int, float]]:
+        serialized = super().to_dict()
+
+        serialized.pop('message', None)
+
+        return {
+            **serialized,
+            'stream_type': self.stream_type,
+            'messages': len(self.message_timings)
+        }
@@ -23,7 +23,8 @@ class TaskProcessedResult(BaseProcessedResult):
         self.timings = {
             'total': self.time,
             'waiting': result.start - result.wait_start,
-            'reading': result.complete - result.write_end
+            'queued': result.write_end - result.start,
+            'running': result.complete - result.write_end
         }
 
         self.data = result.data
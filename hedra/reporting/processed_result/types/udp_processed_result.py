@@ -18,6 +18,7 @@ class UDPProcessedResult(BaseProcessedResult):
         'hostname',
         'status',
         'data',
+        'lost',
         'timings'
     )
 
@@ -40,6 +41,7 @@ class UDPProcessedResult(BaseProcessedResult):
         self.hostname = result.hostname
         self.status = result.status
         self.data = result.data
+        self.lost = result.lost
         self.name = self.shortname
 
         self.time = result.complete - result.start
@@ -74,6 +76,7 @@ class UDPProcessedResult(BaseProcessedResult):
             'params': self.params,
             'hostname': self.hostname,
             'status': self.status,
+            'lost': self.lost,
             'headers': self.headers,
             'data': data
         }
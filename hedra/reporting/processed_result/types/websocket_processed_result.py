@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Dict, List, Union
 from hedra.core.engines.types.websocket import WebsocketResult
 from .http_processed_result import HTTPProcessedResult
 
@@ -16,4 +16,19 @@ class WebsocketProcessedResult(HTTPProcessedResult):
         ).__init__(
             stage,
             result
-        )
\ No newline at end of file
+        )
+
+        self.message_timings: List[float] = result.message_timings
+
+        if len(self.message_timings) > 0:
+            self.timings['message'] = self.message_timings
+
+    def to_dict(self) -> Dict[str, Union[str, int, float]]:
+        serialized = super().to_dict()
+
+        serialized.pop('message', None)
+
+        return {
+            **serialized,
+            'messages': len(self.message_timings)
+        }
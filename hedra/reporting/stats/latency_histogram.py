@@ -0,0 +1,212 @@
+from __future__ import annotations
+import math
+import numpy
+from typing import Dict, List
+
+
+class LatencyHistogram:
+
+    __slots__ = (
+        'relative_accuracy',
+        'gamma',
+        'log_gamma',
+        'min_value',
+        'buckets',
+        'zero_count',
+        'count',
+        'mean',
+        'sum_of_squares',
+        'minimum',
+        'maximum'
+    )
+
+    def __init__(
+        self,
+        relative_accuracy: float=0.001,
+        min_value: float=1e-9
+    ):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy)/(1 - relative_accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.min_value = min_value
+
+        self.buckets: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.mean = 0.0
+        self.sum_of_squares = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+
+    def __len__(self):
+        return self.count
+
+    def update(self, new_value: float):
+
+        if new_value > self.min_value:
+            bucket = math.ceil(math.log(new_value)/self.log_gamma)
+            self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+
+        else:
+            self.zero_count += 1
+
+        self.count += 1
+
+        delta = new_value - self.mean
+        self.mean += delta/self.count
+        self.sum_of_squares += delta * (new_value - self.mean)
+
+        if new_value < self.minimum:
+            self.minimum = new_value
+
+        if new_value > self.maximum:
+            self.maximum = new_value
+
+        return self
+
+    def merge(self, other: LatencyHistogram):
+
+        if other.count == 0:
+            return self
+
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError(
+                f'Err. - cannot merge histograms with differing relative accuracy - {self.relative_accuracy} and {other.relative_accuracy}'
+            )
+
+        for bucket, bucket_count in other.buckets.items():
+            self.buckets[bucket] = self.buckets.get(bucket, 0) + bucket_count
+
+        self.zero_count += other.zero_count
+
+        self._merge_moments(
+            other.count,
+            other.mean,
+            other.sum_of_squares,
+            other.minimum,
+            other.maximum
+        )
+
+        return self
+
+    def update_many(self, values: numpy.ndarray):
+
+        values = numpy.asarray(values, dtype=numpy.float64)
+        values_count = len(values)
+
+        if values_count == 0:
+            return self
+
+        bucketed = values[values > self.min_value]
+        self.zero_count += values_count - len(bucketed)
+
+        buckets, bucket_counts = numpy.unique(
+            numpy.ceil(
+                numpy.log(bucketed)/self.log_gamma
+            ).astype(numpy.int64),
+            return_counts=True
+        )
+
+        for bucket, bucket_count in zip(buckets.tolist(), bucket_counts.tolist()):
+            self.buckets[bucket] = self.buckets.get(bucket, 0) + bucket_count
+
+        values_mean = float(values.mean())
+
+        self._merge_moments(
+            values_count,
+            values_mean,
+            float(numpy.square(values - values_mean).sum()),
+            float(values.min()),
+            float(values.max())
+        )
+
+        return self
+
+    def _merge_moments(
+        self,
+        count: int,
+        mean: float,
+        sum_of_squares: float,
+        minimum: float,
+        maximum: float
+    ):
+        merged_count = self.count + count
+        delta = mean - self.mean
+
+        self.sum_of_squares += sum_of_squares + (
+            delta**2 * self.count * count/merged_count
+        )
+        self.mean += delta * count/merged_count
+        self.count = merged_count
+
+        self.minimum = min(self.minimum, minimum)
+        self.maximum = max(self.maximum, maximum)
+
+    def quantile(self, quantile: float) -> float:
+
+        if self.count == 0:
+            return 0
+
+        rank = quantile * (self.count - 1)
+
+        if rank < self.zero_count:
+            return max(self.minimum, 0)
+
+        seen = self.zero_count
+        value = self.maximum
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+
+            if seen > rank:
+                value = 2 * self.gamma**bucket/(self.gamma + 1)
+                break
+
+        return min(
+            max(value, self.minimum),
+            self.maximum
+        )
+
+    def quantiles(self, quantiles: List[float]) -> List[float]:
+
+        if self.count == 0:
+            return [0 for _ in quantiles]
+
+        ranks = sorted(
+            (quantile * (self.count - 1), idx) for idx, quantile in enumerate(quantiles)
+        )
+
+        values = [self.maximum for _ in quantiles]
+        rank_idx = 0
+
+        while rank_idx < len(ranks) and ranks[rank_idx][0] < self.zero_count:
+            _, quantile_idx = ranks[rank_idx]
+            values[quantile_idx] = max(self.minimum, 0)
+            rank_idx += 1
+
+        seen = self.zero_count
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+
+            while rank_idx < len(ranks) and seen > ranks[rank_idx][0]:
+                _, quantile_idx = ranks[rank_idx]
+                values[quantile_idx] = min(
+                    max(2 * self.gamma**bucket/(self.gamma + 1), self.minimum),
+                    self.maximum
+                )
+
+                rank_idx += 1
+
+        return values
+
+    def variance(self) -> float:
+        divisor = self.count - 1
+        if divisor < 1:
+            divisor = 1
+
+        return self.sum_of_squares/divisor
+
+    def stdev(self) -> float:
+        return math.sqrt(self.variance())
+
+    def get(self):
+        return self.quantile(0.5)